@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import re
+import threading
 from collections import namedtuple
 from collections.abc import Mapping, Sequence
 from dataclasses import asdict, dataclass, field
@@ -8,6 +10,7 @@ from datetime import datetime
 from functools import reduce
 from typing import Any, Literal, NamedTuple, Union
 
+from cachetools import LRUCache
 from django.utils.functional import cached_property
 from parsimonious.exceptions import IncompleteParseError
 from parsimonious.grammar import Grammar
@@ -1230,14 +1233,22 @@ QueryOp = Literal["AND", "OR"]
 QueryToken = Union[SearchFilter, QueryOp, ParenExpression]
 
 
-def parse_search_query(
-    query, config=None, params=None, builder=None, config_overrides=None
-) -> list[
-    SearchFilter
-]:  # TODO: use the `Sequence[QueryToken]` type and update the code that fails type checking.
-    if config is None:
-        config = default_config
+# How many query strings to keep parsed. Dashboards, alerts and on-demand metric specs parse
+# the same handful of queries over and over, and the grammar parse dominates the cost.
+PARSE_CACHE_SIZE = 1024
+
+_search_filters_cache: LRUCache[tuple[str, type, str, bool, str], tuple[Any, ...]] = LRUCache(
+    maxsize=PARSE_CACHE_SIZE
+)
+_search_filters_cache_lock = threading.Lock()
 
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_query_tree(query: str) -> tuple[Node, bool]:
+    """
+    Parses a query into its syntax tree, also returning whether the query contains relative
+    dates. Filters of relative dates depend on the current time so can't be reused.
+    """
     try:
         tree = event_search_grammar.parse(query)
     except IncompleteParseError as e:
@@ -1251,7 +1262,39 @@ def parse_search_query(
             )
         )
 
+    nodes = [tree]
+    while nodes:
+        node = nodes.pop()
+        if node.expr_name == "rel_date_format":
+            return tree, True
+        nodes.extend(node.children)
+    return tree, False
+
+
+def parse_search_query(
+    query, config=None, params=None, builder=None, config_overrides=None
+) -> list[
+    SearchFilter
+]:  # TODO: use the `Sequence[QueryToken]` type and update the code that fails type checking.
+    if config is None:
+        config = default_config
+
+    tree, has_relative_dates = _parse_query_tree(query)
+
     if config_overrides:
         config = SearchConfig.create_from(config, **config_overrides)
 
-    return SearchVisitor(config, params=params, builder=builder).visit(tree)
+    # Without params or a builder the filters only depend on the query and the config, so they
+    # can be shared between callers. They are cached as a tuple so callers get their own list.
+    if params is not None or builder is not None or has_relative_dates:
+        return SearchVisitor(config, params=params, builder=builder).visit(tree)
+
+    # `allow_boolean` and `free_text_key` aren't dataclass fields so aren't part of the repr.
+    cache_key = (query, type(config), repr(config), config.allow_boolean, config.free_text_key)
+    with _search_filters_cache_lock:
+        search_filters = _search_filters_cache.get(cache_key)
+    if search_filters is None:
+        search_filters = tuple(SearchVisitor(config).visit(tree))
+        with _search_filters_cache_lock:
+            _search_filters_cache[cache_key] = search_filters
+    return list(search_filters)
@@ -1,17 +1,23 @@
+import atexit
 import bisect
 import functools
 import logging
 import math
 from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any
 from urllib.parse import quote
 
+from django.core.cache import cache
 from django.core.exceptions import EmptyResultSet, ObjectDoesNotExist
-from django.db import connections
+from django.db import close_old_connections, connections
 from django.db.models.functions import Lower
 
+from sentry import options
+from sentry.utils import metrics
 from sentry.utils.cursors import Cursor, CursorResult, build_cursor
+from sentry.utils.hashlib import md5_text
 from sentry.utils.pagination_factory import PaginatorLike
 
 quote_name = connections["default"].ops.quote_name
@@ -23,6 +29,35 @@ MAX_LIMIT = 100
 MAX_HITS_LIMIT = 1000
 MAX_SNUBA_ELEMENTS = 10000
 
+# How long the prefetched next page of a keyset paginated query is served from the cache.
+PREFETCH_CACHE_TTL = 60
+
+_paginator_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="paginator")
+
+atexit.register(_paginator_pool.shutdown, False)
+
+
+def _run_with_own_connection(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    # Django connections are thread local, so work submitted to the pool queries over a
+    # connection of its own. Close it when it's broken or past its max age like a request would.
+    close_old_connections()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+def submit_concurrently(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Callable[[], Any]:
+    """
+    Starts ``func`` on the paginator pool when ``api.paginator.concurrent-queries`` is enabled,
+    and returns a function that waits for its result. Otherwise ``func`` runs right away.
+    """
+    if options.get("api.paginator.concurrent-queries"):
+        return _paginator_pool.submit(_run_with_own_connection, func, *args, **kwargs).result
+
+    result = func(*args, **kwargs)
+    return lambda: result
+
 
 def count_hits(queryset, max_hits):
     if not max_hits:
@@ -154,12 +189,7 @@ class BasePaginator:
         # max_hits can be limited to speed up the query
         if max_hits is None:
             max_hits = MAX_HITS_LIMIT
-        if count_hits:
-            hits = self.count_hits(max_hits)
-        elif known_hits is not None:
-            hits = known_hits
-        else:
-            hits = None
+        get_hits = submit_concurrently(self.count_hits, max_hits) if count_hits else None
 
         offset = cursor.offset
         # The extra amount is needed so we can decide in the ResultCursor if there is
@@ -176,8 +206,24 @@ class BasePaginator:
         if cursor.is_prev and cursor.value:
             extra += 1
 
+        # Going forward, the next page continues right where this one ends, so it can be fetched
+        # along with this page and served from the cache when it is requested.
+        prefetch = not cursor.is_prev and options.get("api.paginator.prefetch-next-page")
+        prefetch_key = self._get_prefetch_key(cursor, limit, extra) if prefetch else None
+
         stop = offset + limit + extra
-        results = list(queryset[offset:stop])
+        prefetched_ids = cache.get(prefetch_key) if prefetch_key and cursor.value else None
+        if prefetched_ids is not None:
+            metrics.incr("paginator.prefetch.hit")
+            by_id = self.queryset.in_bulk(prefetched_ids)
+            results = [by_id[pk] for pk in prefetched_ids if pk in by_id]
+            next_page = []
+        elif prefetch_key:
+            results = list(queryset[offset : stop + limit])
+            results, next_page = results[: limit + extra], results[limit:]
+        else:
+            results = list(queryset[offset:stop])
+            next_page = []
 
         if cursor.is_prev and cursor.value:
             # If the first result is equal to the cursor_value then it's safe to filter
@@ -194,7 +240,7 @@ class BasePaginator:
         cursor = build_cursor(
             results=results,
             limit=limit,
-            hits=hits,
+            hits=get_hits() if get_hits else known_hits,
             max_hits=max_hits if count_hits else None,
             cursor=cursor,
             is_desc=self.desc,
@@ -202,6 +248,11 @@ class BasePaginator:
             on_results=self.on_results,
         )
 
+        if next_page and cursor.next.has_results:
+            next_key = self._get_prefetch_key(cursor.next, limit, extra)
+            if next_key:
+                cache.set(next_key, [row.pk for row in next_page], PREFETCH_CACHE_TTL)
+
         # Note that this filter is just to remove unwanted rows from the result set.
         # This will reduce the number of rows returned rather than fill a full page,
         # and could result in an empty page being returned
@@ -213,6 +264,21 @@ class BasePaginator:
     def count_hits(self, max_hits):
         return count_hits(self.queryset, max_hits)
 
+    def _get_prefetch_key(self, cursor: Cursor, limit: int, extra: int) -> str | None:
+        # The query (which includes the access filters of the request) is part of the key so
+        # that a page is only ever served to the same query it was fetched for. The page size is
+        # part of it too, as a prefetched page only holds the rows of the size it was fetched for.
+        try:
+            query = str(self.queryset.query)
+        except EmptyResultSet:
+            return None
+        return "paginator:prefetch:{}:{}:{}:{}".format(
+            md5_text(self.queryset.db, query, self.key, self.desc).hexdigest(),
+            limit,
+            extra,
+            cursor,
+        )
+
 
 class Paginator(BasePaginator):
     def get_item_key(self, item, for_prev=False):
@@ -282,6 +348,10 @@ class OffsetPaginator(PaginatorLike):
         if offset < 0:
             raise BadPaginationError("Pagination offset cannot be negative")
 
+        get_hits = (
+            submit_concurrently(self.count_hits, max_hits=MAX_HITS_LIMIT) if count_hits else None
+        )
+
         results = list(queryset[offset:stop])
         if cursor.value != limit:
             results = results[-(limit + 1) :]
@@ -293,10 +363,7 @@ class OffsetPaginator(PaginatorLike):
         if self.on_results:
             results = self.on_results(results)
 
-        if count_hits:
-            hits = self.count_hits(max_hits=MAX_HITS_LIMIT)
-        else:
-            hits = None
+        hits = get_hits() if get_hits else None
 
         return CursorResult(results=results, next=next_cursor, prev=prev_cursor, hits=hits)
 
@@ -346,6 +413,15 @@ class MergingOffsetPaginator(OffsetPaginator):
         if offset < 0:
             raise BadPaginationError("Pagination offset cannot be negative")
 
+        # The count is only needed once the primary results run out, but doesn't depend on them.
+        get_data_count = self.data_count_func
+        if (
+            get_data_count
+            and self.queryset_load_func
+            and options.get("api.paginator.concurrent-queries")
+        ):
+            get_data_count = submit_concurrently(get_data_count)
+
         primary_results = self.data_load_func(offset=offset, limit=self.max_limit + 1)
 
         queryset = self.apply_to_queryset(self.queryset, primary_results)
@@ -362,7 +438,7 @@ class MergingOffsetPaginator(OffsetPaginator):
             # If we hit the end of the results from the data load func, check whether there are
             # any additional results in the queryset_load_func, if one is provided.
             extra_limit = limit - len(results) + 1
-            total_data_count = self.data_count_func()
+            total_data_count = get_data_count()
             total_offset = offset + len(results)
             qs_offset = max(0, total_offset - total_data_count)
             qs_results = self.queryset_load_func(
@@ -1,18 +1,24 @@
 from __future__ import annotations
 
+import atexit
+import functools
 import itertools
 import logging
+import time
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from collections.abc import Callable, Iterable, Mapping, MutableMapping, Sequence
+from collections.abc import Callable, Generator, Iterable, Mapping, MutableMapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from typing import Any, Protocol, TypedDict
 
 import sentry_sdk
 from django.conf import settings
+from django.db import close_old_connections
 from django.db.models import Min, prefetch_related_objects
 
-from sentry import features, tagstore
+from sentry import features, options, tagstore
 from sentry.api.serializers import Serializer, register, serialize
 from sentry.api.serializers.models.actor import ActorSerializer
 from sentry.api.serializers.models.plugin import is_plugin_deprecated
@@ -56,7 +62,7 @@ from sentry.tsdb.snuba import SnubaTSDB
 from sentry.types.group import SUBSTATUS_TO_STR, PriorityLevel
 from sentry.utils.cache import cache
 from sentry.utils.safe import safe_execute
-from sentry.utils.snuba import aliased_query, raw_query
+from sentry.utils.snuba import aliased_query, prepare_aliased_query, raw_query, run_prepared_query
 
 # TODO(jess): remove when snuba is primary backend
 snuba_tsdb = SnubaTSDB(**settings.SENTRY_TSDB_OPTIONS)
@@ -64,6 +70,10 @@ snuba_tsdb = SnubaTSDB(**settings.SENTRY_TSDB_OPTIONS)
 
 logger = logging.getLogger(__name__)
 
+_attrs_query_pool = ThreadPoolExecutor(max_workers=10, thread_name_prefix="group-attrs")
+
+atexit.register(_attrs_query_pool.shutdown, False)
+
 
 def merge_list_dictionaries(
     dict1: MutableMapping[Any, list[Any]], dict2: Mapping[Any, Sequence[Any]]
@@ -72,6 +82,113 @@ def merge_list_dictionaries(
         dict1.setdefault(key, []).extend(val)
 
 
+def partition_by_category(item_list: Sequence[Group]) -> tuple[list[Group], list[Group]]:
+    """Splits groups into error issues and generic issues."""
+    error_issues = [group for group in item_list if GroupCategory.ERROR == group.issue_category]
+    generic_issues = [group for group in item_list if group.issue_category != GroupCategory.ERROR]
+    return error_issues, generic_issues
+
+
+def _run_in_scope(
+    isolation_scope: sentry_sdk.Scope, current_scope: sentry_sdk.Scope, fn: Callable[[], Any]
+) -> Any:
+    # Fetches on the pool don't query Postgres themselves, but reading options can fall through
+    # to the database. Close the connection of the thread when it's broken or past its max age
+    # like a request would.
+    close_old_connections()
+    try:
+        with sentry_sdk.scope.use_isolation_scope(isolation_scope):
+            with sentry_sdk.scope.use_scope(current_scope):
+                return fn()
+    finally:
+        close_old_connections()
+
+
+class GroupAttrsLoader:
+    """
+    Loads the attributes of a list of groups, running the Snuba queries alongside each other and
+    alongside the Postgres queries.
+
+    Only fetches that don't touch the database may be submitted: Django connections are thread
+    local, so Postgres queries stay on the request thread and are timed with ``timer``. Snuba
+    queries look up the models they refer to in Postgres, so they are submitted with
+    ``submit_query``, which does those lookups on the request thread. Fetches are keyed by name
+    and submitted at most once, so a query can be submitted as soon as its inputs are known and
+    its result collected wherever it is needed. Unless ``concurrent`` is set, a submitted fetch
+    runs on the request thread when its result is first requested.
+    """
+
+    def __init__(self, concurrent: bool = False) -> None:
+        self.concurrent = concurrent
+        self.timings: dict[str, float] = {}
+        self._pending: dict[str, Future[Any] | Callable[[], Any]] = {}
+
+    def submit(self, name: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        if name in self._pending:
+            return
+
+        call = functools.partial(self._timed, name, functools.partial(fn, *args, **kwargs))
+        if self.concurrent:
+            self._pending[name] = _attrs_query_pool.submit(
+                _run_in_scope,
+                sentry_sdk.Scope.get_isolation_scope().fork(),
+                sentry_sdk.Scope.get_current_scope().fork(),
+                call,
+            )
+        else:
+            self._pending[name] = call
+
+    def submit_query(self, name: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """
+        Submits ``fn``, which makes a Snuba query with the ``aliased_query`` function passed to it
+        as ``query``. When running concurrently the query is prepared right away, and only the
+        request to Snuba is made on the pool.
+        """
+        if name in self._pending:
+            return
+
+        if not self.concurrent:
+            self.submit(name, fn, *args, query=aliased_query, **kwargs)
+            return
+
+        with self.timer(f"{name}.prepare"):
+            prepared = fn(*args, query=prepare_aliased_query, **kwargs)
+        self.submit(name, run_prepared_query, prepared)
+
+    def result(self, name: str) -> Any:
+        pending = self._pending[name]
+        if isinstance(pending, Future):
+            return pending.result()
+
+        future: Future[Any] = Future()
+        try:
+            future.set_result(pending())
+        except Exception as e:
+            future.set_exception(e)
+        self._pending[name] = future
+        return future.result()
+
+    @contextmanager
+    def timer(self, name: str) -> Generator[None, None, None]:
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.timings[name] = time.monotonic() - start
+
+    def _timed(self, name: str, fn: Callable[[], Any]) -> Any:
+        with self.timer(name):
+            return fn()
+
+    def record_timings(self) -> None:
+        span = sentry_sdk.get_current_span()
+        if span is None:
+            return
+        span.set_data("concurrent", self.concurrent)
+        for name, duration in self.timings.items():
+            span.set_data(f"fetch.{name}", int(duration * 1000))
+
+
 class GroupStatusDetailsResponseOptional(TypedDict, total=False):
     autoResolved: bool
     ignoreCount: int
@@ -194,28 +311,45 @@ class GroupSerializerBase(Serializer, ABC):
         # making unnecessary queries.
         prefetch_related_objects(item_list, "project__organization")
 
+        loader = GroupAttrsLoader(concurrent=options.get("api.group-serializer.concurrent-attrs"))
+        try:
+            return self._get_attrs(item_list, user, loader)
+        finally:
+            loader.record_timings()
+
+    def _get_attrs(
+        self, item_list: Sequence[Group], user: Any, loader: GroupAttrsLoader
+    ) -> MutableMapping[Group, MutableMapping[str, Any]]:
+        # Start the Snuba queries first so they run while the Postgres queries below do.
+        if item_list:
+            self._submit_seen_stats_queries(item_list, loader)
+
         if user.is_authenticated and item_list:
-            bookmarks = set(
-                GroupBookmark.objects.filter(user_id=user.id, group__in=item_list).values_list(
-                    "group_id", flat=True
+            with loader.timer("bookmarks"):
+                bookmarks = set(
+                    GroupBookmark.objects.filter(user_id=user.id, group__in=item_list).values_list(
+                        "group_id", flat=True
+                    )
                 )
-            )
-            seen_groups = dict(
-                GroupSeen.objects.filter(user_id=user.id, group__in=item_list).values_list(
-                    "group_id", "last_seen"
+                seen_groups = dict(
+                    GroupSeen.objects.filter(user_id=user.id, group__in=item_list).values_list(
+                        "group_id", "last_seen"
+                    )
                 )
-            )
-            subscriptions = self._get_subscriptions(item_list, user)
+            with loader.timer("subscriptions"):
+                subscriptions = self._get_subscriptions(item_list, user)
         else:
             bookmarks = set()
             seen_groups = {}
             subscriptions = defaultdict(lambda: (False, False, None))
 
-        resolved_assignees = self._serialize_assignees(item_list)
+        with loader.timer("assignees"):
+            resolved_assignees = self._serialize_assignees(item_list)
 
         ignore_items = {g.group_id: g for g in GroupSnooze.objects.filter(group__in=item_list)}
 
-        release_resolutions, commit_resolutions = self._resolve_resolutions(item_list, user)
+        with loader.timer("resolutions"):
+            release_resolutions, commit_resolutions = self._resolve_resolutions(item_list, user)
 
         user_ids = {
             user_id
@@ -238,7 +372,8 @@ class GroupSerializerBase(Serializer, ABC):
             GroupShare.objects.filter(group__in=item_list).values_list("group_id", "uuid")
         )
 
-        seen_stats = self._get_seen_stats(item_list, user)
+        with loader.timer("seen_stats"):
+            seen_stats = self._get_seen_stats(item_list, user, loader)
 
         organization_id_list = list({item.project.organization_id for item in item_list})
         # if no groups, then we can't proceed but this seems to be a valid use case
@@ -258,15 +393,17 @@ class GroupSerializerBase(Serializer, ABC):
         authorized = self._is_authorized(user, organization_id)
 
         annotations_by_group_id: MutableMapping[int, list[Any]] = defaultdict(list)
-        for annotations_by_group in itertools.chain.from_iterable(
-            [
-                self._resolve_integration_annotations(organization_id, item_list),
-                [self._resolve_external_issue_annotations(item_list)],
-            ]
-        ):
-            merge_list_dictionaries(annotations_by_group_id, annotations_by_group)
+        with loader.timer("annotations"):
+            for annotations_by_group in itertools.chain.from_iterable(
+                [
+                    self._resolve_integration_annotations(organization_id, item_list),
+                    [self._resolve_external_issue_annotations(item_list)],
+                ]
+            ):
+                merge_list_dictionaries(annotations_by_group_id, annotations_by_group)
 
-        snuba_stats = self._get_group_snuba_stats(item_list, seen_stats)
+        with loader.timer("unhandled"):
+            snuba_stats = self._get_group_snuba_stats(item_list, seen_stats)
 
         result = {}
         for item in item_list:
@@ -362,16 +499,24 @@ class GroupSerializerBase(Serializer, ABC):
 
     @abstractmethod
     def _seen_stats_error(
-        self, error_issue_list: Sequence[Group], user
+        self, error_issue_list: Sequence[Group], user, loader: GroupAttrsLoader
     ) -> Mapping[Group, SeenStats]:
         pass
 
     @abstractmethod
     def _seen_stats_generic(
-        self, generic_issue_list: Sequence[Group], user
+        self, generic_issue_list: Sequence[Group], user, loader: GroupAttrsLoader
     ) -> Mapping[Group, SeenStats]:
         pass
 
+    def _submit_seen_stats_queries(
+        self, item_list: Sequence[Group], loader: GroupAttrsLoader
+    ) -> None:
+        """
+        Submits the Snuba queries behind the seen stats to ``loader`` ahead of
+        ``_get_seen_stats``. Serializers whose seen stats come from Snuba override this.
+        """
+
     def _expand(self, key) -> bool:
         if self.expand is None:
             return False
@@ -442,7 +587,9 @@ class GroupSerializerBase(Serializer, ABC):
             status_label = "unresolved"
         return status_details, status_label
 
-    def _get_seen_stats(self, item_list: Sequence[Group], user) -> Mapping[Group, SeenStats] | None:
+    def _get_seen_stats(
+        self, item_list: Sequence[Group], user, loader: GroupAttrsLoader
+    ) -> Mapping[Group, SeenStats] | None:
         """
         Returns a dictionary keyed by item that includes:
             - times_seen
@@ -456,16 +603,15 @@ class GroupSerializerBase(Serializer, ABC):
         if not item_list:
             return None
 
-        # partition the item_list by type
-        error_issues = [group for group in item_list if GroupCategory.ERROR == group.issue_category]
-        generic_issues = [
-            group for group in item_list if group.issue_category != GroupCategory.ERROR
-        ]
+        self._submit_seen_stats_queries(item_list, loader)
+        error_issues, generic_issues = partition_by_category(item_list)
 
         # bulk query for the seen_stats by type
-        error_stats = (self._seen_stats_error(error_issues, user) if error_issues else {}) or {}
+        error_stats = (
+            self._seen_stats_error(error_issues, user, loader) if error_issues else {}
+        ) or {}
         generic_stats = (
-            self._seen_stats_generic(generic_issues, user) if generic_issues else {}
+            self._seen_stats_generic(generic_issues, user, loader) if generic_issues else {}
         ) or {}
         agg_stats = {**error_stats, **generic_stats}
         # combine results back
@@ -761,7 +907,7 @@ class GroupSerializer(GroupSerializerBase):
         GroupSerializerBase.__init__(self)
         self.environment_func = environment_func if environment_func is not None else lambda: None
 
-    def _seen_stats_error(self, item_list, user) -> Mapping[Group, SeenStats]:
+    def _seen_stats_error(self, item_list, user, loader) -> Mapping[Group, SeenStats]:
         return self.__seen_stats_impl(
             item_list,
             tagstore.backend.get_groups_user_counts,
@@ -769,7 +915,7 @@ class GroupSerializer(GroupSerializerBase):
         )
 
     def _seen_stats_generic(
-        self, generic_issue_list: Sequence[Group], user
+        self, generic_issue_list: Sequence[Group], user, loader
     ) -> Mapping[Group, SeenStats]:
         return self.__seen_stats_impl(
             generic_issue_list,
@@ -977,33 +1123,43 @@ class GroupSerializerSnuba(GroupSerializerBase):
                         conditions.append(new_condition)
         self.conditions = conditions
 
+    def _submit_seen_stats_queries(
+        self, item_list: Sequence[Group], loader: GroupAttrsLoader
+    ) -> None:
+        if self._collapse("stats"):
+            return
+
+        error_issues, generic_issues = partition_by_category(item_list)
+        for name, issue_list, execute_seen_stats_query in (
+            ("error_seen_stats", error_issues, self._execute_error_seen_stats_query),
+            ("generic_seen_stats", generic_issues, self._execute_generic_seen_stats_query),
+        ):
+            if issue_list:
+                loader.submit_query(
+                    name,
+                    execute_seen_stats_query,
+                    item_list=issue_list,
+                    start=self.start,
+                    end=self.end,
+                    conditions=self.conditions,
+                    environment_ids=self.environment_ids,
+                )
+
     def _seen_stats_error(
-        self, error_issue_list: Sequence[Group], user
+        self, error_issue_list: Sequence[Group], user, loader: GroupAttrsLoader
     ) -> Mapping[Group, SeenStats]:
         return self._parse_seen_stats_results(
-            self._execute_error_seen_stats_query(
-                item_list=error_issue_list,
-                start=self.start,
-                end=self.end,
-                conditions=self.conditions,
-                environment_ids=self.environment_ids,
-            ),
+            loader.result("error_seen_stats"),
             error_issue_list,
             bool(self.start or self.end or self.conditions),
             self.environment_ids,
         )
 
     def _seen_stats_generic(
-        self, generic_issue_list: Sequence[Group], user
+        self, generic_issue_list: Sequence[Group], user, loader: GroupAttrsLoader
     ) -> Mapping[Group, SeenStats]:
         return self._parse_seen_stats_results(
-            self._execute_generic_seen_stats_query(
-                item_list=generic_issue_list,
-                start=self.start,
-                end=self.end,
-                conditions=self.conditions,
-                environment_ids=self.environment_ids,
-            ),
+            loader.result("generic_seen_stats"),
             generic_issue_list,
             bool(self.start or self.end or self.conditions),
             self.environment_ids,
@@ -1011,7 +1167,12 @@ class GroupSerializerSnuba(GroupSerializerBase):
 
     @staticmethod
     def _execute_error_seen_stats_query(
-        item_list, start=None, end=None, conditions=None, environment_ids=None
+        item_list,
+        start=None,
+        end=None,
+        conditions=None,
+        environment_ids=None,
+        query: Callable[..., Any] = aliased_query,
     ):
         project_ids = list({item.project_id for item in item_list})
         group_ids = [item.id for item in item_list]
@@ -1025,7 +1186,7 @@ class GroupSerializerSnuba(GroupSerializerBase):
         if environment_ids:
             filters["environment"] = environment_ids
 
-        return aliased_query(
+        return query(
             dataset=Dataset.Events,
             start=start,
             end=end,
@@ -1041,7 +1202,12 @@ class GroupSerializerSnuba(GroupSerializerBase):
 
     @staticmethod
     def _execute_perf_seen_stats_query(
-        item_list, start=None, end=None, conditions=None, environment_ids=None
+        item_list,
+        start=None,
+        end=None,
+        conditions=None,
+        environment_ids=None,
+        query: Callable[..., Any] = aliased_query,
     ):
         project_ids = list({item.project_id for item in item_list})
         group_ids = [item.id for item in item_list]
@@ -1055,7 +1221,7 @@ class GroupSerializerSnuba(GroupSerializerBase):
         filters = {"project_id": project_ids}
         if environment_ids:
             filters["environment"] = environment_ids
-        return aliased_query(
+        return query(
             dataset=Dataset.Transactions,
             start=start,
             end=end,
@@ -1074,7 +1240,12 @@ class GroupSerializerSnuba(GroupSerializerBase):
 
     @staticmethod
     def _execute_generic_seen_stats_query(
-        item_list, start=None, end=None, conditions=None, environment_ids=None
+        item_list,
+        start=None,
+        end=None,
+        conditions=None,
+        environment_ids=None,
+        query: Callable[..., Any] = aliased_query,
     ):
         project_ids = list({item.project_id for item in item_list})
         group_ids = [item.id for item in item_list]
@@ -1087,7 +1258,7 @@ class GroupSerializerSnuba(GroupSerializerBase):
         filters = {"project_id": project_ids, "group_id": group_ids}
         if environment_ids:
             filters["environment"] = environment_ids
-        return aliased_query(
+        return query(
             dataset=Dataset.IssuePlatform,
             start=start,
             end=end,
@@ -10,14 +10,16 @@ from typing import Any
 from django.utils import timezone
 from rest_framework.request import Request
 
-from sentry import features, release_health, tsdb
+from sentry import features, options, release_health, tsdb
 from sentry.api.serializers import serialize
 from sentry.api.serializers.models.external_issue import ExternalIssueSerializer
 from sentry.api.serializers.models.group import (
     BaseGroupSerializerResponse,
+    GroupAttrsLoader,
     GroupSerializer,
     GroupSerializerSnuba,
     SeenStats,
+    partition_by_category,
     snuba_tsdb,
 )
 from sentry.api.serializers.models.platformexternalissue import PlatformExternalIssueSerializer
@@ -271,7 +273,13 @@ class StreamGroupSerializerSnuba(GroupSerializerSnuba, GroupStatsMixin):
         if not self._collapse("base"):
             attrs = super().get_attrs(item_list, user)
         else:
-            seen_stats = self._get_seen_stats(item_list, user)
+            loader = GroupAttrsLoader(
+                concurrent=options.get("api.group-serializer.concurrent-attrs")
+            )
+            try:
+                seen_stats = self._get_seen_stats(item_list, user, loader)
+            finally:
+                loader.record_timings()
 
             if seen_stats:
                 attrs = {item: seen_stats.get(item, {}) for item in item_list}
@@ -517,37 +525,71 @@ class StreamGroupSerializerSnuba(GroupSerializerSnuba, GroupStatsMixin):
             )
         return results
 
+    def _submit_seen_stats_queries(
+        self, item_list: Sequence[Group], loader: GroupAttrsLoader
+    ) -> None:
+        if self._collapse("stats"):
+            return
+
+        error_issues, generic_issues = partition_by_category(item_list)
+        if error_issues:
+            self.__submit_seen_stats_queries(
+                "error_seen_stats", error_issues, self._execute_error_seen_stats_query, loader
+            )
+        if generic_issues:
+            self.__submit_seen_stats_queries(
+                "generic_seen_stats", generic_issues, self._execute_generic_seen_stats_query, loader
+            )
+
+    def __submit_seen_stats_queries(
+        self,
+        name: str,
+        issue_list: Sequence[Group],
+        seen_stats_func: Callable[..., Mapping[str, Any]],
+        loader: GroupAttrsLoader,
+    ) -> None:
+        partial_execute_seen_stats_query = functools.partial(
+            seen_stats_func,
+            item_list=issue_list,
+            environment_ids=self.environment_ids,
+            start=self.start,
+            end=self.end,
+        )
+        loader.submit_query(name, partial_execute_seen_stats_query)
+        if self.conditions and not self._collapse("filtered"):
+            loader.submit_query(
+                f"{name}.filtered", partial_execute_seen_stats_query, conditions=self.conditions
+            )
+        if (self.start or self.end) and not self._collapse("lifetime"):
+            loader.submit_query(
+                f"{name}.lifetime", partial_execute_seen_stats_query, start=None, end=None
+            )
+
     def _seen_stats_error(
-        self, error_issue_list: Sequence[Group], user
+        self, error_issue_list: Sequence[Group], user, loader: GroupAttrsLoader
     ) -> Mapping[Group, SeenStats]:
-        return self.__seen_stats_impl(error_issue_list, self._execute_error_seen_stats_query)
+        return self.__seen_stats_impl(error_issue_list, "error_seen_stats", loader)
 
     def _seen_stats_generic(
-        self, generic_issue_list: Sequence[Group], user
+        self, generic_issue_list: Sequence[Group], user, loader: GroupAttrsLoader
     ) -> Mapping[Group, SeenStats]:
-        return self.__seen_stats_impl(generic_issue_list, self._execute_generic_seen_stats_query)
+        return self.__seen_stats_impl(generic_issue_list, "generic_seen_stats", loader)
 
     def __seen_stats_impl(
         self,
         error_issue_list: Sequence[Group],
-        seen_stats_func: Callable[[Any, Any, Any, Any, Any], Mapping[str, Any]],
+        name: str,
+        loader: GroupAttrsLoader,
     ) -> Mapping[Any, SeenStats]:
-        partial_execute_seen_stats_query = functools.partial(
-            seen_stats_func,
-            item_list=error_issue_list,
-            environment_ids=self.environment_ids,
-            start=self.start,
-            end=self.end,
-        )
         time_range_result = self._parse_seen_stats_results(
-            partial_execute_seen_stats_query(),
+            loader.result(name),
             error_issue_list,
             self.start or self.end or self.conditions,
             self.environment_ids,
         )
         filtered_result = (
             self._parse_seen_stats_results(
-                partial_execute_seen_stats_query(conditions=self.conditions),
+                loader.result(f"{name}.filtered"),
                 error_issue_list,
                 self.start or self.end or self.conditions,
                 self.environment_ids,
@@ -558,7 +600,7 @@ class StreamGroupSerializerSnuba(GroupSerializerSnuba, GroupStatsMixin):
         lifetime_result = (
             (
                 self._parse_seen_stats_results(
-                    partial_execute_seen_stats_query(start=None, end=None),
+                    loader.result(f"{name}.lifetime"),
                     error_issue_list,
                     False,
                     self.environment_ids,
@@ -134,6 +134,9 @@ SENTRY_MONITORS_REDIS_CLUSTER = "default"
 SENTRY_STATISTICAL_DETECTORS_REDIS_CLUSTER = "default"
 SENTRY_METRIC_META_REDIS_CLUSTER = "default"
 SENTRY_ESCALATION_THRESHOLDS_REDIS_CLUSTER = "default"
+SENTRY_TAGSTORE_SUMMARIES_REDIS_CLUSTER = "default"
+SENTRY_DATA_EXPORT_REDIS_CLUSTER = "default"
+SENTRY_DELETIONS_REDIS_CLUSTER = "default"
 SENTRY_SPAN_BUFFER_CLUSTER = "default"
 SENTRY_ASSEMBLE_CLUSTER = "default"
 SENTRY_UPTIME_DETECTOR_CLUSTER = "default"
@@ -736,6 +739,7 @@ CELERY_IMPORTS = (
     "sentry.hybridcloud.tasks.deliver_webhooks",
     "sentry.incidents.tasks",
     "sentry.snuba.tasks",
+    "sentry.tagstore.tasks",
     "sentry.replays.tasks",
     "sentry.monitors.tasks.clock_pulse",
     "sentry.monitors.tasks.detect_broken_monitor_envs",
@@ -760,6 +764,7 @@ CELERY_IMPORTS = (
     "sentry.tasks.deletion.scheduled",
     "sentry.tasks.deletion.groups",
     "sentry.tasks.deletion.hybrid_cloud",
+    "sentry.tasks.deletion.shards",
     "sentry.tasks.deliver_from_outbox",
     "sentry.tasks.digests",
     "sentry.tasks.email",
@@ -1087,6 +1092,12 @@ CELERYBEAT_SCHEDULE_REGION = {
         "schedule": crontab(minute="*/1"),
         "options": {"expires": 30},
     },
+    "refresh-group-tag-summaries": {
+        "task": "sentry.tagstore.tasks.refresh_group_tag_summaries",
+        # Run every 1 minute
+        "schedule": crontab(minute="*/1"),
+        "options": {"expires": 60},
+    },
     "update-user-reports": {
         "task": "sentry.tasks.update_user_reports",
         # Run every 15 minutes
@@ -3295,6 +3306,10 @@ SENTRY_FEATURE_ADOPTION_CACHE_OPTIONS = {
 
 ADDITIONAL_BULK_QUERY_DELETES: list[tuple[str, str, str | None]] = []
 
+# The number of concurrent deletes `sentry cleanup` splits the cleanup of a table into, by model
+# label (e.g. {"sentry.FileBlob": 4}). Tables not listed are cleaned up by a single delete.
+SENTRY_CLEANUP_TABLE_CONCURRENCY: dict[str, int] = {}
+
 # Monitor limits to prevent abuse
 MAX_MONITORS_PER_ORG = 1500
 MAX_ENVIRONMENTS_PER_MONITOR = 1000
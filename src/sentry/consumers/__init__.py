@@ -99,6 +99,18 @@ def ingest_replay_recordings_buffered_options() -> list[click.Option]:
             type=int,
             default=1,
         ),
+        click.Option(
+            ["--max-upload-workers", "max_upload_workers"],
+            type=int,
+            default=8,
+            help="The maximum number of threads uploading recording segments concurrently.",
+        ),
+        click.Option(
+            ["--max-pending-commits", "max_pending_commits"],
+            type=int,
+            default=1,
+            help="The maximum number of flushed buffers uploading before applying backpressure.",
+        ),
     ]
     return options
 
@@ -152,6 +164,23 @@ def ingest_events_options() -> list[click.Option]:
             default=False,
         )
     )
+    options.append(
+        click.Option(
+            ["--threads", "num_threads"],
+            type=int,
+            default=1,
+            help="Process events in a thread pool of this size while preserving ordering per project. Can not be combined with --processes.",
+        )
+    )
+    options.append(
+        click.Option(
+            ["--batched", "batched"],
+            type=bool,
+            is_flag=True,
+            default=False,
+            help="Store events in the processing store in batches of up to --max-batch-size events.",
+        )
+    )
     return options
 
 
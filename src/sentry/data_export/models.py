@@ -2,6 +2,7 @@ import logging
 
 import orjson
 from django.conf import settings
+from django.core.cache import cache
 from django.db import models, router, transaction
 from django.urls import reverse
 from django.utils import timezone
@@ -23,6 +24,9 @@ from .base import DEFAULT_EXPIRATION, ExportQueryType, ExportStatus
 
 logger = logging.getLogger(__name__)
 
+PROGRESS_CACHE_KEY = "data-export.progress:{data_export_id}"
+PROGRESS_CACHE_TTL = 24 * 60 * 60
+
 
 @region_silo_model
 class ExportedData(Model):
@@ -63,6 +67,22 @@ class ExportedData(Model):
         # Example: Discover_2020-July-21_27.csv
         return f"{export_type}_{date}_{self.id}.csv"
 
+    def get_progress(self) -> dict[str, int] | None:
+        """
+        Returns the number of completed and total parts of an export that reports its progress
+        while it is being prepared, see `set_progress`.
+        """
+        if self.date_finished is not None:
+            return None
+        return cache.get(PROGRESS_CACHE_KEY.format(data_export_id=self.id))
+
+    def set_progress(self, completed: int, total: int) -> None:
+        cache.set(
+            PROGRESS_CACHE_KEY.format(data_export_id=self.id),
+            {"completed": completed, "total": total},
+            PROGRESS_CACHE_TTL,
+        )
+
     @staticmethod
     def format_date(date) -> str | None:
         # Example: 12:21 PM on July 21, 2020 (UTC)
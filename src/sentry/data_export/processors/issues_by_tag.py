@@ -103,18 +103,20 @@ class IssuesByTagProcessor:
             result["ip_address"] = euser.ip_address if euser else ""
         return result
 
-    def get_raw_data(self, limit=1000, offset=0):
+    def get_raw_data(self, limit=1000, offset=0, start=None, end=None, callbacks=None):
         """
-        Returns list of GroupTagValues
+        Returns list of GroupTagValues, of the events between `start` and `end` when given
         """
         return tagstore.backend.get_group_tag_value_iter(
             group=self.group,
             environment_ids=[self.environment_id],
             key=self.lookup_key,
-            callbacks=self.callbacks,
+            callbacks=self.callbacks if callbacks is None else callbacks,
             limit=limit,
             offset=offset,
             tenant_ids={"organization_id": self.project.organization_id},
+            start=start,
+            end=end,
         )
 
     def get_serialized_data(self, limit=1000, offset=0):
@@ -0,0 +1,164 @@
+"""
+State of issues-by-tag exports that are split into time slices.
+
+Paging through the values of a high-cardinality tag one offset page at a time gets slower with
+every page, since each page aggregates all of the events of the issue again. A sliced export
+instead splits the lifetime of the issue into time slices that are aggregated by tasks in
+parallel. Each task stores the values of its slice in a hash of its own:
+
+    {"<tag value>": "[times_seen, first_seen, last_seen]"}
+
+and counts its slice as completed, and the task completing the last slice merges them. A value
+usually shows up in more than one slice, so its counts are summed and its first and last seen
+dates are taken from the earliest and latest slices it shows up in.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+
+from dateutil.parser import parse as parse_datetime
+from django.conf import settings
+from django.utils import timezone
+from sentry_redis_tools.clients import RedisCluster, StrictRedis
+
+from sentry.models.group import Group
+from sentry.models.organization import Organization
+from sentry.tagstore.types import GroupTagValue
+from sentry.utils import json
+from sentry.utils.dates import outside_retention_with_modified_start
+from sentry.utils.redis import redis_clusters
+
+from .base import ExportError
+
+KEY_TTL = 24 * 60 * 60
+SLICE_KEY = "data-export:{data_export_id}:slice:{index}"
+COMPLETED_KEY = "data-export:{data_export_id}:completed"
+FAILED_KEY = "data-export:{data_export_id}:failed"
+
+# Events can be stored with a timestamp slightly before the first seen date of their issue, see
+# `shrink_time_window`.
+FIRST_SEEN_LEEWAY = timedelta(minutes=5)
+
+TimeSlice = tuple[datetime, datetime]
+
+
+def get_redis_client() -> RedisCluster | StrictRedis:
+    return redis_clusters.get(settings.SENTRY_DATA_EXPORT_REDIS_CLUSTER)
+
+
+def get_time_slices(group: Group, organization: Organization, count: int) -> list[TimeSlice]:
+    """
+    Splits the time range the events of the group may have been stored in, within the retention
+    of the organization, into `count` consecutive slices of equal length.
+    """
+    end = timezone.now() + timedelta(seconds=1)
+    expired, start = outside_retention_with_modified_start(
+        group.first_seen - FIRST_SEEN_LEEWAY, end, organization
+    )
+    if expired:
+        raise ExportError("Invalid date range. Please try a more recent date range.")
+
+    length = (end - start) / count
+    bounds = [start + length * index for index in range(count)] + [end]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def store(data_export_id: int, index: int, tag_values: Sequence[GroupTagValue]) -> None:
+    if not tag_values:
+        return
+
+    key = SLICE_KEY.format(data_export_id=data_export_id, index=index)
+    with get_redis_client().pipeline(transaction=False) as pipeline:
+        pipeline.hset(
+            key,
+            mapping={
+                tag_value.value: json.dumps(
+                    [
+                        tag_value.times_seen,
+                        tag_value.first_seen.isoformat(),
+                        tag_value.last_seen.isoformat(),
+                    ]
+                )
+                for tag_value in tag_values
+            },
+        )
+        pipeline.expire(key, KEY_TTL)
+        pipeline.execute()
+
+
+def clear_slice(data_export_id: int, index: int) -> None:
+    get_redis_client().delete(SLICE_KEY.format(data_export_id=data_export_id, index=index))
+
+
+def complete(data_export_id: int) -> int:
+    """
+    Counts a slice of the export as completed and returns the number of completed slices.
+    """
+    key = COMPLETED_KEY.format(data_export_id=data_export_id)
+    with get_redis_client().pipeline(transaction=False) as pipeline:
+        pipeline.incr(key)
+        pipeline.expire(key, KEY_TTL)
+        completed, _ = pipeline.execute()
+    return int(completed)
+
+
+def fail(data_export_id: int) -> bool:
+    """
+    Marks the export as failed, returns whether it was the first slice to fail.
+    """
+    key = FAILED_KEY.format(data_export_id=data_export_id)
+    return bool(get_redis_client().set(key, 1, ex=KEY_TTL, nx=True))
+
+
+def has_failed(data_export_id: int) -> bool:
+    return bool(get_redis_client().exists(FAILED_KEY.format(data_export_id=data_export_id)))
+
+
+def merge(data_export_id: int, count: int, group: Group, key: str) -> list[GroupTagValue]:
+    """
+    Returns the tag values of all slices of the export ordered by first seen, most recent first,
+    like `get_group_tag_value_iter` orders them.
+    """
+    client = get_redis_client()
+    merged: dict[str, list] = {}
+    # Later slices only ever move the last seen date of a value.
+    for index in range(count):
+        for value, data in client.hscan_iter(
+            SLICE_KEY.format(data_export_id=data_export_id, index=index), count=1000
+        ):
+            if isinstance(value, bytes):
+                value = value.decode()
+            times_seen, first_seen, last_seen = json.loads(data)
+            if value in merged:
+                merged[value][0] += times_seen
+                merged[value][2] = last_seen
+            else:
+                merged[value] = [times_seen, first_seen, last_seen]
+
+    tag_values = [
+        GroupTagValue(
+            group_id=group.id,
+            key=key,
+            value=value,
+            times_seen=times_seen,
+            first_seen=parse_datetime(first_seen),
+            last_seen=parse_datetime(last_seen),
+        )
+        for value, (times_seen, first_seen, last_seen) in merged.items()
+    ]
+    tag_values.sort(key=lambda tag_value: tag_value.first_seen, reverse=True)
+    return tag_values
+
+
+def clear(data_export_id: int, count: int) -> None:
+    """
+    Drops the slices of the export. Whether it failed is kept until it expires, so that the
+    slices still running after a failure don't store anything.
+    """
+    with get_redis_client().pipeline(transaction=False) as pipeline:
+        for index in range(count):
+            pipeline.delete(SLICE_KEY.format(data_export_id=data_export_id, index=index))
+        pipeline.delete(COMPLETED_KEY.format(data_export_id=data_export_id))
+        pipeline.execute()
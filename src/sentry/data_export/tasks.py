@@ -1,16 +1,21 @@
+import atexit
 import codecs
 import csv
+import io
 import logging
-import tempfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from hashlib import sha1
+from typing import Any
 
 import sentry_sdk
 from celery import current_task
 from celery.exceptions import MaxRetriesExceededError
 from django.core.files.base import ContentFile
-from django.db import IntegrityError, router
+from django.db import IntegrityError, close_old_connections, router
 from django.utils import timezone
 
+from sentry import options
 from sentry.models.files.file import File
 from sentry.models.files.fileblob import FileBlob
 from sentry.models.files.fileblobindex import FileBlobIndex
@@ -21,6 +26,7 @@ from sentry.utils import metrics
 from sentry.utils.db import atomic_transaction
 from sentry.utils.sdk import capture_exception
 
+from . import slices
 from .base import (
     EXPORTED_ROWS_LIMIT,
     MAX_BATCH_SIZE,
@@ -36,6 +42,10 @@ from .utils import handle_snuba_errors
 
 logger = logging.getLogger(__name__)
 
+_export_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="data-export")
+
+atexit.register(_export_pool.shutdown, False)
+
 
 @instrumented_task(
     name="sentry.data_export.tasks.assemble_download",
@@ -83,6 +93,7 @@ def assemble_download(
             scope.set_extra("export.query", data_export.query_info)
 
         base_bytes_written = bytes_written
+        blob_writer = None
 
         try:
             # ensure that the export limit is set and capped at EXPORTED_ROWS_LIMIT
@@ -93,38 +104,41 @@ def assemble_download(
 
             processor = get_processor(data_export, environment_id)
 
-            with tempfile.TemporaryFile(mode="w+b") as tf:
-                # XXX(python3):
-                #
-                # In python3 we write unicode strings (which is all the csv
-                # module is able to do, it will NOT write bytes like in py2).
-                # Because of this we use the codec getwriter to transform our
-                # file handle to a stream writer that will encode to utf8.
-                tfw = codecs.getwriter("utf-8")(tf)
-
-                writer = csv.DictWriter(
-                    tfw, processor.header_fields, escapechar="\\", extrasaction="ignore"
-                )
-                if first_page:
-                    writer.writeheader()
-
-                # the position in the file at the end of the headers
-                starting_pos = tf.tell()
+            if first_page and should_slice(data_export):
+                start_sliced_export(data_export, processor, export_limit, environment_id)
+                return
+
+            blob_writer = ExportBlobWriter(data_export, bytes_written)
+            # XXX(python3):
+            #
+            # In python3 we write unicode strings (which is all the csv
+            # module is able to do, it will NOT write bytes like in py2).
+            # Because of this we use the codec getwriter to transform our
+            # file handle to a stream writer that will encode to utf8.
+            writer = csv.DictWriter(
+                codecs.getwriter("utf-8")(blob_writer),
+                processor.header_fields,
+                escapechar="\\",
+                extrasaction="ignore",
+            )
+            if first_page:
+                writer.writeheader()
 
-                # the row offset relative to the start of the current task
-                # this offset tells you the number of rows written during this batch fragment
-                fragment_offset = 0
+            # the position in the file at the end of the headers
+            starting_pos = blob_writer.tell()
 
-                # the absolute row offset from the beginning of the export
-                next_offset = offset + fragment_offset
+            # the row offset relative to the start of the current task
+            # this offset tells you the number of rows written during this batch fragment
+            fragment_offset = 0
 
-                rows = []
+            # the absolute row offset from the beginning of the export
+            next_offset = offset + fragment_offset
 
-                for _ in range(MAX_FRAGMENTS_PER_BATCH):
-                    # the number of rows to export in the next batch fragment
-                    fragment_row_count = min(batch_size, max(export_limit - next_offset, 1))
+            rows = []
 
-                    rows = process_rows(processor, data_export, fragment_row_count, next_offset)
+            fragments = iter_fragments(processor, data_export, batch_size, offset, export_limit)
+            try:
+                for rows in fragments:
                     writer.writerows(rows)
 
                     fragment_offset += len(rows)
@@ -134,14 +148,18 @@ def assemble_download(
                         not rows
                         or len(rows) < batch_size
                         # the batch may exceed MAX_BATCH_SIZE but immediately stops
-                        or tf.tell() - starting_pos >= MAX_BATCH_SIZE
+                        or blob_writer.tell() - starting_pos >= MAX_BATCH_SIZE
+                        or blob_writer.too_big
                     ):
                         break
+            finally:
+                fragments.close()
 
-                tf.seek(0)
-                new_bytes_written = store_export_chunk_as_blob(data_export, bytes_written, tf)
-                bytes_written += new_bytes_written
+            new_bytes_written = blob_writer.close()
+            bytes_written += new_bytes_written
         except ExportError as error:
+            if blob_writer is not None:
+                blob_writer.discard()
             if error.recoverable and export_retries > 0:
                 assemble_download.apply_async(
                     args=[data_export_id],
@@ -165,6 +183,8 @@ def assemble_download(
                 extra={"query": data_export.payload, "org": data_export.organization_id},
             )
             capture_exception(error)
+            if blob_writer is not None:
+                blob_writer.discard()
 
             try:
                 current_task.retry()
@@ -202,6 +222,202 @@ def assemble_download(
                 merge_export_blobs.delay(data_export_id)
 
 
+def should_slice(data_export):
+    return (
+        data_export.query_type == ExportQueryType.ISSUES_BY_TAG
+        and options.get("data-export.issues-by-tag.time-slices") > 1
+    )
+
+
+def start_sliced_export(data_export, processor, export_limit, environment_id):
+    """
+    Splits an issues-by-tag export into time slices that are aggregated in parallel, see
+    `sentry.data_export.slices`.
+    """
+    time_slices = slices.get_time_slices(
+        processor.group,
+        data_export.organization,
+        options.get("data-export.issues-by-tag.time-slices"),
+    )
+    data_export.set_progress(0, len(time_slices))
+    for index, (start, end) in enumerate(time_slices):
+        assemble_issues_by_tag_slice.delay(
+            data_export.id,
+            index=index,
+            count=len(time_slices),
+            start=start,
+            end=end,
+            export_limit=export_limit,
+            environment_id=environment_id,
+        )
+
+
+@instrumented_task(
+    name="sentry.data_export.tasks.assemble_issues_by_tag_slice",
+    queue="data_export",
+    default_retry_delay=60,
+    max_retries=3,
+    acks_late=True,
+    silo_mode=SiloMode.REGION,
+)
+def assemble_issues_by_tag_slice(
+    data_export_id,
+    index,
+    count,
+    start,
+    end,
+    export_limit=EXPORTED_ROWS_LIMIT,
+    batch_size=SNUBA_MAX_RESULTS,
+    environment_id=None,
+    export_retries=3,
+    countdown=60,
+    **kwargs,
+):
+    with sentry_sdk.start_span(op="assemble.slice"):
+        try:
+            data_export = ExportedData.objects.get(id=data_export_id)
+        except ExportedData.DoesNotExist as error:
+            logger.exception(str(error))
+            return
+
+        if slices.has_failed(data_export_id):
+            return
+
+        logger.info("dataexport.slice", extra={"data_export_id": data_export_id, "slice": index})
+
+        try:
+            processor = get_processor(data_export, environment_id)
+
+            offset = 0
+            while offset < export_limit:
+                rows = fetch_issues_by_tag(
+                    processor, min(batch_size, export_limit - offset), offset, start, end
+                )
+                slices.store(data_export_id, index, rows)
+                offset += len(rows)
+                if len(rows) < batch_size:
+                    break
+        except ExportError as error:
+            slices.clear_slice(data_export_id, index)
+            if error.recoverable and export_retries > 0:
+                assemble_issues_by_tag_slice.apply_async(
+                    args=[data_export_id],
+                    kwargs={
+                        "index": index,
+                        "count": count,
+                        "start": start,
+                        "end": end,
+                        "export_limit": export_limit,
+                        "batch_size": batch_size // 2,
+                        "environment_id": environment_id,
+                        "export_retries": export_retries - 1,
+                    },
+                    countdown=countdown,
+                )
+            else:
+                fail_sliced_export(data_export, count, str(error))
+        except Exception as error:
+            metrics.incr("dataexport.error", tags={"error": str(error)}, sample_rate=1.0)
+            logger.exception(
+                "dataexport.error: %s",
+                str(error),
+                extra={"query": data_export.payload, "org": data_export.organization_id},
+            )
+            capture_exception(error)
+            slices.clear_slice(data_export_id, index)
+
+            try:
+                current_task.retry()
+            except MaxRetriesExceededError:
+                fail_sliced_export(data_export, count, "Internal processing failure")
+        else:
+            completed = slices.complete(data_export_id)
+            data_export.set_progress(completed, count)
+            if completed == count:
+                merge_issues_by_tag_slices.delay(
+                    data_export_id,
+                    count=count,
+                    export_limit=export_limit,
+                    environment_id=environment_id,
+                )
+
+
+def fail_sliced_export(data_export, count, message):
+    # Only the first slice to fail lets the user know, the other ones stop once they see it.
+    if slices.fail(data_export.id):
+        metrics.incr("dataexport.end", tags={"success": False, "error": message}, sample_rate=1.0)
+        slices.clear(data_export.id, count)
+        data_export.email_failure(message=message)
+
+
+@instrumented_task(
+    name="sentry.data_export.tasks.merge_issues_by_tag_slices",
+    queue="data_export",
+    acks_late=True,
+    silo_mode=SiloMode.REGION,
+)
+def merge_issues_by_tag_slices(
+    data_export_id, count, export_limit=EXPORTED_ROWS_LIMIT, environment_id=None, **kwargs
+):
+    with sentry_sdk.start_span(op="assemble.merge_slices"):
+        try:
+            data_export = ExportedData.objects.get(id=data_export_id)
+        except ExportedData.DoesNotExist as error:
+            logger.exception(str(error))
+            return
+
+        bytes_written = 0
+        try:
+            processor = get_processor(data_export, environment_id)
+            tag_values = slices.merge(data_export_id, count, processor.group, processor.lookup_key)[
+                :export_limit
+            ]
+
+            # Rows are written in batches like `assemble_download` writes them, a batch that
+            # would make the file too big is dropped together with the ones after it.
+            for batch_start in range(0, max(len(tag_values), 1), SNUBA_MAX_RESULTS):
+                batch = tag_values[batch_start : batch_start + SNUBA_MAX_RESULTS]
+                for callback in processor.callbacks:
+                    callback(batch)
+
+                blob_writer = ExportBlobWriter(data_export, bytes_written)
+                writer = csv.DictWriter(
+                    codecs.getwriter("utf-8")(blob_writer),
+                    processor.header_fields,
+                    escapechar="\\",
+                    extrasaction="ignore",
+                )
+                if batch_start == 0:
+                    writer.writeheader()
+                writer.writerows(processor.serialize_row(item, processor.key) for item in batch)
+
+                new_bytes_written = blob_writer.close()
+                if not new_bytes_written:
+                    break
+                bytes_written += new_bytes_written
+        except ExportError as error:
+            ExportedDataBlob.objects.filter(data_export=data_export).delete()
+            return data_export.email_failure(message=str(error))
+        except Exception as error:
+            metrics.incr("dataexport.error", tags={"error": str(error)}, sample_rate=1.0)
+            logger.exception(
+                "dataexport.error: %s",
+                str(error),
+                extra={"query": data_export.payload, "org": data_export.organization_id},
+            )
+            capture_exception(error)
+            ExportedDataBlob.objects.filter(data_export=data_export).delete()
+            return data_export.email_failure(message="Internal processing failure")
+        else:
+            metrics.distribution("dataexport.row_count", len(tag_values), sample_rate=1.0)
+            metrics.distribution(
+                "dataexport.file_size", bytes_written, sample_rate=1.0, unit="byte"
+            )
+            merge_export_blobs.delay(data_export_id)
+        finally:
+            slices.clear(data_export_id, count)
+
+
 def get_processor(data_export, environment_id):
     try:
         if data_export.query_type == ExportQueryType.ISSUES_BY_TAG:
@@ -238,28 +454,184 @@ def process_rows(processor, data_export, batch_size, offset):
             raise ExportError(f"No processor found for this query type: {data_export.query_type}")
         return rows
     except ExportError as error:
-        error_str = str(error)
-        metrics.incr("dataexport.error", tags={"error": error_str}, sample_rate=1.0)
-        logger.info("dataexport.error: %s", error_str)
-        capture_exception(error)
+        record_export_error(error)
         raise
 
 
+def record_export_error(error):
+    error_str = str(error)
+    metrics.incr("dataexport.error", tags={"error": error_str}, sample_rate=1.0)
+    logger.info("dataexport.error: %s", error_str)
+    capture_exception(error)
+
+
+def iter_fragments(processor, data_export, batch_size, offset, export_limit):
+    """
+    Yields the rows of up to `MAX_FRAGMENTS_PER_BATCH` consecutive batch fragments of an export,
+    starting at `offset`. The fragments of discover exports are fetched from Snuba up to
+    `data-export.concurrent-fetches` at a time, and yielded in order.
+    """
+    concurrency = options.get("data-export.concurrent-fetches")
+    if data_export.query_type != ExportQueryType.DISCOVER or concurrency <= 1:
+        next_offset = offset
+        for _ in range(MAX_FRAGMENTS_PER_BATCH):
+            # the number of rows to export in the next batch fragment
+            fragment_row_count = min(batch_size, max(export_limit - next_offset, 1))
+            rows = process_rows(processor, data_export, fragment_row_count, next_offset)
+            yield rows
+            next_offset += len(rows)
+        return
+
+    # Any fragment shorter than the batch size ends the batch, so the fragments ahead start
+    # where the full fragments before them end.
+    fragments = []
+    for index in range(MAX_FRAGMENTS_PER_BATCH):
+        fragment_offset = offset + index * batch_size
+        fragment_row_count = min(batch_size, max(export_limit - fragment_offset, 1))
+        fragments.append((fragment_row_count, fragment_offset))
+        if fragment_row_count < batch_size:
+            break
+
+    pending = iter(fragments)
+    futures: deque[Future[list[dict[str, Any]]]] = deque()
+
+    def submit_next():
+        for limit, fragment_offset in pending:
+            futures.append(
+                _export_pool.submit(
+                    _fetch_discover_rows,
+                    sentry_sdk.Scope.get_isolation_scope().fork(),
+                    sentry_sdk.Scope.get_current_scope().fork(),
+                    processor,
+                    limit,
+                    fragment_offset,
+                )
+            )
+            return
+
+    try:
+        for _ in range(concurrency):
+            submit_next()
+
+        while futures:
+            try:
+                raw_data_unicode = futures.popleft().result()
+            except ExportError as error:
+                record_export_error(error)
+                raise
+            submit_next()
+            yield processor.handle_fields(raw_data_unicode)
+    finally:
+        # the batch stopped early, the rows ahead are fetched again by the next task
+        for future in futures:
+            future.cancel()
+
+
+def _fetch_discover_rows(isolation_scope, current_scope, processor, limit, offset):
+    with sentry_sdk.scope.use_isolation_scope(isolation_scope):
+        with sentry_sdk.scope.use_scope(current_scope):
+            # Django connections are thread local, the thread queries over a connection of its
+            # own. Close it when it's broken or past its max age like a task would.
+            close_old_connections()
+            try:
+                return fetch_discover(processor, limit, offset)
+            finally:
+                close_old_connections()
+
+
 @handle_snuba_errors(logger)
 def process_issues_by_tag(processor, limit, offset):
     return processor.get_serialized_data(limit=limit, offset=offset)
 
 
+@handle_snuba_errors(logger)
+def fetch_issues_by_tag(processor, limit, offset, start, end):
+    # The users of the values are attached to the merged rows instead of each slice's.
+    return processor.get_raw_data(limit=limit, offset=offset, start=start, end=end, callbacks=())
+
+
 @handle_snuba_errors(logger)
 def process_discover(processor, limit, offset):
     raw_data_unicode = processor.data_fn(limit=limit, offset=offset)["data"]
     return processor.handle_fields(raw_data_unicode)
 
 
+@handle_snuba_errors(logger)
+def fetch_discover(processor, limit, offset):
+    return processor.data_fn(limit=limit, offset=offset)["data"]
+
+
 class ExportDataFileTooBig(Exception):
     pass
 
 
+class ExportBlobWriter:
+    """
+    A writable file object that stores what's written to it as the blobs of an export as soon
+    as a full blob is buffered, so that at most one blob is held in memory at a time.
+
+    Stored blobs are committed right away. A task that fails after storing some of them has to
+    `discard` them before it is retried, otherwise they'd overlap with the retry's blobs.
+    """
+
+    def __init__(self, data_export, bytes_written, blob_size=DEFAULT_BLOB_SIZE):
+        self.data_export = data_export
+        self.base_bytes_written = bytes_written
+        self.blob_size = blob_size
+        self.stored = 0
+        self.buffer = io.BytesIO()
+        # set once the export would exceed the maximum file size, see `store_export_chunk_as_blob`
+        self.too_big = False
+
+    def write(self, data):
+        if not self.too_big:
+            self.buffer.write(data)
+            if self.buffer.tell() >= self.blob_size:
+                self._store(final=False)
+        return len(data)
+
+    def tell(self):
+        return self.stored + self.buffer.tell()
+
+    def close(self):
+        """
+        Stores the rest of the buffer and returns the number of bytes stored, which is 0 when
+        the export became too big.
+        """
+        if not self.too_big:
+            self._store(final=True)
+        return 0 if self.too_big else self.stored
+
+    def discard(self):
+        ExportedDataBlob.objects.filter(
+            data_export=self.data_export, offset__gte=self.base_bytes_written
+        ).delete()
+        self.stored = 0
+        self.buffer = io.BytesIO()
+
+    def _store(self, final):
+        contents = self.buffer.getvalue()
+        size = len(contents) if final else len(contents) - len(contents) % self.blob_size
+        if not size:
+            return
+
+        stored = store_export_chunk_as_blob(
+            self.data_export,
+            self.base_bytes_written + self.stored,
+            io.BytesIO(contents[:size]),
+            blob_size=self.blob_size,
+        )
+        if not stored:
+            # Like a batch that doesn't fit, everything this task stored is dropped.
+            self.too_big = True
+            self.discard()
+            return
+
+        self.stored += stored
+        self.buffer = io.BytesIO()
+        self.buffer.write(contents[size:])
+
+
 def store_export_chunk_as_blob(data_export, bytes_written, fileobj, blob_size=DEFAULT_BLOB_SIZE):
     try:
         with atomic_transaction(
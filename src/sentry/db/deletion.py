@@ -1,14 +1,38 @@
 from __future__ import annotations
 
+import copy
 import itertools
+import time
 from collections.abc import Generator
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Any
 from uuid import uuid4
 
 from django.db import connections, router
+from django.db.models import Min
 from django.utils import timezone
 
+# The bounds of the number of rows deleted at once when the chunk size is adjusted to the
+# duration of the deletes.
+MIN_CHUNK_SIZE = 100
+MAX_CHUNK_SIZE = 100000
+
+# The duration in seconds chunks of deletes are sized for when the chunk size is adjusted.
+TARGET_CHUNK_DURATION = 1.0
+
+
+def get_next_chunk_size(chunk_size: int, duration: float, target_duration: float) -> int:
+    """
+    Returns the size of the next chunk from the size and duration of the previous one, scaling it
+    towards ``target_duration`` while at most halving or doubling it at a time.
+    """
+    if duration <= 0:
+        scaled = chunk_size * 2
+    else:
+        scaled = int(chunk_size * target_duration / duration)
+    scaled = max(chunk_size // 2, min(scaled, chunk_size * 2))
+    return max(MIN_CHUNK_SIZE, min(scaled, MAX_CHUNK_SIZE))
+
 
 class BulkDeleteQuery:
     def __init__(self, model, project_id=None, dtfield=None, days=None, order_by=None):
@@ -18,61 +42,121 @@ class BulkDeleteQuery:
         self.days = int(days) if days is not None else None
         self.order_by = order_by
         self.using = router.db_for_write(model)
-
-    def execute(self, chunk_size=10000):
+        # The range of the date field a deletion is restricted to when it was split.
+        self.bounds: tuple[datetime, datetime] | None = None
+
+    def execute(self, chunk_size=10000, target_duration: float | None = None) -> int:
+        """
+        Deletes the matching rows in chunks of ``chunk_size`` and returns the number of deleted
+        rows. Unless the rows are deleted in a custom order, each chunk continues from the last
+        key of the previous one instead of scanning past the rows deleted before it again. When
+        ``target_duration`` is given, the size of each chunk is adjusted from the duration of the
+        previous one so that chunks take about that many seconds.
+        """
         quote_name = connections[self.using].ops.quote_name
 
-        where = []
+        where: list[tuple[str, list[Any]]] = []
         if self.dtfield and self.days is not None:
-            where.append(
-                "{} < '{}'::timestamptz".format(
-                    quote_name(self.dtfield),
-                    (timezone.now() - timedelta(days=self.days)).isoformat(),
-                )
-            )
+            lower, upper = self.bounds or (None, timezone.now() - timedelta(days=self.days))
+            if lower is not None:
+                where.append((f"{quote_name(self.dtfield)} >= %s", [lower]))
+            where.append((f"{quote_name(self.dtfield)} < %s", [upper]))
         if self.project_id:
-            where.append(f"project_id = {self.project_id}")
-
-        if where:
-            where_clause = "where {}".format(" and ".join(where))
+            where.append(("project_id = %s", [self.project_id]))
+
+        # The rows are deleted in the order of their key, which is the date field (with the id
+        # breaking ties) when there is one.
+        key_fields: list[str] = []
+        order_clause = ""
+        if not self.order_by or self.order_by == self.dtfield:
+            if self.dtfield and self.days is not None:
+                key_fields.append(quote_name(self.dtfield))
+            key_fields.append("id")
+            order_clause = "order by {}".format(", ".join(key_fields))
+        elif self.order_by[0] == "-":
+            order_clause = f"order by {quote_name(self.order_by[1:])} desc"
         else:
-            where_clause = ""
+            order_clause = f"order by {quote_name(self.order_by)} asc"
 
-        if self.order_by:
-            if self.order_by[0] == "-":
-                direction = "desc"
-                order_field = self.order_by[1:]
-            else:
-                direction = "asc"
-                order_field = self.order_by
-            order_clause = f"order by {quote_name(order_field)} {direction}"
-        else:
-            order_clause = ""
-
-        query = """
-            delete from {table}
-            where id = any(array(
-                select id
-                from {table}
-                {where}
-                {order}
-                limit {chunk_size}
-            ));
-        """.format(
-            table=self.model._meta.db_table,
-            chunk_size=chunk_size,
-            where=where_clause,
-            order=order_clause,
-        )
-
-        return self._continuous_query(query)
-
-    def _continuous_query(self, query):
-        results = True
+        deleted = 0
+        position: tuple[Any, ...] | None = None
         cursor = connections[self.using].cursor()
-        while results:
-            cursor.execute(query)
-            results = cursor.rowcount > 0
+        while True:
+            conditions = list(where)
+            if position is not None:
+                if len(key_fields) > 1:
+                    # The condition on the date field alone is what lets the index on it be used.
+                    conditions.append((f"{key_fields[0]} >= %s", [position[0]]))
+                    conditions.append(
+                        ("({}) > (%s, %s)".format(", ".join(key_fields)), [*position])
+                    )
+                else:
+                    conditions.append(("id > %s", [position[0]]))
+
+            if conditions:
+                where_clause = "where {}".format(" and ".join(c for c, _ in conditions))
+            else:
+                where_clause = ""
+            parameters = list(itertools.chain.from_iterable(p for _, p in conditions))
+
+            query = """
+                delete from {table}
+                where id = any(array(
+                    select id
+                    from {table}
+                    {where}
+                    {order}
+                    limit {chunk_size}
+                ))
+                {returning};
+            """.format(
+                table=self.model._meta.db_table,
+                chunk_size=chunk_size,
+                where=where_clause,
+                order=order_clause,
+                returning="returning {}".format(", ".join(key_fields)) if key_fields else "",
+            )
+
+            started = time.monotonic()
+            cursor.execute(query, parameters)
+            rows = cursor.fetchall() if key_fields else None
+            duration = time.monotonic() - started
+
+            if cursor.rowcount <= 0:
+                break
+            deleted += cursor.rowcount
+            if rows:
+                position = max(rows)
+            if target_duration is not None:
+                chunk_size = get_next_chunk_size(chunk_size, duration, target_duration)
+
+        return deleted
+
+    def split(self, count: int) -> list[BulkDeleteQuery]:
+        """
+        Splits the deletion into up to ``count`` deletions of consecutive ranges of the date
+        field, which can be executed concurrently.
+        """
+        if count <= 1 or not self.dtfield or self.days is None or self.bounds is not None:
+            return [self]
+
+        cutoff = timezone.now() - timedelta(days=self.days)
+        queryset = self.model.objects.using(self.using).filter(**{f"{self.dtfield}__lt": cutoff})
+        if self.project_id:
+            queryset = queryset.filter(project_id=self.project_id)
+        oldest = queryset.aggregate(oldest=Min(self.dtfield))["oldest"]
+        if oldest is None:
+            return [self]
+
+        step = (cutoff - oldest) / count
+        bounds = [oldest + step * i for i in range(count)] + [cutoff]
+
+        queries = []
+        for lower, upper in zip(bounds, bounds[1:]):
+            query = copy.copy(self)
+            query.bounds = (lower, upper)
+            queries.append(query)
+        return queries
 
     def iterator(self, chunk_size=100, batch_size=100000) -> Generator[tuple[int, ...], None, None]:
         assert self.days is not None
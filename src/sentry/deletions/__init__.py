@@ -45,6 +45,14 @@ deletion task. Doing so requires a few steps:
 1. Add your deletion task subclass to `sentry.deletions.defaults`
 2. Add your deletion task to the default manager mapping in `sentry.deletions.__init__`.
 
+Parallel Deletions
+------------------
+
+Child relations with many rows (such as the groups of a project) can be deleted in parallel shards
+by listing their model in the ``deletions.parallel.models`` option and setting
+``deletions.parallel.num-shards``. The scheduled deletion then polls the shards of the relation
+instead of deleting it itself, see ``sentry.deletions.shards``.
+
 Undoing Deletions
 -----------------
 
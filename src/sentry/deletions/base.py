@@ -12,9 +12,18 @@ from sentry.utils.query import bulk_delete_objects
 _leaf_re = re.compile(r"^(UserReport|Event|Group)(.+)")
 
 
-def _delete_children(manager, relations, transaction_id=None, actor_id=None):
+def _delete_children(manager, relations, transaction_id=None, actor_id=None, parallel=False):
+    from sentry.deletions import shards
+
     # Ideally this runs through the deletion manager
     for relation in relations:
+        # Relations deleted in parallel shards are polled until all of their
+        # shards are done, returning to the caller to be called again later.
+        if parallel and shards.is_parallel(manager, relation, transaction_id):
+            if shards.delete_relation(manager, relation, transaction_id, actor_id):
+                return True
+            continue
+
         task = manager.get(
             transaction_id=transaction_id,
             actor_id=actor_id,
@@ -59,13 +68,23 @@ class BaseDeletionTask:
     DEFAULT_CHUNK_SIZE = 100
 
     def __init__(
-        self, manager, skip_models=None, transaction_id=None, actor_id=None, chunk_size=None
+        self,
+        manager,
+        skip_models=None,
+        transaction_id=None,
+        actor_id=None,
+        chunk_size=None,
+        parallel=False,
     ):
         self.manager = manager
         self.skip_models = set(skip_models) if skip_models else None
         self.transaction_id = transaction_id
         self.actor_id = actor_id
         self.chunk_size = chunk_size if chunk_size is not None else self.DEFAULT_CHUNK_SIZE
+        # Whether child relations may be deleted in parallel shards (see
+        # `sentry.deletions.shards`). Only tasks that are rescheduled while
+        # `chunk` returns True can wait for the shards to complete.
+        self.parallel = parallel
 
     def __repr__(self):
         return "<{}: skip_models={} transaction_id={} actor_id={}>".format(
@@ -151,7 +170,9 @@ class BaseDeletionTask:
             self.delete_instance(instance)
 
     def delete_children(self, relations):
-        return _delete_children(self.manager, relations, self.transaction_id, self.actor_id)
+        return _delete_children(
+            self.manager, relations, self.transaction_id, self.actor_id, self.parallel
+        )
 
     def mark_deletion_in_progress(self, instance_list):
         pass
@@ -143,7 +143,9 @@ class GroupDeletionTask(ModelDeletionTask):
                 BaseRelation(params={"groups": instance_list}, task=EventDataDeletionTask)
             )
 
-        self.delete_children(child_relations)
+        has_more = self.delete_children(child_relations)
+        if has_more:
+            return has_more
 
         # Remove group objects with children removed.
         return self.delete_instance_bulk(instance_list)
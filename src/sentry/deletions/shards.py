@@ -0,0 +1,196 @@
+"""
+Progress of child relations that are deleted in parallel.
+
+Deleting the child relations of a large project or organization one after the other can take
+days, most of it spent on a few relations with many rows such as groups. A relation listed in
+``deletions.parallel.models`` is instead split into ``deletions.parallel.num-shards`` shards by id,
+and each shard is deleted by a task of its own. The progress of the shards of a relation is kept
+in a Redis hash per deletion and relation:
+
+    {"<shard_id>": "<dispatch token>:<timestamp of the last chunk>" | "done"}
+
+The task deleting the parent polls the progress, and only moves on to the next relation once all
+shards of a relation are done. A shard that didn't report progress within ``SHARD_LEASE`` is
+assumed to be lost (e.g. with a restarted worker, or a backed up queue) and is dispatched again
+with a new token, which is safe since deleting a shard is idempotent. The tasks of a shard carry
+the token they were dispatched with and stop once it was replaced, so that a shard is only ever
+deleted by one chain of tasks.
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from collections.abc import Iterable
+
+from django.conf import settings
+from sentry_redis_tools.clients import RedisCluster, StrictRedis
+
+from sentry import options
+from sentry.utils import json
+from sentry.utils.hashlib import md5_text
+from sentry.utils.redis import load_redis_script, redis_clusters
+
+from .base import BaseRelation, BulkModelDeletionTask, ModelDeletionTask
+
+KEY = "deletions.shards:{transaction_id}:{relation_key}"
+KEY_TTL = 7 * 24 * 60 * 60
+DONE = "done"
+
+# How long a shard may go without completing a chunk before it's dispatched again.
+SHARD_LEASE = 60 * 60
+
+# The longest a shard pauses between two chunks.
+MAX_THROTTLE_DELAY = 5 * 60
+
+renew_shard_lease = load_redis_script("deletions/renew_shard_lease.lua")
+
+
+def get_redis_client() -> RedisCluster | StrictRedis:
+    return redis_clusters.get(settings.SENTRY_DELETIONS_REDIS_CLUSTER)
+
+
+def get_relation_key(relation: BaseRelation) -> str:
+    model = relation.params["model"]
+    return md5_text(
+        json.dumps([model._meta.label, relation.params["query"]], sort_keys=True, default=str)
+    ).hexdigest()
+
+
+def is_parallel(manager, relation: BaseRelation, transaction_id: str | None) -> bool:
+    """
+    Whether the relation is deleted in parallel shards. Progress is tracked per deletion, so this
+    requires a transaction id, and the task deleting the relation needs to support sharding.
+    """
+    if transaction_id is None or options.get("deletions.parallel.num-shards") < 2:
+        return False
+
+    model = relation.params.get("model")
+    if model is None or model._meta.label not in options.get("deletions.parallel.models"):
+        return False
+
+    task = relation.task or manager.tasks.get(model, manager.default_task)
+    return issubclass(task, ModelDeletionTask) and not issubclass(task, BulkModelDeletionTask)
+
+
+def get_progress(transaction_id: str, relation_key: str) -> dict[int, str]:
+    key = KEY.format(transaction_id=transaction_id, relation_key=relation_key)
+    return {
+        int(shard_id): value.decode() if isinstance(value, bytes) else value
+        for shard_id, value in get_redis_client().hgetall(key).items()
+    }
+
+
+def mark_running(
+    transaction_id: str, relation_key: str, shard_ids: Iterable[int]
+) -> dict[int, str]:
+    """
+    Leases the shards to new dispatches, returning the token of the dispatch of each shard.
+    """
+    key = KEY.format(transaction_id=transaction_id, relation_key=relation_key)
+    now = time.time()
+    tokens = {shard_id: uuid.uuid4().hex for shard_id in shard_ids}
+    with get_redis_client().pipeline(transaction=False) as pipeline:
+        pipeline.hset(
+            key, mapping={str(shard_id): f"{token}:{now}" for shard_id, token in tokens.items()}
+        )
+        pipeline.expire(key, KEY_TTL)
+        pipeline.execute()
+    return tokens
+
+
+def renew(transaction_id: str, relation_key: str, shard_id: int, token: str) -> bool:
+    """
+    Renews the lease of the shard, returning ``False`` without changing it if the shard was
+    dispatched again since the dispatch of ``token``.
+    """
+    key = KEY.format(transaction_id=transaction_id, relation_key=relation_key)
+    return bool(
+        renew_shard_lease(
+            [key], [shard_id, token, f"{token}:{time.time()}", KEY_TTL], get_redis_client()
+        )
+    )
+
+
+def mark_done(transaction_id: str, relation_key: str, shard_id: int) -> None:
+    key = KEY.format(transaction_id=transaction_id, relation_key=relation_key)
+    with get_redis_client().pipeline(transaction=False) as pipeline:
+        pipeline.hset(key, str(shard_id), DONE)
+        pipeline.expire(key, KEY_TTL)
+        pipeline.execute()
+
+
+def clear(transaction_id: str, relation_key: str) -> None:
+    get_redis_client().delete(KEY.format(transaction_id=transaction_id, relation_key=relation_key))
+
+
+def get_lost_shards(progress: dict[int, str], num_shards: int) -> list[int]:
+    """
+    Returns the shards that were never dispatched, or that didn't complete a chunk within their
+    lease.
+    """
+    now = time.time()
+    return [
+        shard_id
+        for shard_id in range(num_shards)
+        if shard_id not in progress
+        or (
+            progress[shard_id] != DONE
+            and now - float(progress[shard_id].rpartition(":")[2]) > SHARD_LEASE
+        )
+    ]
+
+
+def get_throttle_delay(chunk_duration: float) -> float:
+    """
+    Returns how long a shard pauses after a chunk that took ``chunk_duration`` seconds. Shards
+    keep to a duty cycle of ``deletions.parallel.duty-cycle``, so the pauses grow with the time
+    the database takes to delete a chunk and a loaded database is given room to recover.
+    """
+    duty_cycle = options.get("deletions.parallel.duty-cycle")
+    if duty_cycle >= 1:
+        return 0
+    duty_cycle = max(duty_cycle, 0.01)
+    return min(chunk_duration * (1 - duty_cycle) / duty_cycle, MAX_THROTTLE_DELAY)
+
+
+def delete_relation(manager, relation: BaseRelation, transaction_id: str, actor_id=None) -> bool:
+    """
+    Dispatches the shards of the relation that are not running, and returns ``True`` while any
+    shard still has rows to delete.
+    """
+    from sentry.tasks.deletion.shards import delete_relation_shard
+
+    num_shards = options.get("deletions.parallel.num-shards")
+    relation_key = get_relation_key(relation)
+    progress = get_progress(transaction_id, relation_key)
+
+    if len(progress) >= num_shards and all(value == DONE for value in progress.values()):
+        model = relation.params["model"]
+        if not model.objects.filter(**relation.params["query"]).exists():
+            return False
+        # Rows were added after the shards completed, start over.
+        clear(transaction_id, relation_key)
+        progress = {}
+
+    lost_shards = get_lost_shards(progress, num_shards)
+    if lost_shards:
+        tokens = mark_running(transaction_id, relation_key, lost_shards)
+        for shard_id, token in tokens.items():
+            delete_relation_shard.apply_async(
+                kwargs={
+                    "model": relation.params["model"],
+                    "query": relation.params["query"],
+                    "task": relation.task,
+                    "transaction_id": transaction_id,
+                    "actor_id": actor_id,
+                    "relation_key": relation_key,
+                    "num_shards": num_shards,
+                    "shard_id": shard_id,
+                    "token": token,
+                }
+            )
+
+    # Shards may complete right away, e.g. when tasks run eagerly.
+    progress = get_progress(transaction_id, relation_key)
+    return not all(progress.get(shard_id) == DONE for shard_id in range(num_shards))
@@ -1,14 +1,18 @@
+import atexit
 import logging
 import time
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
-from typing import Any
+from typing import Any, TypeVar
 
 from rb.clients import LocalClient
 from redis.exceptions import ResponseError
 
+from sentry import options
 from sentry.digests import Record, ScheduleEntry
 from sentry.digests.backends.base import Backend, InvalidState
+from sentry.utils import metrics
 from sentry.utils.locking.backends.redis import RedisLockBackend
 from sentry.utils.locking.lock import Lock
 from sentry.utils.locking.manager import LockManager
@@ -19,6 +23,12 @@ logger = logging.getLogger("sentry.digests")
 
 script = load_redis_script("digests/digests.lua")
 
+T = TypeVar("T")
+
+_partition_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="digests-partition")
+
+atexit.register(_partition_pool.shutdown, False)
+
 
 class RedisBackend(Backend):
     """
@@ -141,6 +151,45 @@ class RedisBackend(Backend):
             )
         )
 
+    def __each_partition(
+        self, operation: str, function: Callable[[int], T], error_message: str
+    ) -> Iterator[T]:
+        """
+        Yields the result of calling ``function`` with each host of the cluster. The hosts are
+        called concurrently when ``digests.concurrent-partitions`` is enabled, in which case the
+        results are yielded in the order the hosts finish. Hosts that fail are logged and skipped.
+        """
+
+        def run(host: int) -> T:
+            start = time.monotonic()
+            try:
+                return function(host)
+            finally:
+                metrics.timing(
+                    f"digests.{operation}.partition_duration",
+                    time.monotonic() - start,
+                    tags={"host": str(host)},
+                )
+
+        if not options.get("digests.concurrent-partitions"):
+            for host in self.cluster.hosts:
+                try:
+                    result = run(host)
+                except Exception as error:
+                    logger.exception(error_message, host, error)
+                else:
+                    yield result
+            return
+
+        futures = {_partition_pool.submit(run, host): host for host in self.cluster.hosts}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as error:
+                logger.exception(error_message, futures[future], error)
+            else:
+                yield result
+
     def __schedule_partition(
         self, host: int, deadline: float, timestamp: float
     ) -> Iterable[tuple[bytes, float]]:
@@ -154,16 +203,13 @@ class RedisBackend(Backend):
         if timestamp is None:
             timestamp = time.time()
 
-        for host in self.cluster.hosts:
-            try:
-                for key, timestamp in self.__schedule_partition(host, deadline, timestamp):
-                    yield ScheduleEntry(key.decode("utf-8"), float(timestamp))
-            except Exception as error:
-                logger.exception(
-                    "Failed to perform scheduling for partition %s due to error: %s",
-                    host,
-                    error,
-                )
+        for response in self.__each_partition(
+            "schedule",
+            lambda host: self.__schedule_partition(host, deadline, timestamp),
+            "Failed to perform scheduling for partition %s due to error: %s",
+        ):
+            for key, entry_timestamp in response:
+                yield ScheduleEntry(key.decode("utf-8"), float(entry_timestamp))
 
     def __maintenance_partition(self, host: int, deadline: float, timestamp: float) -> Any:
         return script(
@@ -176,15 +222,12 @@ class RedisBackend(Backend):
         if timestamp is None:
             timestamp = time.time()
 
-        for host in self.cluster.hosts:
-            try:
-                self.__maintenance_partition(host, deadline, timestamp)
-            except Exception as error:
-                logger.exception(
-                    "Failed to perform maintenance on digest partition %s due to error: %s",
-                    host,
-                    error,
-                )
+        for _ in self.__each_partition(
+            "maintenance",
+            lambda host: self.__maintenance_partition(host, deadline, timestamp),
+            "Failed to perform maintenance on digest partition %s due to error: %s",
+        ):
+            pass
 
     @contextmanager
     def digest(
@@ -7,7 +7,7 @@ from collections import defaultdict, namedtuple
 from collections.abc import Mapping, MutableMapping, MutableSequence, Sequence
 from typing import Any
 
-from sentry import tsdb
+from sentry import eventstore, options, tsdb
 from sentry.digests import Digest, Record
 from sentry.eventstore.models import Event
 from sentry.models.group import Group, GroupStatus
@@ -23,6 +23,12 @@ Notification = namedtuple(
     "Notification", "event rules notification_uuid", defaults=(None, None, None)
 )
 
+# The compact form of a notification that only references its event, which is loaded from
+# nodestore when the digest is built rather than stored with the record.
+NotificationReference = namedtuple(
+    "NotificationReference", "event_id group_id rules notification_uuid", defaults=(None,)
+)
+
 
 def split_key(
     key: str,
@@ -67,11 +73,46 @@ def event_to_record(
     if not rules:
         logger.warning("Creating record for %s that does not contain any rules!", event)
 
-    return Record(
-        event.event_id,
-        Notification(event, [rule.id for rule in rules], notification_uuid),
-        event.datetime.timestamp(),
-    )
+    rule_ids = [rule.id for rule in rules]
+    # The occurrences of issue platform events aren't stored with them, so those events are
+    # always stored whole.
+    if options.get("digests.compact-records") and getattr(event, "occurrence", None) is None:
+        value = NotificationReference(event.event_id, event.group_id, rule_ids, notification_uuid)
+    else:
+        value = Notification(event, rule_ids, notification_uuid)
+
+    return Record(event.event_id, value, event.datetime.timestamp())
+
+
+def load_records(project: Project, records: Sequence[Record]) -> list[Record]:
+    """
+    Replaces the references of compact records with notifications of their events, which are
+    fetched from nodestore at once. Records whose event no longer exists are dropped.
+    """
+    events = {
+        record.key: Event(project.id, record.value.event_id, group_id=record.value.group_id)
+        for record in records
+        if isinstance(record.value, NotificationReference)
+    }
+    if not events:
+        return list(records)
+
+    eventstore.backend.bind_nodes(list(events.values()))
+
+    loaded = []
+    for record in records:
+        if isinstance(record.value, NotificationReference):
+            event = events[record.key]
+            if not event.data:
+                logger.debug("%s could not be associated with an event.", record)
+                continue
+            record = Record(
+                record.key,
+                Notification(event, record.value.rules, record.value.notification_uuid),
+                record.timestamp,
+            )
+        loaded.append(record)
+    return loaded
 
 
 def fetch_state(project: Project, records: Sequence[Record]) -> Mapping[str, Any]:
@@ -209,6 +250,7 @@ def build_digest(
     records: Sequence[Record],
     state: Mapping[str, Any] | None = None,
 ) -> tuple[Digest | None, Sequence[str]]:
+    records = load_records(project, records)
     if not records:
         return None, []
 
@@ -16,7 +16,7 @@ from sentry.models.projectownership import ProjectOwnership
 from sentry.models.rule import Rule
 from sentry.models.rulesnooze import RuleSnooze
 from sentry.notifications.types import ActionTargetType, FallthroughChoiceType
-from sentry.notifications.utils.participants import get_send_to
+from sentry.notifications.utils.participants import get_send_to_many
 from sentry.types.actor import Actor
 
 
@@ -140,20 +140,17 @@ def get_participants_by_event(
     fallthrough_choice: FallthroughChoiceType | None = None,
 ) -> Mapping[Event, Mapping[ExternalProviders, set[Actor]]]:
     """
-    This is probably the slowest part in sending digests because we do a lot of
-    DB calls while we iterate over every event. It would be great if we could
-    combine some queries.
+    This is probably the slowest part in sending digests because the owners of
+    every event are determined separately. The notification settings of all of
+    the owners are resolved at once.
     """
-    return {
-        event: get_send_to(
-            project=project,
-            target_type=target_type,
-            target_identifier=target_identifier,
-            event=event,
-            fallthrough_choice=fallthrough_choice,
-        )
-        for event in get_event_from_groups_in_digest(digest)
-    }
+    return get_send_to_many(
+        project=project,
+        target_type=target_type,
+        target_identifier=target_identifier,
+        events=get_event_from_groups_in_digest(digest),
+        fallthrough_choice=fallthrough_choice,
+    )
 
 
 def sort_records(records: Sequence[Record]) -> Sequence[Record]:
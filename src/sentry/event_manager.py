@@ -119,7 +119,7 @@ from sentry.signals import (
 from sentry.tasks.integrations import kick_off_status_syncs
 from sentry.tasks.process_buffer import buffer_incr
 from sentry.tasks.relay import schedule_invalidate_project_config
-from sentry.tsdb.base import TSDBModel
+from sentry.tsdb.base import IncrMultiOptions, TSDBModel
 from sentry.types.activity import ActivityType
 from sentry.types.group import GroupSubStatus, PriorityLevel
 from sentry.usage_accountant import record
@@ -1083,25 +1083,31 @@ def _get_or_create_group_release(
 
 def _tsdb_record_all_metrics(jobs: Sequence[Job]) -> None:
     """
-    Do all tsdb-related things for save_event in here s.t. we can potentially
-    put everything in a single redis pipeline someday.
+    Do all tsdb-related things for save_event in here s.t. the writes of all
+    jobs are batched together, instead of making a few round trips per event.
     """
 
     # XXX: validate whether anybody actually uses those metrics
 
+    # environment id -> counter increments, with the timestamp of their event
+    incrs: dict[int, list[tuple[TSDBModel, int, IncrMultiOptions]]] = {}
+    records = []
+    frequencies = []
     for job in jobs:
-        incrs = []
-        frequencies = []
-        records = []
-        incrs.append((TSDBModel.project, job["project_id"]))
         event = job["event"]
         release = job["release"]
         environment = job["environment"]
         user = job["user"]
 
+        options: IncrMultiOptions = {"timestamp": event.datetime, "count": 1}
+        job_incrs = incrs.setdefault(environment.id, [])
+        job_frequencies = []
+        job_records = []
+        job_incrs.append((TSDBModel.project, job["project_id"], options))
+
         for group_info in job["groups"]:
-            incrs.append((TSDBModel.group, group_info.group.id))
-            frequencies.append(
+            job_incrs.append((TSDBModel.group, group_info.group.id, options))
+            job_frequencies.append(
                 (
                     TSDBModel.frequent_environments_by_group,
                     {group_info.group.id: {environment.id: 1}},
@@ -1109,34 +1115,38 @@ def _tsdb_record_all_metrics(jobs: Sequence[Job]) -> None:
             )
 
             if group_info.group_release:
-                frequencies.append(
+                job_frequencies.append(
                     (
                         TSDBModel.frequent_releases_by_group,
                         {group_info.group.id: {group_info.group_release.id: 1}},
                     )
                 )
             if user:
-                records.append(
+                job_records.append(
                     (TSDBModel.users_affected_by_group, group_info.group.id, (user.tag_value,))
                 )
 
         if release:
-            incrs.append((TSDBModel.release, release.id))
+            job_incrs.append((TSDBModel.release, release.id, options))
 
         if user:
             project_id = job["project_id"]
-            records.append((TSDBModel.users_affected_by_project, project_id, (user.tag_value,)))
+            job_records.append((TSDBModel.users_affected_by_project, project_id, (user.tag_value,)))
 
-        if incrs:
-            tsdb.backend.incr_multi(incrs, timestamp=event.datetime, environment_id=environment.id)
+        if job_records:
+            records.append((job_records, event.datetime, environment.id))
 
-        if records:
-            tsdb.backend.record_multi(
-                records, timestamp=event.datetime, environment_id=environment.id
-            )
+        if job_frequencies:
+            frequencies.append((job_frequencies, event.datetime, None))
+
+    for environment_id, environment_incrs in incrs.items():
+        tsdb.backend.incr_multi(environment_incrs, environment_id=environment_id)
+
+    if records:
+        tsdb.backend.record_multi_batch(records)
 
-        if frequencies:
-            tsdb.backend.record_frequency_multi(frequencies, timestamp=event.datetime)
+    if frequencies:
+        tsdb.backend.record_frequency_multi_batch(frequencies)
 
 
 def _nodestore_save_many(jobs: Sequence[Job], app_feature: str) -> None:
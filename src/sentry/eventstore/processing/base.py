@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import MutableMapping
+from collections.abc import MutableMapping, Sequence
 from datetime import timedelta
 from typing import Any
 
@@ -45,15 +45,47 @@ class EventProcessingStore(Service):
         self.inner.set(key, event, self.timeout)
         return key
 
+    def store_many(self, events: Sequence[Event], unprocessed: bool = False) -> list[str]:
+        """
+        Store multiple events with as few round-trips to the backend as it
+        supports. Returns the keys in the same order as the given events.
+        """
+        keys = [cache_key_for_event(event) for event in events]
+        if unprocessed:
+            keys = [self.__get_unprocessed_key(key) for key in keys]
+        self.inner.set_many(list(zip(keys, events)), self.timeout)
+        return keys
+
     def get(self, key: str, unprocessed: bool = False) -> MutableMapping[str, Any] | None:
         if unprocessed:
             key = self.__get_unprocessed_key(key)
         return self.inner.get(key)
 
+    def get_many(
+        self, keys: Sequence[str], unprocessed: bool = False
+    ) -> dict[str, MutableMapping[str, Any]]:
+        """
+        Fetch multiple events by their keys. Missing events are omitted from
+        the result, which is keyed by the given (processed) keys.
+        """
+        if unprocessed:
+            lookup = {self.__get_unprocessed_key(key): key for key in keys}
+        else:
+            lookup = {key: key for key in keys}
+        return {lookup[key]: value for key, value in self.inner.get_many(list(lookup))}
+
     def delete_by_key(self, key: str) -> None:
         self.inner.delete(key)
         self.inner.delete(self.__get_unprocessed_key(key))
 
+    def delete_many_by_key(self, keys: Sequence[str]) -> None:
+        self.inner.delete_many(
+            [*keys, *(self.__get_unprocessed_key(key) for key in keys)],
+        )
+
     def delete(self, event: Event) -> None:
         key = cache_key_for_event(event)
         self.delete_by_key(key)
+
+    def delete_many(self, events: Sequence[Event]) -> None:
+        self.delete_many_by_key([cache_key_for_event(event) for event in events])
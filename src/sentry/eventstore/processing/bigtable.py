@@ -10,7 +10,8 @@ class BigtableEventProcessingStore(EventProcessingStore):
     Creates an instance of the processing store which uses Bigtable as its
     backend.
 
-    Keyword argument are forwarded to the ``BigtableKVStorage`` constructor.
+    Keyword argument are forwarded to the ``BigtableKVStorage`` constructor,
+    e.g. ``compression="zstd"`` to compress payloads.
     """
 
     def __init__(self, **options):
@@ -1,4 +1,4 @@
-from sentry.utils.codecs import JSONCodec
+from sentry.utils.codecs import BytesCodec, JSONCodec, OptionalZstdCodec
 from sentry.utils.kvstore.encoding import KVStorageCodecWrapper
 from sentry.utils.kvstore.redis import RedisKVStorage
 from sentry.utils.redis import redis_clusters
@@ -10,11 +10,20 @@ class RedisClusterEventProcessingStore(EventProcessingStore):
     """
     Creates an instance of the processing store which uses a Redis Cluster
     client as its backend.
+
+    Setting the ``compression`` option to ``"zstd"`` compresses payloads
+    before they are written. Compressed and uncompressed payloads are both
+    readable regardless of this option.
     """
 
     def __init__(self, **options):
+        compression = options.pop("compression", None)
+        if compression not in (None, "zstd"):
+            raise ValueError('"compression" must be one of None, "zstd"')
+
         super().__init__(
             KVStorageCodecWrapper(
-                RedisKVStorage(redis_clusters.get(options.pop("cluster", "default"))), JSONCodec()
+                RedisKVStorage(redis_clusters.get_binary(options.pop("cluster", "default"))),
+                JSONCodec() | BytesCodec() | OptionalZstdCodec(compress=compression == "zstd"),
             )
         )
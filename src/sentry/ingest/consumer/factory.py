@@ -1,17 +1,22 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
+import threading
+from collections.abc import Callable, Hashable, Mapping
 from functools import partial
 from typing import NamedTuple, TypeVar
 
+import msgpack
 from arroyo.backends.kafka.consumer import KafkaPayload
 from arroyo.processing.strategies import (
     CommitOffsets,
     FilterStep,
+    MessageRejected,
     ProcessingStrategy,
     ProcessingStrategyFactory,
     RunTask,
+    RunTaskInThreads,
 )
+from arroyo.processing.strategies.batching import BatchStep
 from arroyo.types import Commit, FilteredPayload, Message, Partition
 
 from sentry.ingest.types import ConsumerType
@@ -19,7 +24,11 @@ from sentry.processing.backpressure.arroyo import HealthChecker, create_backpres
 from sentry.utils.arroyo import MultiprocessingPool, run_task_with_multiprocessing
 
 from .attachment_event import decode_and_process_chunks, process_attachments_and_events
-from .simple_event import process_simple_event_message
+from .simple_event import (
+    parse_simple_event_message,
+    process_simple_event_batch,
+    process_simple_event_message,
+)
 
 
 class MultiProcessConfig(NamedTuple):
@@ -30,10 +39,169 @@ class MultiProcessConfig(NamedTuple):
     output_block_size: int | None
 
 
+class ThreadedConfig(NamedTuple):
+    num_threads: int
+    max_pending_futures: int
+
+
 TInput = TypeVar("TInput")
 TOutput = TypeVar("TOutput")
 
 
+class KeyOrdering:
+    """
+    Tracks the most recently scheduled message for each ordering key so that messages sharing a
+    key are processed one after another, in offset order, while messages with different keys are
+    processed concurrently.
+
+    `schedule` must be called from the consumer thread in offset order. The returned "previous"
+    event must be waited on before processing and the returned "done" event must be passed to
+    `complete` once processing has finished (successfully or not). If the message is not
+    processed after all, `cancel` must be called (from the consumer thread) instead.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tails: dict[Hashable, threading.Event] = {}
+
+    def schedule(self, key: Hashable) -> tuple[threading.Event | None, threading.Event]:
+        done = threading.Event()
+        with self._lock:
+            previous = self._tails.get(key)
+            self._tails[key] = done
+        return previous, done
+
+    def cancel(
+        self, key: Hashable, previous: threading.Event | None, done: threading.Event
+    ) -> None:
+        """
+        Restores the tail of the key to the previously scheduled message, so that a message that
+        is submitted again (for example after backpressure) does not wait for itself.
+        """
+        with self._lock:
+            if self._tails.get(key) is not done:
+                return
+            if previous is None or previous.is_set():
+                del self._tails[key]
+            else:
+                self._tails[key] = previous
+
+    def complete(self, key: Hashable, done: threading.Event) -> None:
+        done.set()
+        with self._lock:
+            if self._tails.get(key) is done:
+                del self._tails[key]
+
+
+class OrderedPayload(NamedTuple):
+    key: Hashable
+    previous: threading.Event | None
+    done: threading.Event
+    payload: KafkaPayload
+
+
+def get_ordering_key(message: Message[KafkaPayload]) -> Hashable:
+    """
+    Events of the same project are processed in order. Messages which can't be decoded are not
+    ordered; they are rejected by the processing function.
+    """
+    try:
+        return msgpack.unpackb(message.payload.value, use_list=False)["project_id"]
+    except Exception:
+        return None
+
+
+def process_ordered(
+    ordering: KeyOrdering,
+    function: Callable[[Message[KafkaPayload]], TOutput],
+    message: Message[OrderedPayload],
+) -> TOutput:
+    ordered = message.payload
+
+    try:
+        # The previous message with the same key was submitted to the (FIFO) thread pool before
+        # this one, so it is either running or finished and this wait can not deadlock.
+        if ordered.previous is not None:
+            ordered.previous.wait()
+
+        return function(message.replace(ordered.payload))
+    finally:
+        if ordered.key is not None:
+            ordering.complete(ordered.key, ordered.done)
+
+
+class OrderedRunTaskInThreads(ProcessingStrategy[FilteredPayload | KafkaPayload]):
+    """
+    Process messages concurrently in a thread pool while preserving ordering between messages of
+    the same project. `RunTaskInThreads` only forwards results (and therefore offsets) once every
+    earlier message has completed, so commits never pass the lowest unfinished message.
+
+    A message only keeps its ordering slot once the thread pool has accepted it. When the pool
+    applies backpressure the slot is released again, as arroyo submits the same message again
+    later on.
+    """
+
+    def __init__(
+        self,
+        function: Callable[[Message[KafkaPayload]], TOutput],
+        concurrency: int,
+        max_pending_futures: int,
+        next_step: ProcessingStrategy[FilteredPayload | TOutput],
+    ) -> None:
+        self.__ordering = KeyOrdering()
+        self.__next_step: ProcessingStrategy[FilteredPayload | OrderedPayload] = RunTaskInThreads(
+            processing_function=partial(process_ordered, self.__ordering, function),
+            concurrency=concurrency,
+            max_pending_futures=max_pending_futures,
+            next_step=next_step,
+        )
+
+    def submit(self, message: Message[FilteredPayload | KafkaPayload]) -> None:
+        payload = message.payload
+        if isinstance(payload, FilteredPayload):
+            self.__next_step.submit(message.replace(payload))
+            return
+
+        key = get_ordering_key(message.replace(payload))
+        if key is None:
+            self.__next_step.submit(
+                message.replace(OrderedPayload(None, None, threading.Event(), payload))
+            )
+            return
+
+        previous, done = self.__ordering.schedule(key)
+        try:
+            self.__next_step.submit(message.replace(OrderedPayload(key, previous, done, payload)))
+        except MessageRejected:
+            self.__ordering.cancel(key, previous, done)
+            raise
+
+    def poll(self) -> None:
+        self.__next_step.poll()
+
+    def join(self, timeout: float | None = None) -> None:
+        self.__next_step.join(timeout)
+
+    def close(self) -> None:
+        self.__next_step.close()
+
+    def terminate(self) -> None:
+        self.__next_step.terminate()
+
+
+def threaded_step(
+    threaded: ThreadedConfig,
+    function: Callable[[Message[KafkaPayload]], TOutput],
+    next_step: ProcessingStrategy[FilteredPayload | TOutput],
+) -> ProcessingStrategy[FilteredPayload | KafkaPayload]:
+    return OrderedRunTaskInThreads(
+        function=function,
+        concurrency=threaded.num_threads,
+        max_pending_futures=threaded.max_pending_futures,
+        next_step=next_step,
+    )
+
+
 def maybe_multiprocess_step(
     mp: MultiProcessConfig | None,
     function: Callable[[Message[TInput]], TOutput],
@@ -68,12 +236,15 @@ class IngestStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
         max_batch_time: int,
         input_block_size: int | None,
         output_block_size: int | None,
+        num_threads: int = 1,
+        batched: bool = False,
     ):
         self.consumer_type = consumer_type
         self.is_attachment_topic = consumer_type == ConsumerType.Attachments
         self.reprocess_only_stuck_events = reprocess_only_stuck_events
 
         self.multi_process = None
+        self.threaded = None
         self._pool = MultiprocessingPool(num_processes)
 
         # XXX: Attachment topic has two multiprocessing strategies chained together so we use
@@ -87,6 +258,20 @@ class IngestStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
                 num_processes, max_batch_size, max_batch_time, input_block_size, output_block_size
             )
 
+        # Threaded processing is only supported for topics containing "simple" events. The
+        # attachments topic requires chunks to be processed before the events referencing them.
+        if num_threads > 1 and not self.is_attachment_topic:
+            assert self.multi_process is None, "Threads and processes can not be combined"
+            self.threaded = ThreadedConfig(num_threads, max_batch_size)
+
+        # In batched mode events are decoded and parsed one at a time (optionally in multiple
+        # processes) and then stored and dispatched in batches to reduce round-trips.
+        self.batched = batched and not self.is_attachment_topic
+        if self.batched:
+            assert self.threaded is None, "Threads and batches can not be combined"
+        self.max_batch_size = max_batch_size
+        self.max_batch_time = max_batch_time
+
         self.health_checker = HealthChecker("ingest")
 
     def create_with_partitions(
@@ -104,7 +289,27 @@ class IngestStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
                 consumer_type=self.consumer_type,
                 reprocess_only_stuck_events=self.reprocess_only_stuck_events,
             )
-            next_step = maybe_multiprocess_step(mp, event_function, final_step, self._pool)
+            if self.batched:
+                parse_function = partial(
+                    parse_simple_event_message,
+                    consumer_type=self.consumer_type,
+                )
+                batch_step = BatchStep(
+                    max_batch_size=self.max_batch_size,
+                    max_batch_time=self.max_batch_time,
+                    next_step=RunTask(
+                        function=partial(
+                            process_simple_event_batch,
+                            reprocess_only_stuck_events=self.reprocess_only_stuck_events,
+                        ),
+                        next_step=final_step,
+                    ),
+                )
+                next_step = maybe_multiprocess_step(mp, parse_function, batch_step, self._pool)
+            elif self.threaded is not None:
+                next_step = threaded_step(self.threaded, event_function, final_step)
+            else:
+                next_step = maybe_multiprocess_step(mp, event_function, final_step, self._pool)
             return create_backpressure_step(health_checker=self.health_checker, next_step=next_step)
 
         # The `attachments` topic is a bit different, as it allows multiple event types:
@@ -1,8 +1,8 @@
 import functools
 import logging
 import random
-from collections.abc import Mapping
-from typing import Any
+from collections.abc import Mapping, MutableMapping, Sequence
+from typing import Any, NamedTuple
 
 import orjson
 import sentry_sdk
@@ -60,8 +60,6 @@ def process_event(
     """
     Perform some initial filtering and deserialize the message payload.
     """
-    payload = message["payload"]
-    start_time = float(message["start_time"])
     event_id = message["event_id"]
     project_id = int(message["project_id"])
     remote_addr = message.get("remote_addr")
@@ -102,6 +100,50 @@ def process_event(
         )
         return  # message already processed do not reprocess
 
+    data = parse_event(message, project)
+    if data is None:
+        return
+
+    # Raise the retriable exception and skip DLQ if anything below this point fails as it may be caused by
+    # intermittent network issue
+    try:
+        # If we only want to reprocess "stuck" events, we check if this event is already in the
+        # `processing_store`. We only continue here if the event *is* present, as that will eventually
+        # process and consume the event from the `processing_store`, whereby getting it "unstuck".
+        if reprocess_only_stuck_events and not event_processing_store.exists(data):
+            return
+
+        with metrics.timer("ingest_consumer._store_event"):
+            cache_key = event_processing_store.store(data)
+
+        dispatch_event(message, project, data, cache_key)
+
+        # remember for an 1 hour that we saved this event (deduplication protection)
+        cache.set(deduplication_key, "", CACHE_TIMEOUT)
+
+        # emit event_accepted once everything is done
+        event_accepted.send_robust(ip=remote_addr, data=data, project=project, sender=process_event)
+    except Exception as exc:
+        if isinstance(exc, KeyError):  # ex: missing event_id in message["payload"]
+            raise
+        raise Retriable(exc)
+
+
+class ParsedEvent(NamedTuple):
+    message: IngestMessage
+    project: Project
+    data: MutableMapping[str, Any]
+
+
+def parse_event(message: IngestMessage, project: Project) -> MutableMapping[str, Any] | None:
+    """
+    Apply the load-shedding killswitches and deserialize the event payload. Returns `None` if
+    the event should be dropped.
+    """
+    project_id = int(message["project_id"])
+    event_id = message["event_id"]
+    attachments = message.get("attachments") or ()
+
     if killswitch_matches_context(
         "store.load-shed-pipeline-projects",
         {
@@ -112,12 +154,12 @@ def process_event(
     ):
         # This killswitch is for the worst of scenarios and should probably not
         # cause additional load on our logging infrastructure
-        return
+        return None
 
     # Parse the JSON payload. This is required to compute the cache key and
     # call process_event. The payload will be put into Kafka raw, to avoid
     # serializing it again.
-    data = orjson.loads(payload)
+    data = orjson.loads(message["payload"])
 
     if project_id == settings.SENTRY_PROJECT:
         metrics.incr(
@@ -135,88 +177,157 @@ def process_event(
             "event_id": event_id,
         },
     ):
-        return
+        return None
 
-    # Raise the retriable exception and skip DLQ if anything below this point fails as it may be caused by
-    # intermittent network issue
-    try:
-        # If we only want to reprocess "stuck" events, we check if this event is already in the
-        # `processing_store`. We only continue here if the event *is* present, as that will eventually
-        # process and consume the event from the `processing_store`, whereby getting it "unstuck".
-        if reprocess_only_stuck_events and not event_processing_store.exists(data):
-            return
+    return data
 
-        with metrics.timer("ingest_consumer._store_event"):
-            cache_key = event_processing_store.store(data)
 
-        try:
-            # Records rc-processing usage broken down by
-            # event type.
-            event_type = data.get("type")
-            if event_type == "error":
-                app_feature = "errors"
-            elif event_type == "transaction":
-                app_feature = "transactions"
-            else:
-                app_feature = None
-
-            if app_feature is not None:
-                record(settings.EVENT_PROCESSING_STORE, app_feature, len(payload), UsageUnit.BYTES)
-        except Exception:
-            pass
-
-        if attachments:
-            with sentry_sdk.start_span(op="ingest_consumer.set_attachment_cache"):
-                attachment_objects = [
-                    CachedAttachment(type=attachment.pop("attachment_type"), **attachment)
-                    for attachment in attachments
-                ]
-
-                attachment_cache.set(
-                    cache_key, attachments=attachment_objects, timeout=CACHE_TIMEOUT
-                )
-
-        if data.get("type") == "transaction":
-            # No need for preprocess/process for transactions thus submit
-            # directly transaction specific save_event task.
-            save_event_transaction.delay(
-                cache_key=cache_key,
-                data=None,
+def dispatch_event(
+    message: IngestMessage, project: Project, data: MutableMapping[str, Any], cache_key: str
+) -> None:
+    """
+    Cache the attachments of a stored event and submit it to the next processing task.
+    """
+    payload = message["payload"]
+    start_time = float(message["start_time"])
+    event_id = message["event_id"]
+    project_id = int(message["project_id"])
+    attachments = message.get("attachments") or ()
+
+    try:
+        # Records rc-processing usage broken down by
+        # event type.
+        event_type = data.get("type")
+        if event_type == "error":
+            app_feature = "errors"
+        elif event_type == "transaction":
+            app_feature = "transactions"
+        else:
+            app_feature = None
+
+        if app_feature is not None:
+            record(settings.EVENT_PROCESSING_STORE, app_feature, len(payload), UsageUnit.BYTES)
+    except Exception:
+        pass
+
+    if attachments:
+        with sentry_sdk.start_span(op="ingest_consumer.set_attachment_cache"):
+            attachment_objects = [
+                CachedAttachment(type=attachment.pop("attachment_type"), **attachment)
+                for attachment in attachments
+            ]
+
+            attachment_cache.set(cache_key, attachments=attachment_objects, timeout=CACHE_TIMEOUT)
+
+    if data.get("type") == "transaction":
+        # No need for preprocess/process for transactions thus submit
+        # directly transaction specific save_event task.
+        save_event_transaction.delay(
+            cache_key=cache_key,
+            data=None,
+            start_time=start_time,
+            event_id=event_id,
+            project_id=project_id,
+        )
+    elif data.get("type") == "feedback":
+        if features.has("organizations:user-feedback-ingest", project.organization, actor=None):
+            save_event_feedback.delay(
+                cache_key=None,  # no need to cache as volume is low
+                data=data,
                 start_time=start_time,
                 event_id=event_id,
                 project_id=project_id,
             )
-        elif data.get("type") == "feedback":
-            if features.has("organizations:user-feedback-ingest", project.organization, actor=None):
-                save_event_feedback.delay(
-                    cache_key=None,  # no need to cache as volume is low
-                    data=data,
-                    start_time=start_time,
-                    event_id=event_id,
-                    project_id=project_id,
-                )
+    else:
+        # Preprocess this event, which spawns either process_event or
+        # save_event. Pass data explicitly to avoid fetching it again from the
+        # cache.
+        with sentry_sdk.start_span(op="ingest_consumer.process_event.preprocess_event"):
+            preprocess_event(
+                cache_key=cache_key,
+                data=data,
+                start_time=start_time,
+                event_id=event_id,
+                project=project,
+                has_attachments=bool(attachments),
+            )
+
+
+@trace_func(name="ingest_consumer.process_event_batch")
+@metrics.wraps("ingest_consumer.process_event_batch")
+def process_event_batch(
+    events: Sequence[ParsedEvent], reprocess_only_stuck_events: bool = False
+) -> None:
+    """
+    Store and dispatch a batch of already parsed events.
+
+    This performs the same work as `process_event` but the deduplication
+    lookups, processing store writes and deduplication markers are each
+    written with a single (pipelined) request for the whole batch.
+    """
+    if not events:
+        return
+
+    deduplication_keys = [
+        f"ev:{event.message['project_id']}:{event.message['event_id']}" for event in events
+    ]
+
+    try:
+        duplicates = cache.get_many(deduplication_keys)
+    except Exception as exc:
+        raise Retriable(exc)
+
+    pending: list[tuple[str, ParsedEvent]] = []
+    seen: set[str] = set()
+    for deduplication_key, event in zip(deduplication_keys, events):
+        # An event may be repeated within the batch, before any marker is written for it
+        if deduplication_key in duplicates or deduplication_key in seen:
+            logger.warning(
+                "pre-process-forwarder detected a duplicated event" " with id:%s for project:%s.",
+                event.message["event_id"],
+                event.message["project_id"],
+            )
         else:
-            # Preprocess this event, which spawns either process_event or
-            # save_event. Pass data explicitly to avoid fetching it again from the
-            # cache.
-            with sentry_sdk.start_span(op="ingest_consumer.process_event.preprocess_event"):
-                preprocess_event(
-                    cache_key=cache_key,
-                    data=data,
-                    start_time=start_time,
-                    event_id=event_id,
-                    project=project,
-                    has_attachments=bool(attachments),
-                )
+            seen.add(deduplication_key)
+            pending.append((deduplication_key, event))
 
-        # remember for an 1 hour that we saved this event (deduplication protection)
-        cache.set(deduplication_key, "", CACHE_TIMEOUT)
+    metrics.distribution("ingest_consumer.process_event_batch.size", len(pending))
+
+    # Raise the retriable exception and skip DLQ if anything below this point fails as it may be caused by
+    # intermittent network issue
+    dispatched: list[str] = []
+    try:
+        if reprocess_only_stuck_events:
+            pending = [
+                (key, event) for key, event in pending if event_processing_store.exists(event.data)
+            ]
+
+        with metrics.timer("ingest_consumer._store_event_batch"):
+            cache_keys = event_processing_store.store_many([event.data for _, event in pending])
+
+        for cache_key, (deduplication_key, event) in zip(cache_keys, pending):
+            dispatch_event(event.message, event.project, event.data, cache_key)
+            dispatched.append(deduplication_key)
+
+        # remember for an 1 hour that we saved these events (deduplication protection)
+        cache.set_many({key: "" for key in dispatched}, CACHE_TIMEOUT)
 
         # emit event_accepted once everything is done
-        event_accepted.send_robust(ip=remote_addr, data=data, project=project, sender=process_event)
+        for _, event in pending:
+            event_accepted.send_robust(
+                ip=event.message.get("remote_addr"),
+                data=event.data,
+                project=event.project,
+                sender=process_event,
+            )
     except Exception as exc:
-        if isinstance(exc, KeyError):  # ex: missing event_id in message["payload"]
-            raise
+        # The batch is retried as a whole, remember the events dispatched before the failure so
+        # that they are not dispatched again.
+        if dispatched:
+            try:
+                cache.set_many({key: "" for key in dispatched}, CACHE_TIMEOUT)
+            except Exception:
+                logger.exception("ingest_consumer.process_event_batch.set_markers_failed")
         raise Retriable(exc)
 
 
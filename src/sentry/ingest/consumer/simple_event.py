@@ -3,16 +3,54 @@ import logging
 import msgpack
 from arroyo.backends.kafka.consumer import KafkaPayload
 from arroyo.dlq import InvalidMessage
+from arroyo.processing.strategies.batching import ValuesBatch
 from arroyo.types import BrokerValue, Message
 
 from sentry.models.project import Project
 from sentry.utils import metrics
+from sentry.utils.cache import cache_key_for_event
 
-from .processors import IngestMessage, Retriable, process_event
+from .processors import (
+    IngestMessage,
+    ParsedEvent,
+    Retriable,
+    parse_event,
+    process_event,
+    process_event_batch,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _decode_simple_event_message(
+    raw_message: Message[KafkaPayload], consumer_type: str
+) -> tuple[IngestMessage, Project] | None:
+    raw_payload = raw_message.payload.value
+    metrics.distribution(
+        "ingest_consumer.payload_size",
+        len(raw_payload),
+        tags={"consumer": consumer_type},
+        unit="byte",
+    )
+
+    message: IngestMessage = msgpack.unpackb(raw_payload, use_list=False)
+
+    message_type = message["type"]
+    project_id = message["project_id"]
+
+    if message_type != "event":
+        raise ValueError(f"Unsupported message type: {message_type}")
+
+    try:
+        with metrics.timer("ingest_consumer.fetch_project"):
+            project = Project.objects.get_from_cache(id=project_id)
+    except Project.DoesNotExist:
+        logger.exception("Project for ingested event does not exist: %s", project_id)
+        return None
+
+    return message, project
+
+
 def process_simple_event_message(
     raw_message: Message[KafkaPayload], consumer_type: str, reprocess_only_stuck_events: bool
 ) -> None:
@@ -29,31 +67,12 @@ def process_simple_event_message(
       `preprocess_event`, which will schedule a followup task such as
       `symbolicate_event` or `process_event`.
     """
-
-    raw_payload = raw_message.payload.value
-    metrics.distribution(
-        "ingest_consumer.payload_size",
-        len(raw_payload),
-        tags={"consumer": consumer_type},
-        unit="byte",
-    )
-
     try:
-        message: IngestMessage = msgpack.unpackb(raw_payload, use_list=False)
-
-        message_type = message["type"]
-        project_id = message["project_id"]
-
-        if message_type != "event":
-            raise ValueError(f"Unsupported message type: {message_type}")
-
-        try:
-            with metrics.timer("ingest_consumer.fetch_project"):
-                project = Project.objects.get_from_cache(id=project_id)
-        except Project.DoesNotExist:
-            logger.exception("Project for ingested event does not exist: %s", project_id)
+        decoded = _decode_simple_event_message(raw_message, consumer_type)
+        if decoded is None:
             return
 
+        message, project = decoded
         return process_event(message, project, reprocess_only_stuck_events)
 
     except Exception as exc:
@@ -64,3 +83,47 @@ def process_simple_event_message(
         raw_value = raw_message.value
         assert isinstance(raw_value, BrokerValue)
         raise InvalidMessage(raw_value.partition, raw_value.offset) from exc
+
+
+def parse_simple_event_message(
+    raw_message: Message[KafkaPayload], consumer_type: str
+) -> ParsedEvent | None:
+    """
+    Decodes a single Kafka Message containing a "simple" Event payload for
+    batched processing.
+
+    All work which may fail deterministically (decoding, load-shedding and
+    parsing the JSON payload) happens here so invalid messages are sent to the
+    DLQ individually. Storing and dispatching the event happens in
+    `process_simple_event_batch`.
+    """
+    try:
+        decoded = _decode_simple_event_message(raw_message, consumer_type)
+        if decoded is None:
+            return None
+
+        message, project = decoded
+        data = parse_event(message, project)
+        if data is None:
+            return None
+
+        # Fails on a missing event_id, which would otherwise fail the whole batch.
+        cache_key_for_event(data)
+
+        return ParsedEvent(message, project, data)
+
+    except Exception as exc:
+        raw_value = raw_message.value
+        assert isinstance(raw_value, BrokerValue)
+        raise InvalidMessage(raw_value.partition, raw_value.offset) from exc
+
+
+def process_simple_event_batch(
+    batch: Message[ValuesBatch[ParsedEvent | None]], reprocess_only_stuck_events: bool
+) -> None:
+    """
+    Stores and dispatches a batch of parsed "simple" Events. See
+    `processors.process_event_batch`.
+    """
+    events = [value.payload for value in batch.payload if value.payload is not None]
+    process_event_batch(events, reprocess_only_stuck_events)
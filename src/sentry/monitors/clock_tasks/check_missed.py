@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime
 
 from arroyo.backends.kafka import KafkaPayload
@@ -8,6 +9,7 @@ from django.db.models import Q
 from sentry_kafka_schemas.schema_types.monitors_clock_tasks_v1 import MarkMissing
 
 from sentry.constants import ObjectStatus
+from sentry.monitors import deadlines
 from sentry.monitors.logic.mark_failed import mark_failed
 from sentry.monitors.models import (
     CheckInStatus,
@@ -18,6 +20,7 @@ from sentry.monitors.models import (
 )
 from sentry.monitors.schedule import get_prev_schedule
 from sentry.utils import metrics
+from sentry.utils.iterators import chunked
 
 from .producer import MONITORS_CLOCK_TASKS_CODEC, produce_task
 
@@ -30,6 +33,9 @@ logger = logging.getLogger(__name__)
 # monitors the larger the number of checkins to check will exist.
 MONITOR_LIMIT = 10_000
 
+# The number of monitor environments read from the deadline index that are looked up at once.
+INDEX_BATCH_SIZE = 1000
+
 # re-use the monitor exclusion query node across dispatch_check_missing and
 # mark_environment_missing.
 IGNORE_MONITORS = ~Q(
@@ -55,37 +61,76 @@ def dispatch_check_missing(ts: datetime):
 
     This will dispatch MarkMissing messages into monitors-clock-tasks.
     """
-    missed_envs = list(
-        MonitorEnvironment.objects.filter(
-            IGNORE_MONITORS,
-            monitor__type__in=[MonitorType.CRON_JOB],
-            next_checkin_latest__lte=ts,
-        ).values("id")[:MONITOR_LIMIT]
-    )
+    start = time.monotonic()
+    indexed_env_ids: list[int] | None = None
+    if deadlines.is_enabled():
+        indexed_env_ids = deadlines.get_missed(ts, MONITOR_LIMIT)
+        missed_env_ids = get_indexed_missing(ts, indexed_env_ids)
+    else:
+        missed_env_ids = list(
+            MonitorEnvironment.objects.filter(
+                IGNORE_MONITORS,
+                monitor__type__in=[MonitorType.CRON_JOB],
+                next_checkin_latest__lte=ts,
+            ).values_list("id", flat=True)[:MONITOR_LIMIT]
+        )
 
     metrics.gauge(
         "sentry.monitors.tasks.check_missing.count",
-        len(missed_envs),
+        len(missed_env_ids),
         sample_rate=1.0,
     )
 
-    for monitor_environment in missed_envs:
+    for monitor_environment_id in missed_env_ids:
         message: MarkMissing = {
             "type": "mark_missing",
             "ts": ts.timestamp(),
-            "monitor_environment_id": monitor_environment["id"],
+            "monitor_environment_id": monitor_environment_id,
         }
         # XXX(epurkhiser): Partitioning by monitor_environment.id is important
         # here as these task messages will be consumed in a multi-consumer
         # setup. If we backlogged clock-ticks we may produce multiple missed
         # tasks for the same monitor_environment. These MUST happen in-order.
         payload = KafkaPayload(
-            str(monitor_environment["id"]).encode(),
+            str(monitor_environment_id).encode(),
             MONITORS_CLOCK_TASKS_CODEC.encode(message),
             [],
         )
         produce_task(payload)
 
+    if indexed_env_ids is not None:
+        # Only drop the due entries once their tasks were produced, an error above leaves them
+        # for the next tick.
+        deadlines.remove_missed(ts, indexed_env_ids)
+
+    metrics.timing(
+        "sentry.monitors.tasks.check_missing.duration",
+        time.monotonic() - start,
+        sample_rate=1.0,
+    )
+
+
+def get_indexed_missing(ts: datetime, indexed_env_ids: list[int]) -> list[int]:
+    """
+    Given the monitor environments whose deadline passed according to the deadline index, returns
+    the ones that still missed their check-in according to the database.
+    """
+    missed_env_ids = []
+    for batch in chunked(indexed_env_ids, INDEX_BATCH_SIZE):
+        monitor_environments = MonitorEnvironment.objects.filter(
+            IGNORE_MONITORS,
+            id__in=batch,
+            monitor__type__in=[MonitorType.CRON_JOB],
+            next_checkin_latest__isnull=False,
+        ).values_list("id", "next_checkin_latest")
+        for monitor_environment_id, next_checkin_latest in monitor_environments:
+            if next_checkin_latest <= ts:
+                missed_env_ids.append(monitor_environment_id)
+            else:
+                # The deadline moved since it was indexed
+                deadlines.index_missed(monitor_environment_id, next_checkin_latest)
+    return missed_env_ids
+
 
 def mark_environment_missing(monitor_environment_id: int, ts: datetime):
     logger.info("mark_missing", extra={"monitor_environment_id": monitor_environment_id})
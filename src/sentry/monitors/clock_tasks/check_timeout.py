@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime
 
 from arroyo.backends.kafka import KafkaPayload
 from sentry_kafka_schemas.schema_types.monitors_clock_tasks_v1 import MarkTimeout
 
+from sentry.monitors import deadlines
 from sentry.monitors.logic.mark_failed import mark_failed
 from sentry.monitors.models import CheckInStatus, MonitorCheckIn
 from sentry.monitors.schedule import get_prev_schedule
 from sentry.utils import metrics
+from sentry.utils.iterators import chunked
 
 from .producer import MONITORS_CLOCK_TASKS_CODEC, produce_task
 
@@ -21,6 +24,9 @@ logger = logging.getLogger(__name__)
 # monitors the larger the number of checkins to check will exist.
 CHECKINS_LIMIT = 10_000
 
+# The number of check-ins read from the deadline index that are looked up at once.
+INDEX_BATCH_SIZE = 1000
+
 
 def dispatch_check_timeout(ts: datetime):
     """
@@ -29,11 +35,17 @@ def dispatch_check_timeout(ts: datetime):
 
     This will dispatch MarkTimeout messages into monitors-clock-tasks.
     """
-    timed_out_checkins = list(
-        MonitorCheckIn.objects.filter(status=CheckInStatus.IN_PROGRESS, timeout_at__lte=ts,).values(
-            "id", "monitor_environment_id"
-        )[:CHECKINS_LIMIT]
-    )
+    start = time.monotonic()
+    indexed_checkins: list[tuple[int, int]] | None = None
+    if deadlines.is_enabled():
+        indexed_checkins = deadlines.get_timeouts(ts, CHECKINS_LIMIT)
+        timed_out_checkins = get_indexed_timeouts(ts, indexed_checkins)
+    else:
+        timed_out_checkins = list(
+            MonitorCheckIn.objects.filter(
+                status=CheckInStatus.IN_PROGRESS, timeout_at__lte=ts
+            ).values("id", "monitor_environment_id")[:CHECKINS_LIMIT]
+        )
 
     metrics.gauge(
         "sentry.monitors.tasks.check_timeout.count",
@@ -60,6 +72,47 @@ def dispatch_check_timeout(ts: datetime):
         )
         produce_task(payload)
 
+    if indexed_checkins is not None:
+        # Only drop the due entries once their tasks were produced, an error above leaves them
+        # for the next tick.
+        deadlines.remove_timeouts(ts, indexed_checkins)
+
+    metrics.timing(
+        "sentry.monitors.tasks.check_timeout.duration",
+        time.monotonic() - start,
+        sample_rate=1.0,
+    )
+
+
+def get_indexed_timeouts(
+    ts: datetime, indexed_checkins: list[tuple[int, int]]
+) -> list[dict[str, int]]:
+    """
+    Given the check-ins whose timeout passed according to the deadline index, returns the ones
+    that are still in progress and timed out according to the database.
+    """
+    timed_out_checkins = []
+    for batch in chunked(indexed_checkins, INDEX_BATCH_SIZE):
+        checkins = MonitorCheckIn.objects.filter(
+            id__in=[checkin_id for _, checkin_id in batch],
+            status=CheckInStatus.IN_PROGRESS,
+            timeout_at__isnull=False,
+        ).values("id", "monitor_environment_id", "timeout_at")
+        for checkin in checkins:
+            if checkin["timeout_at"] <= ts:
+                timed_out_checkins.append(
+                    {
+                        "id": checkin["id"],
+                        "monitor_environment_id": checkin["monitor_environment_id"],
+                    }
+                )
+            else:
+                # The timeout was bumped since it was indexed
+                deadlines.index_timeout(
+                    checkin["monitor_environment_id"], checkin["id"], checkin["timeout_at"]
+                )
+    return timed_out_checkins
+
 
 def mark_checkin_timeout(checkin_id: int, ts: datetime):
     logger.info("checkin_timeout", extra={"checkin_id": checkin_id})
@@ -6,9 +6,10 @@ from collections import defaultdict
 from collections.abc import Mapping
 from concurrent.futures import ThreadPoolExecutor, wait
 from copy import deepcopy
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from functools import partial
-from typing import Literal
+from typing import Any, Literal
 
 import sentry_sdk
 from arroyo.backends.kafka.consumer import KafkaPayload
@@ -22,12 +23,13 @@ from sentry_kafka_schemas.codecs import Codec
 from sentry_kafka_schemas.schema_types.ingest_monitors_v1 import IngestMonitorMessage
 from sentry_sdk.tracing import Span, Transaction
 
-from sentry import quotas, ratelimits
+from sentry import options, quotas, ratelimits
 from sentry.conf.types.kafka_definition import Topic, get_topic_codec
 from sentry.constants import DataCategory, ObjectStatus
 from sentry.db.postgres.transactions import in_test_hide_transaction_boundary
 from sentry.killswitches import killswitch_matches_context
 from sentry.models.project import Project
+from sentry.monitors import deadlines
 from sentry.monitors.clock_dispatch import try_monitor_clock_tick
 from sentry.monitors.constants import PermitCheckInStatus
 from sentry.monitors.logic.mark_failed import mark_failed
@@ -40,6 +42,7 @@ from sentry.monitors.models import (
     MonitorEnvironmentLimitsExceeded,
     MonitorEnvironmentValidationFailed,
     MonitorLimitsExceeded,
+    MonitorStatus,
     MonitorType,
 )
 from sentry.monitors.processing_errors.errors import (
@@ -404,9 +407,51 @@ def update_existing_check_in(
         updated_checkin["date_updated"] = start_time
 
     existing_check_in.update(**updated_checkin)
+    deadlines.index_timeout(
+        monitor_environment.id, existing_check_in.id, updated_checkin["timeout_at"]
+    )
 
 
-def _process_checkin(item: CheckinItem, txn: Transaction | Span):
+@dataclass
+class ValidatedCheckin:
+    """
+    A check-in that passed validation, together with the monitor and monitor
+    environment it is stored for.
+    """
+
+    item: CheckinItem
+    project: Project
+    monitor: Monitor
+    monitor_environment: MonitorEnvironment
+    guid: uuid.UUID
+    use_latest_checkin: bool
+    validated_params: Mapping[str, Any]
+    metric_kwargs: Mapping[str, str]
+    start_time: datetime
+
+
+@dataclass
+class CheckinGroupState:
+    """
+    State shared by the check-ins of a group processed by
+    `process_checkin_group`. All check-ins of a group belong to the same
+    monitor environment, so the monitor and monitor environment are only
+    loaded once per group.
+
+    `pending` are the check-ins (with their original items) buffered to be
+    created together by `flush_pending_checkins`.
+    """
+
+    monitor: Monitor | None = None
+    monitor_environment: MonitorEnvironment | None = None
+    pending: list[tuple[CheckinItem, ValidatedCheckin]] = field(default_factory=list)
+
+
+def _validate_checkin(
+    item: CheckinItem,
+    txn: Transaction | Span,
+    group: CheckinGroupState | None = None,
+) -> ValidatedCheckin:
     params = item.payload
 
     start_time = to_datetime(float(item.message["start_time"]))
@@ -548,11 +593,16 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span):
     # 01
     # Retrieve or upsert monitor for this check-in
     try:
-        monitor = _ensure_monitor_with_config(
-            project,
-            monitor_slug,
-            monitor_config,
-        )
+        if group is not None and group.monitor is not None and not monitor_config:
+            monitor = group.monitor
+        else:
+            monitor = _ensure_monitor_with_config(
+                project,
+                monitor_slug,
+                monitor_config,
+            )
+        if group is not None:
+            group.monitor = monitor
     except ProcessingErrorsException as e:
         ensure_config_errors = list(e.processing_errors)
     except MonitorLimitsExceeded as e:
@@ -661,9 +711,18 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span):
     # 02
     # Retrieve or upsert monitor environment for this check-in
     try:
-        monitor_environment = MonitorEnvironment.objects.ensure_environment(
-            project, monitor, environment
-        )
+        if (
+            group is not None
+            and group.monitor_environment is not None
+            and group.monitor_environment.monitor_id == monitor.id
+        ):
+            monitor_environment = group.monitor_environment
+        else:
+            monitor_environment = MonitorEnvironment.objects.ensure_environment(
+                project, monitor, environment
+            )
+        if group is not None:
+            group.monitor_environment = monitor_environment
     except MonitorEnvironmentLimitsExceeded as e:
         metrics.incr(
             "monitors.checkin.result",
@@ -723,6 +782,32 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span):
         }
         raise ProcessingErrorsException([invalid_env_error], monitor)
 
+    return ValidatedCheckin(
+        item=item,
+        project=project,
+        monitor=monitor,
+        monitor_environment=monitor_environment,
+        guid=guid,
+        use_latest_checkin=use_latest_checkin,
+        validated_params=validated_params,
+        metric_kwargs=metric_kwargs,
+        start_time=start_time,
+    )
+
+
+def _store_checkin(validated_checkin: ValidatedCheckin, txn: Transaction | Span):
+    item = validated_checkin.item
+    project = validated_checkin.project
+    project_id = project.id
+    monitor = validated_checkin.monitor
+    monitor_environment = validated_checkin.monitor_environment
+    monitor_slug = item.valid_monitor_slug
+    guid = validated_checkin.guid
+    use_latest_checkin = validated_checkin.use_latest_checkin
+    validated_params = validated_checkin.validated_params
+    metric_kwargs = validated_checkin.metric_kwargs
+    start_time = validated_checkin.start_time
+
     # 03
     # Create or update check-in
 
@@ -854,6 +939,8 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span):
                     )
                 else:
                     txn.set_tag("outcome", "create_new_checkin")
+                    if timeout_at is not None:
+                        deadlines.index_timeout(monitor_environment.id, check_in.id, timeout_at)
                     with in_test_hide_transaction_boundary():
                         signal_first_checkin(project, monitor)
                     metrics.incr(
@@ -913,6 +1000,10 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span):
         logger.exception("Failed to process check-in")
 
 
+def _process_checkin(item: CheckinItem, txn: Transaction | Span):
+    _store_checkin(_validate_checkin(item, txn), txn)
+
+
 def process_checkin(item: CheckinItem):
     """
     Process an individual check-in
@@ -931,13 +1022,220 @@ def process_checkin(item: CheckinItem):
         logger.exception("Failed to process check-in")
 
 
+def _can_bulk_create(checkin: ValidatedCheckin, group: CheckinGroupState) -> bool:
+    """
+    Check-ins can be created in bulk when they are completed check-ins for a
+    monitor environment that is already OK. Storing these creates a check-in and
+    moves the monitor environment along its schedule, without updating an
+    existing check-in or running any incident logic.
+    """
+    status = getattr(CheckInStatus, checkin.validated_params["status"].upper())
+    return (
+        status == CheckInStatus.OK
+        and not checkin.use_latest_checkin
+        and checkin.monitor_environment.status == MonitorStatus.OK
+        and all(
+            pending.monitor_environment.id == checkin.monitor_environment.id
+            and pending.guid != checkin.guid
+            for _, pending in group.pending
+        )
+    )
+
+
+def _bulk_create_checkins(checkins: list[ValidatedCheckin]) -> bool:
+    """
+    Creates the check-ins with a single insert and moves their monitor
+    environment to the schedule of the latest one with a single update, the
+    same as storing them one after the other would. Returns False without
+    creating anything when the check-ins can no longer be created in bulk.
+    """
+    project = checkins[0].project
+    monitor = checkins[0].monitor
+    monitor_config = monitor.get_validated_config()
+
+    with transaction.atomic(router.db_for_write(Monitor)):
+        monitor_environment = MonitorEnvironment.objects.select_for_update().get(
+            id=checkins[0].monitor_environment.id
+        )
+        if monitor_environment.status != MonitorStatus.OK:
+            return False
+        if MonitorCheckIn.objects.filter(guid__in=[checkin.guid for checkin in checkins]).exists():
+            return False
+
+        last_checkin = monitor_environment.last_checkin
+        next_checkin = monitor_environment.next_checkin
+        next_checkin_latest = monitor_environment.next_checkin_latest
+        moved = False
+
+        check_ins = []
+        for checkin in checkins:
+            duration = checkin.validated_params["duration"]
+            date_added = checkin.start_time
+            if duration is not None:
+                date_added -= timedelta(milliseconds=duration)
+
+            check_ins.append(
+                MonitorCheckIn(
+                    project_id=project.id,
+                    monitor=monitor,
+                    monitor_environment=monitor_environment,
+                    guid=checkin.guid,
+                    duration=duration,
+                    status=CheckInStatus.OK,
+                    date_added=date_added,
+                    date_updated=checkin.start_time,
+                    expected_time=next_checkin,
+                    timeout_at=None,
+                    monitor_config=monitor_config,
+                    trace_id=checkin.validated_params.get("contexts", {})
+                    .get("trace", {})
+                    .get("trace_id"),
+                )
+            )
+
+            # Same as `mark_ok`, an older check-in does not move the monitor
+            # environment back.
+            if last_checkin is None or last_checkin <= checkin.start_time:
+                last_checkin = date_added
+                next_checkin = monitor.get_next_expected_checkin(checkin.start_time)
+                next_checkin_latest = monitor.get_next_expected_checkin_latest(checkin.start_time)
+                moved = True
+
+        MonitorCheckIn.objects.bulk_create(check_ins)
+        if moved:
+            MonitorEnvironment.objects.filter(id=monitor_environment.id).update(
+                last_checkin=last_checkin,
+                next_checkin=next_checkin,
+                next_checkin_latest=next_checkin_latest,
+            )
+            deadlines.index_missed(monitor_environment.id, next_checkin_latest)
+
+        with in_test_hide_transaction_boundary():
+            signal_first_checkin(project, monitor)
+
+    return True
+
+
+def flush_pending_checkins(group: CheckinGroupState):
+    """
+    Stores the check-ins buffered by a group. When they can't be created in
+    bulk they are stored one after the other instead.
+    """
+    pending, group.pending = group.pending, []
+    if not pending:
+        return
+
+    # The monitor environment is moved by storing the check-ins
+    group.monitor_environment = None
+
+    try:
+        created = _bulk_create_checkins([checkin for _, checkin in pending])
+    except Exception:
+        logger.exception("monitors.consumer.bulk_create_failed")
+        created = False
+
+    metrics.incr(
+        "monitors.checkin.bulk_create",
+        tags={"created": str(created).lower()},
+    )
+    metrics.distribution("monitors.checkin.bulk_create.size", len(pending))
+
+    if not created:
+        for item, checkin in pending:
+            try:
+                with sentry_sdk.start_transaction(
+                    op="_process_checkin",
+                    name="monitors.monitor_consumer",
+                ) as txn:
+                    checkin.monitor_environment.refresh_from_db()
+                    _store_checkin(checkin, txn)
+            except ProcessingErrorsException as e:
+                handle_processing_errors(item, e)
+            except Exception:
+                logger.exception("Failed to process check-in")
+        return
+
+    for _, checkin in pending:
+        track_outcome(
+            org_id=checkin.project.organization_id,
+            project_id=checkin.project.id,
+            key_id=None,
+            outcome=Outcome.ACCEPTED,
+            reason=None,
+            timestamp=checkin.start_time,
+            category=DataCategory.MONITOR,
+        )
+        kafka_delay = checkin.item.ts - checkin.start_time.replace(tzinfo=None)
+        metrics.gauge("monitors.checkin.relay_kafka_delay", kafka_delay.total_seconds())
+        delay = datetime.now() - checkin.item.ts
+        metrics.gauge("monitors.checkin.completion_time", delay.total_seconds())
+        metrics.incr(
+            "monitors.checkin.result",
+            tags={**checkin.metric_kwargs, "status": "created_new_checkin"},
+        )
+        metrics.incr(
+            "monitors.checkin.result",
+            tags={**checkin.metric_kwargs, "status": "complete"},
+        )
+
+
+def process_group_checkin(item: CheckinItem, group: CheckinGroupState):
+    """
+    Process a check-in of a group. Check-ins that can be created in bulk are
+    buffered in the group, any other check-in is stored right away after
+    flushing the buffered check-ins so that check-ins are still stored in
+    order.
+    """
+    try:
+        with sentry_sdk.start_transaction(
+            op="_process_checkin",
+            name="monitors.monitor_consumer",
+        ) as txn:
+            # Upserting the monitor may change its schedule, which applies to
+            # the check-ins after the upsert only.
+            if item.payload.get("monitor_config"):
+                flush_pending_checkins(group)
+
+            # Deepcopy the checkin here so that it's not modified. We need the original when we get a
+            # `ProcessingErrorsException`
+            checkin = _validate_checkin(deepcopy(item), txn, group)
+
+            if _can_bulk_create(checkin, group):
+                txn.set_tag("outcome", "bulk_create_checkin")
+                group.pending.append((item, checkin))
+                return
+
+            if group.pending:
+                flush_pending_checkins(group)
+                checkin.monitor_environment.refresh_from_db()
+
+            # The monitor environment is updated by storing the check-in
+            group.monitor_environment = None
+            _store_checkin(checkin, txn)
+    except ProcessingErrorsException as e:
+        handle_processing_errors(item, e)
+    except Exception:
+        logger.exception("Failed to process check-in")
+
+
 def process_checkin_group(items: list[CheckinItem]):
     """
     Process a group of related check-ins (all part of the same monitor)
     completely serially.
+
+    With `crons.bulk-checkins` the monitor and monitor environment are loaded
+    once for the group, and consecutive completed check-ins are created with a
+    single insert.
     """
+    if not options.get("crons.bulk-checkins"):
+        for item in items:
+            process_checkin(item)
+        return
+
+    group = CheckinGroupState()
     for item in items:
-        process_checkin(item)
+        process_group_checkin(item, group)
+    flush_pending_checkins(group)
 
 
 def process_batch(executor: ThreadPoolExecutor, message: Message[ValuesBatch[KafkaPayload]]):
@@ -0,0 +1,188 @@
+"""
+Sorted indexes of the upcoming deadlines of monitor environments and check-ins.
+
+Finding the monitor environments that missed a check-in and the check-ins that timed out on
+every clock tick scans all of them in the database. The deadlines are instead kept in two Redis
+sorted sets, which are updated whenever a deadline moves:
+
+- ``missed`` holds monitor environment ids scored by their ``next_checkin_latest``
+- ``timeout`` holds ``<monitor_environment_id>:<checkin_id>`` members scored by the
+  ``timeout_at`` of in-progress check-ins
+
+so that a tick only reads the entries whose deadline passed. The scores are only a hint: due
+entries are checked against the database before anything is dispatched for them, and an entry
+whose deadline moved in the meantime is indexed again with its actual deadline. Due entries are
+only removed once the tick dispatched them, so that a tick failing midway leaves them to the next
+one.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from sentry_redis_tools.clients import RedisCluster, StrictRedis
+
+from sentry import options
+from sentry.utils import redis
+from sentry.utils.iterators import chunked
+from sentry.utils.query import RangeQuerySetWrapper
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+    from sentry.monitors.models import MonitorCheckIn, MonitorEnvironment
+
+MISSED_KEY = "sentry.monitors.deadlines.missed"
+TIMEOUT_KEY = "sentry.monitors.deadlines.timeout"
+
+BACKFILL_BATCH_SIZE = 1000
+REMOVE_BATCH_SIZE = 1000
+
+remove_due = redis.load_redis_script("monitors/remove_due.lua")
+
+
+def get_redis_client() -> RedisCluster | StrictRedis:
+    return redis.redis_clusters.get(settings.SENTRY_MONITORS_REDIS_CLUSTER)
+
+
+def is_enabled() -> bool:
+    return options.get("crons.deadline-index")
+
+
+def _get_timeout_member(monitor_environment_id: int, checkin_id: int) -> str:
+    return f"{monitor_environment_id}:{checkin_id}"
+
+
+def index_missed(monitor_environment_id: int, next_checkin_latest: datetime | None) -> None:
+    client = get_redis_client()
+    if next_checkin_latest is None:
+        client.zrem(MISSED_KEY, monitor_environment_id)
+    else:
+        client.zadd(MISSED_KEY, {str(monitor_environment_id): next_checkin_latest.timestamp()})
+
+
+def index_timeout(
+    monitor_environment_id: int, checkin_id: int, timeout_at: datetime | None
+) -> None:
+    member = _get_timeout_member(monitor_environment_id, checkin_id)
+    client = get_redis_client()
+    if timeout_at is None:
+        client.zrem(TIMEOUT_KEY, member)
+    else:
+        client.zadd(TIMEOUT_KEY, {member: timeout_at.timestamp()})
+
+
+def _get_due(key: str, ts: datetime, limit: int) -> list[str]:
+    members = get_redis_client().zrangebyscore(key, "-inf", ts.timestamp(), start=0, num=limit)
+    return [member.decode() if isinstance(member, bytes) else member for member in members]
+
+
+def _remove_due(key: str, ts: datetime, members: Sequence[str]) -> None:
+    if not members:
+        return
+    # Entries indexed again with a later deadline since they were read are kept.
+    client = get_redis_client()
+    for batch in chunked(members, REMOVE_BATCH_SIZE):
+        remove_due([key], [ts.timestamp(), *batch], client)
+
+
+def get_missed(ts: datetime, limit: int) -> list[int]:
+    """
+    Returns the ids of up to ``limit`` monitor environments whose ``next_checkin_latest`` was
+    indexed at or before ``ts``.
+    """
+    return [int(member) for member in _get_due(MISSED_KEY, ts, limit)]
+
+
+def remove_missed(ts: datetime, monitor_environment_ids: Sequence[int]) -> None:
+    """
+    Removes the monitor environments which were handled by the tick at ``ts`` from the index,
+    unless their deadline was moved past ``ts`` since.
+    """
+    _remove_due(MISSED_KEY, ts, [str(id) for id in monitor_environment_ids])
+
+
+def get_timeouts(ts: datetime, limit: int) -> list[tuple[int, int]]:
+    """
+    Returns the ``(monitor_environment_id, checkin_id)`` of up to ``limit`` check-ins whose
+    ``timeout_at`` was indexed at or before ``ts``.
+    """
+    timeouts = []
+    for member in _get_due(TIMEOUT_KEY, ts, limit):
+        monitor_environment_id, checkin_id = member.split(":")
+        timeouts.append((int(monitor_environment_id), int(checkin_id)))
+    return timeouts
+
+
+def remove_timeouts(ts: datetime, timeouts: Sequence[tuple[int, int]]) -> None:
+    """
+    Removes the check-ins which were handled by the tick at ``ts`` from the index, unless their
+    timeout was moved past ``ts`` since.
+    """
+    _remove_due(
+        TIMEOUT_KEY,
+        ts,
+        [
+            _get_timeout_member(monitor_environment_id, checkin_id)
+            for monitor_environment_id, checkin_id in timeouts
+        ],
+    )
+
+
+def _index_all(
+    monitor_environments: QuerySet[MonitorEnvironment], checkins: QuerySet[MonitorCheckIn]
+) -> None:
+    from sentry.monitors.models import CheckInStatus
+
+    client = get_redis_client()
+
+    def index(key: str, scores: Iterable[tuple[str, datetime]]) -> None:
+        for batch in chunked(scores, BACKFILL_BATCH_SIZE):
+            client.zadd(key, {member: deadline.timestamp() for member, deadline in batch})
+
+    index(
+        MISSED_KEY,
+        (
+            (str(monitor_environment.id), monitor_environment.next_checkin_latest)
+            for monitor_environment in RangeQuerySetWrapper(
+                monitor_environments.filter(next_checkin_latest__isnull=False)
+            )
+        ),
+    )
+    index(
+        TIMEOUT_KEY,
+        (
+            (_get_timeout_member(checkin.monitor_environment_id, checkin.id), checkin.timeout_at)
+            for checkin in RangeQuerySetWrapper(
+                checkins.filter(status=CheckInStatus.IN_PROGRESS, timeout_at__isnull=False)
+            )
+        ),
+    )
+
+
+def index_monitor(monitor_id: int) -> None:
+    """
+    Indexes the deadlines of the environments and in-progress check-ins of a monitor. Used when
+    they were updated in bulk, or when the monitor is enabled again after its environments were
+    dropped from the index while it was disabled.
+    """
+    from sentry.monitors.models import MonitorCheckIn, MonitorEnvironment
+
+    _index_all(
+        MonitorEnvironment.objects.filter(monitor_id=monitor_id),
+        MonitorCheckIn.objects.filter(monitor_id=monitor_id),
+    )
+
+
+def backfill() -> None:
+    """
+    Indexes the deadlines of all monitor environments and in-progress check-ins. Deadlines are
+    indexed as they move regardless of ``crons.deadline-index``, this only needs to run once
+    before it's enabled to index the ones that didn't move since.
+    """
+    from sentry.monitors.models import MonitorCheckIn, MonitorEnvironment
+
+    _index_all(MonitorEnvironment.objects.all(), MonitorCheckIn.objects.all())
@@ -17,6 +17,7 @@ from sentry.models.environment import Environment
 from sentry.models.project import Project
 from sentry.models.rule import Rule, RuleActivity, RuleActivityType
 from sentry.models.scheduledeletion import RegionScheduledDeletion
+from sentry.monitors import deadlines
 from sentry.monitors.models import (
     CheckInStatus,
     Monitor,
@@ -85,6 +86,8 @@ class MonitorDetailsMixin(BaseEndpointMixin):
         result = validator.save()
 
         params = {}
+        # Whether deadlines of the monitor's environments and check-ins should be indexed again
+        reindex_deadlines = False
         if "name" in result:
             params["name"] = result["name"]
         if "slug" in result:
@@ -110,12 +113,14 @@ class MonitorDetailsMixin(BaseEndpointMixin):
                 MonitorEnvironment.objects.filter(monitor_id=monitor.id).update(
                     next_checkin_latest=F("next_checkin") + get_checkin_margin(checkin_margin)
                 )
+                reindex_deadlines = True
 
             max_runtime = result["config"].get("max_runtime")
             if max_runtime != existing_max_runtime:
                 MonitorCheckIn.objects.filter(
                     monitor_id=monitor.id, status=CheckInStatus.IN_PROGRESS
                 ).update(timeout_at=TruncMinute(F("date_added")) + get_max_runtime(max_runtime))
+                reindex_deadlines = True
 
         if "project" in result and result["project"].id != monitor.project_id:
             raise ParameterValidationError("existing monitors may not be moved between projects")
@@ -127,6 +132,9 @@ class MonitorDetailsMixin(BaseEndpointMixin):
             # This protects against a race condition
             if outcome != Outcome.ACCEPTED:
                 raise ParameterValidationError("Failed to enable monitor, please try again")
+            # Environments of disabled monitors are dropped from the index once their deadline
+            # passes
+            reindex_deadlines = True
 
         # Attempt to unassign the monitor seat
         if params["status"] == ObjectStatus.DISABLED and monitor.status != ObjectStatus.DISABLED:
@@ -146,6 +154,9 @@ class MonitorDetailsMixin(BaseEndpointMixin):
                 data=monitor.get_audit_log_data(),
             )
 
+        if reindex_deadlines:
+            deadlines.index_monitor(monitor.id)
+
         # Update alert rule after in case slug or name changed
         if "alert_rule" in result:
             # Check to see if rule exists
@@ -33,6 +33,7 @@ from sentry.constants import ObjectStatus
 from sentry.db.models.query import in_iexact
 from sentry.models.environment import Environment
 from sentry.models.organization import Organization
+from sentry.monitors import deadlines
 from sentry.monitors.models import (
     Monitor,
     MonitorEnvironment,
@@ -419,6 +420,11 @@ class OrganizationMonitorIndexEndpoint(OrganizationEndpoint):
                 monitor.update(**result)
                 updated.append(monitor)
 
+            # Environments of disabled monitors are dropped from the deadline index once their
+            # deadline passes
+            if status == ObjectStatus.ACTIVE:
+                deadlines.index_monitor(monitor.id)
+
         return self.respond(
             {
                 "updated": serialize(list(updated), request.user),
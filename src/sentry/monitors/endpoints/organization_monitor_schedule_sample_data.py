@@ -4,8 +4,6 @@ import zoneinfo
 from datetime import datetime
 from typing import cast
 
-from croniter import croniter
-from dateutil import rrule
 from rest_framework import serializers
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -16,8 +14,8 @@ from sentry.api.base import region_silo_endpoint
 from sentry.api.bases.organization import OrganizationEndpoint
 from sentry.models.organization import Organization
 from sentry.monitors.models import ScheduleType
-from sentry.monitors.schedule import SCHEDULE_INTERVAL_MAP
-from sentry.monitors.types import IntervalUnit
+from sentry.monitors.schedule import get_next_schedules
+from sentry.monitors.types import CrontabSchedule, IntervalSchedule, IntervalUnit
 from sentry.monitors.validators import ConfigValidator
 
 MAX_TICKS = 100
@@ -55,21 +53,13 @@ class OrganizationMonitorScheduleSampleDataEndpoint(OrganizationEndpoint):
         reference_ts = datetime.now(tz=tz).replace(minute=0, second=0, microsecond=0)
         ticks: list[datetime] = []
         if schedule_type == ScheduleType.CRONTAB:
-            iterator = croniter(schedule, reference_ts)
-            while len(ticks) < num_ticks:
-                ticks.append(iterator.get_next(datetime))
+            ticks = get_next_schedules(reference_ts, CrontabSchedule(schedule), num_ticks)
 
         elif schedule_type == ScheduleType.INTERVAL:
-            rule = rrule.rrule(
-                freq=SCHEDULE_INTERVAL_MAP[cast(IntervalUnit, schedule[1])],
-                interval=schedule[0],
-                dtstart=reference_ts,
-                count=num_ticks,
+            interval_schedule = IntervalSchedule(
+                interval=schedule[0], unit=cast(IntervalUnit, schedule[1])
             )
-            new_date = reference_ts
-            ticks.append(new_date)
-            while len(ticks) < num_ticks:
-                new_date = rule.after(new_date)
-                ticks.append(new_date)
+            ticks.append(reference_ts)
+            ticks.extend(get_next_schedules(reference_ts, interval_schedule, num_ticks - 1))
 
         return Response([int(ts.timestamp()) for ts in ticks])
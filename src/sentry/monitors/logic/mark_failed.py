@@ -12,6 +12,7 @@ from django.utils.text import get_text_list
 from django.utils.translation import gettext_lazy as _
 
 from sentry.issues.grouptype import MonitorIncidentType
+from sentry.monitors import deadlines
 from sentry.monitors.models import (
     CheckInStatus,
     MonitorCheckIn,
@@ -82,6 +83,8 @@ def mark_failed(
     if not affected:
         return False
 
+    deadlines.index_missed(monitor_env.id, next_checkin_latest)
+
     # refresh the object from the database so we have the updated values in our
     # cached instance
     monitor_env.refresh_from_db()
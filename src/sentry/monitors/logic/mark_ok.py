@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 from django.utils import timezone
 
 from sentry import analytics
+from sentry.monitors import deadlines
 from sentry.monitors.models import CheckInStatus, MonitorCheckIn, MonitorEnvironment, MonitorStatus
 from sentry.monitors.tasks.detect_broken_monitor_envs import NUM_DAYS_BROKEN_PERIOD
 
@@ -76,9 +77,13 @@ def mark_ok(checkin: MonitorCheckIn, ts: datetime):
                             monitor_env_id=monitor_env.id,
                         )
 
-    MonitorEnvironment.objects.filter(id=monitor_env.id).exclude(last_checkin__gt=ts).update(
-        **params
+    affected = (
+        MonitorEnvironment.objects.filter(id=monitor_env.id)
+        .exclude(last_checkin__gt=ts)
+        .update(**params)
     )
+    if affected:
+        deadlines.index_missed(monitor_env.id, next_checkin_latest)
 
 
 def resolve_incident_group(
@@ -1,4 +1,6 @@
-from datetime import datetime
+import copy
+from datetime import datetime, timedelta
+from functools import lru_cache
 
 from croniter import croniter
 from dateutil import rrule
@@ -14,6 +16,40 @@ SCHEDULE_INTERVAL_MAP: dict[IntervalUnit, int] = {
     "minute": rrule.MINUTELY,
 }
 
+# Interval units of a fixed length. The occurrences of these rules are computed arithmetically
+# instead of by iterating the rrule, which produces the same wall clock times.
+FIXED_INTERVAL_UNITS: dict[IntervalUnit, str] = {
+    "week": "weeks",
+    "day": "days",
+    "hour": "hours",
+    "minute": "minutes",
+}
+
+# The number of parsed crontab expressions kept in memory per process.
+CRONTAB_CACHE_SIZE = 10_000
+
+
+@lru_cache(maxsize=CRONTAB_CACHE_SIZE)
+def _compile_crontab(crontab: str) -> croniter:
+    return croniter(crontab)
+
+
+def _get_crontab_iterator(crontab: str, reference_ts: datetime) -> croniter:
+    """
+    Returns a croniter for the crontab positioned at the reference_ts. Parsing the expression is
+    most of the cost of creating a croniter, so the parsed expression is reused across calls and
+    only the (cheap) position is set on a copy.
+    """
+    iterator = copy.copy(_compile_crontab(crontab))
+    iterator.set_current(reference_ts, force=True)
+    return iterator
+
+
+def _get_interval_delta(schedule: ScheduleConfig) -> timedelta | None:
+    if schedule.type != "interval" or schedule.unit not in FIXED_INTERVAL_UNITS:
+        return None
+    return timedelta(**{FIXED_INTERVAL_UNITS[schedule.unit]: schedule.interval})
+
 
 def get_next_schedule(
     reference_ts: datetime,
@@ -38,10 +74,14 @@ def get_next_schedule(
     # of granularity we're able to support
 
     if schedule.type == "crontab":
-        iterator = croniter(schedule.crontab, reference_ts)
+        iterator = _get_crontab_iterator(schedule.crontab, reference_ts)
         return iterator.get_next(datetime).replace(second=0, microsecond=0)
 
     if schedule.type == "interval":
+        delta = _get_interval_delta(schedule)
+        if delta is not None:
+            return (reference_ts.replace(microsecond=0) + delta).replace(second=0)
+
         rule = rrule.rrule(
             freq=SCHEDULE_INTERVAL_MAP[schedule.unit],
             interval=schedule.interval,
@@ -53,6 +93,40 @@ def get_next_schedule(
     raise NotImplementedError("unknown schedule_type")
 
 
+def get_next_schedules(
+    reference_ts: datetime,
+    schedule: ScheduleConfig,
+    count: int,
+) -> list[datetime]:
+    """
+    Determines the next `count` timestamps of a schedule after the
+    reference_ts. Unlike `get_next_schedule` the timestamps are not clamped to
+    the minute.
+
+    >>> get_next_schedules('05:30', CrontabSchedule('0 * * * *'), 3)
+    >>> [06:00, 07:00, 08:00]
+    """
+    if schedule.type == "crontab":
+        iterator = _get_crontab_iterator(schedule.crontab, reference_ts)
+        return [iterator.get_next(datetime) for _ in range(count)]
+
+    if schedule.type == "interval":
+        delta = _get_interval_delta(schedule)
+        if delta is not None:
+            start_ts = reference_ts.replace(microsecond=0)
+            return [start_ts + delta * (tick + 1) for tick in range(count)]
+
+        rule = rrule.rrule(
+            freq=SCHEDULE_INTERVAL_MAP[schedule.unit],
+            interval=schedule.interval,
+            dtstart=reference_ts,
+            count=count + 1,
+        )
+        return [ts for ts in rule if ts > reference_ts][:count]
+
+    raise NotImplementedError("unknown schedule_type")
+
+
 def get_prev_schedule(
     start_ts: datetime,
     reference_ts: datetime,
@@ -78,12 +152,28 @@ def get_prev_schedule(
     """
     if schedule.type == "crontab":
         return (
-            croniter(schedule.crontab, reference_ts)
+            _get_crontab_iterator(schedule.crontab, reference_ts)
             .get_prev(datetime)
             .replace(second=0, microsecond=0)
         )
 
     if schedule.type == "interval":
+        # The rrule compares wall clock times when both timestamps are in the
+        # same timezone, which the arithmetic below relies on. Iterating the
+        # rrule from the start_ts is linear in the number of occurrences since.
+        delta = _get_interval_delta(schedule)
+        start_wall_ts = start_ts.replace(microsecond=0, tzinfo=None)
+        reference_wall_ts = reference_ts.replace(tzinfo=None)
+        if (
+            delta is not None
+            and start_ts.tzinfo is reference_ts.tzinfo
+            and start_wall_ts < reference_wall_ts
+        ):
+            # The last occurrence strictly before the reference_ts
+            occurrences = (reference_wall_ts - start_wall_ts - timedelta(microseconds=1)) // delta
+            prev_ts = start_wall_ts + delta * occurrences
+            return prev_ts.replace(second=0, tzinfo=reference_ts.tzinfo)
+
         rule = rrule.rrule(
             freq=SCHEDULE_INTERVAL_MAP[schedule.unit],
             interval=schedule.interval,
@@ -56,12 +56,14 @@ class DjangoNodeStorage(NodeStorage):
         create_or_update(Node, id=id, values={"data": compress(data), "timestamp": timezone.now()})
 
     def cleanup(self, cutoff_timestamp: datetime) -> None:
-        from sentry.db.deletion import BulkDeleteQuery
+        from sentry.db.deletion import TARGET_CHUNK_DURATION, BulkDeleteQuery
 
         total_seconds = (timezone.now() - cutoff_timestamp).total_seconds()
         days = math.floor(total_seconds / 86400)
 
-        BulkDeleteQuery(model=Node, dtfield="timestamp", days=days).execute()
+        BulkDeleteQuery(model=Node, dtfield="timestamp", days=days).execute(
+            target_duration=TARGET_CHUNK_DURATION
+        )
         if self.cache:
             self.cache.clear()
 
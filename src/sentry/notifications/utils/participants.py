@@ -3,11 +3,12 @@ from __future__ import annotations
 import logging
 from collections import defaultdict
 from collections.abc import Iterable, Mapping, MutableMapping, Sequence
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
+from django.core.cache import cache
 from django.db.models import Q
 
-from sentry import features
+from sentry import features, options
 from sentry.integrations.types import ExternalProviders
 from sentry.integrations.utils.providers import get_provider_enum_from_string
 from sentry.models.commit import Commit
@@ -38,6 +39,7 @@ from sentry.services.hybrid_cloud.user_option import get_option_from_list, user_
 from sentry.types.actor import Actor, ActorType
 from sentry.utils import json, metrics
 from sentry.utils.committers import AuthorCommitsSerialized, get_serialized_event_file_committers
+from sentry.utils.hashlib import md5_text
 
 if TYPE_CHECKING:
     from sentry.eventstore.models import Event
@@ -52,6 +54,15 @@ AVAILABLE_PROVIDERS = {
 
 FALLTHROUGH_NOTIFICATION_LIMIT = 20
 
+# Recipients are resolved over and over for the same projects and teams during bursts of issue
+# alerts, so the team memberships, project members and notification settings they're resolved
+# from can be cached for `notifications.recipients.cache-ttl` seconds.
+TEAM_MEMBERS_CACHE_KEY = "notifications.recipients.team-members:{team_id}"
+PROJECT_MEMBERS_CACHE_KEY = "notifications.recipients.project-members:{project_id}"
+SETTINGS_CACHE_KEY = "notifications.recipients.settings:{hash}"
+
+K = TypeVar("K")
+
 
 class ParticipantMap:
     _dict: MutableMapping[ExternalProviders, MutableMapping[Actor, int]]
@@ -220,10 +231,7 @@ def get_owners(
 
     elif owners == ProjectOwnership.Everyone:
         outcome = "everyone"
-        users = user_service.get_many_by_id(
-            ids=list(project.member_set.values_list("user_id", flat=True))
-        )
-        recipients = Actor.many_from_object(users)
+        recipients = Actor.many_from_object(get_project_member_users(project))
 
     else:
         outcome = "match"
@@ -396,6 +404,39 @@ def get_send_to(
     )
 
 
+def get_send_to_many(
+    project: Project,
+    target_type: ActionTargetType,
+    target_identifier: int | None = None,
+    events: Iterable[Event] = (),
+    notification_type_enum: NotificationSettingEnum = NotificationSettingEnum.ISSUE_ALERTS,
+    fallthrough_choice: FallthroughChoiceType | None = None,
+    notification_uuid: str | None = None,
+) -> Mapping[Event, Mapping[ExternalProviders, set[Actor]]]:
+    """
+    Like `get_send_to` for many events of a project at once. The eligible recipients of each
+    event are determined separately, but the notification settings of all of them are resolved
+    together.
+    """
+    recipients_by_event = {
+        event: determine_eligible_recipients(
+            project, target_type, target_identifier, event, fallthrough_choice
+        )
+        for event in events
+    }
+    if not recipients_by_event:
+        return {}
+
+    return _get_recipients_by_provider_many(
+        project,
+        recipients_by_event,
+        notification_type_enum,
+        target_type,
+        target_identifier,
+        notification_uuid,
+    )
+
+
 def get_fallthrough_recipients(
     project: Project, fallthrough_choice: FallthroughChoiceType | None
 ) -> Iterable[RpcUser]:
@@ -407,14 +448,10 @@ def get_fallthrough_recipients(
         return []
 
     elif fallthrough_choice == FallthroughChoiceType.ALL_MEMBERS:
-        return user_service.get_many_by_id(
-            ids=list(project.member_set.values_list("user_id", flat=True))
-        )
+        return get_project_member_users(project)
 
     elif fallthrough_choice == FallthroughChoiceType.ACTIVE_MEMBERS:
-        member_users = user_service.get_many_by_id(
-            ids=list(project.member_set.values_list("user_id", flat=True)),
-        )
+        member_users = list(get_project_member_users(project))
         member_users.sort(
             key=lambda u: u.last_active.isoformat() if u.last_active else "", reverse=True
         )
@@ -423,6 +460,22 @@ def get_fallthrough_recipients(
     raise NotImplementedError(f"Unknown fallthrough choice: {fallthrough_choice}")
 
 
+def get_project_member_users(project: Project) -> list[RpcUser]:
+    ttl = options.get("notifications.recipients.cache-ttl")
+    cache_key = PROJECT_MEMBERS_CACHE_KEY.format(project_id=project.id)
+    if ttl > 0:
+        users = cache.get(cache_key)
+        if users is not None:
+            return users
+
+    users = user_service.get_many_by_id(
+        ids=list(project.member_set.values_list("user_id", flat=True))
+    )
+    if ttl > 0:
+        cache.set(cache_key, users, ttl)
+    return users
+
+
 def get_user_from_identifier(
     project: Project, target_identifier: str | int | None
 ) -> RpcUser | None:
@@ -469,10 +522,51 @@ def _partition_recipients(
     return mapping
 
 
+def _get_team_member_user_ids(team_ids: Iterable[int]) -> Mapping[int, set[int]]:
+    team_ids = set(team_ids)
+    ttl = options.get("notifications.recipients.cache-ttl")
+    user_ids_by_team: dict[int, set[int]] = {}
+    if ttl > 0:
+        cached = cache.get_many(
+            [TEAM_MEMBERS_CACHE_KEY.format(team_id=team_id) for team_id in team_ids]
+        )
+        for team_id in team_ids:
+            user_ids = cached.get(TEAM_MEMBERS_CACHE_KEY.format(team_id=team_id))
+            if user_ids is not None:
+                user_ids_by_team[team_id] = user_ids
+
+    missing_team_ids = team_ids - user_ids_by_team.keys()
+    if not missing_team_ids:
+        return user_ids_by_team
+
+    fetched: dict[int, set[int]] = {team_id: set() for team_id in missing_team_ids}
+    members = OrganizationMemberTeam.objects.filter(team_id__in=missing_team_ids).select_related(
+        "organizationmember"
+    )
+    for member in members:
+        if member.organizationmember.user_id is not None:
+            fetched[member.team_id].add(member.organizationmember.user_id)
+    if ttl > 0:
+        cache.set_many(
+            {
+                TEAM_MEMBERS_CACHE_KEY.format(team_id=team_id): user_ids
+                for team_id, user_ids in fetched.items()
+            },
+            ttl,
+        )
+
+    user_ids_by_team.update(fetched)
+    return user_ids_by_team
+
+
 def _get_users_from_team_fall_back(
     teams: Iterable[Actor],
     recipients_by_provider: Mapping[ExternalProviders, Iterable[Actor]],
-) -> Iterable[RpcUser]:
+) -> Mapping[Actor, set[Actor]]:
+    """
+    Returns the users of each of the teams that have no notification settings for any of the
+    providers, who are notified in place of their team.
+    """
     assert all(team.is_team for team in teams)
 
     teams_to_fall_back = set(teams)
@@ -481,15 +575,18 @@ def _get_users_from_team_fall_back(
             teams_to_fall_back.remove(recipient)
 
     # Fall back to notifying each subscribed user if there aren't team notification settings
-    members = OrganizationMemberTeam.objects.filter(
-        team_id__in=[team.id for team in teams_to_fall_back]
-    ).select_related("organizationmember")
-    user_ids = {
-        member.organizationmember.user_id
-        for member in members
-        if member.organizationmember.user_id is not None
+    user_ids_by_team = _get_team_member_user_ids(team.id for team in teams_to_fall_back)
+    user_ids = set().union(*user_ids_by_team.values())
+    users_by_id = {
+        user.id: user
+        for user in Actor.many_from_object(user_service.get_many_by_id(ids=list(user_ids)))
+    }
+    return {
+        team: {
+            users_by_id[user_id] for user_id in user_ids_by_team[team.id] if user_id in users_by_id
+        }
+        for team in teams_to_fall_back
     }
-    return user_service.get_many_by_id(ids=list(user_ids))
 
 
 def combine_recipients_by_provider(
@@ -514,13 +611,38 @@ def get_notification_recipients(
     project_ids: list[int] | None = None,
     actor_type: ActorType | None = None,
 ) -> Mapping[ExternalProviders, set[Actor]]:
-    recipients_by_provider = notifications_service.get_notification_recipients(
-        recipients=list(recipients),
-        type=type,
-        organization_id=organization_id,
-        project_ids=project_ids,
-        actor_type=actor_type,
-    )
+    recipients = list(recipients)
+    ttl = options.get("notifications.recipients.cache-ttl")
+    cache_key = None
+    recipients_by_provider = None
+    if ttl > 0:
+        cache_key = SETTINGS_CACHE_KEY.format(
+            hash=md5_text(
+                json.dumps(
+                    [
+                        type,
+                        organization_id,
+                        sorted(project_ids or ()),
+                        actor_type,
+                        sorted((recipient.actor_type, recipient.id) for recipient in recipients),
+                    ],
+                    default=str,
+                )
+            ).hexdigest()
+        )
+        recipients_by_provider = cache.get(cache_key)
+
+    if recipients_by_provider is None:
+        recipients_by_provider = notifications_service.get_notification_recipients(
+            recipients=recipients,
+            type=type,
+            organization_id=organization_id,
+            project_ids=project_ids,
+            actor_type=actor_type,
+        )
+        if cache_key is not None:
+            cache.set(cache_key, recipients_by_provider, ttl)
+
     # ensure we use a defaultdict here in case someone tries to access a provider that has no recipients
     out = defaultdict(set)
     for provider, actors in recipients_by_provider.items():
@@ -555,9 +677,37 @@ def _get_recipients_by_provider(
     notification_uuid: str | None = None,
 ) -> Mapping[ExternalProviders, set[Actor]]:
     """Get the lists of recipients that should receive an Issue Alert by ExternalProvider."""
-    recipients_by_type = _partition_recipients(recipients)
-    teams = recipients_by_type[ActorType.TEAM]
-    users = recipients_by_type[ActorType.USER]
+    return _get_recipients_by_provider_many(
+        project,
+        {None: recipients},
+        notification_type_enum,
+        target_type,
+        target_identifier,
+        notification_uuid,
+    )[None]
+
+
+def _get_recipients_by_provider_many(
+    project: Project,
+    recipients_by_key: Mapping[K, Iterable[Actor]],
+    notification_type_enum: NotificationSettingEnum = NotificationSettingEnum.ISSUE_ALERTS,
+    target_type: ActionTargetType | None = None,
+    target_identifier: int | None = None,
+    notification_uuid: str | None = None,
+) -> dict[K, Mapping[ExternalProviders, set[Actor]]]:
+    """
+    Like `_get_recipients_by_provider` for several sets of recipients, whose notification
+    settings are resolved together.
+    """
+    recipients_by_type_by_key = {
+        key: _partition_recipients(recipients) for key, recipients in recipients_by_key.items()
+    }
+    all_teams: set[Actor] = set().union(
+        *(
+            recipients_by_type[ActorType.TEAM]
+            for recipients_by_type in recipients_by_type_by_key.values()
+        )
+    )
 
     # First evaluate the teams.
     setting_type = notification_type_enum
@@ -565,7 +715,7 @@ def _get_recipients_by_provider(
 
     # get by team
     teams_by_provider = get_notification_recipients(
-        recipients=teams,
+        recipients=all_teams,
         type=setting_type,
         organization_id=project.organization_id,
         project_ids=[project.id],
@@ -580,19 +730,61 @@ def _get_recipients_by_provider(
     }
 
     # If there are any teams that didn't get added, fall back and add all users.
-    users |= set(Actor.many_from_object(_get_users_from_team_fall_back(teams, teams_by_provider)))
+    fall_back_users = _get_users_from_team_fall_back(all_teams, teams_by_provider)
+    users_by_key: dict[K, set[Actor]] = {}
+    for key, recipients_by_type in recipients_by_type_by_key.items():
+        users = set(recipients_by_type[ActorType.USER])
+        for team in recipients_by_type[ActorType.TEAM]:
+            users |= fall_back_users.get(team, set())
+        users_by_key[key] = users
 
     # Repeat for users.
     users_by_provider: Mapping[ExternalProviders, Iterable[Actor]] = {}
     # convert from string to enum
     users_by_provider = get_notification_recipients(
-        recipients=users,
+        recipients=set().union(*users_by_key.values()),
         type=setting_type,
         organization_id=project.organization_id,
         project_ids=[project.id],
         actor_type=ActorType.USER,
     )
 
+    result = {}
+    for key, recipients_by_type in recipients_by_type_by_key.items():
+        teams = recipients_by_type[ActorType.TEAM]
+        users = users_by_key[key]
+        key_teams_by_provider = {
+            provider: {team for team in provider_teams if team in teams}
+            for provider, provider_teams in teams_by_provider.items()
+        }
+        key_users_by_provider = {
+            provider: {user for user in provider_users if user in users}
+            for provider, provider_users in users_by_provider.items()
+        }
+        _log_recipients_by_provider(
+            project,
+            teams,
+            users,
+            key_teams_by_provider,
+            key_users_by_provider,
+            target_type,
+            target_identifier,
+            notification_uuid,
+        )
+        result[key] = combine_recipients_by_provider(key_teams_by_provider, key_users_by_provider)
+    return result
+
+
+def _log_recipients_by_provider(
+    project: Project,
+    teams: Iterable[Actor],
+    users: Iterable[Actor],
+    teams_by_provider: Mapping[ExternalProviders, Iterable[Actor]],
+    users_by_provider: Mapping[ExternalProviders, Iterable[Actor]],
+    target_type: ActionTargetType | None,
+    target_identifier: int | None,
+    notification_uuid: str | None,
+) -> None:
     # TODO(jangjodi): Remove the try-except once INC-564 prevention steps are completed
     try:
         teams_by_provider_dict = {
@@ -617,5 +809,3 @@ def _get_recipients_by_provider(
         logger.info("sentry.notifications.recipients_by_provider", extra=extra)
     except Exception as e:
         logger.exception("Unable to log recipients_by_provider: %s", e)
-
-    return combine_recipients_by_provider(teams_by_provider, users_by_provider)
@@ -464,6 +464,13 @@ register(
     default=[],
     flags=FLAG_ALLOW_EMPTY | FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Decode only the custom events of a recording segment when extracting replay actions.
+register(
+    "replay.consumer.recording.scan-custom-events",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 
 # User Feedback Options
 register(
@@ -625,6 +632,14 @@ register("snuba.search.chunk-growth-rate", default=1.5, flags=FLAG_AUTOMATOR_MOD
 register("snuba.search.max-chunk-size", default=2000, flags=FLAG_AUTOMATOR_MODIFIABLE)
 register("snuba.search.max-total-chunk-time-seconds", default=30.0, flags=FLAG_AUTOMATOR_MODIFIABLE)
 register("snuba.search.hits-sample-size", default=100, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Serve repeated issue searches and their later pages from the groups collected by a recent
+# identical search for up to 30 seconds.
+register(
+    "snuba.search.result-cache.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 register("snuba.track-outcomes-sample-rate", default=0.0, flags=FLAG_AUTOMATOR_MODIFIABLE)
 
 # The percentage of tagkeys that we want to cache. Set to 1.0 in order to cache everything, <=0.0 to stop caching
@@ -634,6 +649,131 @@ register(
     flags=FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# The number of batch fragments of a discover export that are fetched from Snuba at a time.
+register(
+    "data-export.concurrent-fetches",
+    type=Int,
+    default=1,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Store digest records as references to their events rather than the events themselves.
+register(
+    "digests.compact-records",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Run the scheduling and maintenance of digests on all hosts of the digest cluster concurrently.
+register(
+    "digests.concurrent-partitions",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# The number of digests delivered by a single task.
+register(
+    "digests.delivery-batch-size",
+    type=Int,
+    default=1,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# The number of seconds the team memberships, project members and notification settings used to
+# resolve the recipients of notifications are cached for, 0 disables the cache.
+register(
+    "notifications.recipients.cache-ttl",
+    type=Int,
+    default=0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# The number of shards the child relations listed in `deletions.parallel.models` are split into
+# and deleted by in parallel when deleting a project or organization. 0 deletes them serially.
+register(
+    "deletions.parallel.num-shards",
+    type=Int,
+    default=0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+register(
+    "deletions.parallel.models",
+    type=Sequence,
+    default=["sentry.Group"],
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# The fraction of time a deletion shard spends deleting, it pauses after each chunk for the rest.
+register(
+    "deletions.parallel.duty-cycle",
+    type=Float,
+    default=0.5,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# The number of time slices an issues-by-tag export is split into and aggregated in parallel.
+register(
+    "data-export.issues-by-tag.time-slices",
+    type=Int,
+    default=1,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Transform the results of discover queries column by column rather than row by row.
+register(
+    "snuba.columnar-results",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Serve the tags of issues from precomputed summaries, which are kept up to date for the issues
+# whose tags were recently requested. A summary of an issue that has seen new events since it was
+# computed is used for up to `max-age` seconds.
+register(
+    "tagstore.group-tag-summary.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+register(
+    "tagstore.group-tag-summary.max-age",
+    type=Int,
+    default=300,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Coalesce identical cached Snuba queries across processes: only the holder of a lease on the
+# query's cache key runs it, and the others wait up to `max-wait` seconds for its result.
+register(
+    "snuba.query-cache.single-flight",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+register(
+    "snuba.query-cache.single-flight.max-wait",
+    type=Float,
+    default=5.0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Cache the closed buckets of discover timeseries queries and only query the missing ones. Buckets
+# are considered closed once they ended more than `settle-seconds` ago.
+register(
+    "snuba.timeseries-cache.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+register(
+    "snuba.timeseries-cache.settle-seconds",
+    type=Int,
+    default=300,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # Kafka Publisher
 register("kafka-publisher.raw-event-sample-rate", default=0.0, flags=FLAG_AUTOMATOR_MODIFIABLE)
 
@@ -1000,6 +1140,27 @@ register(
     default=[],
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Run the Snuba queries of the group serializers alongside their Postgres queries.
+register(
+    "api.group-serializer.concurrent-attrs",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Run the hits count of paginated queries alongside the page query.
+register(
+    "api.paginator.concurrent-queries",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Fetch the next page of keyset paginated queries along with the current one and cache it.
+register(
+    "api.paginator.prefetch-next-page",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 
 # Switch for new logic for release health metrics, based on filtering on org & project ids
 register(
@@ -1925,6 +2086,24 @@ register(
 # Killswitch for monitor check-ins
 register("crons.organization.disable-check-in", type=Sequence, default=[])
 
+# Load the monitor and monitor environment once per group of check-ins processed by the monitors
+# consumer, and create consecutive completed check-ins of a group with a single insert.
+register(
+    "crons.bulk-checkins",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Find missed check-ins and timed out check-ins on each clock tick from the sorted deadline index
+# instead of scanning the database. Run `sentry.monitors.deadlines.backfill` before enabling.
+register(
+    "crons.deadline-index",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # Sets the timeout for webhooks
 register(
     "sentry-apps.webhook.timeout.sec",
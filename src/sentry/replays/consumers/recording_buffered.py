@@ -19,6 +19,17 @@ This option limits the amount of time a message will wait in the buffer before b
 this value exceeds the Kafka commit interval then the Kafka offsets will not be committed until the
 buffer has been flushed and fully committed.
 
+**max_upload_workers:**
+
+This option limits the number of concurrent blob uploads. The upload pool is shared for the
+lifetime of the consumer so storage connections are reused between flushes.
+
+**max_pending_commits:**
+
+This option limits the number of flushed buffers which may be uploading at a given time. While
+a buffer is being committed the next buffer continues to fill. Once the limit is reached the
+consumer stops accepting messages until an in-flight commit completes (backpressure).
+
 # Errors
 
 All deterministic errors must be handled otherwise the consumer will deadlock and progress will
@@ -41,7 +52,8 @@ from __future__ import annotations
 import logging
 import time
 from collections.abc import Mapping
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import partial
 from typing import Any, TypedDict
 
 import sentry_sdk
@@ -49,11 +61,12 @@ from arroyo.backends.kafka.consumer import KafkaPayload
 from arroyo.processing.strategies.abstract import ProcessingStrategy, ProcessingStrategyFactory
 from arroyo.processing.strategies.buffer import Buffer
 from arroyo.processing.strategies.commit import CommitOffsets
-from arroyo.processing.strategies.run_task import RunTask
+from arroyo.processing.strategies.run_task_in_threads import RunTaskInThreads
 from arroyo.types import BaseValue, Commit, Message, Partition
 from sentry_kafka_schemas.codecs import Codec, ValidationError
 from sentry_kafka_schemas.schema_types.ingest_replay_recordings_v1 import ReplayRecording
 
+from sentry import options
 from sentry.conf.types.kafka_definition import Topic, get_topic_codec
 from sentry.replays.lib.storage import (
     RecordingSegmentStorageMeta,
@@ -65,6 +78,7 @@ from sentry.replays.usecases.ingest import decompress, process_headers, track_in
 from sentry.replays.usecases.ingest.dom_index import (
     ReplayActionsEvent,
     emit_replay_actions,
+    iter_custom_events_from_segment,
     parse_replay_actions,
 )
 from sentry.utils import json, metrics
@@ -113,10 +127,14 @@ class RecordingBufferedStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
         max_buffer_message_count: int,
         max_buffer_size_in_bytes: int,
         max_buffer_time_in_seconds: int,
+        max_upload_workers: int = 8,
+        max_pending_commits: int = 1,
     ) -> None:
         self.max_buffer_message_count = max_buffer_message_count
         self.max_buffer_size_in_bytes = max_buffer_size_in_bytes
         self.max_buffer_time_in_seconds = max_buffer_time_in_seconds
+        self.max_pending_commits = max_pending_commits
+        self.upload_pool = ThreadPoolExecutor(max_workers=max_upload_workers)
 
     def create_with_partitions(
         self,
@@ -129,12 +147,17 @@ class RecordingBufferedStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
                 self.max_buffer_size_in_bytes,
                 self.max_buffer_time_in_seconds,
             ),
-            next_step=RunTask(
-                function=process_commit,
+            next_step=RunTaskInThreads(
+                processing_function=partial(process_commit, self.upload_pool),
+                concurrency=self.max_pending_commits,
+                max_pending_futures=self.max_pending_commits,
                 next_step=CommitOffsets(commit),
             ),
         )
 
+    def shutdown(self) -> None:
+        self.upload_pool.shutdown()
+
 
 class UploadEvent(TypedDict):
     key: str
@@ -275,7 +298,12 @@ def process_message(buffer: RecordingBuffer, message: bytes) -> None:
             decompressed_segment = decompress(recording_data)
 
         with sentry_sdk.start_span(op="replays.consumer.recording.json_loads_segment"):
-            parsed_recording_data = json.loads(decompressed_segment)
+            # Only custom events are used to build replay actions. When enabled we lazily
+            # decode them rather than loading the whole segment.
+            if options.get("replay.consumer.recording.scan-custom-events"):
+                parsed_recording_data = iter_custom_events_from_segment(decompressed_segment)
+            else:
+                parsed_recording_data = json.loads(decompressed_segment)
             parsed_replay_event = (
                 json.loads(cast_payload_bytes(decoded_message["replay_event"]))
                 if decoded_message.get("replay_event")
@@ -320,23 +348,36 @@ def process_message(buffer: RecordingBuffer, message: bytes) -> None:
 
 
 def process_commit(
-    message: Message[tuple[list[UploadEvent], list[InitialSegmentEvent], list[ReplayActionsEvent]]]
+    pool: ThreadPoolExecutor,
+    message: Message[tuple[list[UploadEvent], list[InitialSegmentEvent], list[ReplayActionsEvent]]],
 ) -> None:
     # High I/O section.
     with sentry_sdk.start_span(op="replays.consumer.recording.commit_buffer"):
         upload_events, initial_segment_events, replay_action_events = message.payload
-        commit_uploads(upload_events)
+        commit_uploads(upload_events, pool)
         commit_initial_segments(initial_segment_events)
         commit_replay_actions(replay_action_events)
 
 
-def commit_uploads(upload_events: list[UploadEvent]) -> None:
+def commit_uploads(
+    upload_events: list[UploadEvent],
+    pool: ThreadPoolExecutor | None = None,
+) -> None:
+    if not upload_events:
+        return None
+
+    start = time.monotonic()
+
     with sentry_sdk.start_span(op="replays.consumer.recording.upload_segments"):
         # This will run to completion taking potentially an infinite amount of time. However,
         # that outcome is unlikely. In the event of an indefinite backlog the process can be
         # restarted.
-        with ThreadPoolExecutor(max_workers=len(upload_events)) as pool:
+        if pool is None:
+            with ThreadPoolExecutor(max_workers=len(upload_events)) as local_pool:
+                futures = [local_pool.submit(_do_upload, upload) for upload in upload_events]
+        else:
             futures = [pool.submit(_do_upload, upload) for upload in upload_events]
+            wait(futures)
 
     has_errors = False
 
@@ -354,6 +395,16 @@ def commit_uploads(upload_events: list[UploadEvent]) -> None:
     if has_errors:
         raise BufferCommitFailed("Could not upload one or more recordings.")
 
+    # Per-flush metrics. Upload latency percentiles are derived from the per-upload timing
+    # emitted by "_do_upload".
+    metrics.distribution(
+        "replays.recording_consumer.flush.size",
+        sum(len(upload["value"]) for upload in upload_events),
+        unit="byte",
+    )
+    metrics.distribution("replays.recording_consumer.flush.segments", len(upload_events))
+    metrics.timing("replays.recording_consumer.flush.duration", time.monotonic() - start)
+
 
 def commit_initial_segments(initial_segment_events: list[InitialSegmentEvent]) -> None:
     for segment in initial_segment_events:
@@ -373,8 +424,12 @@ def commit_replay_actions(replay_action_events: list[ReplayActionsEvent]) -> Non
 
 
 def _do_upload(upload_event: UploadEvent) -> None:
+    start = time.monotonic()
+
     with sentry_sdk.start_span(op="replays.consumer.recording.upload_segment"):
         # If an error occurs this will retry up to five times by default.
         #
         # Refer to `src.sentry.filestore.gcs.GCS_RETRIES`.
         storage_kv.set(upload_event["key"], upload_event["value"])
+
+    metrics.timing("replays.recording_consumer.upload_latency", time.monotonic() - start)
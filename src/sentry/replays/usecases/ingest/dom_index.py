@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import logging
 import random
+import re
 import time
 import uuid
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
 from hashlib import md5
 from typing import Any, Literal, TypedDict
 
@@ -24,6 +25,11 @@ EVENT_LIMIT = 20
 
 replay_publisher: KafkaPublisher | None = None
 
+# RRWeb events are serialized by the SDK with the "type" key first. This lets us find custom
+# events (type 5) in a segment without decoding the snapshot and mutation events around them.
+SEGMENT_PREFIX_RE = re.compile(r'\s*\[\s*(?:\]|\{\s*"type"\s*:)')
+CUSTOM_EVENT_RE = re.compile(r'\{\s*"type"\s*:\s*5\s*,')
+
 ReplayActionsEventPayloadClick = TypedDict(
     "ReplayActionsEventPayloadClick",
     {
@@ -85,7 +91,7 @@ def parse_replay_actions(
     project_id: int,
     replay_id: str,
     retention_days: int,
-    segment_data: list[dict[str, Any]],
+    segment_data: Iterable[dict[str, Any]],
     replay_event: dict[str, Any] | None,
 ) -> ReplayActionsEvent | None:
     """Parse RRWeb payload to ReplayActionsEvent."""
@@ -155,7 +161,7 @@ def log_canvas_size(
 def get_user_actions(
     project_id: int,
     replay_id: str,
-    events: list[dict[str, Any]],
+    events: Iterable[dict[str, Any]],
     replay_event: dict[str, Any] | None,
 ) -> list[ReplayActionsEventPayloadClick]:
     """Return a list of ReplayActionsEventPayloadClick types.
@@ -323,12 +329,42 @@ def _should_report_rage_click_issue(project_id: int) -> bool:
     return all([_project_has_feature_enabled(), _project_has_option_enabled()])
 
 
-def _iter_custom_events(events: list[dict[str, Any]]) -> Generator[dict[str, Any], None, None]:
+def _iter_custom_events(events: Iterable[dict[str, Any]]) -> Generator[dict[str, Any], None, None]:
     for event in events:
         if event.get("type") == 5:
             yield event
 
 
+def iter_custom_events_from_segment(segment: bytes) -> Generator[dict[str, Any], None, None]:
+    """Yield the custom events of a decompressed RRWeb segment.
+
+    Only the custom events are decoded. Full snapshot and incremental (mutation) events, which
+    make up the bulk of a segment, are never materialized. Iteration is lazy so callers which
+    stop early (e.g. after collecting the maximum number of clicks) do not scan the remainder of
+    the segment.
+
+    This relies on the SDK serializing the "type" key first. Segments whose first event does not
+    lead with the "type" key were not produced by the SDK's serializer and are decoded in full.
+    """
+    text = segment.decode("utf-8")
+
+    if SEGMENT_PREFIX_RE.match(text) is None:
+        yield from _iter_custom_events(json.loads(text))
+        return None
+
+    position = 0
+    while (match := CUSTOM_EVENT_RE.search(text, position)) is not None:
+        event, end = json.raw_decode(text, match.start())
+
+        # RRWeb comment nodes are also serialized with type 5. They have no "data" key and are
+        # nested within a snapshot or mutation event so we skip past the match and continue.
+        if isinstance(event.get("data"), dict) and "timestamp" in event:
+            yield event
+            position = end
+        else:
+            position = match.end()
+
+
 def _handle_resource_metric_event(event: dict[str, Any]) -> None:
     if event["data"].get("payload", {}).get("op") not in ("resource.fetch", "resource.xhr"):
         return None
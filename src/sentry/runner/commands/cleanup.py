@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import os
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import timedelta
 from multiprocessing import JoinableQueue as Queue
 from multiprocessing import Process
-from typing import Final, Literal, TypeAlias
+from typing import TYPE_CHECKING, Any, Final, Literal, TypeAlias, TypeVar
 from uuid import uuid4
 
 import click
@@ -16,6 +19,13 @@ from django.utils import timezone
 from sentry.runner.decorators import log_options
 from sentry.silo.base import SiloLimit, SiloMode
 
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+    from sentry.db.deletion import BulkDeleteQuery
+
+T = TypeVar("T")
+
 
 def get_project(value: str) -> int | None:
     from sentry.models.project import Project
@@ -48,6 +58,72 @@ def debug_output(msg: str) -> None:
     click.echo(msg)
 
 
+class TableStats:
+    """
+    The number of rows removed from each table and the time spent on it, which is collected from
+    the threads cleaning up tables concurrently.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tables: dict[str, tuple[int | None, float]] = {}
+
+    def record(self, table: str, rows: int | None, duration: float) -> None:
+        with self._lock:
+            previous_rows, previous_duration = self._tables.get(table, (0, 0.0))
+            if rows is not None and previous_rows is not None:
+                rows += previous_rows
+            self._tables[table] = (rows, previous_duration + duration)
+
+    def summary(self) -> list[str]:
+        lines = [f"{'Table':<40} {'Rows':>12} {'Seconds':>10} {'Rows/s':>10}"]
+        with self._lock:
+            for table, (rows, duration) in sorted(self._tables.items()):
+                if rows is None:
+                    lines.append(f"{table:<40} {'-':>12} {duration:>10.1f} {'-':>10}")
+                else:
+                    rate = rows / duration if duration > 0 else 0.0
+                    lines.append(f"{table:<40} {rows:>12} {duration:>10.1f} {rate:>10.1f}")
+        return lines
+
+
+def run_in_thread(func: Callable[..., T], *args: Any) -> T:
+    """
+    Calls ``func`` and closes the database connections it opened, as threads don't share the
+    connections of the main thread.
+    """
+    from django.db import connections
+
+    try:
+        return func(*args)
+    finally:
+        connections.close_all()
+
+
+def get_table_concurrency(model: type[Model]) -> int:
+    return max(int(settings.SENTRY_CLEANUP_TABLE_CONCURRENCY.get(model._meta.label, 1)), 1)
+
+
+def bulk_delete(query: BulkDeleteQuery, concurrency: int) -> int:
+    """
+    Deletes the rows of a `BulkDeleteQuery`, split into up to ``concurrency`` concurrent deletes,
+    with chunks sized by their latency.
+    """
+    from sentry.db.deletion import TARGET_CHUNK_DURATION
+
+    queries = query.split(concurrency)
+    if len(queries) == 1:
+        return query.execute(chunk_size=10000, target_duration=TARGET_CHUNK_DURATION)
+
+    with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+        return sum(
+            executor.map(
+                lambda q: run_in_thread(q.execute, 10000, TARGET_CHUNK_DURATION),
+                queries,
+            )
+        )
+
+
 def multiprocess_worker(task_queue: _WorkQueue) -> None:
     # Configure within each Process
     import logging
@@ -109,6 +185,13 @@ def multiprocess_worker(task_queue: _WorkQueue) -> None:
     show_default=True,
     help="The total number of concurrent worker processes to run.",
 )
+@click.option(
+    "--table-concurrency",
+    type=int,
+    default=1,
+    show_default=True,
+    help="The number of tables that are cleaned up at the same time.",
+)
 @click.option(
     "--silent", "-q", default=False, is_flag=True, help="Run quietly. No output on success."
 )
@@ -126,6 +209,7 @@ def cleanup(
     days: int,
     project: str | None,
     concurrency: int,
+    table_concurrency: int,
     silent: bool,
     model: tuple[str, ...],
     router: str | None,
@@ -138,8 +222,12 @@ def cleanup(
     but if you have a specific project you want to limit this to this can be
     done with the `--project` flag which accepts a project ID or a string
     with the form `org/project` where both are slugs.
+
+    Tables that don't depend on each other are cleaned up concurrently by up
+    to `--table-concurrency` threads, and `SENTRY_CLEANUP_TABLE_CONCURRENCY`
+    splits the cleanup of single large tables further.
     """
-    if concurrency < 1:
+    if concurrency < 1 or table_concurrency < 1:
         click.echo("Error: Minimum concurrency is 1", err=True)
         raise click.Abort()
 
@@ -158,6 +246,19 @@ def cleanup(
         p.start()
         pool.append(p)
 
+    stats = TableStats()
+    executor = ThreadPoolExecutor(max_workers=table_concurrency)
+    table_jobs: list[Future[None]] = []
+
+    def submit_table_job(table: str, func: Callable[..., int | None], *args: Any) -> None:
+        def job() -> None:
+            started = time.time()
+            rows = run_in_thread(func, *args)
+            stats.record(table, rows, time.time() - started)
+            debug_output(f">> Finished cleaning up {table}")
+
+        table_jobs.append(executor.submit(job))
+
     try:
         from sentry.runner import configure
 
@@ -165,7 +266,6 @@ def cleanup(
 
         from django.apps import apps
         from django.db import router as db_router
-        from django.db.models import Model
 
         from sentry import models, nodestore
         from sentry.constants import ObjectStatus
@@ -291,26 +391,33 @@ def cleanup(
                 debug_output("Removing old NodeStore values")
 
                 cutoff = timezone.now() - timedelta(days=days)
-                try:
-                    nodestore.backend.cleanup(cutoff)
-                except NotImplementedError:
-                    click.echo("NodeStore backend does not support cleanup operation", err=True)
+
+                def cleanup_nodestore() -> None:
+                    try:
+                        nodestore.backend.cleanup(cutoff)
+                    except NotImplementedError:
+                        click.echo("NodeStore backend does not support cleanup operation", err=True)
+
+                submit_table_job("NodeStore", cleanup_nodestore)
 
         debug_output("Running bulk query deletes in BULK_QUERY_DELETES")
         for model_tp, dtfield, order_by in BULK_QUERY_DELETES:
-            chunk_size = 10000
-
             debug_output(f"Removing {model_tp.__name__} for days={days} project={project or '*'}")
             if is_filtered(model_tp):
                 debug_output(">> Skipping %s" % model_tp.__name__)
             else:
-                BulkDeleteQuery(
-                    model=model_tp,
-                    dtfield=dtfield,
-                    days=days,
-                    project_id=project_id,
-                    order_by=order_by,
-                ).execute(chunk_size=chunk_size)
+                submit_table_job(
+                    model_tp.__name__,
+                    bulk_delete,
+                    BulkDeleteQuery(
+                        model=model_tp,
+                        dtfield=dtfield,
+                        days=days,
+                        project_id=project_id,
+                        order_by=order_by,
+                    ),
+                    get_table_concurrency(model_tp),
+                )
 
         debug_output("Running bulk deletes in DELETES")
         for model_tp, dtfield, order_by in DELETES:
@@ -329,10 +436,14 @@ def cleanup(
                     order_by=order_by,
                 )
 
+                started = time.time()
+                rows = 0
                 for chunk in q.iterator(chunk_size=100):
                     task_queue.put((imp, chunk))
+                    rows += len(chunk)
 
                 task_queue.join()
+                stats.record(model_tp.__name__, rows, time.time() - started)
 
         project_deletion_query = None
         to_delete_by_project = []
@@ -350,6 +461,9 @@ def cleanup(
 
         if project_deletion_query is not None and len(to_delete_by_project):
             debug_output("Running bulk deletes in DELETES_BY_PROJECT")
+            # The models are deleted together, so each of them is attributed the whole duration.
+            started = time.time()
+            rows_by_model = {model_tp.__name__: 0 for model_tp, _, _ in to_delete_by_project}
             for project_id_for_deletion in RangeQuerySetWrapper(
                 project_deletion_query.values_list("id", flat=True),
                 result_value_getter=lambda item: item,
@@ -371,17 +485,36 @@ def cleanup(
 
                     for chunk in q.iterator(chunk_size=100):
                         task_queue.put((imp, chunk))
+                        rows_by_model[model_tp.__name__] += len(chunk)
 
-        task_queue.join()
+            task_queue.join()
+            for model_name, rows in rows_by_model.items():
+                stats.record(model_name, rows, time.time() - started)
 
         # Clean up FileBlob instances which are no longer used and aren't super
-        # recent (as there could be a race between blob creation and reference)
+        # recent (as there could be a race between blob creation and reference).
+        # This has to wait for the deletes above, which release the files of the
+        # deleted rows.
         debug_output("Cleaning up unused FileBlob references")
         if is_filtered(models.FileBlob):
             debug_output(">> Skipping FileBlob")
         else:
-            cleanup_unused_files(silent)
+            submit_table_job(
+                "FileBlob",
+                cleanup_unused_files,
+                silent or table_concurrency > 1,
+                get_table_concurrency(models.FileBlob),
+            )
+
+        for job in table_jobs:
+            job.result()
+
+        debug_output("Cleanup summary:")
+        for line in stats.summary():
+            debug_output(line)
     finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
         # Shut down our pool
         for _ in pool:
             task_queue.put(_STOP_WORKER)
@@ -399,20 +532,25 @@ def cleanup(
         transaction.__exit__(None, None, None)
 
 
-def cleanup_unused_files(quiet: bool = False) -> None:
+def cleanup_unused_files(quiet: bool = False, concurrency: int = 1) -> int:
     """
     Remove FileBlob's (and thus the actual files) if they are no longer
-    referenced by any File.
+    referenced by any File, and return the number of removed blobs.
 
     We set a minimum-age on the query to ensure that we don't try to remove
     any blobs which are brand new and potentially in the process of being
     referenced.
+
+    With a `concurrency` above 1, the blobs are split into as many ranges of
+    ids that are checked concurrently.
     """
+    from django.db.models import Max, Min
+
     from sentry.models.files.file import File
     from sentry.models.files.fileblob import FileBlob
     from sentry.models.files.fileblobindex import FileBlobIndex
 
-    if quiet:
+    if quiet or concurrency > 1:
         from sentry.utils.query import RangeQuerySetWrapper
     else:
         from sentry.utils.query import RangeQuerySetWrapperWithProgressBar as RangeQuerySetWrapper
@@ -420,9 +558,28 @@ def cleanup_unused_files(quiet: bool = False) -> None:
     cutoff = timezone.now() - timedelta(days=1)
     queryset = FileBlob.objects.filter(timestamp__lte=cutoff)
 
-    for blob in RangeQuerySetWrapper(queryset):
-        if FileBlobIndex.objects.filter(blob=blob).exists():
-            continue
-        if File.objects.filter(blob=blob).exists():
-            continue
-        blob.delete()
+    def delete_unused(queryset: Any) -> int:
+        deleted = 0
+        for blob in RangeQuerySetWrapper(queryset):
+            if FileBlobIndex.objects.filter(blob=blob).exists():
+                continue
+            if File.objects.filter(blob=blob).exists():
+                continue
+            blob.delete()
+            deleted += 1
+        return deleted
+
+    if concurrency <= 1:
+        return delete_unused(queryset)
+
+    id_range = queryset.aggregate(min_id=Min("id"), max_id=Max("id"))
+    if id_range["min_id"] is None:
+        return 0
+
+    step = (id_range["max_id"] - id_range["min_id"]) // concurrency + 1
+    shards = [
+        queryset.filter(id__gte=lower, id__lt=lower + step)
+        for lower in range(id_range["min_id"], id_range["max_id"] + 1, step)
+    ]
+    with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+        return sum(executor.map(lambda shard: run_in_thread(delete_unused, shard), shards))
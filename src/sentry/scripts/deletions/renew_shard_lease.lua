@@ -0,0 +1,18 @@
+-- Renew the lease of a shard, if it is still held by the given dispatch of the shard.
+assert(#KEYS == 1, "provide exactly one progress key")
+assert(#ARGV == 4, "provide a shard id, a dispatch token, a lease and a TTL")
+
+local key = KEYS[1]
+local shard_id = ARGV[1]
+local token = ARGV[2]
+local lease = ARGV[3]
+local ttl = ARGV[4]
+
+local value = redis.call("HGET", key, shard_id)
+if not value or string.sub(value, 1, #token + 1) ~= token .. ":" then
+    return 0
+end
+
+redis.call("HSET", key, shard_id, lease)
+redis.call("EXPIRE", key, ttl)
+return 1
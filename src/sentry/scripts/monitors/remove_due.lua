@@ -0,0 +1,16 @@
+-- Remove members from a sorted set, keeping the ones whose score moved past a deadline.
+assert(#KEYS == 1, "provide exactly one sorted set key")
+assert(#ARGV >= 1, "provide a deadline followed by the members to remove")
+
+local key = KEYS[1]
+local deadline = tonumber(ARGV[1])
+
+local removed = 0
+for i = 2, #ARGV do
+    local score = redis.call("ZSCORE", key, ARGV[i])
+    if score and tonumber(score) <= deadline then
+        removed = removed + redis.call("ZREM", key, ARGV[i])
+    end
+end
+
+return removed
@@ -497,6 +497,53 @@ return Router:new({
         end
     ),
 
+    --[[
+    Increment the number of observations for different items in different
+    groups of sketches, so that updates of many keys (that are stored on the
+    same host) can be made with a single script invocation. The arguments are
+    a sequence of groups, each formatted as:
+
+        <number of sketches> <number of items> (<delta> <value>)*
+
+    with the sketches of each group taken from the keys in order.
+    ]]--
+    INCRBATCH = Command:new(
+        function (sketches, arguments)
+            -- Parse (and validate) all of the groups before making any changes.
+            local groups = {}
+            local total = 0
+            local i = 1
+            while i <= #arguments do
+                local count = tonumber(arguments[i])
+                local size = tonumber(arguments[i + 1])
+                i = i + 2
+
+                local items = {}
+                for j = i, i + size * 2 - 1, 2 do
+                    local delta = tonumber(arguments[j])
+                    assert(delta > 0, 'The increment value must be positive and nonzero.')
+                    table.insert(items, {arguments[j + 1], delta})
+                end
+                i = i + size * 2
+
+                table.insert(groups, {count, items})
+                total = total + count
+            end
+            assert(total == #sketches, 'The number of sketches must match the number of key pairs.')
+
+            local results = {}
+            local offset = 0
+            for _, group in ipairs(groups) do
+                local count, items = unpack(group)
+                for j = offset + 1, offset + count do
+                    table.insert(results, sketches[j]:increment(items))
+                end
+                offset = offset + count
+            end
+            return results
+        end
+    ),
+
     --[[
     Estimate the number of observations for each item in all sketches,
     returning a sequence containing scores for items in the order that they
@@ -30,6 +30,7 @@ from snuba_sdk import (
     Request,
 )
 
+from sentry import options
 from sentry.api import event_search
 from sentry.discover.arithmetic import (
     OperandType,
@@ -71,6 +72,8 @@ from sentry.utils.snuba import (
     is_span_op_breakdown,
     raw_snql_query,
     resolve_column,
+    to_columns,
+    to_rows,
 )
 
 
@@ -1555,10 +1558,49 @@ class BaseQueryBuilder:
 
                 return transformed
 
+            if options.get("snuba.columnar-results"):
+                data = to_rows(
+                    self.process_columns(to_columns(results["data"]), translated_columns)
+                )
+            else:
+                data = [get_row(row) for row in results["data"]]
+
             return {
-                "data": [get_row(row) for row in results["data"]],
+                "data": data,
                 "meta": {
                     "fields": field_meta,
                     "tips": {},
                 },
             }
+
+    def process_columns(
+        self, columns: Mapping[str, list[Any]], translated_columns: Mapping[str, str]
+    ) -> dict[str, list[Any]]:
+        """
+        The column-wise equivalent of transforming the rows in `process_results`: the transforms
+        of each column are looked up once for the whole column instead of once per value.
+        """
+        transformed: dict[str, list[Any]] = {}
+        for key, values in columns.items():
+            if any(isinstance(value, float) for value in values):
+                values = [
+                    self.handle_invalid_float(value) if isinstance(value, float) else value
+                    for value in values
+                ]
+            elif any(isinstance(value, list) for value in values):
+                for value in values:
+                    if isinstance(value, list):
+                        for index, item in enumerate(value):
+                            if isinstance(item, float):
+                                value[index] = self.handle_invalid_float(item)
+
+            value_resolver = self.value_resolver_map.get(key)
+            if value_resolver is not None:
+                values = [value_resolver(value) for value in values]
+
+            resolved_key = translated_columns.get(key, key)
+            if not self.builder_config.skip_tag_resolution:
+                resolved_key = self.prefixed_to_tag_map.get(resolved_key, resolved_key)
+            transformed[resolved_key] = values
+
+        return transformed
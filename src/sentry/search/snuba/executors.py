@@ -13,6 +13,7 @@ from math import floor
 from typing import Any, TypedDict, cast
 
 import sentry_sdk
+from django.core.cache import cache
 from django.db.models import Q
 from django.utils import timezone
 from snuba_sdk import (
@@ -107,6 +108,9 @@ POSTGRES_ONLY_SEARCH_FIELDS = [
 ]
 
 
+# How long the groups collected by a search are used to serve identical searches.
+SEARCH_RESULT_CACHE_TTL = 30
+
 ENTITY_EVENTS = "events"
 ENTITY_GROUP_ATTRIBUTES = "group_attributes"
 ENTITY_SEARCH_ISSUES = "search_issues"
@@ -884,6 +888,49 @@ class PostgresSnubaQueryExecutor(AbstractQueryExecutor):
             )
             return results
 
+        # Repeated polls of the issue stream and the pages after the first one are served from
+        # the groups collected by a recent identical search, if there are enough of them.
+        result_cache_key: str | None = None
+        if options.get("snuba.search.result-cache.enabled"):
+            result_cache_key = self._get_result_cache_key(
+                projects,
+                environments,
+                sort_by,
+                count_hits,
+                max_hits,
+                paginator_options,
+                search_filters,
+                date_from,
+                date_to,
+                actor,
+                aggregate_kwargs,
+            )
+        if result_cache_key:
+            cached = cache.get(result_cache_key)
+            if cached is not None:
+                paginator_results = SequencePaginator(
+                    [(score, id) for (id, score) in cached["groups"]],
+                    reverse=True,
+                    **paginator_options,
+                ).get_result(limit, cursor, known_hits=cached["hits"], max_hits=max_hits)
+                if len(paginator_results.results) >= limit or not cached["more_results"]:
+                    metrics.incr("snuba.search.result_cache.hit", skip_internal=False)
+                    # The Postgres predicates (status, assignment, ...) change without the
+                    # groups moving in Snuba, and aren't part of the cache key, so they're
+                    # applied to the cached page again.
+                    current_ids = set(
+                        group_queryset.filter(id__in=paginator_results.results).values_list(
+                            "id", flat=True
+                        )
+                    )
+                    paginator_results.results = [
+                        id for id in paginator_results.results if id in current_ids
+                    ]
+                    return self._finish_results(
+                        paginator_results, limit, cursor, cached["more_results"], now, cached=True
+                    )
+            metrics.incr("snuba.search.result_cache.miss", skip_internal=False)
+
         # Here we check if all the django filters reduce the set of groups down
         # to something that we can send down to Snuba in a `group_id IN (...)`
         # clause.
@@ -1031,6 +1078,28 @@ class PostgresSnubaQueryExecutor(AbstractQueryExecutor):
             if group_ids or len(paginator_results.results) >= limit or not more_results:
                 break
 
+        metrics.distribution("snuba.search.num_chunks", num_chunks)
+
+        # Only a search from the start of the results collects the groups that the pages after
+        # it (and the next poll) need.
+        if result_cache_key and cursor is None:
+            cache.set(
+                result_cache_key,
+                {"groups": result_groups, "hits": hits, "more_results": more_results},
+                SEARCH_RESULT_CACHE_TTL,
+            )
+
+        return self._finish_results(paginator_results, limit, cursor, more_results, now)
+
+    def _finish_results(
+        self,
+        paginator_results: CursorResult[int],
+        limit: int,
+        cursor: Cursor | None,
+        more_results: bool,
+        now: datetime,
+        cached: bool = False,
+    ) -> CursorResult[Group]:
         # HACK: We're using the SequencePaginator to mask the complexities of going
         # back and forth between two databases. This causes a problem with pagination
         # because we're 'lying' to the SequencePaginator (it thinks it has the entire
@@ -1050,18 +1119,66 @@ class PostgresSnubaQueryExecutor(AbstractQueryExecutor):
             # more results.
             paginator_results.prev.has_results = True
 
-        metrics.distribution("snuba.search.num_chunks", num_chunks)
-
         groups = Group.objects.in_bulk(paginator_results.results)
         paginator_results.results = [groups[k] for k in paginator_results.results if k in groups]
 
         metrics.timing(
             "snuba.search.query",
             (timezone.now() - now).total_seconds(),
-            tags={"postgres_only": False},
+            tags={"postgres_only": False, "cached": cached},
         )
         return paginator_results
 
+    def _get_result_cache_key(
+        self,
+        projects: Sequence[Project],
+        environments: Sequence[Environment] | None,
+        sort_by: str,
+        count_hits: bool,
+        max_hits: int | None,
+        paginator_options: Mapping[str, Any],
+        search_filters: Sequence[SearchFilter] | None,
+        date_from: datetime | None,
+        date_to: datetime | None,
+        actor: Any | None,
+        aggregate_kwargs: TrendsSortWeights | None,
+    ) -> str:
+        # Relative dates (`statsPeriod`, `lastSeen:-24h`, ...) resolve to a different time on
+        # every request, so dates are rounded to the lifetime of the cached results.
+        def normalize(value: Any) -> Any:
+            if isinstance(value, datetime):
+                return int(value.timestamp() // SEARCH_RESULT_CACHE_TTL)
+            return value
+
+        filters = sorted(
+            (
+                search_filter.key.name,
+                search_filter.operator,
+                repr(normalize(search_filter.value.raw_value)),
+            )
+            for search_filter in search_filters or ()
+        )
+        key = json.dumps(
+            [
+                type(self).__name__,
+                sorted(project.id for project in projects),
+                sorted(environment.id for environment in environments or ()),
+                sort_by,
+                count_hits,
+                max_hits,
+                filters,
+                normalize(date_from),
+                normalize(date_to),
+                # Filters like `assigned:me` depend on who is searching.
+                getattr(actor, "id", None),
+                aggregate_kwargs,
+                paginator_options,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return f"search:result-cache:{md5(key.encode('utf-8')).hexdigest()}"
+
     def calculate_hits(
         self,
         group_ids: Sequence[int],
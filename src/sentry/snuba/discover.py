@@ -1,3 +1,4 @@
+import functools
 import logging
 import math
 import random
@@ -11,6 +12,7 @@ import sentry_sdk
 from sentry_relay.consts import SPAN_STATUS_CODE_TO_NAME
 from snuba_sdk import Condition, Function, Op
 
+from sentry import options
 from sentry.discover.arithmetic import categorize_columns
 from sentry.exceptions import InvalidSearchQuery
 from sentry.models.group import Group
@@ -27,6 +29,7 @@ from sentry.search.events.fields import (
     is_function,
 )
 from sentry.search.events.types import HistogramParams, ParamsType, QueryBuilderConfig
+from sentry.snuba import timeseries_cache
 from sentry.snuba.dataset import Dataset
 from sentry.tagstore.base import TOP_VALUES_DEFAULT_LIMIT
 from sentry.utils.math import nice_int
@@ -105,20 +108,27 @@ def is_real_column(col):
     return True
 
 
+def parse_bucket_time(value: str) -> int:
+    # `datetime.fromisoformat` is new in Python3.7 and before Python3.11, it is not a full
+    # ISO 8601 parser. It is only the inverse function of `datetime.isoformat`, which is
+    # the format returned by snuba. This is significantly faster when compared to other
+    # parsers like `dateutil.parser.parse` and `datetime.strptime`.
+    return int(datetime.fromisoformat(value).timestamp())
+
+
 def format_time(data, start, end, rollup, orderby):
     rv = []
     start = int(to_naive_timestamp(naiveify_datetime(start)) / rollup) * rollup
     end = (int(to_naive_timestamp(naiveify_datetime(end)) / rollup) * rollup) + rollup
     data_by_time = {}
+    # Results grouped by more than time (like top events) repeat each bucket time for every
+    # group, so each distinct time is only parsed once.
+    parse_time = functools.lru_cache(maxsize=None)(parse_bucket_time)
 
     for obj in data:
         # This is needed for SnQL, and was originally done in utils.snuba.get_snuba_translators
         if isinstance(obj["time"], str):
-            # `datetime.fromisoformat` is new in Python3.7 and before Python3.11, it is not a full
-            # ISO 8601 parser. It is only the inverse function of `datetime.isoformat`, which is
-            # the format returned by snuba. This is significantly faster when compared to other
-            # parsers like `dateutil.parser.parse` and `datetime.strptime`.
-            obj["time"] = int(datetime.fromisoformat(obj["time"]).timestamp())
+            obj["time"] = parse_time(obj["time"])
         if obj["time"] in data_by_time:
             data_by_time[obj["time"]].append(obj)
         else:
@@ -139,17 +149,16 @@ def zerofill(data, start, end, rollup, orderby, time_col_name=None):
     start = int(to_naive_timestamp(naiveify_datetime(start)) / rollup) * rollup
     end = (int(to_naive_timestamp(naiveify_datetime(end)) / rollup) * rollup) + rollup
     data_by_time = {}
+    # Results grouped by more than time (like top events) repeat each bucket time for every
+    # group, so each distinct time is only parsed once.
+    parse_time = functools.lru_cache(maxsize=None)(parse_bucket_time)
 
     for obj in data:
         if time_col_name and time_col_name in obj:
             obj["time"] = obj.pop(time_col_name)
         # This is needed for SnQL, and was originally done in utils.snuba.get_snuba_translators
         if isinstance(obj["time"], str):
-            # `datetime.fromisoformat` is new in Python3.7 and before Python3.11, it is not a full
-            # ISO 8601 parser. It is only the inverse function of `datetime.isoformat`, which is
-            # the format returned by snuba. This is significantly faster when compared to other
-            # parsers like `dateutil.parser.parse` and `datetime.strptime`.
-            obj["time"] = int(datetime.fromisoformat(obj["time"]).timestamp())
+            obj["time"] = parse_time(obj["time"])
         if obj["time"] in data_by_time:
             data_by_time[obj["time"]].append(obj)
         else:
@@ -269,6 +278,46 @@ def _timeseries_query(
                 has_metrics=has_metrics,
             ),
         )
+        if (
+            zerofill_results
+            and not comparison_delta
+            and options.get("snuba.timeseries-cache.enabled")
+            and timeseries_cache.is_cacheable(selected_columns)
+        ):
+            result = _cached_timeseries_query(
+                base_builder,
+                selected_columns,
+                query,
+                params,
+                rollup,
+                referrer,
+                functions_acl=functions_acl,
+                has_metrics=has_metrics,
+                dataset=dataset,
+            )
+            return SnubaTSResult(
+                {
+                    "data": zerofill(
+                        result["data"],
+                        base_builder.params.start,
+                        base_builder.params.end,
+                        rollup,
+                        "time",
+                    ),
+                    "meta": {
+                        "fields": {
+                            value["name"]: get_json_meta_type(
+                                value["name"], value.get("type"), base_builder
+                            )
+                            for value in result["meta"]
+                        }
+                    },
+                },
+                params["start"],
+                params["end"],
+                rollup,
+            )
+
         query_list = [base_builder]
         if comparison_delta:
             if len(base_builder.aggregates) != 1:
@@ -338,6 +387,58 @@ def _timeseries_query(
     )
 
 
+def _cached_timeseries_query(
+    base_builder: TimeseriesQueryBuilder,
+    selected_columns: Sequence[str],
+    query: str,
+    params: ParamsType,
+    rollup: int,
+    referrer: str | None,
+    functions_acl: list[str] | None,
+    has_metrics: bool,
+    dataset: Dataset,
+):
+    """
+    Runs a timeseries query through the timeseries cache, only querying Snuba for the buckets
+    of ``base_builder``'s range that aren't cached.
+    """
+    equations, columns = categorize_columns(selected_columns)
+
+    def run_queries(ranges: Sequence[timeseries_cache.TimeRange]):
+        query_list = []
+        for start, end in ranges:
+            range_params = deepcopy(params)
+            range_params["start"] = start
+            range_params["end"] = end
+            query_list.append(
+                TimeseriesQueryBuilder(
+                    dataset,
+                    range_params,
+                    rollup,
+                    query=query,
+                    selected_columns=columns,
+                    equations=equations,
+                    config=QueryBuilderConfig(
+                        functions_acl=functions_acl,
+                        has_metrics=has_metrics,
+                    ),
+                )
+            )
+        return bulk_snuba_queries([builder.get_snql_query() for builder in query_list], referrer)
+
+    fingerprint = timeseries_cache.get_fingerprint(
+        params, dataset.value, selected_columns, query, functions_acl, has_metrics
+    )
+    return timeseries_cache.query(
+        fingerprint,
+        base_builder.params.start,
+        base_builder.params.end,
+        rollup,
+        run_queries,
+        referrer=referrer,
+    )
+
+
 def query(
     selected_columns,
     query,
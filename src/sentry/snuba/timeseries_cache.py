@@ -0,0 +1,148 @@
+"""
+An incremental cache for the results of timeseries queries.
+
+Buckets that closed long enough ago to no longer receive events don't change, so a timeseries
+that is requested again (typically a dashboard refreshing a sliding window) only needs to query
+the buckets it hasn't seen yet. The closed buckets of a query are stored as a single contiguous
+run per query fingerprint and rollup, together with the range of buckets the run covers:
+
+    {"start": 1700000000, "end": 1700086400, "meta": [...], "data": [{"time": ..., ...}, ...]}
+
+Snuba doesn't return rows for empty buckets, so the covered range is what tells an empty bucket
+apart from a missing one. Partial buckets at either end of the requested range are never read
+from or written to the cache since their contents depend on the exact range.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import time
+from collections.abc import Callable, Mapping, Sequence
+from datetime import datetime
+from typing import Any
+
+from django.core.cache import cache
+
+from sentry import options
+from sentry.utils import json, metrics
+from sentry.utils.dates import to_datetime
+from sentry.utils.hashlib import md5_text
+
+CACHE_TTL = 3600
+
+# Functions whose default argument is the length of the queried range, and so whose value for a
+# bucket depends on the range the bucket was queried with.
+RANGE_DEPENDENT_FUNCTION_RE = re.compile(r"\b(?:eps|epm|floored_epm)\(\s*\)")
+
+# The filter parameters a timeseries query depends on besides its time range.
+FINGERPRINT_PARAMS = ("organization_id", "project_id", "environment", "team_id", "user_id")
+
+TimeRange = tuple[datetime, datetime]
+
+
+def is_cacheable(selected_columns: Sequence[str]) -> bool:
+    return not any(RANGE_DEPENDENT_FUNCTION_RE.search(column) for column in selected_columns)
+
+
+def get_fingerprint(params: Mapping[str, Any], *parts: Any) -> str:
+    """
+    Returns a fingerprint of a timeseries query from its filter parameters, leaving out the time
+    range, and any other `parts` that determine its results.
+    """
+    filters = {}
+    for key in FINGERPRINT_PARAMS:
+        value = params.get(key)
+        if isinstance(value, (list, tuple, set)):
+            value = sorted(value)
+        filters[key] = value
+    return md5_text(json.dumps([filters, *parts], sort_keys=True, default=str)).hexdigest()
+
+
+def get_bucket_time(row: Mapping[str, Any]) -> int:
+    value = row["time"]
+    if isinstance(value, str):
+        return int(datetime.fromisoformat(value).timestamp())
+    return int(value)
+
+
+def query(
+    fingerprint: str,
+    start: datetime,
+    end: datetime,
+    rollup: int,
+    run_queries: Callable[[Sequence[TimeRange]], Sequence[Mapping[str, Any]]],
+    referrer: str | None = None,
+) -> Mapping[str, Any]:
+    """
+    Returns the rows of a timeseries query over ``[start, end)``, ordered by bucket and with the
+    bucket times as timestamps. ``run_queries`` is only called for the ranges that can't be
+    served from the cache and must return a result with "data" and "meta" for each of them.
+    """
+    metric_tags = {"referrer": referrer or "unknown"}
+    start_ts = start.timestamp()
+    end_ts = end.timestamp()
+
+    # The buckets fully contained in the requested range, and the ones among those that closed.
+    first_bucket = math.ceil(start_ts / rollup) * rollup
+    last_bucket = int(end_ts // rollup) * rollup
+    settled_at = time.time() - options.get("snuba.timeseries-cache.settle-seconds")
+    closed_end = min(last_bucket, int(settled_at // rollup) * rollup)
+
+    cache_key = f"tsc:{fingerprint}:{rollup}"
+    entry = None
+    if first_bucket < last_bucket:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            entry = json.loads(cached)
+            if not entry["start"] <= first_bucket < entry["end"]:
+                entry = None
+
+    ranges: list[TimeRange] = []
+    if entry is not None:
+        cached_end = min(entry["end"], last_bucket)
+        cached_rows = [row for row in entry["data"] if first_bucket <= row["time"] < cached_end]
+        if start_ts < first_bucket:
+            ranges.append((start, to_datetime(first_bucket)))
+        if cached_end < end_ts:
+            ranges.append((to_datetime(cached_end), end))
+
+        metrics.incr("snuba.timeseries_cache.hit", tags=metric_tags)
+        metrics.incr("snuba.timeseries_cache.saved_rows", amount=len(cached_rows), tags=metric_tags)
+        metrics.distribution(
+            "snuba.timeseries_cache.hit_ratio",
+            (cached_end - first_bucket) / max(end_ts - start_ts, 1),
+            tags=metric_tags,
+        )
+    else:
+        cached_end = first_bucket
+        cached_rows = []
+        ranges.append((start, end))
+        metrics.incr("snuba.timeseries_cache.miss", tags=metric_tags)
+
+    results = run_queries(ranges) if ranges else []
+
+    rows = cached_rows
+    for result in results:
+        for row in result["data"]:
+            row["time"] = get_bucket_time(row)
+            rows.append(row)
+    rows.sort(key=lambda row: row["time"])
+    meta = results[-1]["meta"] if results else entry["meta"]
+
+    # Only write when the cached run grows: a request that ends before it doesn't add anything.
+    if closed_end > first_bucket and (entry is None or closed_end > entry["end"]):
+        cache.set(
+            cache_key,
+            json.dumps(
+                {
+                    "start": first_bucket,
+                    "end": closed_end,
+                    "meta": meta,
+                    "data": [row for row in rows if first_bucket <= row["time"] < closed_end],
+                }
+            ),
+            CACHE_TTL,
+        )
+
+    return {"data": rows, "meta": meta}
@@ -58,6 +58,7 @@ class TagStorage(Service):
     __all__ = (
         frozenset(
             [
+                "refresh_group_tag_summary",
                 "is_valid_key",
                 "is_valid_value",
                 "is_reserved_key",
@@ -255,6 +256,8 @@ class TagStorage(Service):
         limit: int = 1000,
         offset: int = 0,
         tenant_ids=None,
+        start=None,
+        end=None,
     ):
         """
         >>> get_group_tag_value_iter(group, 2, 3, 'environment')
@@ -334,6 +337,12 @@ class TagStorage(Service):
         """
         raise NotImplementedError
 
+    def refresh_group_tag_summary(self, group, environment_ids, tenant_ids=None):
+        """
+        >>> refresh_group_tag_summary(group, [2, 3])
+        """
+        raise NotImplementedError
+
     def get_group_tag_keys_and_top_values(
         self,
         group,
@@ -11,7 +11,7 @@ from django.core.cache import cache
 from sentry_relay.consts import SPAN_STATUS_CODE_TO_NAME
 from snuba_sdk import Column, Condition, Direction, Entity, Function, Op, OrderBy, Query, Request
 
-from sentry import analytics
+from sentry import analytics, options
 from sentry.api.utils import default_start_end_dates
 from sentry.issues.grouptype import GroupCategory
 from sentry.models.group import Group
@@ -34,6 +34,7 @@ from sentry.search.events.fields import FIELD_ALIASES
 from sentry.search.events.filter import _flip_field_sort
 from sentry.snuba.dataset import Dataset
 from sentry.snuba.referrer import Referrer
+from sentry.tagstore import summaries
 from sentry.tagstore.base import TOP_VALUES_DEFAULT_LIMIT, TagKeyStatus, TagStorage
 from sentry.tagstore.exceptions import (
     GroupTagKeyNotFound,
@@ -702,6 +703,53 @@ class SnubaTagStorage(TagStorage):
         value_limit: int = TOP_VALUES_DEFAULT_LIMIT,
         tenant_ids=None,
         **kwargs,
+    ):
+        # Summaries only cover the whole lifetime of a group without any extra filtering.
+        if (
+            kwargs
+            or value_limit > summaries.SUMMARY_VALUE_LIMIT
+            or not options.get("tagstore.group-tag-summary.enabled")
+        ):
+            return self.__get_group_tag_keys_and_top_values(
+                group, environment_ids, keys, value_limit, tenant_ids=tenant_ids, **kwargs
+            )
+
+        summaries.mark_active(group, environment_ids)
+        summary = summaries.get(group, environment_ids)
+        if summary is not None and summaries.is_fresh(group, summary):
+            metrics.incr("tagstore.group_tag_summary.hit")
+            return summaries.to_tag_keys(group, summary, keys, value_limit)
+
+        metrics.incr("tagstore.group_tag_summary.miss", tags={"stale": summary is not None})
+        if keys is not None:
+            # Only part of the summary is requested, leave computing it to the periodic task.
+            return self.__get_group_tag_keys_and_top_values(
+                group, environment_ids, keys, value_limit, tenant_ids=tenant_ids
+            )
+
+        summary = self.refresh_group_tag_summary(group, environment_ids, tenant_ids=tenant_ids)
+        return summaries.to_tag_keys(group, summary, keys, value_limit)
+
+    def refresh_group_tag_summary(
+        self, group: Group, environment_ids: Sequence[int], tenant_ids=None
+    ) -> summaries.Summary:
+        last_seen = group.last_seen.timestamp() if group.last_seen else 0.0
+        tag_keys = self.__get_group_tag_keys_and_top_values(
+            group,
+            environment_ids,
+            value_limit=summaries.SUMMARY_VALUE_LIMIT,
+            tenant_ids=tenant_ids,
+        )
+        return summaries.store(group, environment_ids, tag_keys, last_seen)
+
+    def __get_group_tag_keys_and_top_values(
+        self,
+        group: Group,
+        environment_ids: Sequence[int],
+        keys: Sequence[str] | None = None,
+        value_limit: int = TOP_VALUES_DEFAULT_LIMIT,
+        tenant_ids=None,
+        **kwargs,
     ):
         # Similar to __get_tag_key_and_top_values except we get the top values
         # for all the keys provided. value_limit in this case means the number
@@ -1421,6 +1469,8 @@ class SnubaTagStorage(TagStorage):
         limit: int = 1000,
         offset: int = 0,
         tenant_ids=None,
+        start=None,
+        end=None,
     ):
         filters = {
             "project_id": get_project_list(group.project_id),
@@ -1432,6 +1482,8 @@ class SnubaTagStorage(TagStorage):
             filters["environment"] = environment_ids
         results = snuba.query(
             dataset=dataset,
+            start=start,
+            end=end,
             groupby=["tags_value"],
             filter_keys=filters,
             conditions=conditions,
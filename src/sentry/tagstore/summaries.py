@@ -0,0 +1,179 @@
+"""
+Precomputed tag key and top value summaries of groups.
+
+Opening the tags of an issue aggregates every event of the issue in Snuba, which gets slow (and
+is repeated on every page view) for issues with many events. A summary stores the result of that
+aggregation per group and set of environments:
+
+    {"computed_at": 1700000000.0, "last_seen": 1699999000.0, "keys": [...]}
+
+``last_seen`` is the ``last_seen`` of the group when the summary was computed, so a summary is
+known to be complete as long as the group hasn't seen new events since. The groups whose tags
+were requested recently are tracked so that a periodic task can keep their summaries up to date,
+and merging or unmerging a group drops its summaries.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable, Sequence
+from typing import Any, TypedDict
+
+from dateutil.parser import parse as parse_datetime
+from django.conf import settings
+from django.core.cache import cache
+from sentry_redis_tools.clients import RedisCluster, StrictRedis
+
+from sentry import options
+from sentry.models.group import Group
+from sentry.tagstore.types import GroupTagKey, GroupTagValue
+from sentry.utils import metrics
+from sentry.utils.redis import redis_clusters
+
+# The number of top values stored per tag key, which covers both the tags tab (10) and the tag
+# distribution bars (9) of the issue details page.
+SUMMARY_VALUE_LIMIT = 10
+
+CACHE_TTL = 24 * 60 * 60
+CACHE_KEY = "tagstore.group-tag-summary:{group_id}"
+
+ACTIVE_GROUPS_KEY = "tagstore.group-tag-summary:active"
+# How long a group is kept up to date after its tags were last requested.
+ACTIVE_WINDOW = 60 * 60
+# The maximum number of summaries refreshed by a single run of the periodic task.
+MAX_REFRESHES_PER_RUN = 1000
+
+
+class Summary(TypedDict):
+    computed_at: float
+    last_seen: float
+    keys: list[dict[str, Any]]
+
+
+def get_redis_client() -> RedisCluster | StrictRedis:
+    return redis_clusters.get(settings.SENTRY_TAGSTORE_SUMMARIES_REDIS_CLUSTER)
+
+
+def get_environment_key(environment_ids: Sequence[int] | None) -> str:
+    return ",".join(str(environment_id) for environment_id in sorted(environment_ids or ()))
+
+
+def parse_environment_key(environment_key: str) -> list[int]:
+    return [int(environment_id) for environment_id in environment_key.split(",") if environment_id]
+
+
+def get(group: Group, environment_ids: Sequence[int] | None) -> Summary | None:
+    summaries = cache.get(CACHE_KEY.format(group_id=group.id)) or {}
+    return summaries.get(get_environment_key(environment_ids))
+
+
+def store(
+    group: Group,
+    environment_ids: Sequence[int] | None,
+    tag_keys: Iterable[GroupTagKey],
+    last_seen: float,
+) -> Summary:
+    """
+    Stores the tag keys of a group with their top values as its summary for the given
+    environments. ``last_seen`` is the ``last_seen`` of the group before the tag keys were queried.
+    """
+    summary: Summary = {
+        "computed_at": time.time(),
+        "last_seen": last_seen,
+        "keys": [
+            {
+                "key": tag_key.key,
+                "values_seen": tag_key.values_seen,
+                "count": tag_key.count,
+                "top_values": [
+                    [
+                        tag_value.value,
+                        tag_value.times_seen,
+                        tag_value.first_seen.isoformat() if tag_value.first_seen else None,
+                        tag_value.last_seen.isoformat() if tag_value.last_seen else None,
+                    ]
+                    for tag_value in tag_key.top_values or ()
+                ],
+            }
+            for tag_key in tag_keys
+        ],
+    }
+
+    cache_key = CACHE_KEY.format(group_id=group.id)
+    summaries = cache.get(cache_key) or {}
+    summaries[get_environment_key(environment_ids)] = summary
+    cache.set(cache_key, summaries, CACHE_TTL)
+    return summary
+
+
+def invalidate(group_ids: Iterable[int]) -> None:
+    cache.delete_many([CACHE_KEY.format(group_id=group_id) for group_id in group_ids])
+
+
+def is_fresh(group: Group, summary: Summary) -> bool:
+    """
+    A summary is fresh when the group hasn't seen any events since it was computed, or when it
+    was computed less than ``tagstore.group-tag-summary.max-age`` seconds ago.
+    """
+    if group.last_seen is not None and group.last_seen.timestamp() <= summary["last_seen"]:
+        return True
+    return time.time() - summary["computed_at"] <= options.get("tagstore.group-tag-summary.max-age")
+
+
+def to_tag_keys(
+    group: Group, summary: Summary, keys: Sequence[str] | None, value_limit: int
+) -> list[GroupTagKey]:
+    metrics.distribution(
+        "tagstore.group_tag_summary.age", time.time() - summary["computed_at"], unit="second"
+    )
+
+    tag_keys = []
+    for data in summary["keys"]:
+        if keys is not None and data["key"] not in keys:
+            continue
+        tag_keys.append(
+            GroupTagKey(
+                group_id=group.id,
+                key=data["key"],
+                values_seen=data["values_seen"],
+                count=data["count"],
+                top_values=[
+                    GroupTagValue(
+                        group_id=group.id,
+                        key=data["key"],
+                        value=value,
+                        times_seen=times_seen,
+                        first_seen=parse_datetime(first_seen) if first_seen else None,
+                        last_seen=parse_datetime(last_seen) if last_seen else None,
+                    )
+                    for value, times_seen, first_seen, last_seen in data["top_values"][:value_limit]
+                ],
+            )
+        )
+    return tag_keys
+
+
+def mark_active(group: Group, environment_ids: Sequence[int] | None) -> None:
+    member = f"{group.id}:{get_environment_key(environment_ids)}"
+    get_redis_client().zadd(ACTIVE_GROUPS_KEY, {member: time.time()})
+
+
+def get_active() -> list[tuple[int, list[int]]]:
+    """
+    Returns the groups and environments whose tags were requested within the active window,
+    most recently requested first, and forgets the ones requested before it.
+    """
+    client = get_redis_client()
+    cutoff = time.time() - ACTIVE_WINDOW
+    client.zremrangebyscore(ACTIVE_GROUPS_KEY, "-inf", f"({cutoff}")
+    members = client.zrevrangebyscore(
+        ACTIVE_GROUPS_KEY, "+inf", cutoff, start=0, num=MAX_REFRESHES_PER_RUN
+    )
+
+    active = []
+    for member in members:
+        if isinstance(member, bytes):
+            member = member.decode()
+        group_id, environment_key = member.split(":", 1)
+        active.append((int(group_id), parse_environment_key(environment_key)))
+    return active
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import logging
+import time
+
+from celery.exceptions import SoftTimeLimitExceeded
+
+from sentry import options, tagstore
+from sentry.locks import locks
+from sentry.models.group import Group
+from sentry.silo.base import SiloMode
+from sentry.tagstore import summaries
+from sentry.tasks.base import instrumented_task
+from sentry.utils import metrics
+from sentry.utils.locking import UnableToAcquireLock
+
+logger = logging.getLogger(__name__)
+
+# Runs stop refreshing summaries after this many seconds, well within the soft time limit, and
+# leave the remaining groups to the next run.
+REFRESH_TIME_BUDGET = 45
+
+
+@instrumented_task(
+    name="sentry.tagstore.tasks.refresh_group_tag_summaries",
+    time_limit=65,
+    soft_time_limit=60,
+    silo_mode=SiloMode.REGION,
+)
+def refresh_group_tag_summaries(**kwargs) -> None:
+    """
+    Recomputes the tag summaries of the groups whose tags were recently requested and that have
+    seen new events since their summary was computed.
+    """
+    if not options.get("tagstore.group-tag-summary.enabled"):
+        return
+
+    # Runs that overrun the schedule would otherwise refresh the same groups at once.
+    lock = locks.get(
+        "tagstore.refresh_group_tag_summaries", duration=65, name="refresh_group_tag_summaries"
+    )
+    try:
+        with lock.acquire():
+            _refresh_active_summaries()
+    except UnableToAcquireLock:
+        metrics.incr("tagstore.group_tag_summary.refresh_locked")
+
+
+def _refresh_active_summaries() -> None:
+    deadline = time.monotonic() + REFRESH_TIME_BUDGET
+
+    active = summaries.get_active()
+    groups = Group.objects.select_related("project").in_bulk({group_id for group_id, _ in active})
+
+    refreshed = 0
+    for group_id, environment_ids in active:
+        if time.monotonic() > deadline:
+            metrics.incr("tagstore.group_tag_summary.refresh_budget_exceeded")
+            break
+
+        group = groups.get(group_id)
+        if group is None:
+            continue
+
+        summary = summaries.get(group, environment_ids)
+        if (
+            summary is not None
+            and group.last_seen is not None
+            and group.last_seen.timestamp() <= summary["last_seen"]
+        ):
+            continue
+
+        try:
+            tagstore.backend.refresh_group_tag_summary(
+                group,
+                environment_ids,
+                tenant_ids={"organization_id": group.project.organization_id},
+            )
+        except SoftTimeLimitExceeded:
+            logger.warning(
+                "tagstore.refresh_group_tag_summaries.soft_time_limit",
+                extra={"refreshed": refreshed},
+            )
+            break
+        except Exception:
+            logger.exception(
+                "tagstore.refresh_group_tag_summary.failed",
+                extra={"group_id": group_id, "environment_ids": environment_ids},
+            )
+            continue
+        refreshed += 1
+
+    metrics.incr("tagstore.group_tag_summary.refreshed", amount=refreshed)
@@ -169,6 +169,7 @@ def _run_deletion(
         query={"id": deletion.object_id},
         transaction_id=deletion.guid,
         actor_id=deletion.actor_id,
+        parallel=model_class is RegionScheduledDeletion,
     )
 
     if not task.should_proceed(instance):
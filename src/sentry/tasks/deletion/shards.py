@@ -0,0 +1,89 @@
+import time
+from typing import Any
+
+from sentry.exceptions import DeleteAborted
+from sentry.silo.base import SiloMode
+from sentry.tasks.base import instrumented_task, retry
+from sentry.tasks.deletion.scheduled import MAX_RETRIES, logger
+from sentry.utils import metrics
+
+
+@instrumented_task(
+    name="sentry.tasks.deletion.delete_relation_shard",
+    queue="cleanup",
+    default_retry_delay=60 * 5,
+    max_retries=MAX_RETRIES,
+    acks_late=True,
+    silo_mode=SiloMode.REGION,
+)
+@retry(exclude=(DeleteAborted,))
+def delete_relation_shard(
+    model,
+    query,
+    transaction_id: str,
+    relation_key: str,
+    num_shards: int,
+    shard_id: int,
+    task=None,
+    actor_id: int | None = None,
+    token: str | None = None,
+    **kwargs: Any,
+) -> None:
+    """
+    Deletes a chunk of the rows of a child relation in the shard, and schedules itself again
+    until the shard is empty. See `sentry.deletions.shards`.
+    """
+    from sentry import deletions
+    from sentry.deletions import shards
+
+    # The shard was dispatched again while this task was queued. Tasks dispatched without a token
+    # are left to the dispatch that replaces them once their lease expires.
+    if token is None or not shards.renew(transaction_id, relation_key, shard_id, token):
+        metrics.incr("deletions.shard.superseded", tags={"model": model.__name__})
+        return
+
+    deletion_task = deletions.get(
+        model=model,
+        query=query,
+        task=task,
+        transaction_id=transaction_id,
+        actor_id=actor_id,
+        parallel=True,
+    )
+
+    start = time.monotonic()
+    has_more = deletion_task.chunk(num_shards=num_shards, shard_id=shard_id)
+    duration = time.monotonic() - start
+    metrics.timing("deletions.shard.chunk_duration", duration, tags={"model": model.__name__})
+
+    if not has_more:
+        shards.mark_done(transaction_id, relation_key, shard_id)
+        logger.info(
+            "deletion.shard.completed",
+            extra={
+                "transaction_id": transaction_id,
+                "model": model.__name__,
+                "shard_id": shard_id,
+                "num_shards": num_shards,
+            },
+        )
+        return
+
+    # Renew the lease of the shard so that it isn't dispatched a second time
+    if not shards.renew(transaction_id, relation_key, shard_id, token):
+        metrics.incr("deletions.shard.superseded", tags={"model": model.__name__})
+        return
+    delete_relation_shard.apply_async(
+        kwargs={
+            "model": model,
+            "query": query,
+            "task": task,
+            "transaction_id": transaction_id,
+            "actor_id": actor_id,
+            "relation_key": relation_key,
+            "num_shards": num_shards,
+            "shard_id": shard_id,
+            "token": token,
+        },
+        countdown=shards.get_throttle_delay(duration),
+    )
@@ -1,7 +1,9 @@
 import logging
 import time
+from collections.abc import Sequence
 from datetime import datetime
 
+from sentry import options
 from sentry.digests import Record, get_option_key
 from sentry.digests.backends.base import InvalidState
 from sentry.digests.notifications import build_digest, split_key
@@ -9,7 +11,7 @@ from sentry.models.options.project_option import ProjectOption
 from sentry.models.project import Project
 from sentry.silo.base import SiloMode
 from sentry.tasks.base import instrumented_task
-from sentry.utils import snuba
+from sentry.utils import metrics, snuba
 
 logger = logging.getLogger(__name__)
 
@@ -35,8 +37,40 @@ def schedule_digests() -> None:
     timeout = 300
     digests.backend.maintenance(deadline - timeout)
 
+    # Digests are delivered in batches of `digests.delivery-batch-size` keys per task, a single
+    # task per key takes longer to dispatch than to run for small digests.
+    batch_size = options.get("digests.delivery-batch-size")
+    batch: list[tuple[str, float]] = []
     for entry in digests.backend.schedule(deadline):
-        deliver_digest.delay(entry.key, entry.timestamp)
+        metrics.distribution(
+            "digests.schedule_lag", max(deadline - entry.timestamp, 0), unit="second"
+        )
+        if batch_size <= 1:
+            deliver_digest.delay(entry.key, entry.timestamp)
+            continue
+
+        batch.append((entry.key, entry.timestamp))
+        if len(batch) >= batch_size:
+            deliver_digests.delay(batch)
+            batch = []
+
+    if batch:
+        deliver_digests.delay(batch)
+    metrics.timing("digests.schedule.duration", time.time() - deadline)
+
+
+@instrumented_task(
+    name="sentry.tasks.digests.deliver_digests",
+    queue="digests.delivery",
+    silo_mode=SiloMode.REGION,
+)
+def deliver_digests(entries: Sequence[tuple[str, float]]) -> None:
+    for key, schedule_timestamp in entries:
+        # A digest that fails to deliver shouldn't hold up the rest of the batch.
+        try:
+            deliver_digest(key, schedule_timestamp)
+        except Exception:
+            logger.exception("Failed to deliver digest %s", key)
 
 
 @instrumented_task(
@@ -47,6 +47,7 @@ def merge_groups(
     from sentry.models.grouprulestatus import GroupRuleStatus
     from sentry.models.groupsubscription import GroupSubscription
     from sentry.models.userreport import UserReport
+    from sentry.tagstore import summaries
 
     if not (from_object_ids and to_object_id):
         logger.error("group.malformed.missing_params", extra={"transaction_id": transaction_id})
@@ -114,6 +115,7 @@ def merge_groups(
             from_object_ids.remove(from_object_id)
 
             similarity.merge(group.project, new_group, [group], allow_unsafe=True)
+            summaries.invalidate([group.id, new_group.id])
 
             environment_ids = list(
                 Environment.objects.filter(projects=group.project).values_list("id", flat=True)
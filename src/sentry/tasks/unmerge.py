@@ -25,6 +25,7 @@ from sentry.models.project import Project
 from sentry.models.release import Release
 from sentry.models.userreport import UserReport
 from sentry.silo.base import SiloMode
+from sentry.tagstore import summaries
 from sentry.tasks.base import instrumented_task
 from sentry.tsdb.base import TSDBModel
 from sentry.types.activity import ActivityType
@@ -291,6 +292,7 @@ def truncate_denormalizations(project, group):
     )
 
     similarity.delete(project, group)
+    summaries.invalidate([group.id])
 
 
 def collect_group_environment_data(events):
@@ -539,6 +541,7 @@ def unmerge(*posargs, **kwargs):
     # If there are no more events to process, we're done with the migration.
     if not events:
         unlock_hashes(args.project_id, locked_primary_hashes)
+        summaries.invalidate([source.id, *(group_id for group_id, _ in args.destinations.values())])
         for unmerge_key, (group_id, eventstream_state) in args.destinations.items():
             logger.warning(
                 "Unmerge complete (eventstream state: %s)",
@@ -1,3 +1,4 @@
+from collections import namedtuple
 from collections.abc import Iterable, Mapping, Sequence
 from datetime import datetime, timedelta
 from enum import Enum
@@ -16,6 +17,9 @@ ONE_DAY = ONE_HOUR * 24
 TSDBKey = TypeVar("TSDBKey", str, int)
 TSDBItem = TypeVar("TSDBItem", str, int)
 
+# The parameters of the Count-Min sketches backing frequency tables.
+SketchParameters = namedtuple("SketchParameters", "depth width capacity")
+
 
 class IncrMultiOptions(TypedDict):
     timestamp: datetime
@@ -133,9 +137,11 @@ class BaseTSDB(Service):
             "delete",
             "record",
             "record_multi",
+            "record_multi_batch",
             "merge_distinct_counts",
             "delete_distinct_counts",
             "record_frequency_multi",
+            "record_frequency_multi_batch",
             "merge_frequencies",
             "delete_frequencies",
             "flush",
@@ -522,6 +528,20 @@ class BaseTSDB(Service):
         for model, key, values in items:
             self.record(model, key, values, timestamp, environment_id=environment_id)
 
+    def record_multi_batch(
+        self,
+        batch: Sequence[
+            tuple[Iterable[tuple[TSDBModel, int, Iterable[str]]], datetime | None, int | None]
+        ],
+    ) -> None:
+        """
+        Record occurrence of items in distinct counters for multiple
+        ``(items, timestamp, environment_id)`` arguments of ``record_multi``,
+        such as the ones of all events of a batch.
+        """
+        for items, timestamp, environment_id in batch:
+            self.record_multi(items, timestamp, environment_id=environment_id)
+
     def get_distinct_counts_series(
         self,
         model: TSDBModel,
@@ -613,6 +633,24 @@ class BaseTSDB(Service):
         """
         raise NotImplementedError
 
+    def record_frequency_multi_batch(
+        self,
+        batch: Sequence[
+            tuple[
+                Sequence[tuple[TSDBModel, Mapping[str, Mapping[str, int | float]]]],
+                datetime | None,
+                int | None,
+            ]
+        ],
+    ) -> None:
+        """
+        Record items in frequency tables for multiple
+        ``(requests, timestamp, environment_id)`` arguments of
+        ``record_frequency_multi``, such as the ones of all events of a batch.
+        """
+        for requests, timestamp, environment_id in batch:
+            self.record_frequency_multi(requests, timestamp, environment_id=environment_id)
+
     def get_most_frequent(
         self,
         model: TSDBModel,
@@ -0,0 +1,899 @@
+"""
+An array-backed, in-process time series storage.
+
+Every series keeps one ring buffer per rollup, with a slot for each of the samples that are
+retained for the rollup. A slot remembers the rollup interval it holds, so that when the ring
+wraps around the slot is reused for a newer interval and the older one is gone, in the same way
+that the TTLs of the Redis backend expire data:
+
+    {
+        (<model>, <key>, <environment id>): {
+            <rollup>: RingBuffer(intervals=array("q", ...), values=...),
+            ...
+        },
+        ...
+    }
+
+Counters are stored in ``array("q")`` columns. Distinct counters are HyperLogLogs, and frequency
+tables are the Count-Min sketches with a top-N index implemented by ``cmsketch.lua`` for the Redis
+backend, so this backend returns the same (approximate) results as ``RedisTSDB`` does for the
+intervals within the retention of each rollup. (Late writes are dropped once the slot of their
+interval holds a newer one, while Redis drops them based on the time they are written at.)
+
+This is a bounded-memory backend, not a faster one: ``InMemoryTSDB`` keeps every interval and
+every distinct value it was given for the lifetime of the process, while this backend only holds
+the retained samples of each rollup and fixed-size estimators. Hashing values into HyperLogLogs
+and sketches is more work than adding them to sets and dicts, so reads and writes are somewhat
+slower than with ``InMemoryTSDB`` (see ``test_columnar_benchmark.py``).
+
+All data lives in the memory of the process, so this backend is only suitable where every read
+and write happens in the same process, such as tests and single process installs:
+
+    SENTRY_TSDB = "sentry.tsdb.columnar.ColumnarTSDB"
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Mapping, MutableSequence, Sequence
+from datetime import datetime
+from typing import Any, Generic, TypeVar
+
+import mmh3
+from django.utils import timezone
+
+from sentry.tsdb.base import (
+    BaseTSDB,
+    IncrMultiOptions,
+    SketchParameters,
+    TSDBItem,
+    TSDBKey,
+    TSDBModel,
+)
+
+T = TypeVar("T")
+
+# The number of bits of the hash of a value that select its HyperLogLog register. 2 ** 12
+# registers have a standard error of 1.6%.
+HLL_PRECISION = 12
+HLL_REGISTERS = 1 << HLL_PRECISION
+# HyperLogLogs keep their registers in a dict until this many are set, as most distinct counters
+# only ever see a few values.
+HLL_SPARSE_LIMIT = HLL_REGISTERS // 16
+
+
+class RingBuffer(Generic[T]):
+    """
+    The values of the intervals of a rollup, stored in a fixed number of slots that are reused
+    as newer intervals are written. Writes for an interval older than the one held by its slot
+    are dropped, as that interval is past the retention of the rollup.
+    """
+
+    __slots__ = ("intervals", "values", "empty")
+
+    def __init__(self, samples: int, values: MutableSequence[T], empty: T) -> None:
+        self.intervals = array("q", [-1]) * samples
+        self.values = values
+        self.empty = empty
+
+    def get(self, interval: int) -> T:
+        slot = interval % len(self.intervals)
+        if self.intervals[slot] != interval:
+            return self.empty
+        return self.values[slot]
+
+    def set(self, interval: int, value: T) -> None:
+        slot = interval % len(self.intervals)
+        if interval < self.intervals[slot]:
+            return
+        self.intervals[slot] = interval
+        self.values[slot] = value
+
+    def incr(self: RingBuffer[int], interval: int, count: int) -> None:
+        slot = interval % len(self.intervals)
+        if interval < self.intervals[slot]:
+            return
+        if self.intervals[slot] != interval:
+            self.intervals[slot] = interval
+            self.values[slot] = count
+        else:
+            self.values[slot] += count
+
+    def pop(self, interval: int) -> T:
+        slot = interval % len(self.intervals)
+        if self.intervals[slot] != interval:
+            return self.empty
+        value = self.values[slot]
+        self.intervals[slot] = -1
+        self.values[slot] = self.empty
+        return value
+
+    def items(self) -> Iterator[tuple[int, T]]:
+        for interval, value in zip(self.intervals, self.values):
+            if interval >= 0:
+                yield interval, value
+
+
+class HyperLogLog:
+    """
+    A cardinality estimator, like the ones backing ``PFADD`` and ``PFCOUNT``.
+    """
+
+    __slots__ = ("registers",)
+
+    def __init__(self) -> None:
+        self.registers: dict[int, int] | bytearray = {}
+
+    def get(self, register: int) -> int:
+        if isinstance(self.registers, dict):
+            return self.registers.get(register, 0)
+        return self.registers[register]
+
+    def set(self, register: int, rank: int) -> None:
+        self.registers[register] = rank
+        if isinstance(self.registers, dict) and len(self.registers) > HLL_SPARSE_LIMIT:
+            registers = bytearray(HLL_REGISTERS)
+            for r, value in self.registers.items():
+                registers[r] = value
+            self.registers = registers
+
+    def ranks(self) -> Iterator[tuple[int, int]]:
+        if isinstance(self.registers, dict):
+            yield from self.registers.items()
+        else:
+            for register, rank in enumerate(self.registers):
+                if rank:
+                    yield register, rank
+
+    @staticmethod
+    def hash(value: Any) -> tuple[int, int]:
+        """
+        Returns the register a value belongs to and its rank, which is the position of the first
+        set bit in the rest of the hash of the value.
+        """
+        if not isinstance(value, (str, bytes)):
+            value = str(value)
+        value_hash = mmh3.hash64(value, signed=False)[0]
+        register = value_hash >> (64 - HLL_PRECISION)
+        remainder = value_hash & ((1 << (64 - HLL_PRECISION)) - 1)
+        rank = 64 - HLL_PRECISION - remainder.bit_length() + 1
+        return register, rank
+
+    def add(self, value: Any) -> None:
+        self.update_ranks([self.hash(value)])
+
+    def update_ranks(self, ranks: Iterable[tuple[int, int]]) -> None:
+        for register, rank in ranks:
+            if rank > self.get(register):
+                self.set(register, rank)
+
+    def update(self, other: HyperLogLog) -> None:
+        self.update_ranks(other.ranks())
+
+    def count(self) -> int:
+        ranks = [rank for _, rank in self.ranks()]
+        zeros = HLL_REGISTERS - len(ranks)
+        total = zeros + sum(2.0**-rank for rank in ranks)
+        alpha = 0.7213 / (1 + 1.079 / HLL_REGISTERS)
+        estimate = alpha * HLL_REGISTERS**2 / total
+        # Small cardinalities are estimated from the number of empty registers (linear counting.)
+        if estimate <= 2.5 * HLL_REGISTERS and zeros:
+            estimate = HLL_REGISTERS * math.log(HLL_REGISTERS / zeros)
+        return int(round(estimate))
+
+
+def count_distinct(hlls: Iterable[HyperLogLog | None]) -> int:
+    """
+    Returns the cardinality of the union of the HyperLogLogs, like ``PFCOUNT`` of multiple keys.
+    """
+    union = HyperLogLog()
+    for hll in hlls:
+        if hll is not None:
+            union.update(hll)
+    return union.count()
+
+
+class FrequencySketch:
+    """
+    A Count-Min sketch with an index of the most frequent items, which is a port of the sketch in
+    ``cmsketch.lua``. Items are counted exactly in the index until it reaches its capacity, after
+    which the estimation matrix is initialized from the index and the index is maintained from
+    the estimates.
+    """
+
+    __slots__ = ("parameters", "index", "estimates")
+
+    def __init__(self, parameters: SketchParameters) -> None:
+        self.parameters = parameters
+        self.index: dict[str, float] = {}
+        self.estimates: array[float] | None = None
+
+    def exists(self) -> bool:
+        return bool(self.index)
+
+    def coordinates(self, value: str) -> list[int]:
+        width = self.parameters.width
+        return [
+            depth * width + mmh3.hash(value, depth + 1, signed=False) % width
+            for depth in range(self.parameters.depth)
+        ]
+
+    def get_estimates(self) -> array[float]:
+        if self.estimates is None:
+            self.estimates = array("d", [0.0]) * (self.parameters.depth * self.parameters.width)
+        return self.estimates
+
+    def estimate(self, value: str) -> float:
+        score = self.index.get(value)
+        if score is not None:
+            return score
+        if self.estimates is None:
+            return 0.0
+        return min(self.estimates[c] for c in self.coordinates(value))
+
+    def increment(self, items: Iterable[tuple[str, float]]) -> None:
+        capacity = self.parameters.capacity
+        if capacity > len(self.index):
+            for value, delta in items:
+                self.index[value] = self.index.get(value, 0.0) + delta
+
+            # Once the index is full, the estimation matrix takes over from the index.
+            if len(self.index) >= capacity:
+                estimates = self.get_estimates()
+                for value, score in self.index.items():
+                    for c in self.coordinates(value):
+                        if score > estimates[c]:
+                            estimates[c] = score
+                self.truncate()
+            return
+
+        # This uses the conservative update strategy, like ``cmsketch.lua``.
+        estimates = self.get_estimates()
+        scores = []
+        for value, delta in items:
+            coordinates = self.coordinates(value)
+            score = self.index.get(value)
+            if score is None:
+                score = min(estimates[c] for c in coordinates)
+            score += delta
+            for c in coordinates:
+                if score > estimates[c]:
+                    estimates[c] = score
+            scores.append((value, score))
+
+        if capacity > 0:
+            minimum = min(self.index.values())
+            added = False
+            for value, score in scores:
+                if score > minimum:
+                    self.index[value] = score
+                    added = True
+            if added:
+                self.truncate()
+
+    def truncate(self) -> None:
+        capacity = self.parameters.capacity
+        if len(self.index) > capacity:
+            ranked = sorted(self.index.items(), key=lambda item: (item[1], item[0]))
+            self.index = dict(ranked[len(ranked) - capacity :])
+
+    def ranked(self, limit: int) -> list[tuple[str, float]]:
+        return sorted(self.index.items(), key=lambda item: (item[1], item[0]), reverse=True)[:limit]
+
+    def merge(self, source: FrequencySketch) -> None:
+        if not source.exists():
+            return
+
+        if source.estimates is None:
+            self.increment(source.index.items())
+            return
+
+        # The estimation matrices are added up and the index is rebuilt from the members of both
+        # indices with their combined estimates.
+        if self.estimates is None:
+            estimates = self.get_estimates()
+            for value, score in self.index.items():
+                for c in self.coordinates(value):
+                    if score > estimates[c]:
+                        estimates[c] = score
+        estimates = self.get_estimates()
+        for c, observations in enumerate(source.estimates):
+            estimates[c] += observations
+
+        members = set(self.index) | set(source.index)
+        self.index = {
+            value: min(estimates[c] for c in self.coordinates(value)) for value in members
+        }
+        self.truncate()
+
+
+def rank(sketches: Iterable[FrequencySketch | None], limit: int) -> list[tuple[str, float]]:
+    """
+    Returns the most frequent items across the sketches, with their total scores.
+    """
+    existing = [sketch for sketch in sketches if sketch is not None and sketch.exists()]
+    if not existing:
+        return []
+    if len(existing) == 1:
+        return existing[0].ranked(limit)
+
+    members = set().union(*(sketch.index for sketch in existing))
+    results = [(value, sum(sketch.estimate(value) for sketch in existing)) for value in members]
+    results.sort(key=lambda item: (-item[1], item[0]))
+    return results[:limit]
+
+
+SeriesKey = tuple[TSDBModel, Any, int | None]
+
+
+class ColumnarTSDB(BaseTSDB):
+    """
+    An in-process time series storage, keeping a ring buffer for each rollup of a series. It
+    implements the semantics of ``RedisTSDB``, including its sketches, but data is not shared
+    between processes and is lost when the process exits.
+    """
+
+    DEFAULT_SKETCH_PARAMETERS = SketchParameters(3, 128, 50)
+
+    def __init__(self, **options: Any) -> None:
+        super().__init__(**options)
+        # Held by writes and by reads, which iterate over the registers and indexes that writes
+        # from other threads (web threads, threaded consumers) add entries to.
+        self.lock = threading.RLock()
+        self.flush()
+
+    def flush(self) -> None:
+        self.counters: dict[SeriesKey, dict[int, RingBuffer[int]]] = {}
+        self.sets: dict[SeriesKey, dict[int, RingBuffer[HyperLogLog | None]]] = {}
+        self.frequencies: dict[SeriesKey, dict[int, RingBuffer[FrequencySketch | None]]] = {}
+
+    def _get_buffers(
+        self,
+        store: dict[SeriesKey, dict[int, RingBuffer[T]]],
+        series_key: SeriesKey,
+        factory: Callable[[int], RingBuffer[T]],
+    ) -> dict[int, RingBuffer[T]]:
+        buffers = store.get(series_key)
+        if buffers is None:
+            buffers = store[series_key] = {
+                rollup: factory(samples) for rollup, samples in self.rollups.items()
+            }
+        return buffers
+
+    def _make_counter(self, samples: int) -> RingBuffer[int]:
+        return RingBuffer(samples, array("q", [0]) * samples, 0)
+
+    def _make_objects(self, samples: int) -> RingBuffer[Any]:
+        return RingBuffer(samples, [None] * samples, None)
+
+    def _get_intervals(self, timestamp: datetime) -> dict[int, int]:
+        epoch = int(timestamp.timestamp())
+        return {rollup: int(epoch / rollup) for rollup in self.rollups}
+
+    def _read(
+        self,
+        store: dict[SeriesKey, dict[int, RingBuffer[T]]],
+        series_key: SeriesKey,
+        rollup: int,
+        timestamp: float,
+    ) -> T | None:
+        buffers = store.get(series_key)
+        if buffers is None or rollup not in buffers:
+            return None
+        return buffers[rollup].get(self.normalize_ts_to_rollup(timestamp, rollup))
+
+    # Counters
+
+    def incr(
+        self,
+        model: TSDBModel,
+        key: TSDBKey,
+        timestamp: datetime | None = None,
+        count: int = 1,
+        environment_id: int | None = None,
+    ) -> None:
+        self.incr_multi([(model, key)], timestamp, count, environment_id)
+
+    def incr_multi(
+        self,
+        items: Sequence[tuple[TSDBModel, TSDBKey] | tuple[TSDBModel, TSDBKey, IncrMultiOptions]],
+        timestamp: datetime | None = None,
+        count: int = 1,
+        environment_id: int | None = None,
+    ) -> None:
+        self.validate_arguments([item[0] for item in items], [environment_id])
+
+        if timestamp is None:
+            timestamp = timezone.now()
+
+        intervals: dict[datetime, dict[int, int]] = {}
+        with self.lock:
+            for item in items:
+                if len(item) == 2:
+                    model, key = item
+                    _timestamp, _count = timestamp, count
+                else:
+                    model, key, options = item
+                    _timestamp = options.get("timestamp", timestamp) or timestamp
+                    _count = options.get("count", count) or count
+
+                if _timestamp not in intervals:
+                    intervals[_timestamp] = self._get_intervals(_timestamp)
+                _intervals = intervals[_timestamp]
+
+                for _environment_id in {environment_id, None}:
+                    buffers = self._get_buffers(
+                        self.counters, (model, key, _environment_id), self._make_counter
+                    )
+                    for rollup, buffer in buffers.items():
+                        buffer.incr(_intervals[rollup], _count)
+
+    def merge(
+        self,
+        model: TSDBModel,
+        destination: int,
+        sources: list[int],
+        timestamp: datetime | None = None,
+        environment_ids: Iterable[int] | None = None,
+    ) -> None:
+        ids = (set(environment_ids) if environment_ids is not None else set()).union([None])
+
+        self.validate_arguments([model], ids)
+
+        with self.lock:
+            for environment_id in ids:
+                for source in sources:
+                    source_buffers = self.counters.pop((model, source, environment_id), None)
+                    if source_buffers is None:
+                        continue
+                    buffers = self._get_buffers(
+                        self.counters, (model, destination, environment_id), self._make_counter
+                    )
+                    for rollup, source_buffer in source_buffers.items():
+                        buffer = buffers[rollup]
+                        for interval, count in source_buffer.items():
+                            buffer.incr(interval, count)
+
+    def delete(
+        self,
+        models: list[TSDBModel],
+        keys: list[int],
+        start: datetime | None = None,
+        end: datetime | None = None,
+        timestamp: datetime | None = None,
+        environment_ids: Iterable[int | None] | None = None,
+    ) -> None:
+        self._delete(self.counters, models, keys, start, end, timestamp, environment_ids)
+
+    def _delete(
+        self,
+        store: dict[SeriesKey, dict[int, RingBuffer[Any]]],
+        models: list[TSDBModel],
+        keys: Iterable[Any],
+        start: datetime | None,
+        end: datetime | None,
+        timestamp: datetime | None,
+        environment_ids: Iterable[int | None] | None,
+    ) -> None:
+        ids = (set(environment_ids) if environment_ids is not None else set()).union([None])
+
+        self.validate_arguments(models, ids)
+
+        rollups = self.get_active_series(start, end, timestamp)
+
+        with self.lock:
+            for model in models:
+                for key in keys:
+                    for environment_id in ids:
+                        buffers = store.get((model, key, environment_id))
+                        if buffers is None:
+                            continue
+                        for rollup, series in rollups.items():
+                            if rollup not in buffers:
+                                continue
+                            for _timestamp in series:
+                                buffers[rollup].pop(self.normalize_to_rollup(_timestamp, rollup))
+
+    def get_range(
+        self,
+        model: TSDBModel,
+        keys: Sequence[TSDBKey],
+        start: datetime,
+        end: datetime,
+        rollup: int | None = None,
+        environment_ids: list[int] | None = None,
+        conditions: Any = None,
+        use_cache: bool = False,
+        jitter_value: int | None = None,
+        tenant_ids: dict[str, str | int] | None = None,
+        referrer_suffix: str | None = None,
+    ) -> dict[TSDBKey, list[tuple[int, int]]]:
+        _environment_ids: list[int | None] = list(environment_ids) if environment_ids else [None]
+
+        self.validate_arguments([model], _environment_ids)
+
+        rollup, series = self.get_optimal_rollup_series(start, end, rollup)
+
+        with self.lock:
+            results = {}
+            for key in keys:
+                results[key] = [
+                    (
+                        timestamp,
+                        sum(
+                            self._read(
+                                self.counters, (model, key, environment_id), rollup, timestamp
+                            )
+                            or 0
+                            for environment_id in _environment_ids
+                        ),
+                    )
+                    for timestamp in series
+                ]
+            return results
+
+    # Distinct counters
+
+    def record(
+        self,
+        model: TSDBModel,
+        key: int,
+        values: Iterable[str],
+        timestamp: datetime | None = None,
+        environment_id: int | None = None,
+    ) -> None:
+        self.record_multi(((model, key, values),), timestamp, environment_id)
+
+    def record_multi(
+        self,
+        items: Iterable[tuple[TSDBModel, int, Iterable[str]]],
+        timestamp: datetime | None = None,
+        environment_id: int | None = None,
+    ) -> None:
+        # Values are only hashed once for all of the counters they are recorded in.
+        hashed = [
+            (model, key, [HyperLogLog.hash(value) for value in values])
+            for model, key, values in items
+        ]
+
+        self.validate_arguments([model for model, key, ranks in hashed], [environment_id])
+
+        if timestamp is None:
+            timestamp = timezone.now()
+        intervals = self._get_intervals(timestamp)
+
+        with self.lock:
+            for model, key, ranks in hashed:
+                for _environment_id in {environment_id, None}:
+                    buffers = self._get_buffers(
+                        self.sets, (model, key, _environment_id), self._make_objects
+                    )
+                    for rollup, buffer in buffers.items():
+                        hll = buffer.get(intervals[rollup])
+                        if hll is None:
+                            hll = HyperLogLog()
+                            buffer.set(intervals[rollup], hll)
+                        hll.update_ranks(ranks)
+
+    def get_distinct_counts_series(
+        self,
+        model: TSDBModel,
+        keys: Sequence[int],
+        start: datetime,
+        end: datetime | None = None,
+        rollup: int | None = None,
+        environment_id: int | None = None,
+        tenant_ids: dict[str, str | int] | None = None,
+    ) -> dict[int, list[tuple[int, Any]]]:
+        self.validate_arguments([model], [environment_id])
+
+        rollup, series = self.get_optimal_rollup_series(start, end, rollup)
+
+        with self.lock:
+            return {
+                key: [
+                    (
+                        timestamp,
+                        count_distinct(
+                            [self._read(self.sets, (model, key, environment_id), rollup, timestamp)]
+                        ),
+                    )
+                    for timestamp in series
+                ]
+                for key in keys
+            }
+
+    def get_distinct_counts_totals(
+        self,
+        model: TSDBModel,
+        keys: Sequence[int],
+        start: datetime,
+        end: datetime | None = None,
+        rollup: int | None = None,
+        environment_id: int | None = None,
+        use_cache: bool = False,
+        jitter_value: int | None = None,
+        tenant_ids: dict[str, int | str] | None = None,
+        referrer_suffix: str | None = None,
+    ) -> dict[int, Any]:
+        self.validate_arguments([model], [environment_id])
+
+        rollup, series = self.get_optimal_rollup_series(start, end, rollup)
+
+        with self.lock:
+            return {
+                key: count_distinct(
+                    self._read(self.sets, (model, key, environment_id), rollup, timestamp)
+                    for timestamp in series
+                )
+                for key in keys
+            }
+
+    def get_distinct_counts_union(
+        self,
+        model: TSDBModel,
+        keys: list[int] | None,
+        start: datetime,
+        end: datetime | None = None,
+        rollup: int | None = None,
+        environment_id: int | None = None,
+        tenant_ids: dict[str, str | int] | None = None,
+    ) -> int:
+        self.validate_arguments([model], [environment_id])
+
+        if not keys:
+            return 0
+
+        rollup, series = self.get_optimal_rollup_series(start, end, rollup)
+
+        with self.lock:
+            return count_distinct(
+                self._read(self.sets, (model, key, environment_id), rollup, timestamp)
+                for key in keys
+                for timestamp in series
+            )
+
+    def merge_distinct_counts(
+        self,
+        model: TSDBModel,
+        destination: int,
+        sources: list[int],
+        timestamp: datetime | None = None,
+        environment_ids: Iterable[int] | None = None,
+    ) -> None:
+        ids = (set(environment_ids) if environment_ids is not None else set()).union([None])
+
+        self.validate_arguments([model], ids)
+
+        with self.lock:
+            for environment_id in ids:
+                for source in sources:
+                    source_buffers = self.sets.pop((model, source, environment_id), None)
+                    if source_buffers is None:
+                        continue
+                    buffers = self._get_buffers(
+                        self.sets, (model, destination, environment_id), self._make_objects
+                    )
+                    for rollup, source_buffer in source_buffers.items():
+                        buffer = buffers[rollup]
+                        for interval, source_hll in source_buffer.items():
+                            hll = buffer.get(interval)
+                            if hll is None:
+                                hll = HyperLogLog()
+                                buffer.set(interval, hll)
+                            hll.update(source_hll)
+
+    def delete_distinct_counts(
+        self,
+        models: list[TSDBModel],
+        keys: list[int],
+        start: datetime | None = None,
+        end: datetime | None = None,
+        timestamp: datetime | None = None,
+        environment_ids: Iterable[int] | None = None,
+    ) -> None:
+        self._delete(self.sets, models, keys, start, end, timestamp, environment_ids)
+
+    # Frequency tables
+
+    def record_frequency_multi(
+        self,
+        requests: Sequence[tuple[TSDBModel, Mapping[str, Mapping[str, int | float]]]],
+        timestamp: datetime | None = None,
+        environment_id: int | None = None,
+    ) -> None:
+        self.validate_arguments([model for model, request in requests], [environment_id])
+
+        if timestamp is None:
+            timestamp = timezone.now()
+        intervals = self._get_intervals(timestamp)
+
+        with self.lock:
+            for model, request in requests:
+                for key, items in request.items():
+                    # Members are stored as strings, as they are by Redis.
+                    scores = [(str(member), float(score)) for member, score in items.items()]
+                    for _environment_id in {environment_id, None}:
+                        buffers = self._get_buffers(
+                            self.frequencies, (model, key, _environment_id), self._make_objects
+                        )
+                        for rollup, buffer in buffers.items():
+                            sketch = buffer.get(intervals[rollup])
+                            if sketch is None:
+                                sketch = FrequencySketch(self.DEFAULT_SKETCH_PARAMETERS)
+                                buffer.set(intervals[rollup], sketch)
+                            sketch.increment(scores)
+
+    def get_most_frequent(
+        self,
+        model: TSDBModel,
+        keys: Sequence[TSDBKey],
+        start: datetime,
+        end: datetime | None = None,
+        rollup: int | None = None,
+        limit: int | None = None,
+        environment_id: int | None = None,
+        tenant_ids: dict[str, str | int] | None = None,
+    ) -> dict[TSDBKey, list[tuple[str, float]]]:
+        self.validate_arguments([model], [environment_id])
+
+        rollup, series = self.get_optimal_rollup_series(start, end, rollup)
+
+        if limit is None:
+            limit = self.DEFAULT_SKETCH_PARAMETERS.capacity
+
+        with self.lock:
+            return {
+                key: rank(
+                    (
+                        self._read(
+                            self.frequencies, (model, key, environment_id), rollup, timestamp
+                        )
+                        for timestamp in series
+                    ),
+                    limit,
+                )
+                for key in keys
+            }
+
+    def get_most_frequent_series(
+        self,
+        model: TSDBModel,
+        keys: Iterable[str],
+        start: datetime,
+        end: datetime | None = None,
+        rollup: int | None = None,
+        limit: int | None = None,
+        environment_id: int | None = None,
+        tenant_ids: dict[str, str | int] | None = None,
+    ) -> dict[str, Iterable[Any]]:
+        self.validate_arguments([model], [environment_id])
+
+        rollup, series = self.get_optimal_rollup_series(start, end, rollup)
+
+        if limit is None:
+            limit = self.DEFAULT_SKETCH_PARAMETERS.capacity
+
+        with self.lock:
+            results: dict[str, Iterable[Any]] = {}
+            for key in keys:
+                results[key] = [
+                    (
+                        timestamp,
+                        dict(
+                            rank(
+                                [
+                                    self._read(
+                                        self.frequencies,
+                                        (model, key, environment_id),
+                                        rollup,
+                                        timestamp,
+                                    )
+                                ],
+                                limit,
+                            )
+                        ),
+                    )
+                    for timestamp in series
+                ]
+            return results
+
+    def get_frequency_series(
+        self,
+        model: TSDBModel,
+        items: Mapping[TSDBKey, Sequence[TSDBItem]],
+        start: datetime,
+        end: datetime | None = None,
+        rollup: int | None = None,
+        environment_id: int | None = None,
+        tenant_ids: dict[str, str | int] | None = None,
+    ) -> dict[TSDBKey, list[tuple[float, dict[TSDBItem, float]]]]:
+        self.validate_arguments([model], [environment_id])
+
+        rollup, series = self.get_optimal_rollup_series(start, end, rollup)
+
+        with self.lock:
+            results: dict[TSDBKey, list[tuple[float, dict[TSDBItem, float]]]] = {}
+            for key, members in items.items():
+                result = results[key] = []
+                for timestamp in series:
+                    sketch = self._read(
+                        self.frequencies, (model, key, environment_id), rollup, timestamp
+                    )
+                    result.append(
+                        (
+                            timestamp,
+                            {
+                                member: (
+                                    sketch.estimate(str(member))
+                                    if sketch is not None and sketch.exists()
+                                    else 0.0
+                                )
+                                for member in members
+                            },
+                        )
+                    )
+            return results
+
+    def get_frequency_totals(
+        self,
+        model: TSDBModel,
+        items: Mapping[TSDBKey, Sequence[TSDBItem]],
+        start: datetime,
+        end: datetime | None = None,
+        rollup: int | None = None,
+        environment_id: int | None = None,
+        tenant_ids: dict[str, str | int] | None = None,
+    ) -> dict[TSDBKey, dict[TSDBItem, float]]:
+        results: dict[TSDBKey, dict[TSDBItem, float]] = {}
+        for key, series in self.get_frequency_series(
+            model, items, start, end, rollup, environment_id
+        ).items():
+            result = results[key] = {}
+            for timestamp, scores in series:
+                for member, score in scores.items():
+                    result[member] = result.get(member, 0.0) + score
+        return results
+
+    def merge_frequencies(
+        self,
+        model: TSDBModel,
+        destination: str,
+        sources: Sequence[TSDBKey],
+        timestamp: datetime | None = None,
+        environment_ids: Iterable[int] | None = None,
+    ) -> None:
+        ids = (set(environment_ids) if environment_ids is not None else set()).union([None])
+
+        self.validate_arguments([model], ids)
+
+        with self.lock:
+            for environment_id in ids:
+                for source in sources:
+                    source_buffers = self.frequencies.pop((model, source, environment_id), None)
+                    if source_buffers is None:
+                        continue
+                    buffers = self._get_buffers(
+                        self.frequencies, (model, destination, environment_id), self._make_objects
+                    )
+                    for rollup, source_buffer in source_buffers.items():
+                        buffer = buffers[rollup]
+                        for interval, source_sketch in source_buffer.items():
+                            sketch = buffer.get(interval)
+                            if sketch is None:
+                                sketch = FrequencySketch(self.DEFAULT_SKETCH_PARAMETERS)
+                                buffer.set(interval, sketch)
+                            sketch.merge(source_sketch)
+
+    def delete_frequencies(
+        self,
+        models: list[TSDBModel],
+        keys: Iterable[str],
+        start: datetime | None = None,
+        end: datetime | None = None,
+        timestamp: datetime | None = None,
+        environment_ids: Iterable[int] | None = None,
+    ) -> None:
+        self._delete(self.frequencies, models, keys, start, end, timestamp, environment_ids)
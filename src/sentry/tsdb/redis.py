@@ -3,7 +3,7 @@ import itertools
 import logging
 import random
 import uuid
-from collections import defaultdict, namedtuple
+from collections import defaultdict
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from datetime import datetime
 from functools import reduce
@@ -15,7 +15,15 @@ from django.utils import timezone
 from django.utils.encoding import force_bytes
 from redis.client import Script
 
-from sentry.tsdb.base import BaseTSDB, IncrMultiOptions, TSDBItem, TSDBKey, TSDBModel
+from sentry.tsdb.base import (
+    BaseTSDB,
+    IncrMultiOptions,
+    SketchParameters,
+    TSDBItem,
+    TSDBKey,
+    TSDBModel,
+)
+from sentry.utils import metrics
 from sentry.utils.dates import to_datetime
 from sentry.utils.redis import (
     check_cluster_versions,
@@ -29,7 +37,6 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
-SketchParameters = namedtuple("SketchParameters", "depth width capacity")
 
 CountMinScript = load_redis_script("tsdb/cmsketch.lua")
 
@@ -468,26 +475,61 @@ class RedisTSDB(BaseTSDB):
         """
         Record an occurrence of an item in a distinct counter.
         """
-        self.validate_arguments([model for model, key, values in items], [environment_id])
+        self.record_multi_batch([(items, timestamp, environment_id)])
 
-        if timestamp is None:
-            timestamp = timezone.now()
+    def record_multi_batch(
+        self,
+        batch: Sequence[
+            tuple[Iterable[tuple[TSDBModel, int, Iterable[str]]], datetime | None, int | None]
+        ],
+    ) -> None:
+        """
+        Record occurrences of items in distinct counters for multiple
+        ``record_multi`` calls, using a single pipeline per cluster.
 
-        ts = int(timestamp.timestamp())  # ``timestamp`` is not actually a timestamp :(
+        Values added to the same counter by different calls (such as the users
+        of several events of the same group) are merged into one ``PFADD``.
+        """
+        now = timezone.now()
 
-        for (cluster, durable), environment_ids in self.get_cluster_groups({None, environment_id}):
-            manager = cluster.fanout()
-            if not durable:
-                manager = SuppressionWrapper(manager)
+        # cluster -> counter key -> (routing key, values, expiry)
+        updates: dict[
+            tuple[rb.Cluster, bool], dict[str | int, tuple[int, set[str], int]]
+        ] = defaultdict(dict)
+        for items, timestamp, environment_id in batch:
+            items = list(items)
+            self.validate_arguments([model for model, key, values in items], [environment_id])
 
-            with manager as client:
+            if timestamp is None:
+                timestamp = now
+
+            ts = int(timestamp.timestamp())  # ``timestamp`` is not actually a timestamp :(
+
+            for cluster, environment_ids in self.get_cluster_groups({None, environment_id}):
+                cluster_updates = updates[cluster]
                 for model, key, values in items:
-                    c = client.target_key(key)
                     for rollup, max_values in self.rollups.items():
+                        expiry = self.calculate_expiry(rollup, max_values, timestamp)
                         for _environment_id in environment_ids:
                             k = self.make_key(model, rollup, ts, key, _environment_id)
-                            c.pfadd(k, *values)
-                            c.expireat(k, self.calculate_expiry(rollup, max_values, timestamp))
+                            if k in cluster_updates:
+                                _, pending, pending_expiry = cluster_updates[k]
+                                pending.update(values)
+                                cluster_updates[k] = (key, pending, max(pending_expiry, expiry))
+                            else:
+                                cluster_updates[k] = (key, set(values), expiry)
+
+        for (cluster, durable), cluster_updates in updates.items():
+            manager = cluster.fanout()
+            if not durable:
+                manager = SuppressionWrapper(manager)
+
+            with metrics.timer("tsdb.redis.record_multi", tags={"durable": durable}):
+                with manager as client:
+                    for k, (key, values, expiry) in cluster_updates.items():
+                        c = client.target_key(key)
+                        c.pfadd(k, *values)
+                        c.expireat(k, expiry)
 
     def get_distinct_counts_series(
         self,
@@ -779,51 +821,97 @@ class RedisTSDB(BaseTSDB):
         timestamp: datetime | None = None,
         environment_id: int | None = None,
     ) -> None:
-        self.validate_arguments([model for model, request in requests], [environment_id])
+        self.record_frequency_multi_batch([(requests, timestamp, environment_id)])
 
-        if not self.enable_frequency_sketches:
-            return
+    def record_frequency_multi_batch(
+        self,
+        batch: Sequence[
+            tuple[
+                Sequence[tuple[TSDBModel, Mapping[str, Mapping[str, int | float]]]],
+                datetime | None,
+                int | None,
+            ]
+        ],
+    ) -> None:
+        """
+        Record items in frequency tables for multiple ``record_frequency_multi``
+        calls, with a single script invocation (using the ``INCRBATCH`` command)
+        per host of each cluster.
 
-        if timestamp is None:
-            timestamp = timezone.now()
+        Increments of the same sketches by different calls (such as the ones of
+        several events of the same group) are merged into a single update.
+        """
+        for requests, timestamp, environment_id in batch:
+            self.validate_arguments([model for model, request in requests], [environment_id])
 
-        ts = int(timestamp.timestamp())  # ``timestamp`` is not actually a timestamp :(
+        if not self.enable_frequency_sketches:
+            return
 
-        for (cluster, durable), environment_ids in self.get_cluster_groups({None, environment_id}):
-            commands: dict[str, list] = {}
+        now = timezone.now()
+
+        # cluster -> host -> (routing key, sketch keys -> items, expirations)
+        updates: dict[
+            tuple[rb.Cluster, bool],
+            dict[int, tuple[str, dict[tuple[str, ...], dict[str, float]], dict[str, int]]],
+        ] = defaultdict(dict)
+        for requests, timestamp, environment_id in batch:
+            if timestamp is None:
+                timestamp = now
+
+            ts = int(timestamp.timestamp())  # ``timestamp`` is not actually a timestamp :(
+
+            for (cluster, durable), environment_ids in self.get_cluster_groups(
+                {None, environment_id}
+            ):
+                hosts = updates[(cluster, durable)]
+                router = cluster.get_router()
+                for model, request in requests:
+                    for key, items in request.items():
+                        keys: list[str] = []
+                        expirations = {}
+
+                        # Figure out all of the keys we need to be incrementing,
+                        # as well as their expiration policies.
+                        for rollup, max_values in self.rollups.items():
+                            expiry = self.calculate_expiry(rollup, max_values, timestamp)
+                            for _environment_id in environment_ids:
+                                chunk = self.make_frequency_table_keys(
+                                    model, rollup, ts, key, _environment_id
+                                )
+                                keys.extend(chunk)
+                                for k in chunk:
+                                    expirations[k] = expiry
 
-            for model, request in requests:
-                for key, items in request.items():
-                    keys = []
-                    expirations = {}
+                        host = router.get_host_for_key(key)
+                        if host not in hosts:
+                            hosts[host] = (key, {}, {})
+                        _, sketches, host_expirations = hosts[host]
 
-                    # Figure out all of the keys we need to be incrementing, as
-                    # well as their expiration policies.
-                    for rollup, max_values in self.rollups.items():
-                        chunk = []
-                        for environment_id in environment_ids:
-                            chunk = self.make_frequency_table_keys(
-                                model, rollup, ts, key, environment_id
-                            )
-                            keys.extend(chunk)
+                        pending = sketches.setdefault(tuple(keys), {})
+                        for member, score in items.items():
+                            pending[member] = pending.get(member, 0) + score
 
-                        expiry = self.calculate_expiry(rollup, max_values, timestamp)
-                        for k in chunk:
-                            expirations[k] = expiry
+                        for k, t in expirations.items():
+                            host_expirations[k] = max(host_expirations.get(k, t), t)
 
-                    arguments = ["INCR"] + list(self.DEFAULT_SKETCH_PARAMETERS)
+        for (cluster, durable), hosts in updates.items():
+            commands: dict[str, list] = {}
+            for routing_key, sketches, expirations in hosts.values():
+                keys = []
+                arguments: list[Any] = ["INCRBATCH", *self.DEFAULT_SKETCH_PARAMETERS]
+                for sketch_keys, items in sketches.items():
+                    keys.extend(sketch_keys)
+                    arguments.extend((len(sketch_keys) // 2, len(items)))
                     for member, score in items.items():
                         arguments.extend((score, member))
 
-                    # Since we're essentially merging dictionaries, we need to
-                    # append this to any value that already exists at the key.
-                    cmds = commands.setdefault(key, [])
-                    cmds.append((CountMinScript, keys, arguments))
-                    for k, t in expirations.items():
-                        cmds.append(("EXPIREAT", k, t))
+                cmds = commands[routing_key] = [(CountMinScript, keys, arguments)]
+                for k, t in expirations.items():
+                    cmds.append(("EXPIREAT", k, t))
 
             try:
-                cluster.execute_commands(commands)
+                with metrics.timer("tsdb.redis.record_frequency_multi", tags={"durable": durable}):
+                    cluster.execute_commands(commands)
             except Exception:
                 if durable:
                     raise
@@ -41,12 +41,24 @@ method_specifications = {
     "delete": (WRITE, multiple_model_argument),
     "record": (WRITE, single_model_argument),
     "record_multi": (WRITE, lambda callargs: {model for model, key, values in callargs["items"]}),
+    "record_multi_batch": (
+        WRITE,
+        lambda callargs: {
+            model for items, _, _ in callargs["batch"] for model, key, values in items
+        },
+    ),
     "merge_distinct_counts": (WRITE, single_model_argument),
     "delete_distinct_counts": (WRITE, multiple_model_argument),
     "record_frequency_multi": (
         WRITE,
         lambda callargs: {model for model, data in callargs["requests"]},
     ),
+    "record_frequency_multi_batch": (
+        WRITE,
+        lambda callargs: {
+            model for requests, _, _ in callargs["batch"] for model, data in requests
+        },
+    ),
     "merge_frequencies": (WRITE, single_model_argument),
     "delete_frequencies": (WRITE, multiple_model_argument),
     "flush": (WRITE, dont_do_this),
@@ -91,3 +91,27 @@ class ZstdCodec(Codec[bytes, bytes]):
 
     def decode(self, value: bytes) -> bytes:
         return zstandard.ZstdDecompressor().decompress(value)
+
+
+class OptionalZstdCodec(Codec[bytes, bytes]):
+    """
+    Optionally compress values with zstd. Decoding only decompresses values
+    that start with the zstd frame magic number, so data written with and
+    without compression can be read interchangeably (e.g. while compression
+    is being rolled out or rolled back.)
+    """
+
+    magic = b"\x28\xb5\x2f\xfd"
+
+    def __init__(self, compress: bool = True) -> None:
+        self.compress = compress
+
+    def encode(self, value: bytes) -> bytes:
+        if not self.compress:
+            return value
+        return zstandard.ZstdCompressor().compress(value)
+
+    def decode(self, value: bytes) -> bytes:
+        if not value.startswith(self.magic):
+            return value
+        return zstandard.ZstdDecompressor().decompress(value)
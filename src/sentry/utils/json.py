@@ -125,6 +125,15 @@ def loads(value: str | bytes, use_rapid_json: bool = False, **kwargs: NoReturn)
         return _default_decoder.decode(value)
 
 
+# NoReturn here is to make this a mypy error to pass kwargs, since they are currently silently dropped
+def raw_decode(value: str, idx: int = 0, **kwargs: NoReturn) -> tuple[Any, int]:
+    """
+    Decode the JSON document starting at `idx` and return it along with the index at which the
+    document ended. Trailing data is ignored.
+    """
+    return _default_decoder.raw_decode(value, idx)
+
+
 # dumps JSON with `orjson` or the default function depending on `option_name`
 # TODO: remove this when orjson experiment is successful
 def dumps_experimental(option_name: str, data: Any) -> str:
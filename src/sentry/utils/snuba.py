@@ -12,7 +12,7 @@ from contextlib import contextmanager
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from hashlib import sha1
-from typing import Any, Union
+from typing import Any, NamedTuple, Union
 from urllib.parse import urlparse
 
 import sentry_sdk
@@ -24,6 +24,8 @@ from django.core.cache import cache
 from snuba_sdk import MetricsQuery, Request
 from snuba_sdk.legacy import json_to_snql
 
+from sentry import options
+from sentry.locks import locks
 from sentry.models.environment import Environment
 from sentry.models.group import Group
 from sentry.models.grouprelease import GroupRelease
@@ -39,6 +41,7 @@ from sentry.snuba.query_sources import QuerySource
 from sentry.snuba.referrer import validate_referrer
 from sentry.utils import json, metrics
 from sentry.utils.dates import outside_retention_with_modified_start
+from sentry.utils.locking import UnableToAcquireLock
 
 logger = logging.getLogger(__name__)
 
@@ -276,6 +279,22 @@ def parse_snuba_datetime(value):
     return parse_datetime(value)
 
 
+def to_columns(rows: Sequence[Mapping[str, Any]]) -> dict[str, list[Any]]:
+    """
+    Returns the rows of a Snuba result as a list of values per column. Snuba returns the same
+    columns for every row, so the columns are taken from the first one.
+    """
+    if not rows:
+        return {}
+    return {key: [row[key] for row in rows] for key in rows[0]}
+
+
+def to_rows(columns: Mapping[str, Sequence[Any]]) -> list[dict[str, Any]]:
+    """The inverse of `to_columns`, for callers that work with row dicts."""
+    names = list(columns)
+    return [dict(zip(names, values)) for values in zip(*columns.values())]
+
+
 class SnubaError(Exception):
     pass
 
@@ -825,12 +844,7 @@ def raw_query(
     Sends a query to snuba.  See `SnubaQueryParams` docstring for param
     descriptions.
     """
-
-    if referrer:
-        kwargs["tenant_ids"] = kwargs.get("tenant_ids") or dict()
-        kwargs["tenant_ids"]["referrer"] = referrer
-
-    snuba_params = SnubaQueryParams(
+    snuba_params = _make_query_params(
         dataset=dataset,
         start=start,
         end=end,
@@ -839,6 +853,7 @@ def raw_query(
         filter_keys=filter_keys,
         aggregations=aggregations,
         rollup=rollup,
+        referrer=referrer,
         is_grouprelease=is_grouprelease,
         **kwargs,
     )
@@ -846,6 +861,14 @@ def raw_query(
     return bulk_raw_query([snuba_params], referrer=referrer, use_cache=use_cache)[0]
 
 
+def _make_query_params(referrer: str | None = None, **kwargs: Any) -> SnubaQueryParams:
+    if referrer:
+        kwargs["tenant_ids"] = kwargs.get("tenant_ids") or dict()
+        kwargs["tenant_ids"]["referrer"] = referrer
+
+    return SnubaQueryParams(**kwargs)
+
+
 SnubaQuery = Union[Request, MutableMapping[str, Any]]
 Translator = Callable[[Any], Any]
 RequestQueryBody = tuple[Request, Translator, Translator]
@@ -922,6 +945,12 @@ def bulk_raw_query(
     return _apply_cache_and_build_results(request_bodies, referrer=referrer, use_cache=use_cache)
 
 
+# How long the lease on a single-flight query is held if its holder never releases it, and how
+# often the processes waiting on it check for its result.
+SINGLE_FLIGHT_LEASE_SECONDS = 30
+SINGLE_FLIGHT_POLL_INTERVAL = 0.05
+
+
 def get_cache_key(query: SnubaQuery) -> str:
     if isinstance(query, Request):
         hashable = str(query)
@@ -964,13 +993,10 @@ def _apply_cache_and_build_results(
         to_query = [(query_pos, query_params, None) for query_pos, query_params in query_param_list]
 
     if to_query:
-        query_results = _bulk_snuba_query([item[1] for item in to_query], headers)
-        for result, (query_pos, _, opt_cache_key) in zip(query_results, to_query):
-            if opt_cache_key:
-                cache.set(
-                    opt_cache_key, json.dumps(result), settings.SENTRY_SNUBA_CACHE_TTL_SECONDS
-                )
-            results.append((query_pos, result))
+        if use_cache and options.get("snuba.query-cache.single-flight"):
+            results.extend(_single_flight_query(to_query, headers, referrer))
+        else:
+            results.extend(_query_and_cache(to_query, headers))
 
     # Sort so that we get the results back in the original param list order
     results.sort()
@@ -978,6 +1004,84 @@ def _apply_cache_and_build_results(
     return [result[1] for result in results]
 
 
+def _query_and_cache(
+    to_query: Sequence[tuple[int, RequestQueryBody, str | None]],
+    headers: Mapping[str, str],
+) -> list[tuple[int, Mapping[str, Any]]]:
+    results = []
+    query_results = _bulk_snuba_query([item[1] for item in to_query], headers)
+    for result, (query_pos, _, opt_cache_key) in zip(query_results, to_query):
+        if opt_cache_key:
+            cache.set(opt_cache_key, json.dumps(result), settings.SENTRY_SNUBA_CACHE_TTL_SECONDS)
+        results.append((query_pos, result))
+    return results
+
+
+def _single_flight_query(
+    to_query: Sequence[tuple[int, RequestQueryBody, str | None]],
+    headers: Mapping[str, str],
+    referrer: str | None,
+) -> list[tuple[int, Mapping[str, Any]]]:
+    """
+    Runs the queries whose lease this process acquires and waits for other processes to cache
+    the results of the rest. Queries whose result doesn't show up within the maximum wait, or
+    whose lease is released without a result, fall through to Snuba.
+    """
+    metric_tags = {"referrer": referrer} if referrer else None
+
+    leases = []
+    leading = []
+    waiting = []
+    for item in to_query:
+        lease = locks.get(
+            f"{item[2]}:lease", duration=SINGLE_FLIGHT_LEASE_SECONDS, name="snuba_query_cache"
+        )
+        try:
+            lease.acquire()
+        except UnableToAcquireLock:
+            waiting.append((item, lease))
+        else:
+            leases.append(lease)
+            leading.append(item)
+
+    try:
+        results = _query_and_cache(leading, headers) if leading else []
+    finally:
+        for lease in leases:
+            lease.release()
+
+    fallthrough = []
+    deadline = time.monotonic() + options.get("snuba.query-cache.single-flight.max-wait")
+    while waiting:
+        cache_data = cache.get_many([item[2] for item, _ in waiting])
+        pending = []
+        for item, lease in waiting:
+            cached_result = cache_data.get(item[2])
+            if cached_result is not None:
+                metrics.incr("snuba.query_cache.coalesced", tags=metric_tags)
+                results.append((item[0], json.loads(cached_result)))
+            elif lease.locked():
+                pending.append((item, lease))
+            else:
+                # The leader is gone without caching a result, likely because its query failed.
+                fallthrough.append(item)
+
+        waiting = pending
+        if waiting and time.monotonic() + SINGLE_FLIGHT_POLL_INTERVAL > deadline:
+            fallthrough.extend(item for item, _ in waiting)
+            break
+        if waiting:
+            time.sleep(SINGLE_FLIGHT_POLL_INTERVAL)
+
+    if fallthrough:
+        metrics.incr(
+            "snuba.query_cache.single_flight.fallthrough", amount=len(fallthrough), tags=metric_tags
+        )
+        results.extend(_query_and_cache(fallthrough, headers))
+
+    return results
+
+
 def _bulk_snuba_query(
     snuba_param_list: Sequence[RequestQueryBody],
     headers: Mapping[str, str],
@@ -1393,6 +1497,37 @@ def _aliased_query_impl(**kwargs):
     return raw_query(**aliased_query_params(**kwargs))
 
 
+class PreparedQuery(NamedTuple):
+    body: RequestQueryBody
+    referrer: str | None
+    use_cache: bool
+
+
+def prepare_aliased_query(**kwargs) -> PreparedQuery:
+    """
+    Resolves the parameters of an ``aliased_query`` into the Snuba request
+    without sending it. This is where the models the query refers to
+    (projects, environments, releases, groups) are looked up in Postgres, so
+    the prepared query can be run with ``run_prepared_query`` from a thread
+    that doesn't use the database.
+    """
+    params = aliased_query_params(**kwargs)
+    referrer = params.pop("referrer", None)
+    use_cache = params.pop("use_cache", False)
+    query, forward, reverse = _prepare_query_params(
+        _make_query_params(referrer=referrer, **params), referrer
+    )
+    return PreparedQuery(
+        (json_to_snql(query, query["dataset"]), forward, reverse), referrer, use_cache
+    )
+
+
+def run_prepared_query(query: PreparedQuery) -> Mapping[str, Any]:
+    return _apply_cache_and_build_results(
+        [query.body], referrer=query.referrer, use_cache=query.use_cache
+    )[0]
+
+
 def resolve_conditions(
     conditions: Sequence | None, column_resolver: Callable[[Any], Any]
 ) -> list | None:
@@ -1,9 +1,12 @@
+import threading
 from datetime import timedelta
 from unittest.mock import patch
 
+import pytest
 from django.utils import timezone
 
 from sentry.api.serializers import serialize
+from sentry.api.serializers.models.group import GroupAttrsLoader
 from sentry.integrations.types import ExternalProviderEnum
 from sentry.models.group import Group, GroupStatus
 from sentry.models.grouplink import GroupLink
@@ -404,3 +407,76 @@ class GroupSerializerTest(TestCase, PerformanceIssueTestCase):
         assert serialized["count"] == "1"
         assert serialized["issueCategory"] == "performance"
         assert serialized["issueType"] == "performance_n_plus_one_db_queries"
+
+
+def test_attrs_loader_defers_fetches():
+    calls = []
+    loader = GroupAttrsLoader()
+
+    loader.submit("query", lambda value: calls.append(value) or value, 1)
+    # Submitting under a name that is already pending is a no-op.
+    loader.submit("query", lambda value: calls.append(value) or value, 2)
+    assert calls == []
+
+    assert loader.result("query") == 1
+    assert loader.result("query") == 1
+    assert calls == [1]
+    assert set(loader.timings) == {"query"}
+
+
+def test_attrs_loader_concurrent():
+    barrier = threading.Barrier(2, timeout=5)
+    loader = GroupAttrsLoader(concurrent=True)
+
+    # Both fetches must be running at the same time to get past the barrier.
+    loader.submit("first", lambda: barrier.wait() is not None)
+    loader.submit("second", lambda: barrier.wait() is not None)
+    assert loader.result("first")
+    assert loader.result("second")
+    assert set(loader.timings) == {"first", "second"}
+
+
+@pytest.mark.parametrize("concurrent", [False, True])
+def test_attrs_loader_raises(concurrent):
+    def fail():
+        raise ValueError("boom")
+
+    loader = GroupAttrsLoader(concurrent=concurrent)
+    loader.submit("query", fail)
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            loader.result("query")
+
+
+@pytest.mark.parametrize("concurrent", [False, True])
+def test_attrs_loader_submit_query(concurrent):
+    threads = {}
+
+    def execute(value, query):
+        return query(value=value)
+
+    def prepare(value):
+        threads["prepare"] = threading.current_thread()
+        return value * 2
+
+    def run(prepared):
+        threads["run"] = threading.current_thread()
+        return prepared + 1
+
+    loader = GroupAttrsLoader(concurrent=concurrent)
+    with (
+        patch("sentry.api.serializers.models.group.prepare_aliased_query", side_effect=prepare),
+        patch("sentry.api.serializers.models.group.run_prepared_query", side_effect=run),
+        patch("sentry.api.serializers.models.group.aliased_query", side_effect=lambda value: value),
+    ):
+        loader.submit_query("query", execute, 1)
+        result = loader.result("query")
+
+    if concurrent:
+        # Only the request to Snuba is made on the pool.
+        assert result == 3
+        assert threads["prepare"] is threading.current_thread()
+        assert threads["run"] is not threading.current_thread()
+    else:
+        assert result == 1
+        assert threads == {}
@@ -739,3 +739,38 @@ def test_search_value_classify_and_format_wildcard(value, expected_kind, expecte
     kind = search_value.classify_wildcard()
     assert kind == expected_kind
     assert search_value.format_wildcard(kind) == expected_value
+
+
+def test_parse_search_query_cache():
+    query = "user.email:foo@example.com release:1.2.1 count():>5"
+    first = parse_search_query(query)
+    second = parse_search_query(query)
+    assert first == second
+    # Callers get their own list to modify.
+    assert first is not second
+    first.append("AND")
+    assert parse_search_query(query) == second
+
+
+def test_parse_search_query_cache_config_overrides():
+    query = "a:1 OR b:2"
+    assert "OR" in parse_search_query(query)
+    with pytest.raises(InvalidSearchQuery):
+        parse_search_query(query, config_overrides={"allow_boolean": False})
+    assert "OR" in parse_search_query(query)
+
+    key_mappings = {"target": ["a"]}
+    assert parse_search_query("a:1", config_overrides={"key_mappings": key_mappings}) == [
+        SearchFilter(key=SearchKey(name="target"), operator="=", value=SearchValue("1"))
+    ]
+    assert parse_search_query("a:1") == [
+        SearchFilter(key=SearchKey(name="a"), operator="=", value=SearchValue("1"))
+    ]
+
+
+def test_parse_search_query_cache_relative_dates():
+    with freeze_time("2024-01-10T12:00:00"):
+        first = parse_search_query("timestamp:-24h")
+    with freeze_time("2024-01-11T12:00:00"):
+        second = parse_search_query("timestamp:-24h")
+    assert first[0].value.raw_value + timedelta(days=1) == second[0].value.raw_value
@@ -0,0 +1,77 @@
+import os
+
+import pytest
+
+from sentry.api import event_search
+from sentry.api.event_search import parse_search_query
+from sentry.constants import MODULE_ROOT
+from sentry.exceptions import InvalidSearchQuery
+from sentry.utils import json
+
+FIXTURES_PATH = os.path.join(MODULE_ROOT, os.pardir, os.pardir, "fixtures/search-syntax")
+
+# Queries as they show up in dashboard widgets, alert rules and on-demand metric specs.
+QUERIES = [
+    "",
+    "event.type:transaction",
+    "event.type:error !level:info",
+    "transaction.duration:>1s transaction.op:pageload",
+    "event.type:transaction transaction:/api/0/organizations/{organization_slug}/events/",
+    "is:unresolved is:for_review assigned_or_suggested:[me, none]",
+    "release:[1.2.0, 1.2.1, 1.3.0] environment:production",
+    "http.status_code:[500, 502, 503] !transaction:*healthcheck*",
+    "p95(transaction.duration):>500ms count():>100",
+    "(browser.name:Chrome OR browser.name:Firefox) device.family:iPhone",
+    'message:"Failed to fetch" has:user !user.email:*@example.com',
+    "measurements.lcp:>2.5s measurements.cls:>0.1 transaction.op:pageload",
+    "span.op:db span.description:*SELECT* span.duration:>100ms",
+    "stack.filename:*.py error.handled:false error.type:KeyError",
+]
+
+
+def load_corpus() -> list[str]:
+    """Returns the real-world queries together with the valid queries of the shared fixtures."""
+    corpus = list(QUERIES)
+    for file in sorted(os.listdir(FIXTURES_PATH)):
+        with open(os.path.join(FIXTURES_PATH, file)) as fp:
+            corpus.extend(case["query"] for case in json.load(fp) if not case.get("raisesError"))
+
+    valid = []
+    for query in corpus:
+        try:
+            parse_search_query(query)
+        except InvalidSearchQuery:
+            continue
+        valid.append(query)
+    return valid
+
+
+def benchmark_available() -> bool:
+    try:
+        __import__("pytest_benchmark")
+    except ModuleNotFoundError:
+        return False
+    else:
+        return True
+
+
+def clear_caches() -> None:
+    event_search._parse_query_tree.cache_clear()
+    event_search._search_filters_cache.clear()
+
+
+def parse_corpus(corpus: list[str]) -> None:
+    for query in corpus:
+        parse_search_query(query)
+
+
+def parse_corpus_uncached(corpus: list[str]) -> None:
+    clear_caches()
+    parse_corpus(corpus)
+
+
+@pytest.mark.skipif(not benchmark_available(), reason="requires pytest-benchmark")
+@pytest.mark.parametrize("parser", [parse_corpus_uncached, parse_corpus], ids=["cold", "warm"])
+def test_benchmark_parse_search_query(parser, benchmark):
+    corpus = load_corpus()
+    benchmark(parser, corpus)
@@ -1,5 +1,6 @@
 from datetime import UTC, datetime, timedelta
 from unittest import TestCase as SimpleTestCase
+from unittest import mock
 
 import pytest
 from django.db.models import DateTimeField, IntegerField, OuterRef, Subquery, Value
@@ -30,6 +31,7 @@ from sentry.api.paginator import (
     Paginator,
     SequencePaginator,
     reverse_bisect_left,
+    submit_concurrently,
 )
 from sentry.incidents.models.alert_rule import AlertRule
 from sentry.incidents.models.incident import Incident
@@ -37,6 +39,7 @@ from sentry.models.rule import Rule
 from sentry.models.user import User
 from sentry.testutils.cases import APITestCase, SnubaTestCase, TestCase
 from sentry.testutils.helpers.datetime import iso_format
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.silo import control_silo_test
 from sentry.utils.cursors import Cursor
 from sentry.utils.snuba import raw_snql_query
@@ -100,6 +103,75 @@ class PaginatorTest(TestCase):
         result3 = paginator.get_result(limit=1, cursor=result2.prev)
         assert len(result3) == 0, (result3, list(result3))
 
+    def test_prefetch_next_page(self):
+        for i in range(5):
+            self.create_user(f"user{i}@example.com")
+
+        paginator = self.cls(User.objects.all(), "id")
+        page1 = paginator.get_result(limit=2, cursor=None)
+        page2 = paginator.get_result(limit=2, cursor=page1.next)
+
+        with (
+            override_options({"api.paginator.prefetch-next-page": True}),
+            mock.patch("sentry.api.paginator.metrics") as metrics,
+        ):
+            result1 = paginator.get_result(limit=2, cursor=None)
+            assert list(result1) == list(page1)
+            metrics.incr.assert_not_called()
+
+            result2 = paginator.get_result(limit=2, cursor=result1.next)
+            assert list(result2) == list(page2)
+            assert result2.next.has_results
+            assert result2.prev.has_results
+            metrics.incr.assert_called_once_with("paginator.prefetch.hit")
+
+            # A different query never gets the pages prefetched for another one.
+            paginator = self.cls(User.objects.exclude(id=page2[0].id), "id")
+            result = paginator.get_result(limit=2, cursor=result1.next)
+            assert page2[0] not in list(result)
+            metrics.incr.assert_called_once_with("paginator.prefetch.hit")
+
+    def test_prefetch_next_page_different_limit(self):
+        for i in range(7):
+            self.create_user(f"user{i}@example.com")
+
+        paginator = self.cls(User.objects.all(), "id")
+        expected = paginator.get_result(limit=4, cursor=paginator.get_result(limit=2).next)
+
+        with (
+            override_options({"api.paginator.prefetch-next-page": True}),
+            mock.patch("sentry.api.paginator.metrics") as metrics,
+        ):
+            result1 = paginator.get_result(limit=2, cursor=None)
+
+            # The same cursor with a larger page size doesn't get the smaller prefetched page.
+            result2 = paginator.get_result(limit=4, cursor=result1.next)
+            assert list(result2) == list(expected)
+            assert len(result2) == 4
+            assert result2.next.has_results
+            metrics.incr.assert_not_called()
+
+            result3 = paginator.get_result(limit=2, cursor=result1.next)
+            assert list(result3) == list(expected)[:2]
+            metrics.incr.assert_called_once_with("paginator.prefetch.hit")
+
+
+def test_submit_concurrently():
+    calls = []
+
+    def func(value, *, extra):
+        calls.append(value)
+        return value + extra
+
+    get_result = submit_concurrently(func, 1, extra=1)
+    assert calls == [1]
+    assert get_result() == 2
+
+    with override_options({"api.paginator.concurrent-queries": True}):
+        get_result = submit_concurrently(func, 2, extra=1)
+        assert get_result() == 3
+    assert calls == [1, 2]
+
 
 @control_silo_test
 class OffsetPaginatorTest(TestCase):
@@ -86,6 +86,7 @@ class DataExportTest(APITestCase):
             "status": ExportStatus.Early,
             "checksum": None,
             "fileName": None,
+            "progress": None,
         }
 
     def test_progress_export(self):
@@ -116,6 +117,7 @@ class DataExportTest(APITestCase):
             "status": data_export.status,
             "checksum": None,
             "fileName": None,
+            "progress": None,
         }
 
     def test_fields_are_lists(self):
@@ -3,10 +3,16 @@ from unittest.mock import patch
 from django.db import IntegrityError
 
 from sentry.data_export.base import ExportQueryType
-from sentry.data_export.models import ExportedData
-from sentry.data_export.tasks import assemble_download, merge_export_blobs
+from sentry.data_export.models import ExportedData, ExportedDataBlob
+from sentry.data_export.tasks import (
+    ExportBlobWriter,
+    assemble_download,
+    iter_fragments,
+    merge_export_blobs,
+)
 from sentry.exceptions import InvalidSearchQuery
 from sentry.models.files.file import File
+from sentry.models.files.fileblob import FileBlob
 from sentry.search.events.constants import TIMEOUT_ERROR_MESSAGE
 from sentry.testutils.cases import SnubaTestCase, TestCase
 from sentry.testutils.helpers.datetime import before_now, iso_format
@@ -95,6 +101,33 @@ class AssembleDownloadTest(TestCase, SnubaTestCase):
 
         assert emailer.called
 
+    @patch("sentry.data_export.models.ExportedData.email_success")
+    @patch("sentry.data_export.models.ExportedData.set_progress")
+    def test_issue_by_tag_time_slices(self, set_progress, emailer):
+        de = ExportedData.objects.create(
+            user_id=self.user.id,
+            organization=self.org,
+            query_type=ExportQueryType.ISSUES_BY_TAG,
+            query_info={"project": [self.project.id], "group": self.event.group_id, "key": "foo"},
+        )
+        with self.options({"data-export.issues-by-tag.time-slices": 9}), self.tasks():
+            assemble_download(de.id, batch_size=1)
+        de = ExportedData.objects.get(id=de.id)
+        assert de.date_finished is not None
+        file = de._get_file()
+        with file.getfile() as f:
+            header, raw1, raw2 = f.read().strip().split(b"\r\n")
+        assert header == b"value,times_seen,last_seen,first_seen"
+
+        # the slices are about a minute long, the events of bar2 are merged from two of them
+        raw1, raw2 = sorted([raw1, raw2])
+        assert raw1.startswith(b"bar,1,")
+        assert raw2.startswith(b"bar2,2,")
+
+        assert [c.args for c in set_progress.call_args_list] == [(i, 9) for i in range(10)]
+        assert de.get_progress() is None
+        assert emailer.called
+
     @patch("sentry.data_export.models.ExportedData.email_success")
     def test_no_error_on_retry(self, emailer):
         de = ExportedData.objects.create(
@@ -688,3 +721,91 @@ class AssembleDownloadLargeTest(TestCase, SnubaTestCase):
 class MergeExportBlobsTest(TestCase, SnubaTestCase):
     def test_task_persistent_name(self):
         assert merge_export_blobs.name == "sentry.data_export.tasks.merge_blobs"
+
+
+class ExportBlobWriterTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.data_export = ExportedData.objects.create(
+            user_id=self.user.id,
+            organization=self.organization,
+            query_type=ExportQueryType.DISCOVER,
+            query_info={"project": [self.project.id], "field": ["title"], "query": ""},
+        )
+
+    def get_blobs(self):
+        return [
+            (export_blob.offset, FileBlob.objects.get(id=export_blob.blob_id).size)
+            for export_blob in ExportedDataBlob.objects.filter(
+                data_export=self.data_export
+            ).order_by("offset")
+        ]
+
+    def test_stores_full_blobs_while_writing(self):
+        writer = ExportBlobWriter(self.data_export, 100, blob_size=4)
+        writer.write(b"abc")
+        assert self.get_blobs() == []
+
+        writer.write(b"defghij")
+        assert self.get_blobs() == [(100, 4), (104, 4)]
+        assert writer.tell() == 10
+
+        assert writer.close() == 10
+        assert self.get_blobs() == [(100, 4), (104, 4), (108, 2)]
+
+    def test_discard(self):
+        ExportBlobWriter(self.data_export, 0, blob_size=4).write(b"abcd")
+        writer = ExportBlobWriter(self.data_export, 4, blob_size=4)
+        writer.write(b"efghij")
+        assert self.get_blobs() == [(0, 4), (4, 4)]
+
+        # only the blobs stored by the writer are dropped
+        writer.discard()
+        assert self.get_blobs() == [(0, 4)]
+
+    @patch("sentry.data_export.tasks.MAX_FILE_SIZE", 6)
+    def test_too_big(self):
+        writer = ExportBlobWriter(self.data_export, 0, blob_size=4)
+        writer.write(b"abcd")
+        writer.write(b"efgh")
+        assert writer.too_big
+        assert writer.close() == 0
+        assert self.get_blobs() == []
+
+
+class IterFragmentsTest(TestCase):
+    class Processor:
+        def __init__(self, total):
+            self.total = total
+            self.fetched = []
+
+        def data_fn(self, limit, offset):
+            self.fetched.append((offset, limit))
+            return {"data": [{"row": i} for i in range(offset, min(offset + limit, self.total))]}
+
+        def handle_fields(self, rows):
+            return rows
+
+    def test_concurrent_fetches(self):
+        data_export = ExportedData(query_type=ExportQueryType.DISCOVER)
+
+        def export(processor, offset, export_limit):
+            # consumes the fragments like `assemble_download` does
+            fragments = iter_fragments(processor, data_export, 3, offset, export_limit)
+            result = []
+            for rows in fragments:
+                result.append([row["row"] for row in rows])
+                if len(rows) < 3:
+                    break
+            fragments.close()
+            return result
+
+        for concurrency in (1, 3):
+            with self.options({"data-export.concurrent-fetches": concurrency}):
+                processor = self.Processor(total=8)
+                assert export(processor, offset=2, export_limit=100) == [[2, 3, 4], [5, 6, 7], []]
+
+                # fragments are never fetched past the export limit
+                processor = self.Processor(total=100)
+                assert export(processor, offset=0, export_limit=5) == [[0, 1, 2], [3, 4]]
+                assert sorted(processor.fetched) == [(0, 3), (3, 2)]
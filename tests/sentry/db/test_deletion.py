@@ -4,7 +4,7 @@ from datetime import timedelta
 
 from django.utils import timezone
 
-from sentry.db.deletion import BulkDeleteQuery
+from sentry.db.deletion import MAX_CHUNK_SIZE, MIN_CHUNK_SIZE, BulkDeleteQuery, get_next_chunk_size
 from sentry.models.group import Group
 from sentry.models.project import Project
 from sentry.testutils.cases import TestCase, TransactionTestCase
@@ -37,6 +37,59 @@ class BulkDeleteQueryTest(TestCase):
         assert not Group.objects.filter(id=group1_2.id).exists()
         assert Group.objects.filter(id=group1_3.id).exists()
 
+    def test_chunked(self):
+        now = timezone.now()
+        project = self.create_project()
+        old_groups = [
+            self.create_group(project, last_seen=now - timedelta(days=2, minutes=i % 2))
+            for i in range(5)
+        ]
+        new_group = self.create_group(project, last_seen=now)
+
+        deleted = BulkDeleteQuery(model=Group, dtfield="last_seen", days=1).execute(chunk_size=2)
+
+        assert deleted == len(old_groups)
+        assert not Group.objects.filter(id__in=[g.id for g in old_groups]).exists()
+        assert Group.objects.filter(id=new_group.id).exists()
+
+    def test_chunked_without_date(self):
+        project = self.create_project()
+        groups = [self.create_group(project) for _ in range(3)]
+
+        assert BulkDeleteQuery(model=Group, project_id=project.id).execute(chunk_size=1) == 3
+        assert not Group.objects.filter(id__in=[g.id for g in groups]).exists()
+
+    def test_split(self):
+        now = timezone.now()
+        project = self.create_project()
+        old_groups = [
+            self.create_group(project, last_seen=now - timedelta(days=days)) for days in (2, 3, 4)
+        ]
+        new_group = self.create_group(project, last_seen=now)
+
+        queries = BulkDeleteQuery(model=Group, dtfield="last_seen", days=1).split(2)
+        assert len(queries) == 2
+        assert queries[0].bounds[1] == queries[1].bounds[0]
+
+        assert sum(query.execute(chunk_size=1) for query in queries) == len(old_groups)
+        assert Group.objects.filter(id=new_group.id).exists()
+
+    def test_split_nothing_to_delete(self):
+        query = BulkDeleteQuery(model=Group, dtfield="last_seen", days=1)
+        assert query.split(4) == [query]
+
+
+def test_get_next_chunk_size():
+    # Chunks scale towards the target duration, by at most a factor of two at a time.
+    assert get_next_chunk_size(1000, 0.5, 1.0) == 2000
+    assert get_next_chunk_size(1000, 0.1, 1.0) == 2000
+    assert get_next_chunk_size(1000, 1.25, 1.0) == 800
+    assert get_next_chunk_size(1000, 10.0, 1.0) == 500
+    assert get_next_chunk_size(1000, 0.0, 1.0) == 2000
+
+    assert get_next_chunk_size(MIN_CHUNK_SIZE, 10.0, 1.0) == MIN_CHUNK_SIZE
+    assert get_next_chunk_size(MAX_CHUNK_SIZE, 0.1, 1.0) == MAX_CHUNK_SIZE
+
 
 class BulkDeleteQueryIteratorTestCase(TransactionTestCase):
     def test_iteration(self):
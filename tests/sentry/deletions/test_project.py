@@ -1,4 +1,6 @@
 from sentry import eventstore
+from sentry.deletions import shards
+from sentry.deletions.base import ModelRelation
 from sentry.incidents.models.alert_rule import AlertRule
 from sentry.incidents.models.incident import Incident
 from sentry.models.commit import Commit
@@ -173,3 +175,19 @@ class DeleteProjectTest(APITestCase, TransactionTestCase, HybridCloudTestMixin):
             conditions, tenant_ids={"organization_id": 123, "referrer": "r"}
         )
         assert len(events) == 0
+
+    def test_parallel_group_deletion(self):
+        project = self.create_project(name="test")
+        groups = [self.create_group(project=project) for _ in range(10)]
+        deletion = self.ScheduledDeletion.schedule(instance=project, days=0)
+
+        with self.options({"deletions.parallel.num-shards": 4}), self.tasks():
+            run_scheduled_deletions()
+
+        assert not Project.objects.filter(id=project.id).exists()
+        assert not Group.objects.filter(id__in=[group.id for group in groups]).exists()
+
+        relation_key = shards.get_relation_key(ModelRelation(Group, {"project_id": project.id}))
+        assert shards.get_progress(deletion.guid, relation_key) == {
+            shard_id: shards.DONE for shard_id in range(4)
+        }
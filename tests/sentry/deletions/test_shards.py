@@ -0,0 +1,102 @@
+import time
+
+from sentry.deletions import default_manager, shards
+from sentry.deletions.base import ModelRelation
+from sentry.models.activity import Activity
+from sentry.models.group import Group
+from sentry.tasks.deletion.shards import delete_relation_shard
+from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
+
+
+class ShardsTest(TestCase):
+    @override_options({"deletions.parallel.num-shards": 4})
+    def test_is_parallel(self):
+        relation = ModelRelation(Group, {"project_id": self.project.id})
+        assert shards.is_parallel(default_manager, relation, "abc")
+
+        # Progress is tracked per deletion
+        assert not shards.is_parallel(default_manager, relation, None)
+
+        # Bulk deletions can't be sharded
+        relation = ModelRelation(Activity, {"project_id": self.project.id})
+        with override_options({"deletions.parallel.models": ["sentry.Activity"]}):
+            assert not shards.is_parallel(default_manager, relation, "abc")
+
+    def test_get_lost_shards(self):
+        now = time.time()
+        progress = {
+            0: shards.DONE,
+            1: f"abc:{now}",
+            2: f"abc:{now - shards.SHARD_LEASE - 1}",
+        }
+        assert shards.get_lost_shards(progress, 4) == [2, 3]
+
+    def test_get_throttle_delay(self):
+        with override_options({"deletions.parallel.duty-cycle": 0.25}):
+            assert shards.get_throttle_delay(2) == 6
+            assert shards.get_throttle_delay(3600) == shards.MAX_THROTTLE_DELAY
+
+        with override_options({"deletions.parallel.duty-cycle": 1.0}):
+            assert shards.get_throttle_delay(2) == 0
+
+    @override_options({"deletions.parallel.num-shards": 2})
+    def test_delete_relation_resumes_lost_shards(self):
+        group = self.create_group(project=self.project)
+        relation = ModelRelation(Group, {"project_id": self.project.id})
+        relation_key = shards.get_relation_key(relation)
+
+        # Shard 0 completed, shard 1 was lost with its worker
+        shards.mark_done("abc", relation_key, 0)
+        shards.get_redis_client().hset(
+            shards.KEY.format(transaction_id="abc", relation_key=relation_key),
+            "1",
+            time.time() - shards.SHARD_LEASE - 1,
+        )
+
+        with self.tasks():
+            assert not shards.delete_relation(default_manager, relation, "abc")
+
+        assert not Group.objects.filter(id=group.id).exists()
+        assert shards.get_progress("abc", relation_key) == {0: shards.DONE, 1: shards.DONE}
+
+    def test_renew(self):
+        relation_key = "relation"
+        first = shards.mark_running("abc", relation_key, [0])[0]
+        assert shards.renew("abc", relation_key, 0, first)
+
+        # The shard was dispatched again, e.g. after its lease expired in a backed up queue
+        second = shards.mark_running("abc", relation_key, [0])[0]
+        assert not shards.renew("abc", relation_key, 0, first)
+        assert shards.renew("abc", relation_key, 0, second)
+
+        shards.mark_done("abc", relation_key, 0)
+        assert not shards.renew("abc", relation_key, 0, second)
+
+    def test_superseded_shard_task(self):
+        group = self.create_group(project=self.project)
+        relation = ModelRelation(Group, {"project_id": self.project.id})
+        relation_key = shards.get_relation_key(relation)
+
+        first = shards.mark_running("abc", relation_key, [0])[0]
+        second = shards.mark_running("abc", relation_key, [0])[0]
+
+        kwargs = {
+            "model": Group,
+            "query": {"project_id": self.project.id},
+            "transaction_id": "abc",
+            "relation_key": relation_key,
+            "num_shards": 1,
+            "shard_id": 0,
+        }
+
+        # Tasks of earlier dispatches exit without deleting anything
+        with self.tasks():
+            delete_relation_shard(token=first, **kwargs)
+            delete_relation_shard(**kwargs)
+        assert Group.objects.filter(id=group.id).exists()
+
+        with self.tasks():
+            delete_relation_shard(token=second, **kwargs)
+        assert not Group.objects.filter(id=group.id).exists()
+        assert shards.get_progress("abc", relation_key) == {0: shards.DONE}
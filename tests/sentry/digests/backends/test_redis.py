@@ -6,6 +6,7 @@ from sentry.digests import Record
 from sentry.digests.backends.base import InvalidState
 from sentry.digests.backends.redis import RedisBackend
 from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
 
 
 class RedisBackendTestCase(TestCase):
@@ -39,6 +40,17 @@ class RedisBackendTestCase(TestCase):
         # longer exist at this point.
         assert set(backend.schedule(time.time())) == set()
 
+    @override_options({"digests.concurrent-partitions": True})
+    def test_concurrent_partitions(self):
+        backend = RedisBackend()
+        backend.add("timeline", Record("record:1", "value", time.time()))
+        with backend.digest("timeline", 0) as records:
+            assert len(records) == 1
+
+        backend.add("timeline", Record("record:2", "value", time.time()))
+        assert {entry.key for entry in backend.schedule(time.time())} == {"timeline"}
+        backend.maintenance(time.time())
+
     def test_truncation(self):
         backend = RedisBackend(capacity=2, truncation_chance=1.0)
 
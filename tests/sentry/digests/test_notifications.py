@@ -6,10 +6,13 @@ from collections.abc import Mapping, MutableMapping, MutableSequence
 from functools import cached_property, reduce
 
 from sentry.digests import Record
+from sentry.digests.codecs import CompressedPickleCodec
 from sentry.digests.notifications import (
     Notification,
+    NotificationReference,
     event_to_record,
     group_records,
+    load_records,
     rewrite_record,
     sort_group_contents,
     sort_rule_groups,
@@ -19,6 +22,7 @@ from sentry.digests.notifications import (
 from sentry.models.rule import Rule
 from sentry.notifications.types import ActionTargetType, FallthroughChoiceType
 from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.skips import requires_snuba
 
 pytestmark = [requires_snuba]
@@ -70,6 +74,39 @@ class RewriteRecordTestCase(TestCase):
         )
 
 
+class LoadRecordsTestCase(TestCase):
+    @override_options({"digests.compact-records": True})
+    def test_compact_records(self):
+        notification_uuid = str(uuid.uuid4())
+        event = self.store_event(data={"fingerprint": ["group-1"]}, project_id=self.project.id)
+        rule = self.project.rule_set.all()[0]
+        record = event_to_record(event, (rule,), notification_uuid)
+        assert record.value == NotificationReference(
+            event.event_id, event.group_id, [rule.id], notification_uuid
+        )
+
+        # records are stored through the codec of the backend
+        codec = CompressedPickleCodec()
+        compact = Record(record.key, codec.decode(codec.encode(record.value)), record.timestamp)
+        missing = Record(
+            "missing",
+            NotificationReference("a" * 32, event.group_id, [rule.id], notification_uuid),
+            record.timestamp,
+        )
+        with override_options({"digests.compact-records": False}):
+            full = event_to_record(event, (rule,), notification_uuid)
+
+        (loaded, loaded_full) = load_records(self.project, [compact, missing, full])
+        assert loaded.key == record.key
+        assert loaded.timestamp == record.timestamp
+        assert loaded.value.event.event_id == event.event_id
+        assert loaded.value.event.group_id == event.group_id
+        assert loaded.value.event.data["fingerprint"] == ["group-1"]
+        assert loaded.value.rules == [rule.id]
+        assert loaded.value.notification_uuid == notification_uuid
+        assert loaded_full is full
+
+
 class GroupRecordsTestCase(TestCase):
     def setUp(self):
         self.notification_uuid = str(uuid.uuid4())
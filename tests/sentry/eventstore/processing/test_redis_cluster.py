@@ -1,5 +1,8 @@
 from datetime import datetime
 
+import pytest
+
+from sentry.eventstore.processing.redis import RedisClusterEventProcessingStore
 from sentry.eventstore.reprocessing.redis import RedisReprocessingStore
 from sentry.testutils.helpers.redis import use_redis_cluster
 
@@ -20,3 +23,32 @@ def test_mark_event_reprocessed():
     assert progress is not None
     assert progress.get("syncCount") == 10
     assert progress.get("totalEvents") == 20
+
+
+@pytest.mark.parametrize("compression", [None, "zstd"])
+@use_redis_cluster()
+def test_event_processing_store_batch_operations(compression):
+    store = RedisClusterEventProcessingStore(cluster="cluster", compression=compression)
+    events = [{"project": 1, "event_id": f"{i:032x}", "message": "x" * 1000} for i in range(5)]
+
+    keys = store.store_many(events)
+    assert keys == [f"e:{event['event_id']}:1" for event in events]
+    assert store.get_many([*keys, "e:missing:1"]) == dict(zip(keys, events))
+
+    store.store_many(events[:2], unprocessed=True)
+    assert store.get_many(keys, unprocessed=True) == dict(zip(keys[:2], events[:2]))
+
+    store.delete_many(events[:3])
+    assert store.get_many(keys) == dict(zip(keys[3:], events[3:]))
+    assert store.get_many(keys, unprocessed=True) == {}
+
+
+@use_redis_cluster()
+def test_event_processing_store_reads_both_formats():
+    event = {"project": 1, "event_id": "a" * 32}
+
+    key = RedisClusterEventProcessingStore(cluster="cluster").store(event)
+    assert RedisClusterEventProcessingStore(cluster="cluster", compression="zstd").get(key) == event
+
+    key = RedisClusterEventProcessingStore(cluster="cluster", compression="zstd").store(event)
+    assert RedisClusterEventProcessingStore(cluster="cluster").get(key) == event
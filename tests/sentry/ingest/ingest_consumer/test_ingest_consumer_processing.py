@@ -18,9 +18,13 @@ from django.conf import settings
 
 from sentry import eventstore
 from sentry.event_manager import EventManager
+from sentry.eventstore.processing import event_processing_store
 from sentry.ingest.consumer.processors import (
+    ParsedEvent,
+    Retriable,
     process_attachment_chunk,
     process_event,
+    process_event_batch,
     process_individual_attachment,
     process_userreport,
 )
@@ -107,6 +111,96 @@ def test_deduplication_works(default_project, task_runner, preprocess_event):
     }
 
 
+def _make_parsed_events(project, payloads, start_time):
+    return [
+        ParsedEvent(
+            {
+                "payload": orjson.dumps(payload).decode(),
+                "start_time": start_time,
+                "event_id": payload["event_id"],
+                "project_id": project.id,
+                "remote_addr": "127.0.0.1",
+            },
+            project,
+            payload,
+        )
+        for payload in payloads
+    ]
+
+
+@django_db_all
+def test_process_event_batch(default_project, task_runner, preprocess_event):
+    start_time = time.time() - 3600
+    payloads = [
+        get_normalized_event({"message": f"hello world {i}"}, default_project) for i in range(3)
+    ]
+    events = _make_parsed_events(default_project, payloads, start_time)
+
+    # The second batch is entirely deduplicated.
+    for _ in range(2):
+        process_event_batch(events)
+
+    assert [kwargs["event_id"] for kwargs in preprocess_event] == [
+        payload["event_id"] for payload in payloads
+    ]
+    for kwargs, payload in zip(preprocess_event, payloads):
+        cache_key = f"e:{payload['event_id']}:{default_project.id}"
+        assert kwargs["cache_key"] == cache_key
+        assert event_processing_store.get(cache_key) == payload
+
+
+@django_db_all
+def test_process_event_batch_duplicates_within_batch(
+    default_project, task_runner, preprocess_event
+):
+    start_time = time.time() - 3600
+    payloads = [
+        get_normalized_event({"message": f"hello world {i}"}, default_project) for i in range(2)
+    ]
+    events = _make_parsed_events(
+        default_project, [payloads[0], payloads[0], payloads[1]], start_time
+    )
+
+    process_event_batch(events)
+
+    assert [kwargs["event_id"] for kwargs in preprocess_event] == [
+        payload["event_id"] for payload in payloads
+    ]
+
+
+@django_db_all
+def test_process_event_batch_retried_after_partial_dispatch(
+    default_project, task_runner, monkeypatch
+):
+    start_time = time.time() - 3600
+    payloads = [
+        get_normalized_event({"message": f"hello world {i}"}, default_project) for i in range(3)
+    ]
+    events = _make_parsed_events(default_project, payloads, start_time)
+
+    dispatched = []
+
+    def failing_preprocess_event(**kwargs):
+        if len(dispatched) == 2:
+            raise Exception("broker unavailable")
+        dispatched.append(kwargs["event_id"])
+
+    monkeypatch.setattr(
+        "sentry.ingest.consumer.processors.preprocess_event", failing_preprocess_event
+    )
+    with pytest.raises(Retriable):
+        process_event_batch(events)
+    assert dispatched == [payloads[0]["event_id"], payloads[1]["event_id"]]
+
+    # Retrying the batch only dispatches the events that were not dispatched yet
+    monkeypatch.setattr(
+        "sentry.ingest.consumer.processors.preprocess_event",
+        lambda **kwargs: dispatched.append(kwargs["event_id"]),
+    )
+    process_event_batch(events)
+    assert dispatched == [payload["event_id"] for payload in payloads]
+
+
 @django_db_all
 def test_transactions_spawn_save_event_transaction(
     default_project,
@@ -0,0 +1,171 @@
+import random
+import threading
+import time
+from datetime import datetime
+from unittest import mock
+
+import msgpack
+from arroyo.backends.kafka import KafkaPayload
+from arroyo.processing.strategies import MessageRejected
+from arroyo.types import BrokerValue, Message, Partition, Topic
+
+from sentry.conf.types.kafka_definition import Topic as TopicNames
+from sentry.ingest.consumer.factory import IngestStrategyFactory, KeyOrdering
+from sentry.ingest.types import ConsumerType
+from sentry.testutils.pytest.fixtures import django_db_all
+
+
+def make_message(project_id: int, event_id: int, offset: int) -> Message[KafkaPayload]:
+    payload = msgpack.packb(
+        {
+            "type": "event",
+            "project_id": project_id,
+            "payload": b"{}",
+            "start_time": int(time.time()),
+            "event_id": str(event_id),
+        }
+    )
+    return Message(
+        BrokerValue(
+            KafkaPayload(None, payload, []),
+            Partition(Topic(TopicNames.INGEST_EVENTS.value), 0),
+            offset,
+            datetime.now(),
+        )
+    )
+
+
+def test_key_ordering():
+    ordering = KeyOrdering()
+
+    previous, first = ordering.schedule(1)
+    assert previous is None
+
+    previous, second = ordering.schedule(1)
+    assert previous is first
+
+    # Unrelated keys are not ordered against each other.
+    previous, other = ordering.schedule(2)
+    assert previous is None
+
+    ordering.complete(1, first)
+    assert first.is_set()
+
+    # The most recently scheduled message remains the tail of the key.
+    previous, third = ordering.schedule(1)
+    assert previous is second
+
+    ordering.complete(1, second)
+    ordering.complete(1, third)
+    ordering.complete(2, other)
+    assert ordering._tails == {}
+
+
+def test_key_ordering_cancel():
+    ordering = KeyOrdering()
+
+    _, first = ordering.schedule(1)
+    previous, rejected = ordering.schedule(1)
+    assert previous is first
+
+    # A cancelled message doesn't become the predecessor of the next one (or of itself, when it
+    # is submitted again).
+    ordering.cancel(1, previous, rejected)
+    previous, retried = ordering.schedule(1)
+    assert previous is first
+
+    # Cancelling the only message of a key forgets the key.
+    previous, rejected = ordering.schedule(2)
+    ordering.cancel(2, previous, rejected)
+    assert 2 not in ordering._tails
+
+    ordering.complete(1, first)
+    ordering.complete(1, retried)
+    assert ordering._tails == {}
+
+
+def run_threaded(
+    messages: list[Message[KafkaPayload]], max_batch_size: int
+) -> tuple[dict[int, list[int]], mock.Mock, int]:
+    processed: dict[int, list[int]] = {1: [], 2: [], 3: []}
+    lock = threading.Lock()
+
+    def process(raw_message, consumer_type, reprocess_only_stuck_events):
+        message = msgpack.unpackb(raw_message.payload.value, use_list=False)
+        time.sleep(random.random() / 100)
+        with lock:
+            processed[message["project_id"]].append(int(message["event_id"]))
+
+    commit = mock.Mock()
+    factory = IngestStrategyFactory(
+        ConsumerType.Events,
+        reprocess_only_stuck_events=False,
+        num_processes=1,
+        max_batch_size=max_batch_size,
+        max_batch_time=1,
+        input_block_size=None,
+        output_block_size=None,
+        num_threads=4,
+    )
+
+    rejections = 0
+    with mock.patch(
+        "sentry.ingest.consumer.factory.process_simple_event_message", side_effect=process
+    ):
+        strategy = factory.create_with_partitions(commit, {})
+
+        for message in messages:
+            # Like the arroyo stream processor, submit rejected messages again after polling.
+            while True:
+                try:
+                    strategy.submit(message)
+                except MessageRejected:
+                    rejections += 1
+                    strategy.poll()
+                else:
+                    break
+            strategy.poll()
+
+        strategy.close()
+        strategy.join(5)
+        factory.shutdown()
+
+    return processed, commit, rejections
+
+
+@django_db_all
+def test_threaded_processing_preserves_project_order():
+    messages = [make_message(offset % 3 + 1, offset, offset) for offset in range(30)]
+    processed, commit, _ = run_threaded(messages, max_batch_size=100)
+
+    assert processed == {
+        1: list(range(0, 30, 3)),
+        2: list(range(1, 30, 3)),
+        3: list(range(2, 30, 3)),
+    }
+
+    # Offsets are committed through to the end of the processed messages.
+    committed: dict[Partition, int] = {}
+    for call in commit.call_args_list:
+        committed.update(call.args[0])
+    assert committed == {Partition(Topic(TopicNames.INGEST_EVENTS.value), 0): 30}
+
+
+@django_db_all
+def test_threaded_processing_backpressure():
+    # With a single pending future nearly every message is rejected at least once, and must not
+    # end up waiting for its own rejected attempt.
+    messages = [make_message(offset % 3 + 1, offset, offset) for offset in range(30)]
+    processed, commit, rejections = run_threaded(messages, max_batch_size=1)
+
+    assert rejections > 0
+    assert processed == {
+        1: list(range(0, 30, 3)),
+        2: list(range(1, 30, 3)),
+        3: list(range(2, 30, 3)),
+    }
+
+    committed: dict[Partition, int] = {}
+    for call in commit.call_args_list:
+        committed.update(call.args[0])
+    assert committed == {Partition(Topic(TopicNames.INGEST_EVENTS.value), 0): 30}
@@ -8,6 +8,7 @@ from django.utils import timezone
 from sentry_kafka_schemas.schema_types.monitors_clock_tasks_v1 import MarkMissing
 
 from sentry.constants import ObjectStatus
+from sentry.monitors import deadlines
 from sentry.monitors.clock_tasks.check_missed import (
     dispatch_check_missing,
     mark_environment_missing,
@@ -23,9 +24,111 @@ from sentry.monitors.models import (
     ScheduleType,
 )
 from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
 
 
 class MonitorClockTasksCheckMissingTest(TestCase):
+    @override_options({"crons.deadline-index": True})
+    @mock.patch("sentry.monitors.clock_tasks.check_missed.produce_task")
+    def test_missing_checkin_from_deadline_index(self, mock_produce_task):
+        org = self.create_organization()
+        project = self.create_project(organization=org)
+
+        ts = timezone.now().replace(second=0, microsecond=0)
+
+        def create_monitor_environment(next_checkin_latest, status=ObjectStatus.ACTIVE):
+            monitor = Monitor.objects.create(
+                organization_id=org.id,
+                project_id=project.id,
+                type=MonitorType.CRON_JOB,
+                status=status,
+                config={
+                    "schedule_type": ScheduleType.CRONTAB,
+                    "schedule": "* * * * *",
+                    "max_runtime": None,
+                    "checkin_margin": None,
+                },
+            )
+            return MonitorEnvironment.objects.create(
+                monitor=monitor,
+                environment_id=self.environment.id,
+                last_checkin=ts - timedelta(minutes=2),
+                next_checkin=next_checkin_latest - timedelta(minutes=1),
+                next_checkin_latest=next_checkin_latest,
+                status=MonitorStatus.OK,
+            )
+
+        missed = create_monitor_environment(ts)
+        # Checked in after its deadline was indexed
+        moved = create_monitor_environment(ts + timedelta(minutes=1))
+        disabled = create_monitor_environment(ts, status=ObjectStatus.DISABLED)
+        upcoming = create_monitor_environment(ts + timedelta(minutes=1))
+
+        deadlines.index_missed(missed.id, ts)
+        deadlines.index_missed(moved.id, ts)
+        deadlines.index_missed(disabled.id, ts)
+        deadlines.index_missed(upcoming.id, ts + timedelta(minutes=1))
+
+        dispatch_check_missing(ts)
+
+        message: MarkMissing = {
+            "type": "mark_missing",
+            "ts": ts.timestamp(),
+            "monitor_environment_id": missed.id,
+        }
+        payload = KafkaPayload(
+            str(missed.id).encode(),
+            MONITORS_CLOCK_TASKS_CODEC.encode(message),
+            [],
+        )
+        assert mock_produce_task.mock_calls == [mock.call(payload)]
+
+        # The handled environments were removed from the index, the moved environment was
+        # indexed again with its actual deadline
+        assert deadlines.get_missed(ts, 10) == []
+        assert sorted(deadlines.get_missed(ts + timedelta(minutes=1), 10)) == sorted(
+            [moved.id, upcoming.id]
+        )
+
+    @override_options({"crons.deadline-index": True})
+    @mock.patch("sentry.monitors.clock_tasks.check_missed.produce_task")
+    def test_missing_checkin_from_deadline_index_produce_failure(self, mock_produce_task):
+        ts = timezone.now().replace(second=0, microsecond=0)
+
+        monitor = Monitor.objects.create(
+            organization_id=self.organization.id,
+            project_id=self.project.id,
+            type=MonitorType.CRON_JOB,
+            config={
+                "schedule_type": ScheduleType.CRONTAB,
+                "schedule": "* * * * *",
+                "max_runtime": None,
+                "checkin_margin": None,
+            },
+        )
+        monitor_environment = MonitorEnvironment.objects.create(
+            monitor=monitor,
+            environment_id=self.environment.id,
+            last_checkin=ts - timedelta(minutes=2),
+            next_checkin=ts - timedelta(minutes=1),
+            next_checkin_latest=ts,
+            status=MonitorStatus.OK,
+        )
+        deadlines.index_missed(monitor_environment.id, ts)
+
+        # A tick failing to produce its tasks leaves the due entries in the index
+        mock_produce_task.side_effect = Exception("produce failed")
+        with pytest.raises(Exception, match="produce failed"):
+            dispatch_check_missing(ts)
+        assert deadlines.get_missed(ts, 10) == [monitor_environment.id]
+
+        # And the next tick dispatches them
+        mock_produce_task.side_effect = None
+        mock_produce_task.reset_mock()
+        dispatch_check_missing(ts + timedelta(minutes=1))
+        assert mock_produce_task.call_count == 1
+        assert deadlines.get_missed(ts + timedelta(minutes=1), 10) == []
+
     @mock.patch("sentry.monitors.clock_tasks.check_missed.produce_task")
     def test_missing_checkin(self, mock_produce_task):
         org = self.create_organization()
@@ -1,10 +1,12 @@
 from datetime import timedelta
 from unittest import mock
 
+import pytest
 from arroyo.backends.kafka import KafkaPayload
 from django.utils import timezone
 from sentry_kafka_schemas.schema_types.monitors_clock_tasks_v1 import MarkTimeout
 
+from sentry.monitors import deadlines
 from sentry.monitors.clock_tasks.check_timeout import dispatch_check_timeout, mark_checkin_timeout
 from sentry.monitors.clock_tasks.producer import MONITORS_CLOCK_TASKS_CODEC
 from sentry.monitors.logic.mark_failed import mark_failed
@@ -18,6 +20,7 @@ from sentry.monitors.models import (
     ScheduleType,
 )
 from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
 
 
 class MonitorClockTasksCheckTimeoutTest(TestCase):
@@ -500,3 +503,141 @@ class MonitorClockTasksCheckTimeoutTest(TestCase):
         # Second call does NOT trigger a mark_failed
         mark_checkin_timeout(checkin.id, ts + timedelta(minutes=31))
         assert mock_mark_failed.call_count == 1
+
+    @override_options({"crons.deadline-index": True})
+    @mock.patch("sentry.monitors.clock_tasks.check_timeout.produce_task")
+    def test_timeout_from_deadline_index(self, mock_produce_task):
+        org = self.create_organization()
+        project = self.create_project(organization=org)
+
+        ts = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+        monitor = Monitor.objects.create(
+            organization_id=org.id,
+            project_id=project.id,
+            type=MonitorType.CRON_JOB,
+            config={
+                "schedule_type": ScheduleType.CRONTAB,
+                "schedule": "0 0 * * *",
+                "checkin_margin": None,
+                "max_runtime": 30,
+            },
+        )
+        monitor_environment = MonitorEnvironment.objects.create(
+            monitor=monitor,
+            environment_id=self.environment.id,
+            last_checkin=ts,
+            next_checkin=ts + timedelta(hours=24),
+            next_checkin_latest=ts + timedelta(hours=24, minutes=1),
+            status=MonitorStatus.OK,
+        )
+        checkin = MonitorCheckIn.objects.create(
+            monitor=monitor,
+            monitor_environment=monitor_environment,
+            project_id=project.id,
+            status=CheckInStatus.IN_PROGRESS,
+            date_added=ts,
+            date_updated=ts,
+            timeout_at=ts + timedelta(minutes=30),
+        )
+        # The timeout was bumped by a heartbeat after it was indexed
+        bumped_checkin = MonitorCheckIn.objects.create(
+            monitor=monitor,
+            monitor_environment=monitor_environment,
+            project_id=project.id,
+            status=CheckInStatus.IN_PROGRESS,
+            date_added=ts,
+            date_updated=ts,
+            timeout_at=ts + timedelta(minutes=45),
+        )
+        # Completed check-ins are not timed out
+        completed_checkin = MonitorCheckIn.objects.create(
+            monitor=monitor,
+            monitor_environment=monitor_environment,
+            project_id=project.id,
+            status=CheckInStatus.OK,
+            date_added=ts,
+            date_updated=ts,
+            timeout_at=None,
+        )
+        deadlines.index_timeout(monitor_environment.id, checkin.id, ts + timedelta(minutes=30))
+        deadlines.index_timeout(
+            monitor_environment.id, bumped_checkin.id, ts + timedelta(minutes=30)
+        )
+        deadlines.index_timeout(
+            monitor_environment.id, completed_checkin.id, ts + timedelta(minutes=30)
+        )
+
+        dispatch_check_timeout(ts + timedelta(minutes=29))
+        assert mock_produce_task.call_count == 0
+
+        dispatch_check_timeout(ts + timedelta(minutes=30))
+        message: MarkTimeout = {
+            "type": "mark_timeout",
+            "ts": (ts + timedelta(minutes=30)).timestamp(),
+            "monitor_environment_id": monitor_environment.id,
+            "checkin_id": checkin.id,
+        }
+        payload = KafkaPayload(
+            str(monitor_environment.id).encode(),
+            MONITORS_CLOCK_TASKS_CODEC.encode(message),
+            [],
+        )
+        assert mock_produce_task.mock_calls == [mock.call(payload)]
+
+        # The handled check-ins were removed from the index, the bumped check-in was indexed
+        # again with its actual timeout
+        assert deadlines.get_timeouts(ts + timedelta(minutes=44), 10) == []
+        assert deadlines.get_timeouts(ts + timedelta(minutes=45), 10) == [
+            (monitor_environment.id, bumped_checkin.id)
+        ]
+
+    @override_options({"crons.deadline-index": True})
+    @mock.patch("sentry.monitors.clock_tasks.check_timeout.produce_task")
+    def test_timeout_from_deadline_index_produce_failure(self, mock_produce_task):
+        ts = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+        monitor = Monitor.objects.create(
+            organization_id=self.organization.id,
+            project_id=self.project.id,
+            type=MonitorType.CRON_JOB,
+            config={
+                "schedule_type": ScheduleType.CRONTAB,
+                "schedule": "0 0 * * *",
+                "checkin_margin": None,
+                "max_runtime": 30,
+            },
+        )
+        monitor_environment = MonitorEnvironment.objects.create(
+            monitor=monitor,
+            environment_id=self.environment.id,
+            last_checkin=ts,
+            next_checkin=ts + timedelta(hours=24),
+            next_checkin_latest=ts + timedelta(hours=24, minutes=1),
+            status=MonitorStatus.OK,
+        )
+        checkin = MonitorCheckIn.objects.create(
+            monitor=monitor,
+            monitor_environment=monitor_environment,
+            project_id=self.project.id,
+            status=CheckInStatus.IN_PROGRESS,
+            date_added=ts,
+            date_updated=ts,
+            timeout_at=ts + timedelta(minutes=30),
+        )
+        deadlines.index_timeout(monitor_environment.id, checkin.id, ts + timedelta(minutes=30))
+
+        # A tick failing to produce its tasks leaves the due entries in the index
+        mock_produce_task.side_effect = Exception("produce failed")
+        with pytest.raises(Exception, match="produce failed"):
+            dispatch_check_timeout(ts + timedelta(minutes=30))
+        assert deadlines.get_timeouts(ts + timedelta(minutes=30), 10) == [
+            (monitor_environment.id, checkin.id)
+        ]
+
+        # And the next tick dispatches them
+        mock_produce_task.side_effect = None
+        mock_produce_task.reset_mock()
+        dispatch_check_timeout(ts + timedelta(minutes=31))
+        assert mock_produce_task.call_count == 1
+        assert deadlines.get_timeouts(ts + timedelta(minutes=31), 10) == []
@@ -247,6 +247,63 @@ class MonitorConsumerTest(TestCase):
         # The last group is monitor_2 but with a diff environment
         assert group_3[0].payload.get("environment") == "test"
 
+    def test_bulk_checkins(self) -> None:
+        monitor = self._create_monitor(slug="my-monitor")
+        now = datetime.now().replace(second=0, microsecond=0)
+
+        # The monitor environment is OK after its first check-in
+        self.send_checkin(monitor.slug, ts=now - timedelta(minutes=10))
+        monitor_environment = MonitorEnvironment.objects.get(monitor=monitor)
+        assert monitor_environment.status == MonitorStatus.OK
+
+        factory = StoreMonitorCheckInStrategyFactory(mode="parallel", max_batch_size=4)
+        consumer = factory.create_with_partitions(mock.Mock(), {self.partition: 0})
+
+        guids = []
+        with (
+            self.options({"crons.bulk-checkins": True}),
+            mock.patch.object(
+                MonitorCheckIn.objects, "bulk_create", wraps=MonitorCheckIn.objects.bulk_create
+            ) as bulk_create,
+        ):
+            for minutes in (5, 4, 3):
+                self.send_checkin(
+                    monitor.slug, ts=now - timedelta(minutes=minutes), consumer=consumer
+                )
+                guids.append(self.guid)
+
+            # An in-progress check-in is stored on its own, after the others
+            self.send_checkin(
+                monitor.slug,
+                ts=now - timedelta(minutes=2),
+                status="in_progress",
+                consumer=consumer,
+            )
+            in_progress_guid = self.guid
+
+            # One more check-in to process the batch
+            self.send_checkin(monitor.slug, ts=now, consumer=consumer)
+
+        assert bulk_create.call_count == 1
+
+        check_ins = [MonitorCheckIn.objects.get(guid=guid) for guid in guids]
+        assert all(check_in.status == CheckInStatus.OK for check_in in check_ins)
+        assert check_ins[0].expected_time == monitor_environment.next_checkin
+        for previous, check_in in zip(check_ins, check_ins[1:]):
+            assert check_in.expected_time == monitor.get_next_expected_checkin(previous.date_added)
+
+        in_progress = MonitorCheckIn.objects.get(guid=in_progress_guid)
+        assert in_progress.status == CheckInStatus.IN_PROGRESS
+        assert in_progress.expected_time == monitor.get_next_expected_checkin(
+            check_ins[-1].date_added
+        )
+
+        monitor_environment.refresh_from_db()
+        assert monitor_environment.last_checkin == in_progress.date_added
+        assert monitor_environment.next_checkin == monitor.get_next_expected_checkin(
+            in_progress.date_added
+        )
+
     def test_passing(self) -> None:
         monitor = self._create_monitor(slug="my-monitor")
         self.send_checkin(monitor.slug)
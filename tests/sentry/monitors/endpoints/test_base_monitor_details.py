@@ -8,6 +8,8 @@ from sentry.constants import ObjectStatus
 from sentry.models.environment import Environment
 from sentry.models.rule import Rule, RuleActivity, RuleActivityType
 from sentry.models.scheduledeletion import RegionScheduledDeletion
+from sentry.monitors import deadlines
+from sentry.monitors.clock_tasks.check_missed import dispatch_check_missing
 from sentry.monitors.constants import TIMEOUT
 from sentry.monitors.logic.mark_ok import mark_ok
 from sentry.monitors.models import (
@@ -414,6 +416,12 @@ class BaseUpdateMonitorTest(MonitorTestCase):
             == monitor_environment.next_checkin_latest
         )
 
+        # check that the moved deadline was indexed
+        score = deadlines.get_redis_client().zscore(
+            deadlines.MISSED_KEY, str(monitor_environment.id)
+        )
+        assert score == monitor_environment.next_checkin_latest.timestamp()
+
         # check that unsetting the parameter works
         resp = self.get_success_response(
             self.organization.slug,
@@ -473,6 +481,12 @@ class BaseUpdateMonitorTest(MonitorTestCase):
             second=0, microsecond=0
         ) + timedelta(minutes=15)
 
+        # check that the moved timeout was indexed
+        score = deadlines.get_redis_client().zscore(
+            deadlines.TIMEOUT_KEY, f"{monitor_environment.id}:{check_in.id}"
+        )
+        assert score == check_in.timeout_at.timestamp()
+
         # check that unsetting the parameter works
         resp = self.get_success_response(
             self.organization.slug, monitor.slug, method="PUT", **{"config": {"max_runtime": None}}
@@ -791,6 +805,40 @@ class BaseUpdateMonitorTest(MonitorTestCase):
         assert monitor.status == ObjectStatus.ACTIVE
         assert assign_monitor_seat.called
 
+    @override_options({"crons.deadline-index": True})
+    @patch("sentry.monitors.clock_tasks.check_missed.produce_task")
+    @patch("sentry.quotas.backend.check_assign_monitor_seat")
+    @patch("sentry.quotas.backend.assign_monitor_seat")
+    def test_activate_monitor_indexes_deadlines(
+        self, assign_monitor_seat, check_assign_monitor_seat, mock_produce_task
+    ):
+        check_assign_monitor_seat.return_value = SeatAssignmentResult(assignable=True)
+        assign_monitor_seat.return_value = Outcome.ACCEPTED
+
+        ts = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+
+        monitor = self._create_monitor()
+        monitor_environment = self._create_monitor_environment(
+            monitor,
+            next_checkin=ts - timedelta(minutes=1),
+            next_checkin_latest=ts,
+        )
+        deadlines.index_missed(monitor_environment.id, ts)
+        monitor.update(status=ObjectStatus.DISABLED)
+
+        # The disabled environment is dropped from the index once its deadline passes
+        dispatch_check_missing(ts)
+        assert not mock_produce_task.called
+        assert deadlines.get_missed(ts, 10) == []
+
+        self.get_success_response(
+            self.organization.slug, monitor.slug, method="PUT", **{"status": "active"}
+        )
+        assert deadlines.get_missed(ts, 10) == [monitor_environment.id]
+
+        dispatch_check_missing(ts)
+        assert mock_produce_task.call_count == 1
+
     @patch("sentry.quotas.backend.check_assign_monitor_seat")
     @patch("sentry.quotas.backend.assign_monitor_seat")
     def test_no_activate_if_already_activated(self, assign_monitor_seat, check_assign_monitor_seat):
@@ -1,9 +1,16 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 
 import pytest
-
-from sentry.monitors.schedule import get_next_schedule, get_prev_schedule
+from dateutil import rrule
+
+from sentry.monitors import schedule as monitor_schedule
+from sentry.monitors.schedule import (
+    SCHEDULE_INTERVAL_MAP,
+    get_next_schedule,
+    get_next_schedules,
+    get_prev_schedule,
+)
 from sentry.monitors.types import CrontabSchedule, IntervalSchedule
 
 
@@ -83,3 +90,71 @@ def test_get_prev_schedule():
 
     # 2 hour interval: (start = 1:30) 5:35 -> 5:30
     assert get_prev_schedule(start_ts, t(5, 35), IntervalSchedule(2, "hour")) == t(5, 30)
+
+
+def test_get_next_schedules():
+    assert get_next_schedules(t(5, 30), CrontabSchedule("0 * * * *"), 3) == [
+        t(6, 0),
+        t(7, 0),
+        t(8, 0),
+    ]
+    assert get_next_schedules(t(5, 30), IntervalSchedule(2, "hour"), 3) == [
+        t(7, 30),
+        t(9, 30),
+        t(11, 30),
+    ]
+
+    # Monthly intervals skip the months without the day of the start
+    jan_31 = datetime(2019, 1, 31, 12, 0, tzinfo=timezone.utc)
+    assert get_next_schedules(jan_31, IntervalSchedule(1, "month"), 2) == [
+        datetime(2019, 3, 31, 12, 0, tzinfo=timezone.utc),
+        datetime(2019, 5, 31, 12, 0, tzinfo=timezone.utc),
+    ]
+
+
+def test_crontab_is_parsed_once():
+    monitor_schedule._compile_crontab.cache_clear()
+
+    get_next_schedule(t(5, 30), CrontabSchedule("*/5 * * * *"))
+    get_prev_schedule(t(1, 30), t(5, 30), CrontabSchedule("*/5 * * * *"))
+    get_next_schedules(t(5, 30), CrontabSchedule("*/5 * * * *"), 10)
+
+    cache_info = monitor_schedule._compile_crontab.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 2
+
+
+@pytest.mark.parametrize("unit", ["minute", "hour", "day", "week"])
+@pytest.mark.parametrize("interval", [1, 7, 90])
+def test_interval_matches_rrule(unit, interval):
+    """
+    The occurrences of fixed length intervals are computed arithmetically,
+    they must match the occurrences of the rrule, including across DST.
+    """
+    tz = ZoneInfo("America/New_York")
+    start_ts = datetime(2024, 3, 9, 1, 42, 17, 5, tzinfo=tz)
+    schedule = IntervalSchedule(interval, unit)
+
+    for minutes in range(0, 60 * 24 * 60, 617):
+        reference_ts = start_ts + timedelta(minutes=minutes, seconds=13)
+
+        next_rule = rrule.rrule(
+            freq=SCHEDULE_INTERVAL_MAP[unit],
+            interval=interval,
+            dtstart=reference_ts,
+            count=2,
+        )
+        expected_next = next_rule.after(reference_ts).replace(second=0, microsecond=0)
+        assert get_next_schedule(reference_ts, schedule) == expected_next
+
+        if minutes == 0:
+            continue
+
+        prev_rule = rrule.rrule(
+            freq=SCHEDULE_INTERVAL_MAP[unit],
+            interval=interval,
+            dtstart=start_ts,
+            until=reference_ts,
+        )
+        expected_prev = prev_rule.before(reference_ts).replace(second=0, microsecond=0)
+        assert get_prev_schedule(start_ts, reference_ts, schedule) == expected_prev
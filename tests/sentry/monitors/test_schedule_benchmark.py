@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from sentry.monitors import schedule as monitor_schedule
+from sentry.monitors.schedule import get_next_schedule, get_prev_schedule
+from sentry.monitors.types import CrontabSchedule, IntervalSchedule, ScheduleConfig
+
+START_TS = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
+
+# Schedules as they are commonly configured by monitors.
+SCHEDULES: list[ScheduleConfig] = [
+    CrontabSchedule("* * * * *"),
+    CrontabSchedule("*/5 * * * *"),
+    CrontabSchedule("0 * * * *"),
+    CrontabSchedule("30 2 * * *"),
+    CrontabSchedule("0 9 * * 1-5"),
+    CrontabSchedule("0 0 1 * *"),
+    IntervalSchedule(1, "minute"),
+    IntervalSchedule(10, "minute"),
+    IntervalSchedule(6, "hour"),
+    IntervalSchedule(1, "day"),
+]
+
+
+def benchmark_available() -> bool:
+    try:
+        __import__("pytest_benchmark")
+    except ModuleNotFoundError:
+        return False
+    else:
+        return True
+
+
+def process_check_ins(uncached: bool = False) -> None:
+    """
+    Computes the schedules the way a check-in does: the next expected check-in
+    when it is processed, and the previous one when it is marked as missed or
+    timed out. The monitors were created a month before the check-ins, and
+    `uncached` parses crontabs on every check-in as was done before.
+    """
+    for minute in range(100):
+        reference_ts = START_TS + timedelta(days=30, minutes=minute)
+        for schedule in SCHEDULES:
+            if uncached:
+                monitor_schedule._compile_crontab.cache_clear()
+            get_next_schedule(reference_ts, schedule)
+            get_prev_schedule(START_TS, reference_ts, schedule)
+
+
+def process_check_ins_uncached() -> None:
+    process_check_ins(uncached=True)
+
+
+@pytest.mark.skipif(not benchmark_available(), reason="requires pytest-benchmark")
+@pytest.mark.parametrize(
+    "processor", [process_check_ins_uncached, process_check_ins], ids=["cold", "warm"]
+)
+def test_benchmark_schedule(processor, benchmark):
+    benchmark(processor)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import collections
 from collections.abc import Iterable, Mapping, Sequence
 from datetime import timedelta
+from unittest import mock
 
 import pytest
 from django.utils import timezone
@@ -19,6 +20,7 @@ from sentry.models.projectownership import ProjectOwnership
 from sentry.models.repository import Repository
 from sentry.models.team import Team
 from sentry.models.user import User
+from sentry.notifications.services import notifications_service
 from sentry.notifications.types import (
     ActionTargetType,
     FallthroughChoiceType,
@@ -30,6 +32,7 @@ from sentry.notifications.utils.participants import (
     get_owner_reason,
     get_owners,
     get_send_to,
+    get_send_to_many,
 )
 from sentry.ownership import grammar
 from sentry.ownership.grammar import Matcher, Owner, Rule, dump_schema
@@ -38,6 +41,7 @@ from sentry.silo.base import SiloMode
 from sentry.testutils.cases import TestCase
 from sentry.testutils.helpers.datetime import before_now, iso_format
 from sentry.testutils.helpers.features import with_feature
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.helpers.slack import link_team
 from sentry.testutils.silo import assume_test_silo_mode
 from sentry.testutils.skips import requires_snuba
@@ -632,6 +636,36 @@ class GetSendToOwnersTest(_ParticipantsTest):
             self.get_send_to_owners(event), email=[self.user.id], slack=[self.user.id]
         )
 
+    def test_get_send_to_many(self):
+        events = [
+            self.store_event_owners(filename)
+            for filename in ("user.jsx", "team.py", "everyone.cbl", "empty.lol")
+        ]
+
+        assert get_send_to_many(
+            self.project, target_type=ActionTargetType.ISSUE_OWNERS, events=events
+        ) == {event: self.get_send_to_owners(event) for event in events}
+
+    @override_options({"notifications.recipients.cache-ttl": 60})
+    def test_recipients_cache(self):
+        event = self.store_event_owners("team.py")
+
+        with mock.patch.object(
+            notifications_service,
+            "get_notification_recipients",
+            wraps=notifications_service.get_notification_recipients,
+        ) as get_notification_recipients:
+            recipients = self.get_send_to_owners(event)
+            assert get_notification_recipients.call_count == 2
+
+            # the settings of the same recipients are cached
+            assert self.get_send_to_owners(event) == recipients
+            assert get_notification_recipients.call_count == 2
+
+        self.assert_recipients_are(
+            recipients, email=[self.user.id, self.user2.id], slack=[self.user.id, self.user2.id]
+        )
+
 
 class GetOwnersCase(_ParticipantsTest):
     def setUp(self):
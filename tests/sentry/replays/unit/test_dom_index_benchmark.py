@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import uuid
+from typing import Any
+
+import pytest
+
+from sentry.replays.usecases.ingest.dom_index import (
+    get_user_actions,
+    iter_custom_events_from_segment,
+)
+from sentry.utils import json
+
+
+def benchmark_available() -> bool:
+    try:
+        __import__("pytest_benchmark")
+    except ModuleNotFoundError:
+        return False
+    else:
+        return True
+
+
+def make_segment(num_mutations: int, num_clicks: int) -> bytes:
+    """Return a mutation-heavy segment shaped like those produced by the JavaScript SDK."""
+    events: list[dict[str, Any]] = [
+        {
+            "type": 2,
+            "data": {
+                "node": {
+                    "type": 0,
+                    "childNodes": [
+                        {"type": 2, "tagName": "div", "attributes": {"id": str(i)}, "id": i}
+                        for i in range(1000)
+                    ],
+                    "id": 1,
+                },
+            },
+            "timestamp": 1674298824,
+        }
+    ]
+
+    for i in range(num_mutations):
+        events.append(
+            {
+                "type": 3,
+                "data": {
+                    "source": 0,
+                    "texts": [],
+                    "attributes": [{"id": i, "attributes": {"class": "a b c"}}],
+                    "removes": [],
+                    "adds": [
+                        {
+                            "parentId": 1,
+                            "nextId": None,
+                            "node": {"type": 3, "textContent": "Hello, world!" * 10, "id": i},
+                        }
+                    ],
+                },
+                "timestamp": 1674298825 + i,
+            }
+        )
+
+        if i % (num_mutations // num_clicks) == 0:
+            events.append(
+                {
+                    "type": 5,
+                    "timestamp": 1674298825 + i,
+                    "data": {
+                        "tag": "breadcrumb",
+                        "payload": {
+                            "timestamp": 1674298825.403 + i,
+                            "type": "default",
+                            "category": "ui.click",
+                            "message": "div#hello.hello.world",
+                            "data": {
+                                "nodeId": i,
+                                "node": {
+                                    "id": i,
+                                    "tagName": "div",
+                                    "attributes": {"id": "hello", "class": "hello world"},
+                                    "textContent": "Hello, world!",
+                                },
+                            },
+                        },
+                    },
+                }
+            )
+
+    return json.dumps(events).encode()
+
+
+SEGMENTS = [make_segment(num_mutations, 10) for num_mutations in (100, 1_000, 10_000)]
+
+
+def parse_full(segment: bytes) -> None:
+    get_user_actions(1, uuid.uuid4().hex, json.loads(segment), None)
+
+
+def parse_custom_events(segment: bytes) -> None:
+    get_user_actions(1, uuid.uuid4().hex, iter_custom_events_from_segment(segment), None)
+
+
+@pytest.mark.skipif(not benchmark_available(), reason="requires pytest-benchmark")
+@pytest.mark.parametrize("parser", [parse_full, parse_custom_events], ids=lambda x: x.__name__)
+@pytest.mark.parametrize("segment", SEGMENTS, ids=["small", "medium", "large"])
+def test_benchmark_get_user_actions(parser, segment, benchmark):
+    benchmark(parser, segment)
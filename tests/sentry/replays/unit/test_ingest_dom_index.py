@@ -4,6 +4,7 @@ import uuid
 from typing import Any
 from unittest import mock
 
+import orjson
 import pytest
 
 from sentry.replays.testutils import mock_replay_event
@@ -12,6 +13,7 @@ from sentry.replays.usecases.ingest.dom_index import (
     _parse_classes,
     encode_as_uuid,
     get_user_actions,
+    iter_custom_events_from_segment,
     log_canvas_size,
     parse_replay_actions,
 )
@@ -1138,3 +1140,86 @@ def test_emit_click_negative_node_id():
 
     user_actions = get_user_actions(1, uuid.uuid4().hex, events, None)
     assert len(user_actions) == 0
+
+
+def test_iter_custom_events_from_segment():
+    """Test "iter_custom_events_from_segment" only yields top-level custom events."""
+    events: list[dict[str, Any]] = [
+        {
+            "type": 2,
+            "data": {
+                "node": {
+                    "type": 0,
+                    "childNodes": [{"type": 5, "textContent": '{"type":5,', "id": 2}],
+                    "id": 1,
+                }
+            },
+            "timestamp": 1674298824,
+        },
+        {
+            "type": 5,
+            "timestamp": 1674298825,
+            "data": {
+                "tag": "breadcrumb",
+                "payload": {"category": "ui.click", "data": [{"type": 5, "data": {}}]},
+            },
+        },
+        {"type": 3, "data": {"source": 0, "adds": []}, "timestamp": 1674298826},
+        {"type": 5, "timestamp": 1674298827, "data": {"tag": "performanceSpan"}},
+    ]
+
+    # Compact and whitespace separated encodings are both supported.
+    for segment in (json.dumps(events).encode(), orjson.dumps(events)):
+        custom_events = list(iter_custom_events_from_segment(segment))
+        assert custom_events == [events[1], events[3]]
+
+    # Segments which do not lead with the "type" key are decoded in full.
+    segment = b'[{"timestamp": 1, "type": 5, "data": {"tag": "breadcrumb"}}]'
+    assert list(iter_custom_events_from_segment(segment)) == [
+        {"timestamp": 1, "type": 5, "data": {"tag": "breadcrumb"}}
+    ]
+
+    assert list(iter_custom_events_from_segment(b"[]")) == []
+
+
+def test_iter_custom_events_from_segment_invalid_json():
+    """Test invalid segments raise when decoded in full."""
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_custom_events_from_segment(b'[{"hello":"world"'))
+
+
+def test_parse_replay_actions_from_segment():
+    """Test replay actions parsed from a segment match those parsed from decoded events."""
+    events = [
+        {"type": 3, "data": {"source": 0, "adds": [{"node": {"id": 1}}]}, "timestamp": 1},
+        {
+            "type": 5,
+            "timestamp": 1674298825,
+            "data": {
+                "tag": "breadcrumb",
+                "payload": {
+                    "timestamp": 1674298825.403,
+                    "type": "default",
+                    "category": "ui.click",
+                    "message": "div#hello.hello.world",
+                    "data": {
+                        "nodeId": 1,
+                        "node": {
+                            "id": 1,
+                            "tagName": "div",
+                            "attributes": {"id": "hello", "class": "hello world"},
+                            "textContent": "Hello, world!",
+                        },
+                    },
+                },
+            },
+        },
+    ]
+    replay_id = uuid.uuid4().hex
+
+    expected = get_user_actions(1, replay_id, events, None)
+    segment = json.dumps(events).encode()
+    assert get_user_actions(1, replay_id, iter_custom_events_from_segment(segment), None) == (
+        expected
+    )
+    assert len(expected) == 1
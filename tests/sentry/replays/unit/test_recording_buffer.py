@@ -1,4 +1,5 @@
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 import pytest
@@ -131,7 +132,33 @@ def test_commit_uploads(_do_upload):
 
     _do_upload.side_effect = mocked
 
-    commit_uploads([{}])  # type: ignore[typeddict-item]
+    commit_uploads([{"key": "a", "value": b"hello"}])
+
+
+@patch("sentry.replays.consumers.recording_buffered._do_upload")
+def test_commit_uploads_shared_pool(_do_upload):
+    """Assert uploads are submitted to the shared pool and awaited before returning."""
+    uploaded = []
+
+    def mocked(u):
+        uploaded.append(u["key"])
+
+    _do_upload.side_effect = mocked
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        commit_uploads([{"key": "a", "value": b"1"}, {"key": "b", "value": b"2"}], pool)
+        assert sorted(uploaded) == ["a", "b"]
+
+        # The pool remains usable for the next flush.
+        commit_uploads([{"key": "c", "value": b"3"}], pool)
+        assert sorted(uploaded) == ["a", "b", "c"]
+
+
+@patch("sentry.replays.consumers.recording_buffered._do_upload")
+def test_commit_uploads_empty(_do_upload):
+    """Assert an empty batch is a no-op."""
+    commit_uploads([])
+    assert not _do_upload.called
 
 
 @patch("sentry.replays.consumers.recording_buffered._do_upload")
@@ -145,3 +172,17 @@ def test_commit_uploads_failure(_do_upload):
 
     with pytest.raises(BufferCommitFailed):
         commit_uploads([{}])  # type: ignore[typeddict-item]
+
+
+@patch("sentry.replays.consumers.recording_buffered._do_upload")
+def test_commit_uploads_shared_pool_failure(_do_upload):
+    """Assert failures in the shared pool fail the batch."""
+
+    def mocked(u):
+        raise ValueError("")
+
+    _do_upload.side_effect = mocked
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        with pytest.raises(BufferCommitFailed):
+            commit_uploads([{"key": "a", "value": b"1"}], pool)
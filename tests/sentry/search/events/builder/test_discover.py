@@ -18,6 +18,7 @@ from sentry.search.events.types import ParamsType, QueryBuilderConfig
 from sentry.snuba.dataset import Dataset
 from sentry.snuba.referrer import Referrer
 from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
 from sentry.utils.snuba import QueryOutsideRetentionError, UnqualifiedQueryError, bulk_snuba_queries
 from sentry.utils.validators import INVALID_ID_DETAILS
 
@@ -871,6 +872,46 @@ class QueryBuilderTest(TestCase):
                 selected_columns=["count()"],
             )
 
+    def test_process_results_columnar(self):
+        query = QueryBuilder(
+            Dataset.Discover,
+            self.params,
+            selected_columns=["transaction", "p50(transaction.duration)", "count()"],
+            config=QueryBuilderConfig(transform_alias_to_input_format=True),
+        )
+
+        def get_results():
+            return {
+                "data": [
+                    {
+                        "transaction": "a",
+                        "p50_transaction_duration": float("nan"),
+                        "count": 1,
+                    },
+                    {
+                        "transaction": "b",
+                        "p50_transaction_duration": float("inf"),
+                        "count": 2,
+                    },
+                    {"transaction": "c", "p50_transaction_duration": 1.5, "count": 3},
+                ],
+                "meta": [
+                    {"name": "transaction", "type": "String"},
+                    {"name": "p50_transaction_duration", "type": "Float64"},
+                    {"name": "count", "type": "UInt64"},
+                ],
+            }
+
+        expected = query.process_results(get_results())
+        assert expected["data"] == [
+            {"transaction": "a", "p50(transaction.duration)": 0, "count()": 1},
+            {"transaction": "b", "p50(transaction.duration)": None, "count()": 2},
+            {"transaction": "c", "p50(transaction.duration)": 1.5, "count()": 3},
+        ]
+
+        with override_options({"snuba.columnar-results": True}):
+            assert query.process_results(get_results()) == expected
+
     def test_orderby_raw_empty_equation(self):
         with pytest.raises(InvalidSearchQuery, match=re.escape("Cannot sort by an empty equation")):
             QueryBuilder(
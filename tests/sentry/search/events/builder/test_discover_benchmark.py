@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+from sentry.search.events.builder.discover import QueryBuilder
+from sentry.search.events.types import QueryBuilderConfig
+from sentry.snuba.dataset import Dataset
+from sentry.testutils.helpers.options import override_options
+from sentry.testutils.pytest.fixtures import django_db_all
+
+# Transforming the results column by column (`snuba.columnar-results`) is about 1.4-1.5x faster
+# than row by row for results like the one below, from 100 to 10k rows at the time of writing.
+SELECTED_COLUMNS = [
+    "transaction",
+    "count()",
+    "count_unique(user)",
+    "p50(transaction.duration)",
+    "p95(transaction.duration)",
+    "avg(transaction.duration)",
+]
+
+
+def benchmark_available() -> bool:
+    try:
+        __import__("pytest_benchmark")
+    except ModuleNotFoundError:
+        return False
+    else:
+        return True
+
+
+def make_results(num_rows: int) -> dict[str, Any]:
+    """Return a transaction summary page as it is returned by Snuba, with some invalid floats."""
+    rng = random.Random(0)
+    return {
+        "data": [
+            {
+                "transaction": f"/api/0/endpoint/{i % 500}/",
+                "count": rng.randint(1, 1000),
+                "count_unique_user": rng.randint(1, 100),
+                "p50_transaction_duration": rng.random() * 100,
+                "p95_transaction_duration": rng.choice([rng.random() * 500, float("nan")]),
+                "avg_transaction_duration": rng.random() * 200,
+            }
+            for i in range(num_rows)
+        ],
+        "meta": [
+            {"name": "transaction", "type": "String"},
+            {"name": "count", "type": "UInt64"},
+            {"name": "count_unique_user", "type": "UInt64"},
+            {"name": "p50_transaction_duration", "type": "Float64"},
+            {"name": "p95_transaction_duration", "type": "Float64"},
+            {"name": "avg_transaction_duration", "type": "Float64"},
+        ],
+    }
+
+
+@pytest.mark.skipif(not benchmark_available(), reason="requires pytest-benchmark")
+@django_db_all
+@pytest.mark.parametrize("num_rows", [100, 10_000])
+@pytest.mark.parametrize("columnar", [False, True], ids=["rows", "columns"])
+def test_benchmark_process_results(default_project, columnar, num_rows, benchmark):
+    end = datetime.now(timezone.utc).replace(microsecond=0)
+    builder = QueryBuilder(
+        Dataset.Discover,
+        {"project_id": [default_project.id], "start": end - timedelta(days=1), "end": end},
+        selected_columns=SELECTED_COLUMNS,
+        config=QueryBuilderConfig(transform_alias_to_input_format=True),
+    )
+    results = make_results(num_rows)
+
+    with override_options({"snuba.columnar-results": columnar}):
+        processed = benchmark(builder.process_results, results)
+
+    assert len(processed["data"]) == num_rows
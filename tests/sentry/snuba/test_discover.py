@@ -2480,3 +2480,22 @@ def test_zerofill():
 
     assert results[0]["time"] == 1546387200
     assert results[7]["time"] == 1546992000
+
+
+def test_zerofill_repeated_times():
+    data = [
+        {"time": "2019-01-03T00:00:00+00:00", "transaction": "a", "count": 1},
+        {"time": "2019-01-03T00:00:00+00:00", "transaction": "b", "count": 2},
+        {"time": "2019-01-05T00:00:00+00:00", "transaction": "a", "count": 3},
+    ]
+    results = discover.zerofill(
+        data, datetime(2019, 1, 2, 0, 0), datetime(2019, 1, 5, 23, 59, 59), 86400, "time"
+    )
+
+    assert results == [
+        {"time": 1546387200},
+        {"time": 1546473600, "transaction": "a", "count": 1},
+        {"time": 1546473600, "transaction": "b", "count": 2},
+        {"time": 1546560000},
+        {"time": 1546646400, "transaction": "a", "count": 3},
+    ]
@@ -9,6 +9,7 @@ from sentry.snuba import discover
 from sentry.snuba.dataset import Dataset
 from sentry.testutils.cases import SnubaTestCase, TestCase
 from sentry.testutils.helpers.datetime import before_now, iso_format
+from sentry.testutils.helpers.options import override_options
 from sentry.utils.samples import load_data
 
 ARRAY_COLUMNS = ["measurements", "span_op_breakdowns"]
@@ -384,6 +385,34 @@ class DiscoverTimeseriesQueryTest(TimeseriesBase):
             val["count"] for val in result.data["data"] if "count" in val
         ], result.data["data"]
 
+    @override_options({"snuba.timeseries-cache.enabled": True})
+    def test_timeseries_cache(self):
+        params = {
+            "start": self.day_ago,
+            "end": self.day_ago + timedelta(hours=3),
+            "project_id": [self.project.id],
+        }
+        first = discover.timeseries_query(
+            selected_columns=["count()"],
+            query="",
+            referrer="test_discover_query",
+            params=params,
+            rollup=3600,
+        )
+        assert [2, 1] == [val["count"] for val in first.data["data"] if "count" in val]
+
+        with patch("sentry.snuba.discover.bulk_snuba_queries") as mock_query:
+            second = discover.timeseries_query(
+                selected_columns=["count()"],
+                query="",
+                referrer="test_discover_query",
+                params=params,
+                rollup=3600,
+            )
+        # Every bucket of the range is closed and aligned, so nothing needs querying.
+        assert mock_query.call_count == 0
+        assert second.data == first.data
+
     def test_conditional_filter(self):
         project2 = self.create_project(organization=self.organization)
         project3 = self.create_project(organization=self.organization)
@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta, timezone
+
+from sentry.snuba import timeseries_cache
+from sentry.testutils.helpers.datetime import freeze_time
+from sentry.testutils.helpers.options import override_options
+from sentry.testutils.pytest.fixtures import django_db_all
+
+NOW = datetime(2024, 1, 10, 12, 30, tzinfo=timezone.utc)
+HOUR = 3600
+
+
+class FakeSnuba:
+    """Returns one row per hour with the hour's timestamp as its count."""
+
+    def __init__(self):
+        self.ranges = []
+
+    def __call__(self, ranges):
+        self.ranges.extend(ranges)
+        results = []
+        for start, end in ranges:
+            bucket = int(start.timestamp()) // HOUR * HOUR
+            data = []
+            while bucket < end.timestamp():
+                data.append(
+                    {"time": datetime.fromtimestamp(bucket, timezone.utc).isoformat(), "count": 1}
+                )
+                bucket += HOUR
+            results.append({"data": data, "meta": [{"name": "count", "type": "UInt64"}]})
+        return results
+
+
+def run_query(snuba, start, end):
+    return timeseries_cache.query("fingerprint", start, end, HOUR, snuba, referrer="test")
+
+
+@django_db_all
+@freeze_time(NOW)
+@override_options({"snuba.timeseries-cache.settle-seconds": 300})
+def test_sliding_window():
+    snuba = FakeSnuba()
+    start = NOW - timedelta(hours=6, minutes=10)
+
+    result = run_query(snuba, start, NOW)
+    assert snuba.ranges == [(start, NOW)]
+    assert len(result["data"]) == 7
+    assert result["meta"] == [{"name": "count", "type": "UInt64"}]
+
+    snuba.ranges = []
+    later = NOW + timedelta(minutes=20)
+    with freeze_time(later):
+        result = run_query(snuba, start + timedelta(minutes=20), later)
+
+    # Only the partial first bucket and the buckets that weren't closed yet are queried.
+    first_bucket = datetime(2024, 1, 10, 7, tzinfo=timezone.utc)
+    assert snuba.ranges == [
+        (start + timedelta(minutes=20), first_bucket),
+        (datetime(2024, 1, 10, 12, tzinfo=timezone.utc), later),
+    ]
+    assert [row["time"] for row in result["data"]] == [
+        int((first_bucket + timedelta(hours=i)).timestamp()) for i in range(-1, 6)
+    ]
+
+
+@django_db_all
+@freeze_time(NOW)
+def test_fully_cached():
+    snuba = FakeSnuba()
+    start = NOW - timedelta(hours=12, minutes=30)
+    end = NOW - timedelta(hours=2, minutes=30)
+
+    first = run_query(snuba, start, end)
+    snuba.ranges = []
+    assert run_query(snuba, start, end) == first
+    assert snuba.ranges == []
+
+
+@django_db_all
+@freeze_time(NOW)
+def test_different_rollups_are_not_shared():
+    snuba = FakeSnuba()
+    start = NOW - timedelta(hours=12, minutes=30)
+    end = NOW - timedelta(hours=2, minutes=30)
+
+    run_query(snuba, start, end)
+    snuba.ranges = []
+    timeseries_cache.query("fingerprint", start, end, HOUR * 2, snuba)
+    assert snuba.ranges == [(start, end)]
+
+
+def test_is_cacheable():
+    assert timeseries_cache.is_cacheable(["count()", "p95(transaction.duration)"])
+    assert timeseries_cache.is_cacheable(["epm(3600)"])
+    assert not timeseries_cache.is_cacheable(["count()", "epm()"])
+    assert not timeseries_cache.is_cacheable(["equation|eps() * 2"])
+
+
+def test_fingerprint_ignores_time_range():
+    params = {"project_id": [2, 1], "start": NOW, "end": NOW}
+    other = {"project_id": [1, 2], "start": NOW - timedelta(days=1), "end": NOW}
+    assert timeseries_cache.get_fingerprint(params, "count()") == timeseries_cache.get_fingerprint(
+        other, "count()"
+    )
+    assert timeseries_cache.get_fingerprint(params, "count()") != timeseries_cache.get_fingerprint(
+        params, "count_unique(user)"
+    )
@@ -0,0 +1,53 @@
+from unittest import mock
+
+from celery.exceptions import SoftTimeLimitExceeded
+
+from sentry.locks import locks
+from sentry.tagstore.tasks import refresh_group_tag_summaries
+from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
+
+
+@override_options({"tagstore.group-tag-summary.enabled": True})
+class RefreshGroupTagSummariesTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.groups = [self.create_group(), self.create_group()]
+        self.backend = mock.Mock()
+
+        patcher = mock.patch("sentry.tagstore.tasks.tagstore.backend", self.backend)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch(
+            "sentry.tagstore.tasks.summaries.get_active",
+            return_value=[(group.id, []) for group in self.groups],
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_refresh(self):
+        refresh_group_tag_summaries()
+        calls = self.backend.refresh_group_tag_summary.call_args_list
+        assert [call.args[0] for call in calls] == self.groups
+
+    def test_soft_time_limit(self):
+        self.backend.refresh_group_tag_summary.side_effect = SoftTimeLimitExceeded()
+
+        refresh_group_tag_summaries()
+
+        # The run stops instead of moving on to the next group
+        assert self.backend.refresh_group_tag_summary.call_count == 1
+
+    def test_time_budget(self):
+        with mock.patch("sentry.tagstore.tasks.REFRESH_TIME_BUDGET", -1):
+            refresh_group_tag_summaries()
+        assert not self.backend.refresh_group_tag_summary.called
+
+    def test_concurrent_runs(self):
+        lock = locks.get(
+            "tagstore.refresh_group_tag_summaries", duration=65, name="refresh_group_tag_summaries"
+        )
+        with lock.acquire():
+            refresh_group_tag_summaries()
+        assert not self.backend.refresh_group_tag_summary.called
@@ -5,13 +5,15 @@ from django.core import mail
 from django.core.mail.message import EmailMultiAlternatives
 
 import sentry
+from sentry.digests import ScheduleEntry
 from sentry.digests.backends.redis import RedisBackend
 from sentry.digests.notifications import event_to_record
 from sentry.models.projectownership import ProjectOwnership
 from sentry.models.rule import Rule
-from sentry.tasks.digests import deliver_digest
+from sentry.tasks.digests import deliver_digest, schedule_digests
 from sentry.testutils.cases import TestCase
 from sentry.testutils.helpers.datetime import before_now, iso_format
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.skips import requires_snuba
 
 pytestmark = [requires_snuba]
@@ -77,3 +79,19 @@ class DeliverDigestTest(TestCase):
     def test_no_records(self):
         # This shouldn't error if no records are present
         deliver_digest(f"mail:p:{self.project.id}:IssueOwners:")
+
+
+class ScheduleDigestsTest(TestCase):
+    @override_options({"digests.delivery-batch-size": 2})
+    @mock.patch("sentry.tasks.digests.deliver_digest")
+    def test_batched_delivery(self, deliver_digest):
+        entries = [ScheduleEntry(f"mail:p:{self.project.id}:{i}", 1700000000.0) for i in range(3)]
+        with mock.patch.object(sentry, "digests") as digests, self.tasks():
+            digests.backend.schedule.return_value = iter(entries)
+            deliver_digest.side_effect = [Exception("boom"), None, None]
+            schedule_digests()
+
+        # a failed delivery doesn't stop the rest of its batch
+        assert [call.args for call in deliver_digest.call_args_list] == [
+            (entry.key, entry.timestamp) for entry in entries
+        ]
@@ -0,0 +1,697 @@
+import threading
+from array import array
+from datetime import datetime, timedelta, timezone
+
+from sentry.testutils.cases import TestCase
+from sentry.tsdb.base import ONE_DAY, ONE_HOUR, ONE_MINUTE, TSDBModel
+from sentry.tsdb.columnar import (
+    HLL_SPARSE_LIMIT,
+    ColumnarTSDB,
+    FrequencySketch,
+    HyperLogLog,
+    RingBuffer,
+    count_distinct,
+)
+
+
+def test_ring_buffer():
+    buffer = RingBuffer(3, [0] * 3, 0)
+    buffer.set(10, 1)
+    buffer.set(11, 2)
+    assert buffer.get(10) == 1
+    assert buffer.get(11) == 2
+    assert buffer.get(12) == 0
+
+    # Writing an interval that maps to the same slot expires the older one.
+    buffer.set(13, 3)
+    assert buffer.get(10) == 0
+    assert buffer.get(13) == 3
+    assert sorted(buffer.items()) == [(11, 2), (13, 3)]
+
+    assert buffer.pop(11) == 2
+    assert buffer.pop(11) == 0
+    assert list(buffer.items()) == [(13, 3)]
+
+
+def test_ring_buffer_late_writes():
+    buffer = RingBuffer(3, array("q", [0]) * 3, 0)
+    buffer.incr(13, 5)
+
+    # Intervals that are older than the one in their slot are past retention.
+    buffer.incr(10, 1)
+    buffer.set(10, 1)
+    assert buffer.get(10) == 0
+    assert buffer.get(13) == 5
+
+    buffer.incr(13, 1)
+    assert buffer.get(13) == 6
+
+
+def test_hyperloglog():
+    hll = HyperLogLog()
+    assert hll.count() == 0
+
+    for i in range(10):
+        hll.add(f"value:{i}")
+        hll.add(f"value:{i}")
+    assert hll.count() == 10
+    assert isinstance(hll.registers, dict)
+
+    for i in range(10, 20000):
+        hll.add(f"value:{i}")
+    assert isinstance(hll.registers, bytearray)
+    assert len(list(hll.ranks())) > HLL_SPARSE_LIMIT
+    assert abs(hll.count() - 20000) / 20000 < 0.05
+
+    other = HyperLogLog()
+    for i in range(10000, 30000):
+        other.add(f"value:{i}")
+    assert abs(count_distinct([hll, other, None]) - 30000) / 30000 < 0.05
+
+
+def test_frequency_sketch():
+    sketch = FrequencySketch(ColumnarTSDB.DEFAULT_SKETCH_PARAMETERS)
+    assert not sketch.exists()
+    assert sketch.estimate("foo") == 0.0
+
+    sketch.increment([("foo", 1.0), ("bar", 2.0)])
+    sketch.increment([("foo", 1.0)])
+    assert sketch.estimates is None
+    assert sketch.ranked(10) == [("foo", 2.0), ("bar", 2.0)]
+
+    # Exceeding the capacity of the index switches to the estimation matrix, while the most
+    # frequent items stay accurate.
+    for i in range(200):
+        sketch.increment([(f"item:{i}", 1.0), ("foo", 1.0)])
+    assert sketch.estimates is not None
+    assert len(sketch.index) == ColumnarTSDB.DEFAULT_SKETCH_PARAMETERS.capacity
+    assert sketch.ranked(1) == [("foo", 202.0)]
+
+    destination = FrequencySketch(ColumnarTSDB.DEFAULT_SKETCH_PARAMETERS)
+    destination.increment([("foo", 1.0), ("baz", 3.0)])
+    destination.merge(sketch)
+    assert destination.ranked(1) == [("foo", 203.0)]
+    assert destination.estimate("baz") >= 3.0
+
+
+class ColumnarTSDBTest(TestCase):
+    def setUp(self):
+        self.db = ColumnarTSDB(
+            rollups=(
+                # time in seconds, samples to keep
+                (10, 30),  # 5 minutes at 10 seconds
+                (ONE_MINUTE, 120),  # 2 hours at 1 minute
+                (ONE_HOUR, 24),  # 1 days at 1 hour
+                (ONE_DAY, 30),  # 30 days at 1 day
+            )
+        )
+
+    def test_expiry(self):
+        now = datetime.now(timezone.utc)
+
+        self.db.incr(TSDBModel.project, 1, now - timedelta(hours=30))
+        self.db.incr(TSDBModel.project, 1, now - timedelta(hours=2))
+        assert self.db.get_sums(
+            TSDBModel.project, [1], now - timedelta(hours=3), now, rollup=ONE_HOUR
+        ) == {1: 1}
+
+        # The slot of the interval 30 hours ago was reused 24 hours later.
+        self.db.incr(TSDBModel.project, 1, now - timedelta(hours=6))
+        assert self.db.get_sums(
+            TSDBModel.project,
+            [1],
+            now - timedelta(hours=31),
+            now - timedelta(hours=29),
+            rollup=ONE_HOUR,
+        ) == {1: 0}
+
+    def test_simple(self):
+        now = datetime.now(timezone.utc) - timedelta(hours=4)
+        dts = [now + timedelta(hours=i) for i in range(4)]
+
+        def timestamp(d):
+            t = int(d.timestamp())
+            return t - (t % 3600)
+
+        self.db.incr(TSDBModel.project, 1, dts[0])
+        self.db.incr(TSDBModel.project, 1, dts[1], count=2)
+        self.db.incr(TSDBModel.project, 1, dts[1], environment_id=1)
+        self.db.incr(TSDBModel.project, 1, dts[2])
+        self.db.incr_multi(
+            [(TSDBModel.project, 1), (TSDBModel.project, 2)], dts[3], count=3, environment_id=1
+        )
+        self.db.incr_multi(
+            [(TSDBModel.project, 1), (TSDBModel.project, 2)], dts[3], count=1, environment_id=2
+        )
+
+        results = self.db.get_range(TSDBModel.project, [1], dts[0], dts[-1])
+        assert results == {
+            1: [
+                (timestamp(dts[0]), 1),
+                (timestamp(dts[1]), 3),
+                (timestamp(dts[2]), 1),
+                (timestamp(dts[3]), 4),
+            ]
+        }
+
+        results = self.db.get_range(TSDBModel.project, [2], dts[0], dts[-1])
+        assert results == {
+            2: [
+                (timestamp(dts[0]), 0),
+                (timestamp(dts[1]), 0),
+                (timestamp(dts[2]), 0),
+                (timestamp(dts[3]), 4),
+            ]
+        }
+
+        results = self.db.get_range(TSDBModel.project, [1, 2], dts[0], dts[-1], environment_ids=[1])
+        assert results == {
+            1: [
+                (timestamp(dts[0]), 0),
+                (timestamp(dts[1]), 1),
+                (timestamp(dts[2]), 0),
+                (timestamp(dts[3]), 3),
+            ],
+            2: [
+                (timestamp(dts[0]), 0),
+                (timestamp(dts[1]), 0),
+                (timestamp(dts[2]), 0),
+                (timestamp(dts[3]), 3),
+            ],
+        }
+
+        sum_results = self.db.get_sums(TSDBModel.project, [1, 2], dts[0], dts[-1])
+        assert sum_results == {1: 9, 2: 4}
+
+        sum_results = self.db.get_sums(TSDBModel.project, [1, 2], dts[0], dts[-1], environment_id=1)
+        assert sum_results == {1: 4, 2: 3}
+
+        sum_results = self.db.get_sums(TSDBModel.project, [1, 2], dts[0], dts[-1], environment_id=0)
+        assert sum_results == {1: 0, 2: 0}
+
+        self.db.merge(TSDBModel.project, 1, [2], now, environment_ids=[0, 1, 2])
+
+        results = self.db.get_range(TSDBModel.project, [1], dts[0], dts[-1])
+        assert results == {
+            1: [
+                (timestamp(dts[0]), 1),
+                (timestamp(dts[1]), 3),
+                (timestamp(dts[2]), 1),
+                (timestamp(dts[3]), 8),
+            ]
+        }
+
+        results = self.db.get_range(TSDBModel.project, [2], dts[0], dts[-1])
+        assert results == {
+            2: [
+                (timestamp(dts[0]), 0),
+                (timestamp(dts[1]), 0),
+                (timestamp(dts[2]), 0),
+                (timestamp(dts[3]), 0),
+            ]
+        }
+
+        results = self.db.get_range(TSDBModel.project, [1, 2], dts[0], dts[-1], environment_ids=[1])
+        assert results == {
+            1: [
+                (timestamp(dts[0]), 0),
+                (timestamp(dts[1]), 1),
+                (timestamp(dts[2]), 0),
+                (timestamp(dts[3]), 6),
+            ],
+            2: [(timestamp(dts[i]), 0) for i in range(0, 4)],
+        }
+
+        sum_results = self.db.get_sums(TSDBModel.project, [1, 2], dts[0], dts[-1])
+        assert sum_results == {1: 13, 2: 0}
+
+        self.db.delete([TSDBModel.project], [1, 2], dts[0], dts[-1], environment_ids=[0, 1, 2])
+
+        sum_results = self.db.get_sums(TSDBModel.project, [1, 2], dts[0], dts[-1])
+        assert sum_results == {1: 0, 2: 0}
+
+        sum_results = self.db.get_sums(TSDBModel.project, [1, 2], dts[0], dts[-1], environment_id=1)
+        assert sum_results == {1: 0, 2: 0}
+
+    def test_count_distinct(self):
+        now = datetime.now(timezone.utc) - timedelta(hours=4)
+        dts = [now + timedelta(hours=i) for i in range(4)]
+
+        model = TSDBModel.users_affected_by_group
+
+        def timestamp(d):
+            t = int(d.timestamp())
+            return t - (t % 3600)
+
+        self.db.record(model, 1, ("foo", "bar"), dts[0])
+
+        self.db.record(model, 1, ("baz",), dts[1], environment_id=1)
+
+        self.db.record_multi(((model, 1, ("foo", "bar")), (model, 2, ("bar",))), dts[2])
+
+        self.db.record(model, 1, ("baz",), dts[2], environment_id=1)
+
+        self.db.record(model, 2, ("foo",), dts[3])
+
+        assert self.db.get_distinct_counts_series(model, [1], dts[0], dts[-1], rollup=3600) == {
+            1: [
+                (timestamp(dts[0]), 2),
+                (timestamp(dts[1]), 1),
+                (timestamp(dts[2]), 3),
+                (timestamp(dts[3]), 0),
+            ]
+        }
+
+        assert self.db.get_distinct_counts_series(model, [2], dts[0], dts[-1], rollup=3600) == {
+            2: [
+                (timestamp(dts[0]), 0),
+                (timestamp(dts[1]), 0),
+                (timestamp(dts[2]), 1),
+                (timestamp(dts[3]), 1),
+            ]
+        }
+
+        assert self.db.get_distinct_counts_series(
+            model, [1, 2], dts[0], dts[-1], rollup=3600, environment_id=1
+        ) == {
+            1: [
+                (timestamp(dts[0]), 0),
+                (timestamp(dts[1]), 1),
+                (timestamp(dts[2]), 1),
+                (timestamp(dts[3]), 0),
+            ],
+            2: [
+                (timestamp(dts[0]), 0),
+                (timestamp(dts[1]), 0),
+                (timestamp(dts[2]), 0),
+                (timestamp(dts[3]), 0),
+            ],
+        }
+
+        results = self.db.get_distinct_counts_totals(model, [1, 2], dts[0], dts[-1], rollup=3600)
+        assert results == {1: 3, 2: 2}
+
+        results = self.db.get_distinct_counts_totals(
+            model, [1, 2], dts[0], dts[-1], rollup=3600, environment_id=1
+        )
+        assert results == {1: 1, 2: 0}
+
+        results = self.db.get_distinct_counts_totals(
+            model, [1, 2], dts[0], dts[-1], rollup=3600, environment_id=0
+        )
+        assert results == {1: 0, 2: 0}
+
+        assert self.db.get_distinct_counts_union(model, [], dts[0], dts[-1], rollup=3600) == 0
+        assert self.db.get_distinct_counts_union(model, [1, 2], dts[0], dts[-1], rollup=3600) == 3
+        assert (
+            self.db.get_distinct_counts_union(
+                model, [1, 2], dts[0], dts[-1], rollup=3600, environment_id=1
+            )
+            == 1
+        )
+        assert (
+            self.db.get_distinct_counts_union(
+                model, [1, 2], dts[0], dts[-1], rollup=3600, environment_id=0
+            )
+            == 0
+        )
+
+        self.db.merge_distinct_counts(model, 1, [2], dts[0], environment_ids=[0, 1])
+
+        assert self.db.get_distinct_counts_series(model, [1], dts[0], dts[-1], rollup=3600) == {
+            1: [
+                (timestamp(dts[0]), 2),
+                (timestamp(dts[1]), 1),
+                (timestamp(dts[2]), 3),
+                (timestamp(dts[3]), 1),
+            ]
+        }
+
+        assert self.db.get_distinct_counts_series(model, [2], dts[0], dts[-1], rollup=3600) == {
+            2: [
+                (timestamp(dts[0]), 0),
+                (timestamp(dts[1]), 0),
+                (timestamp(dts[2]), 0),
+                (timestamp(dts[3]), 0),
+            ]
+        }
+
+        assert self.db.get_distinct_counts_series(
+            model, [1, 2], dts[0], dts[-1], rollup=3600, environment_id=1
+        ) == {
+            1: [
+                (timestamp(dts[0]), 0),
+                (timestamp(dts[1]), 1),
+                (timestamp(dts[2]), 1),
+                (timestamp(dts[3]), 0),
+            ],
+            2: [
+                (timestamp(dts[0]), 0),
+                (timestamp(dts[1]), 0),
+                (timestamp(dts[2]), 0),
+                (timestamp(dts[3]), 0),
+            ],
+        }
+
+        results = self.db.get_distinct_counts_totals(model, [1, 2], dts[0], dts[-1], rollup=3600)
+        assert results == {1: 3, 2: 0}
+
+        assert self.db.get_distinct_counts_union(model, [], dts[0], dts[-1], rollup=3600) == 0
+        assert self.db.get_distinct_counts_union(model, [1], dts[0], dts[-1], rollup=3600) == 3
+        assert self.db.get_distinct_counts_union(model, [1, 2], dts[0], dts[-1], rollup=3600) == 3
+        assert self.db.get_distinct_counts_union(model, [2], dts[0], dts[-1], rollup=3600) == 0
+
+        self.db.delete_distinct_counts([model], [1, 2], dts[0], dts[-1], environment_ids=[0, 1])
+
+        results = self.db.get_distinct_counts_totals(model, [1, 2], dts[0], dts[-1])
+        assert results == {1: 0, 2: 0}
+
+        results = self.db.get_distinct_counts_totals(
+            model, [1, 2], dts[0], dts[-1], environment_id=1
+        )
+        assert results == {1: 0, 2: 0}
+
+    def test_frequency_tables(self):
+        now = datetime.now(timezone.utc)
+        model = TSDBModel.frequent_issues_by_project
+
+        # None of the registered frequency tables actually support
+        # environments, so we have to pretend like one actually does
+        self.db.models_with_environment_support = self.db.models_with_environment_support | {model}
+
+        rollup = 3600
+
+        self.db.record_frequency_multi(
+            ((model, {"organization:1": {"project:1": 1, "project:2": 2, "project:3": 3}}),), now
+        )
+
+        self.db.record_frequency_multi(
+            (
+                (
+                    model,
+                    {
+                        "organization:1": {
+                            "project:1": 1,
+                            "project:2": 1,
+                            "project:3": 1,
+                            "project:4": 1,
+                        },
+                        "organization:2": {"project:5": 1},
+                    },
+                ),
+            ),
+            now - timedelta(hours=1),
+        )
+
+        self.db.record_frequency_multi(
+            (
+                (
+                    model,
+                    {
+                        "organization:1": {"project:2": 1, "project:3": 2, "project:4": 3},
+                        "organization:2": {"project:5": 0.5},
+                    },
+                ),
+            ),
+            now - timedelta(hours=1),
+            environment_id=1,
+        )
+
+        assert self.db.get_most_frequent(
+            model, ("organization:1", "organization:2"), now, rollup=rollup
+        ) == {
+            "organization:1": [("project:3", 3.0), ("project:2", 2.0), ("project:1", 1.0)],
+            "organization:2": [],
+        }
+
+        assert self.db.get_most_frequent(
+            model,
+            ("organization:1", "organization:2"),
+            now - timedelta(hours=1),
+            now,
+            rollup=rollup,
+            environment_id=1,
+        ) == {
+            "organization:1": [("project:4", 3.0), ("project:3", 2.0), ("project:2", 1.0)],
+            "organization:2": [("project:5", 0.5)],
+        }
+
+        assert self.db.get_most_frequent(
+            model, ("organization:1", "organization:2"), now, limit=1, rollup=rollup
+        ) == {"organization:1": [("project:3", 3.0)], "organization:2": []}
+
+        assert self.db.get_most_frequent(
+            model,
+            ("organization:1", "organization:2"),
+            now - timedelta(hours=1),
+            now,
+            rollup=rollup,
+        ) == {
+            "organization:1": [
+                ("project:3", 3.0 + 3.0),
+                ("project:2", 2.0 + 2.0),
+                ("project:4", 4.0),
+                ("project:1", 1.0 + 1.0),
+            ],
+            "organization:2": [("project:5", 1.5)],
+        }
+
+        assert self.db.get_most_frequent(
+            model,
+            ("organization:1", "organization:2"),
+            now - timedelta(hours=1),
+            now,
+            rollup=rollup,
+            environment_id=0,
+        ) == {"organization:1": [], "organization:2": []}
+
+        timestamp = int(now.timestamp() // rollup) * rollup
+
+        assert self.db.get_most_frequent_series(
+            model,
+            ("organization:1", "organization:2", "organization:3"),
+            now - timedelta(hours=1),
+            now,
+            rollup=rollup,
+        ) == {
+            "organization:1": [
+                (
+                    timestamp - rollup,
+                    {"project:1": 1.0, "project:2": 2.0, "project:3": 3.0, "project:4": 4.0},
+                ),
+                (timestamp, {"project:1": 1.0, "project:2": 2.0, "project:3": 3.0}),
+            ],
+            "organization:2": [(timestamp - rollup, {"project:5": 1.5}), (timestamp, {})],
+            "organization:3": [(timestamp - rollup, {}), (timestamp, {})],
+        }
+
+        assert self.db.get_frequency_series(
+            model,
+            {
+                "organization:1": ("project:1", "project:2", "project:3", "project:4"),
+                "organization:2": ("project:5",),
+            },
+            now - timedelta(hours=1),
+            now,
+            rollup=rollup,
+        ) == {
+            "organization:1": [
+                (
+                    timestamp - rollup,
+                    {"project:1": 1.0, "project:2": 2.0, "project:3": 3.0, "project:4": 4.0},
+                ),
+                (
+                    timestamp,
+                    {"project:1": 1.0, "project:2": 2.0, "project:3": 3.0, "project:4": 0.0},
+                ),
+            ],
+            "organization:2": [
+                (timestamp - rollup, {"project:5": 1.5}),
+                (timestamp, {"project:5": 0.0}),
+            ],
+        }
+
+        assert self.db.get_frequency_series(
+            model,
+            {
+                "organization:1": ("project:1", "project:2", "project:3", "project:4"),
+                "organization:2": ("project:5",),
+            },
+            now - timedelta(hours=1),
+            now,
+            rollup=rollup,
+            environment_id=1,
+        ) == {
+            "organization:1": [
+                (
+                    timestamp - rollup,
+                    {"project:1": 0.0, "project:2": 1.0, "project:3": 2.0, "project:4": 3.0},
+                ),
+                (
+                    timestamp,
+                    {"project:1": 0.0, "project:2": 0.0, "project:3": 0.0, "project:4": 0.0},
+                ),
+            ],
+            "organization:2": [
+                (timestamp - rollup, {"project:5": 0.5}),
+                (timestamp, {"project:5": 0.0}),
+            ],
+        }
+
+        assert self.db.get_frequency_totals(
+            model,
+            {
+                "organization:1": ("project:1", "project:2", "project:3", "project:4", "project:5"),
+                "organization:2": ("project:1", "project:2", "project:3", "project:4", "project:5"),
+            },
+            now - timedelta(hours=1),
+            now,
+            rollup=rollup,
+        ) == {
+            "organization:1": {
+                "project:1": 1.0 + 1.0,
+                "project:2": 2.0 + 2.0,
+                "project:3": 3.0 + 3.0,
+                "project:4": 4.0,
+                "project:5": 0.0,
+            },
+            "organization:2": {
+                "project:1": 0.0,
+                "project:2": 0.0,
+                "project:3": 0.0,
+                "project:4": 0.0,
+                "project:5": 1.5,
+            },
+        }
+
+        self.db.merge_frequencies(
+            model, "organization:1", ["organization:2"], now, environment_ids=[0, 1]
+        )
+
+        assert self.db.get_frequency_totals(
+            model,
+            {
+                "organization:1": ("project:1", "project:2", "project:3", "project:4", "project:5"),
+                "organization:2": ("project:1", "project:2", "project:3", "project:4", "project:5"),
+            },
+            now - timedelta(hours=1),
+            now,
+            rollup=rollup,
+        ) == {
+            "organization:1": {
+                "project:1": 1.0 + 1.0,
+                "project:2": 2.0 + 2.0,
+                "project:3": 3.0 + 3.0,
+                "project:4": 4.0,
+                "project:5": 1.5,
+            },
+            "organization:2": {
+                "project:1": 0.0,
+                "project:2": 0.0,
+                "project:3": 0.0,
+                "project:4": 0.0,
+                "project:5": 0.0,
+            },
+        }
+
+        assert self.db.get_frequency_totals(
+            model,
+            {
+                "organization:1": ("project:1", "project:2", "project:3", "project:4", "project:5"),
+                "organization:2": ("project:1", "project:2", "project:3", "project:4", "project:5"),
+            },
+            now - timedelta(hours=1),
+            now,
+            rollup=rollup,
+            environment_id=1,
+        ) == {
+            "organization:1": {
+                "project:1": 0.0,
+                "project:2": 1.0,
+                "project:3": 2.0,
+                "project:4": 3.0,
+                "project:5": 0.5,
+            },
+            "organization:2": {
+                "project:1": 0.0,
+                "project:2": 0.0,
+                "project:3": 0.0,
+                "project:4": 0.0,
+                "project:5": 0.0,
+            },
+        }
+
+        self.db.delete_frequencies(
+            [model],
+            ["organization:1", "organization:2"],
+            now - timedelta(hours=1),
+            now,
+            environment_ids=[0, 1],
+        )
+
+        assert self.db.get_most_frequent(model, ("organization:1", "organization:2"), now) == {
+            "organization:1": [],
+            "organization:2": [],
+        }
+
+        assert self.db.get_most_frequent(
+            model, ("organization:1", "organization:2"), now, environment_id=1
+        ) == {"organization:1": [], "organization:2": []}
+
+    def test_late_writes(self):
+        now = datetime.now(timezone.utc)
+        late = now - timedelta(seconds=10 * 30)  # one retention window of the 10 second rollup
+
+        self.db.incr(TSDBModel.project, 1, now, count=5)
+        self.db.record(TSDBModel.users_affected_by_project, 1, ["foo"], now)
+        self.db.record_frequency_multi(
+            [(TSDBModel.frequent_issues_by_project, {"project:1": {"group:1": 5}})], now
+        )
+
+        self.db.incr(TSDBModel.project, 1, late)
+        self.db.record(TSDBModel.users_affected_by_project, 1, ["bar", "baz"], late)
+        self.db.record_frequency_multi(
+            [(TSDBModel.frequent_issues_by_project, {"project:1": {"group:2": 1}})], late
+        )
+
+        # The data of the current interval is unchanged by the late writes.
+        self.db.incr(TSDBModel.project, 1, now)
+        assert self.db.get_sums(TSDBModel.project, [1], now, now, rollup=10) == {1: 6}
+        assert self.db.get_distinct_counts_totals(
+            TSDBModel.users_affected_by_project, [1], now, now, rollup=10
+        ) == {1: 1}
+        assert self.db.get_most_frequent(
+            TSDBModel.frequent_issues_by_project, ["project:1"], now, now, rollup=10
+        ) == {"project:1": [("group:1", 5.0)]}
+
+        # Rollups that still retain the late interval have it recorded.
+        assert self.db.get_sums(TSDBModel.project, [1], late, now, rollup=ONE_MINUTE) == {1: 7}
+
+    def test_concurrent_reads_and_writes(self):
+        now = datetime.now(timezone.utc)
+        model = TSDBModel.frequent_issues_by_project
+        errors = []
+
+        def write(thread):
+            for i in range(2000):
+                self.db.record(TSDBModel.users_affected_by_project, 1, [f"{thread}:{i}"], now)
+                self.db.record_frequency_multi([(model, {"project:1": {f"{thread}:{i}": 1}})], now)
+
+        def read():
+            try:
+                for _ in range(200):
+                    self.db.get_distinct_counts_totals(
+                        TSDBModel.users_affected_by_project, [1], now, now, rollup=10
+                    )
+                    self.db.get_most_frequent(model, ["project:1"], now, now, rollup=10)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(i,)) for i in range(2)]
+        threads += [threading.Thread(target=read) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from sentry.tsdb.base import ONE_HOUR, TSDBModel
+from sentry.tsdb.columnar import ColumnarTSDB
+from sentry.tsdb.inmemory import InMemoryTSDB
+
+# ColumnarTSDB trades some speed for bounded memory, this tracks how large that overhead is
+# compared to the dict based InMemoryTSDB (about 1.2x for writes and 2x for reads at the time of
+# writing).
+ROLLUPS = ((10, 360), (ONE_HOUR, 24 * 7), (ONE_HOUR * 24, 90))
+
+# A day of events over a few projects and groups, as they are recorded when events are saved.
+EVENTS = [
+    (
+        datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=i * 17),
+        i % 5,
+        i % 50,
+        f"user:{i % 300}",
+    )
+    for i in range(5000)
+]
+
+
+def benchmark_available() -> bool:
+    try:
+        __import__("pytest_benchmark")
+    except ModuleNotFoundError:
+        return False
+    else:
+        return True
+
+
+def record_and_query(backend_class):
+    db = backend_class(rollups=ROLLUPS)
+    for timestamp, project_id, group_id, user in EVENTS:
+        db.incr_multi(
+            [(TSDBModel.project, project_id), (TSDBModel.group, group_id)],
+            timestamp=timestamp,
+            environment_id=1,
+        )
+        db.record_multi(
+            [
+                (TSDBModel.users_affected_by_group, group_id, [user]),
+                (TSDBModel.users_affected_by_project, project_id, [user]),
+            ],
+            timestamp=timestamp,
+            environment_id=1,
+        )
+        db.record_frequency_multi(
+            [(TSDBModel.frequent_issues_by_project, {f"project:{project_id}": {group_id: 1}})],
+            timestamp=timestamp,
+        )
+
+    start, end = EVENTS[0][0], EVENTS[-1][0]
+    db.get_sums(TSDBModel.group, list(range(50)), start, end)
+    db.get_range(TSDBModel.project, list(range(5)), start, end, rollup=ONE_HOUR)
+    db.get_distinct_counts_totals(TSDBModel.users_affected_by_group, list(range(50)), start, end)
+    db.get_most_frequent(
+        TSDBModel.frequent_issues_by_project, [f"project:{i}" for i in range(5)], start, end
+    )
+
+
+@pytest.mark.skipif(not benchmark_available(), reason="requires pytest-benchmark")
+@pytest.mark.parametrize("backend_class", [InMemoryTSDB, ColumnarTSDB], ids=["dict", "columnar"])
+def test_benchmark_record_and_query(backend_class, benchmark):
+    benchmark(record_and_query, backend_class)
@@ -2,6 +2,7 @@ from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 
 import pytest
+from redis.exceptions import ResponseError
 
 from sentry.testutils.cases import TestCase
 from sentry.testutils.helpers.options import override_options
@@ -590,6 +591,128 @@ class RedisTSDBTest(TestCase):
             model, ("organization:1", "organization:2"), now, environment_id=1
         ) == {"organization:1": [], "organization:2": []}
 
+    def test_count_distinct_batch(self):
+        now = datetime.now(timezone.utc) - timedelta(hours=2)
+        dts = [now + timedelta(hours=i) for i in range(2)]
+
+        model = TSDBModel.users_affected_by_group
+
+        def timestamp(d):
+            t = int(d.timestamp())
+            return t - (t % 3600)
+
+        self.db.record_multi_batch(
+            [
+                (((model, 1, ("foo",)), (model, 2, ("foo",))), dts[0], None),
+                (((model, 1, ("bar",)),), dts[0], 1),
+                (((model, 1, ("foo", "baz")),), dts[1], 1),
+                (((model, 2, ()),), dts[1], None),
+            ]
+        )
+
+        assert self.db.get_distinct_counts_series(model, [1, 2], dts[0], dts[-1], rollup=3600) == {
+            1: [(timestamp(dts[0]), 2), (timestamp(dts[1]), 2)],
+            2: [(timestamp(dts[0]), 1), (timestamp(dts[1]), 0)],
+        }
+
+        assert self.db.get_distinct_counts_series(
+            model, [1, 2], dts[0], dts[-1], rollup=3600, environment_id=1
+        ) == {
+            1: [(timestamp(dts[0]), 1), (timestamp(dts[1]), 2)],
+            2: [(timestamp(dts[0]), 0), (timestamp(dts[1]), 0)],
+        }
+
+    def test_frequency_tables_batch(self):
+        now = datetime.now(timezone.utc)
+        model = TSDBModel.frequent_issues_by_project
+
+        # None of the registered frequency tables actually support
+        # environments, so we have to pretend like one actually does
+        self.db.models_with_environment_support = self.db.models_with_environment_support | {model}
+
+        rollup = 3600
+
+        self.db.record_frequency_multi_batch(
+            [
+                (((model, {"organization:1": {"project:1": 1, "project:2": 2}}),), now, None),
+                (
+                    (
+                        (
+                            model,
+                            {
+                                "organization:1": {"project:2": 1, "project:3": 4},
+                                "organization:2": {"project:4": 1},
+                            },
+                        ),
+                    ),
+                    now,
+                    None,
+                ),
+                (((model, {"organization:2": {"project:5": 2}}),), now, 1),
+                (
+                    ((model, {"organization:1": {"project:1": 1}}),),
+                    now - timedelta(hours=1),
+                    None,
+                ),
+            ]
+        )
+
+        assert self.db.get_most_frequent(
+            model, ("organization:1", "organization:2"), now, rollup=rollup
+        ) == {
+            "organization:1": [("project:3", 4.0), ("project:2", 3.0), ("project:1", 1.0)],
+            "organization:2": [("project:5", 2.0), ("project:4", 1.0)],
+        }
+
+        assert self.db.get_most_frequent(
+            model, ("organization:1", "organization:2"), now, rollup=rollup, environment_id=1
+        ) == {"organization:1": [], "organization:2": [("project:5", 2.0)]}
+
+        assert self.db.get_most_frequent(
+            model,
+            ("organization:1", "organization:2"),
+            now - timedelta(hours=1),
+            now - timedelta(hours=1),
+            rollup=rollup,
+        ) == {"organization:1": [("project:1", 1.0)], "organization:2": []}
+
+        # the indexes of all tables (including the ones of environments) have an expiration set
+        for key, environment_id in (
+            ("organization:1", None),
+            ("organization:2", None),
+            ("organization:2", 1),
+        ):
+            client = self.db.cluster.get_local_client_for_key(key)
+            index, _ = self.db.make_frequency_table_keys(
+                model, rollup, now.timestamp(), key, environment_id
+            )
+            assert client.ttl(index) > 0
+
+    def test_frequency_table_incr_batch(self):
+        client = self.db.cluster.get_local_client_for_key("key")
+
+        parameters = [64, 5, 10]
+
+        CountMinScript(
+            ["1:i", "1:e", "2:i", "2:e", "3:i", "3:e"],
+            ["INCRBATCH"] + parameters + [2, 2, 1, "foo", 2, "bar", 1, 1, 3, "baz"],
+            client=client,
+        )
+
+        assert CountMinScript(
+            ["1:i", "1:e", "2:i", "2:e"], ["RANKED"] + parameters, client=client
+        ) == [[b"bar", b"4"], [b"foo", b"2"]]
+        assert CountMinScript(["3:i", "3:e"], ["RANKED"] + parameters, client=client) == [
+            [b"baz", b"3"]
+        ]
+
+        with pytest.raises(ResponseError):
+            CountMinScript(
+                ["1:i", "1:e", "2:i", "2:e"],
+                ["INCRBATCH"] + parameters + [1, 1, 1, "foo"],
+                client=client,
+            )
+
     def test_frequency_table_import_export_no_estimators(self):
         client = self.db.cluster.get_local_client_for_key("key")
 
@@ -1,6 +1,6 @@
 import pytest
 
-from sentry.utils.codecs import BytesCodec, JSONCodec, ZlibCodec, ZstdCodec
+from sentry.utils.codecs import BytesCodec, JSONCodec, OptionalZstdCodec, ZlibCodec, ZstdCodec
 
 
 @pytest.mark.parametrize(
@@ -22,3 +22,16 @@ def test_codec_chaining() -> None:
 
     assert codec.encode([1, 2, 3]) == b"[1,2,3]"
     assert codec.decode(b"[1,2,3]") == [1, 2, 3]
+
+
+def test_optional_zstd_codec() -> None:
+    compressed = OptionalZstdCodec(compress=True)
+    uncompressed = OptionalZstdCodec(compress=False)
+
+    assert compressed.encode(b"hello") == ZstdCodec().encode(b"hello")
+    assert uncompressed.encode(b"hello") == b"hello"
+
+    # Both codecs read values written by either of them.
+    for codec in (compressed, uncompressed):
+        assert codec.decode(compressed.encode(b"hello")) == b"hello"
+        assert codec.decode(uncompressed.encode(b"hello")) == b"hello"
@@ -1,28 +1,38 @@
+import threading
+import time
 import unittest
 from datetime import datetime, timedelta
 from unittest import mock
 
 import pytest
+from django.core.cache import cache
 from django.utils import timezone
 from urllib3 import HTTPConnectionPool
 from urllib3.exceptions import HTTPError, ReadTimeoutError
 
+from sentry.locks import locks
 from sentry.models.grouprelease import GroupRelease
 from sentry.models.project import Project
 from sentry.models.release import Release
 from sentry.snuba.dataset import Dataset
 from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
+from sentry.utils import json
 from sentry.utils.snuba import (
     ROUND_UP,
     RetrySkipTimeout,
     SnubaQueryParams,
     UnqualifiedQueryError,
+    _apply_cache_and_build_results,
     _prepare_query_params,
+    get_cache_key,
     get_json_type,
     get_query_params_to_update_for_projects,
     get_snuba_column_name,
     get_snuba_translators,
     quantize_time,
+    to_columns,
+    to_rows,
 )
 
 
@@ -302,6 +312,16 @@ class PrepareQueryParamsTest(TestCase):
         assert kwargs == snuba_params.kwargs
 
 
+def test_to_columns():
+    rows = [{"time": 1, "count": 2.0}, {"time": 2, "count": None}]
+    columns = to_columns(rows)
+    assert columns == {"time": [1, 2], "count": [2.0, None]}
+    assert to_rows(columns) == rows
+
+    assert to_columns([]) == {}
+    assert to_rows({}) == []
+
+
 class QuantizeTimeTest(unittest.TestCase):
     def setUp(self):
         self.now = timezone.now().replace(microsecond=0)
@@ -412,6 +432,75 @@ class QuantizeTimeTest(unittest.TestCase):
         assert i != j
 
 
+class SingleFlightQueryTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.query = {"dataset": "events", "selected_columns": ["event_id"]}
+        self.cache_key = get_cache_key(self.query)
+        self.result = {"data": [{"event_id": "a" * 32}]}
+
+    def run_query(self):
+        with override_options({"snuba.query-cache.single-flight": True}):
+            return _apply_cache_and_build_results(
+                [(self.query, lambda x: x, lambda x: x)], use_cache=True
+            )
+
+    @mock.patch("sentry.utils.snuba._bulk_snuba_query")
+    def test_leader_queries_and_caches(self, mock_query):
+        mock_query.return_value = [self.result]
+
+        assert self.run_query() == [self.result]
+        assert mock_query.call_count == 1
+        assert json.loads(cache.get(self.cache_key)) == self.result
+        assert not locks.get(f"{self.cache_key}:lease", duration=1).locked()
+
+        # The cached result is served without querying again.
+        assert self.run_query() == [self.result]
+        assert mock_query.call_count == 1
+
+    @mock.patch("sentry.utils.metrics.incr")
+    @mock.patch("sentry.utils.snuba._bulk_snuba_query")
+    def test_waits_for_leader(self, mock_query, mock_incr):
+        lease = locks.get(f"{self.cache_key}:lease", duration=10)
+        with lease.acquire():
+            timer = threading.Timer(
+                0.1, cache.set, args=(self.cache_key, json.dumps(self.result), 60)
+            )
+            timer.start()
+            assert self.run_query() == [self.result]
+            timer.join()
+
+        assert mock_query.call_count == 0
+        mock_incr.assert_any_call("snuba.query_cache.coalesced", tags=None)
+
+    @override_options({"snuba.query-cache.single-flight.max-wait": 0.1})
+    @mock.patch("sentry.utils.metrics.incr")
+    @mock.patch("sentry.utils.snuba._bulk_snuba_query")
+    def test_falls_through_after_max_wait(self, mock_query, mock_incr):
+        mock_query.return_value = [self.result]
+
+        with locks.get(f"{self.cache_key}:lease", duration=10).acquire():
+            assert self.run_query() == [self.result]
+
+        assert mock_query.call_count == 1
+        mock_incr.assert_any_call(
+            "snuba.query_cache.single_flight.fallthrough", amount=1, tags=None
+        )
+
+    @mock.patch("sentry.utils.snuba._bulk_snuba_query")
+    def test_falls_through_when_leader_fails(self, mock_query):
+        mock_query.return_value = [self.result]
+        lease = locks.get(f"{self.cache_key}:lease", duration=10)
+        lease.acquire()
+        threading.Timer(0.1, lease.release).start()
+
+        start = time.monotonic()
+        assert self.run_query() == [self.result]
+        # The lease going away without a result ends the wait early.
+        assert time.monotonic() - start < 5
+        assert mock_query.call_count == 1
+
+
 class FakeConnectionPool(HTTPConnectionPool):
     def __init__(self, connection, **kwargs):
         self.connection = connection
@@ -1,3 +1,4 @@
+import threading
 from datetime import timedelta
 from unittest import mock
 
@@ -19,8 +20,10 @@ from sentry.notifications.types import NotificationSettingsOptionEnum
 from sentry.silo.base import SiloMode
 from sentry.testutils.cases import APITestCase, PerformanceIssueTestCase, SnubaTestCase
 from sentry.testutils.helpers.datetime import before_now, iso_format
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.silo import assume_test_silo_mode
 from sentry.types.group import PriorityLevel
+from sentry.utils import snuba
 from sentry.utils.samples import load_data
 from tests.sentry.issues.test_utils import SearchIssueTestMixin
 
@@ -424,6 +427,44 @@ class GroupSerializerSnubaTest(APITestCase, SnubaTestCase):
         assert iso_format(result["firstSeen"]) == iso_format(self.week_ago)
         assert result["count"] == "1"
 
+    @override_options({"api.group-serializer.concurrent-attrs": True})
+    def test_seen_stats_concurrent(self):
+        self.test_seen_stats()
+
+    @override_options({"api.group-serializer.concurrent-attrs": True})
+    def test_seen_stats_concurrent_lookups_on_request_thread(self):
+        environment = self.create_environment(project=self.project)
+        event = self.store_event(
+            data={"timestamp": iso_format(self.min_ago), "environment": environment.name},
+            project_id=self.project.id,
+        )
+
+        # The Postgres lookups of the Snuba queries (like the first seen of a single group, and
+        # the names of environments) are made on the request thread, in its transaction.
+        threads = set()
+
+        def shrink_time_window(*args):
+            threads.add(threading.current_thread())
+            return original_shrink_time_window(*args)
+
+        def get_snuba_translators(*args, **kwargs):
+            threads.add(threading.current_thread())
+            return original_get_snuba_translators(*args, **kwargs)
+
+        original_shrink_time_window = snuba.shrink_time_window
+        original_get_snuba_translators = snuba.get_snuba_translators
+        with (
+            mock.patch.object(snuba, "shrink_time_window", side_effect=shrink_time_window),
+            mock.patch.object(snuba, "get_snuba_translators", side_effect=get_snuba_translators),
+        ):
+            result = serialize(
+                event.group,
+                serializer=GroupSerializerSnuba(environment_ids=[environment.id]),
+            )
+
+        assert result["count"] == "1"
+        assert threads == {threading.current_thread()}
+
     def test_get_start_from_seen_stats(self):
         for days, expected in [(None, 30), (0, 14), (1000, 90)]:
             last_seen = None if days is None else before_now(days=days)
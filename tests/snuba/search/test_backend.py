@@ -30,7 +30,7 @@ from sentry.models.grouphistory import GroupHistoryStatus, record_group_history
 from sentry.models.groupowner import GroupOwner
 from sentry.models.groupsubscription import GroupSubscription
 from sentry.search.snuba.backend import EventsDatasetSnubaSearchBackend, SnubaSearchBackendBase
-from sentry.search.snuba.executors import TrendsSortWeights
+from sentry.search.snuba.executors import PostgresSnubaQueryExecutor, TrendsSortWeights
 from sentry.snuba.dataset import Dataset
 from sentry.testutils.cases import SnubaTestCase, TestCase, TransactionTestCase
 from sentry.testutils.helpers import Feature, apply_feature_flag_on_cls
@@ -2562,7 +2562,39 @@ class EventsSnubaSearchTestCases(EventsDatasetTestSetup):
 
 
 class EventsSnubaSearchTest(TestCase, EventsSnubaSearchTestCases):
-    pass
+    def test_result_cache(self):
+        def make_query(**kwargs):
+            return self.make_query(search_filter_query="is:unresolved", sort_by="freq", **kwargs)
+
+        first_page = make_query(limit=1)
+        second_page = make_query(limit=1, cursor=first_page.next)
+        assert len(first_page) == len(second_page) == 1
+
+        with self.options({"snuba.search.result-cache.enabled": True}):
+            assert list(make_query(limit=1)) == list(first_page)
+
+            with mock.patch.object(
+                PostgresSnubaQueryExecutor, "snuba_search", side_effect=AssertionError
+            ):
+                results = make_query(limit=1)
+                assert list(results) == list(first_page)
+                assert results.next.has_results
+
+                results = make_query(limit=1, cursor=results.next)
+                assert list(results) == list(second_page)
+                assert results.prev.has_results
+
+                # Groups that no longer match the Postgres filters are left out.
+                first_page[0].update(status=GroupStatus.RESOLVED, substatus=None)
+                assert list(make_query(limit=2)) == list(second_page)
+
+            # Searches that don't start at the first page don't populate the cache.
+            self.make_query(sort_by="freq", limit=1, cursor=first_page.next)
+            with mock.patch.object(
+                PostgresSnubaQueryExecutor, "snuba_search", side_effect=AssertionError
+            ):
+                with pytest.raises(AssertionError):
+                    self.make_query(sort_by="freq", limit=1, cursor=first_page.next)
 
 
 @apply_feature_flag_on_cls("organizations:issue-search-group-attributes-side-query")
@@ -15,6 +15,7 @@ from sentry.search.events.constants import (
     SEMVER_BUILD_ALIAS,
     SEMVER_PACKAGE_ALIAS,
 )
+from sentry.tagstore import summaries
 from sentry.tagstore.exceptions import (
     GroupTagKeyNotFound,
     GroupTagValueNotFound,
@@ -22,10 +23,12 @@ from sentry.tagstore.exceptions import (
     TagValueNotFound,
 )
 from sentry.tagstore.snuba.backend import SnubaTagStorage
+from sentry.tagstore.tasks import refresh_group_tag_summaries
 from sentry.tagstore.types import GroupTagValue, TagValue
 from sentry.testutils.abstract import Abstract
 from sentry.testutils.cases import PerformanceIssueTestCase, SnubaTestCase, TestCase
 from sentry.testutils.helpers.datetime import before_now, iso_format
+from sentry.testutils.helpers.options import override_options
 from sentry.utils.eventuser import EventUser
 from sentry.utils.samples import load_data
 from tests.sentry.issues.test_utils import SearchIssueTestMixin
@@ -226,6 +229,51 @@ class TagStorageTest(TestCase, SnubaTestCase, SearchIssueTestMixin, PerformanceI
         assert {v.value for v in top_release_values} == {"100", "200"}
         assert all(v.times_seen == 1 for v in top_release_values)
 
+    def test_get_group_tag_keys_and_top_values_summary(self):
+        def get_tag_keys(**kwargs):
+            result = self.ts.get_group_tag_keys_and_top_values(
+                self.proj1group1,
+                [self.proj1env1.id],
+                value_limit=10,
+                tenant_ids={"referrer": "r", "organization_id": 1234},
+                **kwargs,
+            )
+            return sorted(result, key=lambda r: r.key)
+
+        expected = get_tag_keys()
+
+        with override_options({"tagstore.group-tag-summary.enabled": True}):
+            assert summaries.get(self.proj1group1, [self.proj1env1.id]) is None
+            result = get_tag_keys()
+            assert result == expected
+            assert [r.top_values for r in result] == [r.top_values for r in expected]
+            assert summaries.get(self.proj1group1, [self.proj1env1.id]) is not None
+
+            with mock.patch(
+                "sentry.tagstore.snuba.backend.snuba.query", side_effect=AssertionError
+            ):
+                result = get_tag_keys()
+                assert result == expected
+                assert [r.count for r in result] == [r.count for r in expected]
+                assert [r.top_values for r in result] == [r.top_values for r in expected]
+
+                result = get_tag_keys(keys=["sentry:release"])
+                assert [r.key for r in result] == ["sentry:release"]
+                assert {v.value for v in result[0].top_values} == {"100", "200"}
+
+            # Merging or unmerging the group drops its summary.
+            summaries.invalidate([self.proj1group1.id])
+            assert summaries.get(self.proj1group1, [self.proj1env1.id]) is None
+
+            # Requests for specific keys don't compute the summary, but the periodic task does.
+            get_tag_keys(keys=["sentry:release"])
+            assert summaries.get(self.proj1group1, [self.proj1env1.id]) is None
+            with mock.patch("sentry.tagstore.tasks.tagstore.backend", self.ts):
+                refresh_group_tag_summaries()
+            summary = summaries.get(self.proj1group1, [self.proj1env1.id])
+            assert summary is not None
+            assert {k["key"] for k in summary["keys"]} == {r.key for r in expected}
+
     def test_get_group_tag_keys_and_top_values_perf_issue(self):
         perf_group, env = self.perf_group_and_env
 
@@ -1245,6 +1293,8 @@ class TagStorageTest(TestCase, SnubaTestCase, SearchIssueTestMixin, PerformanceI
             1,
             0,
             None,
+            None,
+            None,
         ),
     )
     def test_get_group_tag_value_paginator_sort_by_last_seen(self):